@@ -6,6 +6,7 @@ from py4vasp._batch import Batch
 from py4vasp._calculation import Calculation, calculation
 from py4vasp._third_party.graph import plot
 from py4vasp._third_party.interactive import set_error_handling
+from py4vasp._util.profile import profile
 
 __version__ = "0.11.3"
 set_error_handling("Plain")  # Set default error handling to "Plain"
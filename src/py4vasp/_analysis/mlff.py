@@ -1,5 +1,9 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import concurrent.futures
+import dataclasses
+import math
+import pathlib
 from types import SimpleNamespace
 from typing import Dict
 
@@ -7,6 +11,10 @@ import numpy as np
 
 import py4vasp
 from py4vasp import exception
+from py4vasp._util import check
+
+CHUNK_SIZE = 64
+FORCE_BINS = np.linspace(0.0, 1.0, 51)
 
 
 class MLFFErrorAnalysis:
@@ -43,6 +51,16 @@ class MLFFErrorAnalysis:
     >>> stress_error = mlff_error_analysis.get_stress_rmse(
     ...     normalize_by_configurations=True
     ... )
+
+    For large validation sets, stream the configurations instead of loading them
+    all into memory. The errors are identical to the ones obtained above.
+
+    >>> mlff_error_analysis = MLFFErrorAnalysis.stream_from_paths(
+    ...     dft_data="path/to/dft/data*",
+    ...     mlff_data="path/to/mlff/data*",
+    ...     workers=4,
+    ... )
+    >>> element_error = mlff_error_analysis.get_force_rmse_per_element()
     """
 
     TOTAL_ENERGY = "TOTEN"
@@ -50,6 +68,8 @@ class MLFFErrorAnalysis:
     def __init__(self, *args, **kwargs):
         self.mlff = SimpleNamespace()
         self.dft = SimpleNamespace()
+        self._statistics = None
+        self._force_bins = FORCE_BINS
 
     @classmethod
     def _from_data(cls, batch):
@@ -100,6 +120,101 @@ class MLFFErrorAnalysis:
         set_appropriate_attrs(mlff_error_analysis)
         return mlff_error_analysis
 
+    @classmethod
+    def stream_from_paths(
+        cls,
+        dft_data,
+        mlff_data,
+        chunk_size=CHUNK_SIZE,
+        workers=1,
+        force_bins=FORCE_BINS,
+    ):
+        """Compute the errors of MLFF calculations reading one chunk at a time.
+
+        In contrast to :meth:`from_paths`, the energies, forces, and stresses are not
+        kept in memory. Instead, pairs of DFT and MLFF calculations are read in chunks
+        and only the errors of every configuration and the running sums required for
+        the per-element errors and the histogram are accumulated. The resulting
+        errors are identical to the ones computed by :meth:`from_paths`.
+
+        Parameters
+        ----------
+        dft_data : str or pathlib.Path
+            Path to the DFT data. Accepts wildcards.
+        mlff_data : str or pathlib.Path
+            Path to the MLFF data. Accepts wildcards.
+        chunk_size : int
+            Number of pairs of calculations processed together.
+        workers : int
+            Number of threads reading and processing chunks in parallel.
+        force_bins : np.ndarray
+            Edges of the histogram of the force error per atom in eV/Å.
+        """
+        paths = _find_paths(dft_data=dft_data, mlff_data=mlff_data)
+        return cls._from_stream(paths, None, chunk_size, workers, force_bins)
+
+    @classmethod
+    def stream_from_files(
+        cls,
+        dft_data,
+        mlff_data,
+        chunk_size=CHUNK_SIZE,
+        workers=1,
+        force_bins=FORCE_BINS,
+    ):
+        """Compute the errors of MLFF calculations from files one chunk at a time.
+
+        This is the streaming variant of :meth:`from_files`; see
+        :meth:`stream_from_paths` for details.
+
+        Parameters
+        ----------
+        dft_data : str or pathlib.Path
+            Path to the DFT data. Accepts wildcards.
+        mlff_data : str or pathlib.Path
+            Path to the MLFF data. Accepts wildcards.
+        chunk_size : int
+            Number of pairs of calculations processed together.
+        workers : int
+            Number of threads reading and processing chunks in parallel.
+        force_bins : np.ndarray
+            Edges of the histogram of the force error per atom in eV/Å.
+        """
+        files = _find_paths(dft_data=dft_data, mlff_data=mlff_data)
+        paths = {key: [file.parent for file in value] for key, value in files.items()}
+        return cls._from_stream(paths, files, chunk_size, workers, force_bins)
+
+    @classmethod
+    def _from_stream(cls, paths, files, chunk_size, workers, force_bins):
+        check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+        locations = files or paths
+        if len(locations["dft_data"]) != len(locations["mlff_data"]):
+            message = "Please pass the same number of DFT and MLFF calculations."
+            raise exception.IncorrectUsage(message)
+        mlff_error_analysis = cls(_internal=True)
+        mlff_error_analysis._force_bins = np.asarray(force_bins)
+        pairs = list(zip(locations["dft_data"], locations["mlff_data"]))
+        chunks = [pairs[i : i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+        process_chunk = lambda chunk: _process_chunk(chunk, files, force_bins)
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                results = executor.map(process_chunk, chunks)
+                statistics = _ErrorStatistics.merge(force_bins, results)
+        else:
+            results = map(process_chunk, chunks)
+            statistics = _ErrorStatistics.merge(force_bins, results)
+        mlff_error_analysis._statistics = statistics
+        for key, namespace in (
+            ("dft_data", mlff_error_analysis.dft),
+            ("mlff_data", mlff_error_analysis.mlff),
+        ):
+            namespace.paths = paths[key]
+            if files is not None:
+                namespace.files = files[key]
+            namespace.nconfig = len(pairs)
+            namespace.nions = np.array(statistics.nions)
+        return mlff_error_analysis
+
     def get_energy_error_per_atom(self, normalize_by_configurations=False):
         """Get the error in energy per atom.
 
@@ -117,15 +232,18 @@ class MLFFErrorAnalysis:
             If set to ``True``, the error is averaged over the number of
             configurations. Defaults to ``False``.
         """
-        error = (self.mlff.energies - self.dft.energies) / self.dft.nions
+        if self._statistics is None:
+            error = _energy_error_per_atom(
+                self.dft.energies, self.mlff.energies, self.dft.nions
+            )
+        else:
+            error = np.array(self._statistics.energy_errors)
         if normalize_by_configurations:
             error = np.sum(np.abs(error), axis=-1) / self.dft.nconfig
         return error
 
     def _get_rmse(self, dft_quantity, mlff_quantity, degrees_of_freedom):
-        norm_error = np.linalg.norm(dft_quantity - mlff_quantity, axis=-1)
-        error = np.sqrt(np.sum(norm_error**2, axis=-1) / degrees_of_freedom)
-        return error
+        return _rmse(dft_quantity, mlff_quantity, degrees_of_freedom)
 
     def get_force_rmse(self, normalize_by_configurations=False):
         """Get the root mean square error in forces.
@@ -144,8 +262,10 @@ class MLFFErrorAnalysis:
             If set to ``True``, the error is averaged over the number of
             configurations. Defaults to ``False``.
         """
-        deg_freedom = 3 * self.dft.nions
-        error = self._get_rmse(self.dft.forces, self.mlff.forces, deg_freedom)
+        if self._statistics is None:
+            error = _force_rmse(self.dft.forces, self.mlff.forces, self.dft.nions)
+        else:
+            error = np.array(self._statistics.force_errors)
         if normalize_by_configurations:
             error = np.sum(error, axis=-1) / self.dft.nconfig
         return error
@@ -161,14 +281,177 @@ class MLFFErrorAnalysis:
         ``normalize_by_configurations`` is set to ``True``, the error is
         averaged over the number of configurations.
         """
-        deg_freedom = 6
-        dft_stresses = np.triu(self.dft.stresses)
-        mlff_stresses = np.triu(self.mlff.stresses)
-        error = self._get_rmse(dft_stresses, mlff_stresses, deg_freedom)
+        if self._statistics is None:
+            error = _stress_rmse(self.dft.stresses, self.mlff.stresses)
+        else:
+            error = np.array(self._statistics.stress_errors)
         if normalize_by_configurations:
             error = np.sum(error, axis=-1) / self.dft.nconfig
         return error
 
+    def get_force_rmse_per_element(self):
+        """Get the root mean square error in forces resolved by element.
+
+        For every element, the squared force errors of all atoms of this element in
+        all configurations are averaged, i.e., the error is calculated as
+        :math:`\\sqrt{\\frac{\\sum_{i \\in X}{\\sum_{j=1}^{3}{(F_{MLFF} - F_{DFT})^2}}}{3N_X}}`,
+        where the sum runs over all atoms :math:`i` of the element :math:`X` and
+        :math:`N_X` is the number of these atoms.
+
+        Returns
+        -------
+        dict
+            The force RMSE in eV/Å for every element.
+        """
+        statistics = self._statistics or self._statistics_from_memory()
+        return statistics.force_rmse_per_element()
+
+    def get_force_error_histogram(self):
+        """Get the histogram of the force error per atom.
+
+        The force error per atom is the norm :math:`|F_{MLFF} - F_{DFT}|` for every
+        atom in every configuration. Errors beyond the last bin edge are counted in
+        the last bin.
+
+        Returns
+        -------
+        dict
+            The edges of the bins in eV/Å and the number of atoms in every bin.
+        """
+        statistics = self._statistics or self._statistics_from_memory()
+        return {"edges": statistics.force_bins, "counts": statistics.force_histogram}
+
+    def _statistics_from_memory(self):
+        statistics = _ErrorStatistics(self._force_bins)
+        for elements, dft_forces, mlff_forces in zip(
+            self.dft.elements, self.dft.forces, self.mlff.forces
+        ):
+            statistics.add_forces(elements, dft_forces, mlff_forces)
+        return statistics
+
+
+@dataclasses.dataclass
+class _ErrorStatistics:
+    force_bins: np.ndarray
+    nions: list = dataclasses.field(default_factory=list)
+    energy_errors: list = dataclasses.field(default_factory=list)
+    force_errors: list = dataclasses.field(default_factory=list)
+    stress_errors: list = dataclasses.field(default_factory=list)
+    squared_force_errors: dict = dataclasses.field(default_factory=dict)
+    number_atoms: dict = dataclasses.field(default_factory=dict)
+    force_histogram: np.ndarray = None
+
+    def __post_init__(self):
+        if self.force_histogram is None:
+            self.force_histogram = np.zeros(len(self.force_bins) - 1, dtype=np.int64)
+
+    @classmethod
+    def merge(cls, force_bins, parts):
+        result = cls(force_bins)
+        for part in parts:
+            result.nions.extend(part.nions)
+            result.energy_errors.extend(part.energy_errors)
+            result.force_errors.extend(part.force_errors)
+            result.stress_errors.extend(part.stress_errors)
+            for element, errors in part.squared_force_errors.items():
+                result.squared_force_errors.setdefault(element, []).extend(errors)
+            for element, number in part.number_atoms.items():
+                result.number_atoms[element] = (
+                    result.number_atoms.get(element, 0) + number
+                )
+            result.force_histogram += part.force_histogram
+        return result
+
+    def add(self, dft, mlff):
+        nions = len(dft["elements"])
+        self.nions.append(nions)
+        self.energy_errors.append(
+            _energy_error_per_atom(dft["energy"], mlff["energy"], nions)
+        )
+        self.force_errors.append(_force_rmse(dft["forces"], mlff["forces"], nions))
+        self.stress_errors.append(_stress_rmse(dft["stress"], mlff["stress"]))
+        self.add_forces(dft["elements"], dft["forces"], mlff["forces"])
+
+    def add_forces(self, elements, dft_forces, mlff_forces):
+        norm_error = np.linalg.norm(dft_forces - mlff_forces, axis=-1)
+        elements = np.asarray(elements, dtype=str)
+        for element in dict.fromkeys(elements.tolist()):
+            mask = elements == element
+            squared_error = float(np.sum(norm_error[mask] ** 2))
+            self.squared_force_errors.setdefault(element, []).append(squared_error)
+            number_atoms = self.number_atoms.get(element, 0)
+            self.number_atoms[element] = number_atoms + int(np.sum(mask))
+        clipped_error = np.minimum(norm_error, self.force_bins[-1])
+        self.force_histogram += np.histogram(clipped_error, self.force_bins)[0]
+
+    def force_rmse_per_element(self):
+        # fsum is exact, so the result does not depend on how the data was chunked
+        return {
+            element: math.sqrt(math.fsum(errors) / (3 * self.number_atoms[element]))
+            for element, errors in self.squared_force_errors.items()
+        }
+
+
+def _find_paths(**kwargs):
+    return dict(py4vasp.Batch._path_finder(**kwargs))
+
+
+def _process_chunk(chunk, files, force_bins):
+    statistics = _ErrorStatistics(force_bins)
+    for dft_location, mlff_location in chunk:
+        dft = _read_configuration(dft_location, files is not None)
+        mlff = _read_configuration(mlff_location, files is not None)
+        _validate_configuration(dft, mlff, dft_location, mlff_location)
+        statistics.add(dft, mlff)
+    return statistics
+
+
+def _read_configuration(location, from_file):
+    if from_file:
+        calculation = py4vasp.Calculation.from_file(location)
+    else:
+        calculation = py4vasp.Calculation.from_path(location)
+    tag = MLFFErrorAnalysis.TOTAL_ENERGY
+    force = calculation.force.read()
+    return {
+        "energy": calculation.energy.read(tag)[tag],
+        "forces": force["forces"],
+        "elements": force["structure"]["elements"],
+        "lattice_vectors": force["structure"]["lattice_vectors"],
+        "positions": force["structure"]["positions"],
+        "stress": calculation.stress.read()["stress"],
+    }
+
+
+def _validate_configuration(dft, mlff, dft_location, mlff_location):
+    try:
+        np.testing.assert_almost_equal(dft["positions"], mlff["positions"])
+        np.testing.assert_almost_equal(dft["lattice_vectors"], mlff["lattice_vectors"])
+        assert len(dft["elements"]) == len(mlff["elements"])
+    except AssertionError:
+        message = f"""\
+Please pass a consistent set of data between DFT and MLFF calculations. The structure
+of {pathlib.Path(dft_location)} differs from {pathlib.Path(mlff_location)}."""
+        raise exception.IncorrectUsage(message) from None
+
+
+def _energy_error_per_atom(dft_energies, mlff_energies, nions):
+    return (mlff_energies - dft_energies) / nions
+
+
+def _rmse(dft_quantity, mlff_quantity, degrees_of_freedom):
+    norm_error = np.linalg.norm(dft_quantity - mlff_quantity, axis=-1)
+    error = np.sqrt(np.sum(norm_error**2, axis=-1) / degrees_of_freedom)
+    return error
+
+
+def _force_rmse(dft_forces, mlff_forces, nions):
+    return _rmse(dft_forces, mlff_forces, 3 * nions)
+
+
+def _stress_rmse(dft_stresses, mlff_stresses):
+    return _rmse(np.triu(dft_stresses), np.triu(mlff_stresses), 6)
+
 
 def set_appropriate_attrs(cls):
     set_paths_and_files(cls)
@@ -234,6 +517,8 @@ def set_number_of_ions(cls):
     nions_mlff = np.array([len(_elements) for _elements in elements_mlff])
     cls.dft.nions = nions_dft
     cls.mlff.nions = nions_mlff
+    cls.dft.elements = elements_dft
+    cls.mlff.elements = elements_mlff
 
 
 def set_paths_and_files(cls):
@@ -1,11 +1,16 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import concurrent.futures
+import functools
 import inspect
 import pathlib
 from typing import Dict, List
 
+import py4vasp
 from py4vasp import combine, exception
-from py4vasp._util import convert
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._third_party.graph import Graph
+from py4vasp._util import convert, discover
 
 
 class Batch:
@@ -16,12 +21,20 @@ class Batch:
     paths or files or pass in paths and files directly. Then you can access the
     properties of all calculations via the attributes of the object.
 
+    Every quantity of a :class:`~py4vasp.Calculation` is available as an attribute of
+    the Batch with the same selections. Calling one of its methods calls the method
+    for all calculations and returns a dictionary with a list of the results for
+    every key.
+
     Examples
     --------
     >>> calcs = Batch.from_paths(calc1="path_to_calc1", calc2="path_to_calc2")
     >>> calcs.energies.read() # returns a dictionary with the energies of calc1 and calc2
     >>> calcs.forces.read()   # returns a dictionary with the forces of calc1 and calc2
     >>> calcs.stresses.read() # returns a dictionary with the stresses of calc1 and calc2
+    >>> calcs.dos.to_dict("Sr") # returns a dictionary with the DOS of calc1 and calc2
+    >>> calcs.structure[-1].read() # the final structure of calc1 and calc2
+    >>> calcs.phonon.band.to_dict() # nested quantities work like for a Calculation
 
     Notes
     -----
@@ -46,13 +59,13 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
                 raise exception.IncorrectUsage(message)
             paths = pathlib.Path(value).expanduser().absolute()
             if "*" in paths.as_posix():
-                paths = sorted(list(paths.parent.glob(paths.name)))
+                paths = _glob(paths)
             else:
                 paths = [paths]
             yield key, paths
 
     @classmethod
-    def from_paths(cls, **kwargs):
+    def from_paths(cls, *, workers=None, **kwargs):
         """Set up a Batch object for paths.
 
         Setup a calculation for paths by passing in a dictionary with the name of the
@@ -60,11 +73,16 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
 
         Parameters
         ----------
+        workers : int or None
+            Maximal number of threads reading the calculations when a method is
+            called for all of them. By default, the choice is left to
+            :class:`concurrent.futures.ThreadPoolExecutor`.
         **kwargs : Dict[str, str or pathlib.Path]
             A dictionary with the name of the calculation as key and the path to the
             calculation as value. Wildcards are allowed.
         """
         calculations = cls(_internal=True)
+        calculations._workers = workers
         calculations._paths = {}
         for key, paths in cls._path_finder(**kwargs):
             calculations._paths[key] = paths
@@ -74,7 +92,7 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         return calculations
 
     @classmethod
-    def from_files(cls, **kwargs):
+    def from_files(cls, *, workers=None, **kwargs):
         """Set up a Batch object from files.
 
         Setup a calculation for files by passing in a dictionary with the name of the
@@ -84,11 +102,16 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
 
         Parameters
         ----------
+        workers : int or None
+            Maximal number of threads reading the calculations when a method is
+            called for all of them. By default, the choice is left to
+            :class:`concurrent.futures.ThreadPoolExecutor`.
         **kwargs : Dict[str, str or pathlib.Path]
             A dictionary with the name of the calculation as key and the files to the
             calculation as value. Wildcards are allowed.
         """
         calculations = cls(_internal=True)
+        calculations._workers = workers
         calculations._paths = {}
         calculations._files = {}
         for key, paths in cls._path_finder(**kwargs):
@@ -100,6 +123,76 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         )
         return calculations
 
+    @classmethod
+    def from_tree(cls, *, filename=DEFAULT_FILE, manifest=None, workers=None, **kwargs):
+        """Set up a Batch object for all calculations in directory trees.
+
+        Search the directory tree below every path for files with the given name. The
+        directories are scanned concurrently, so that trees with many entries are
+        discovered quickly.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the files written by the calculations.
+        manifest : str or pathlib.Path or None
+            If set, store the content of the scanned directories in this file. When
+            the discovery is repeated, only directories modified in the meantime are
+            scanned again. Use one manifest for every tree, i.e., pass a single root
+            without wildcards.
+        workers : int or None
+            Maximal number of threads scanning the directories and reading the
+            calculations when a method is called for all of them.
+        **kwargs : Dict[str, str or pathlib.Path]
+            A dictionary with the name of the calculations as key and the root of the
+            directory tree as value.
+
+        Examples
+        --------
+        >>> calcs = Batch.from_tree(convergence="path/to/convergence_tests")
+        >>> calcs.number_of_calculations()
+        {'convergence': 42}
+        """
+        roots = dict(cls._path_finder(**kwargs))
+        if manifest is not None and sum(map(len, roots.values())) > 1:
+            message = "A manifest can only be used for a single directory tree, but the paths select several roots."
+            raise exception.IncorrectUsage(message)
+        files = {}
+        for key, key_roots in roots.items():
+            files[key] = [
+                file
+                for root in key_roots
+                for file in discover.find_files(
+                    root, filename, manifest=manifest, workers=workers
+                )
+            ]
+        calculations = cls(_internal=True)
+        calculations._workers = workers
+        calculations._paths = {
+            key: [file.parent for file in files[key]] for key in files
+        }
+        calculations._files = files
+        calculations = _add_all_combination_classes(
+            calculations, _add_attribute_from_file
+        )
+        return calculations
+
+    def __getattr__(self, name):
+        # Resolves any quantity of a Calculation, only called if the normal attribute
+        # lookup failed, e.g., for quantities not covered by py4vasp.combine.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            getattr(_template_calculation(), name)
+        except AttributeError:
+            raise AttributeError(f"'Batch' has no attribute '{name}'") from None
+        return _Quantity(self, ((getattr, name),))
+
+    def __dir__(self):
+        names = set(super().__dir__())
+        names.update(dir(_template_calculation()))
+        return sorted(name for name in names if not name.startswith("_"))
+
     def paths(self) -> Dict[str, List[pathlib.Path]]:
         """Return the paths of the calculations."""
         return self._paths
@@ -112,6 +205,152 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         """Return the number of calculations for each calculation."""
         return {key: len(value) for key, value in self._paths.items()}
 
+    def to_graph(self, quantity, selection=None, *, workers=None, **kwargs):
+        """Plot a quantity of all calculations into a single graph.
+
+        The data of all calculations is read concurrently and the resulting graphs are
+        merged in a single pass. Every series is labeled by the key of its calculation;
+        if a key matches several calculations, their index is appended to the key.
+
+        Parameters
+        ----------
+        quantity : str
+            Name of the quantity that is plotted, e.g., "dos" or "energy". Nested
+            quantities are separated by a dot, e.g., "phonon.band".
+        selection : str
+            Selection passed on to the `to_graph` method of every calculation.
+        workers : int
+            Maximal number of threads reading the calculations. By default, the limit
+            set when creating the Batch is used.
+        **kwargs
+            Additional keyword arguments passed on to the `to_graph` method.
+
+        Returns
+        -------
+        Graph
+            The graphs of all calculations combined into one.
+
+        Examples
+        --------
+        >>> calcs = Batch.from_paths(kpoints="kpoints_*")
+        >>> calcs.to_graph("dos", "total")
+        Graph(series=[Series(..., label='kpoints[0] total', ...), ...], ...)
+        """
+        labels, calculations = self._labeled_calculations()
+        to_graph = lambda calculation: _quantity(calculation, quantity).to_graph(
+            selection, **kwargs
+        )
+        workers = self._workers if workers is None else workers
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            graphs = list(executor.map(to_graph, calculations))
+        return Graph.merge(graphs, labels=labels)
+
+    def _calculations(self):
+        sources = getattr(self, "_files", self._paths)
+        constructor = (
+            py4vasp.Calculation.from_file
+            if hasattr(self, "_files")
+            else py4vasp.Calculation.from_path
+        )
+        return {
+            key: [constructor(path) for path in paths] for key, paths in sources.items()
+        }
+
+    def _labeled_calculations(self):
+        labels = []
+        calculations = []
+        for key, values in self._calculations().items():
+            for index, calculation in enumerate(values):
+                labels.append(f"{key}[{index}]" if len(values) > 1 else key)
+                calculations.append(calculation)
+        return labels, calculations
+
+
+class _Quantity:
+    """Apply the methods of a quantity to all calculations of a Batch.
+
+    Attributes and indices are recorded and applied to the quantity of every
+    calculation once a method is called. The calculations are read concurrently.
+    """
+
+    def __init__(self, batch, operations):
+        self._batch = batch
+        self._operations = operations
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        operations = (*self._operations, (getattr, name))
+        attribute = _template(operations)
+        if inspect.ismethod(attribute):
+            return functools.partial(self._call, operations)
+        return _Quantity(self._batch, operations)
+
+    def __getitem__(self, key):
+        return _Quantity(self._batch, (*self._operations, (_getitem, key)))
+
+    def __dir__(self):
+        return dir(_template(self._operations))
+
+    def _call(self, operations, *args, **kwargs):
+        call = lambda calculation: _apply(calculation, operations)(*args, **kwargs)
+        calculations = self._batch._calculations()
+        with concurrent.futures.ThreadPoolExecutor(self._batch._workers) as executor:
+            futures = {
+                key: [executor.submit(call, calculation) for calculation in values]
+                for key, values in calculations.items()
+            }
+            return {
+                key: [future.result() for future in values]
+                for key, values in futures.items()
+            }
+
+
+def _apply(calculation, operations):
+    result = calculation
+    for operation, argument in operations:
+        result = operation(result, argument)
+    return result
+
+
+def _template(operations):
+    # resolve the attributes without reading any data, indexing a quantity may read
+    # the file but does not change its type
+    operations = [operation for operation in operations if operation[0] is getattr]
+    return _apply(_template_calculation(), operations)
+
+
+def _template_calculation():
+    # a calculation without data, so the attributes are resolved only from the class
+    # and the registry of quantities independent of the working directory
+    calculation = py4vasp.Calculation(_internal=True)
+    calculation._source = None
+    return calculation
+
+
+def _getitem(quantity, key):
+    return quantity[key]
+
+
+def _glob(pattern):
+    # split off the part of the path without wildcards, so that the remaining pattern
+    # may contain wildcards in several components including ** for recursion
+    parts = pattern.parts
+    first_wildcard = next(i for i, part in enumerate(parts) if "*" in part)
+    anchor = pathlib.Path(*parts[:first_wildcard])
+    return sorted(anchor.glob(str(pathlib.Path(*parts[first_wildcard:]))))
+
+
+def _quantity(calculation, name):
+    quantity = calculation
+    for part in name.split("."):
+        try:
+            quantity = getattr(quantity, part)
+        except AttributeError:
+            message = f"The quantity {name} is not available for a calculation."
+            raise exception.IncorrectUsage(message) from None
+    return quantity
+
 
 def _add_attribute_from_path(calc, class_):
     instance = class_.from_paths(calc.paths())
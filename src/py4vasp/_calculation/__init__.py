@@ -1,6 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import importlib
+import os
 import pathlib
 from typing import Any, List, Optional, Tuple, Union
 
@@ -12,9 +13,10 @@ from py4vasp._calculation.dispatch import (
     _availability_quantity_of,
 )
 from py4vasp._raw.data import CalculationMetaData, _DatabaseData
+from py4vasp._raw.definition import DEFAULT_FILE, DEFAULT_WAVEFILE
 from py4vasp._raw.definition import unique_selections as _schema_unique_selections
 from py4vasp._raw.models import schema_version
-from py4vasp._util import convert, import_
+from py4vasp._util import convert, import_, profile
 
 
 def _append_database_error(
@@ -41,6 +43,7 @@ _SUPPRESSED_DB_EXCEPTIONS = (
 
 
 INPUT_FILES = ("INCAR", "KPOINTS", "POSCAR")
+_OUTPUT_FILES = (DEFAULT_FILE, DEFAULT_WAVEFILE)
 
 # QUANTITIES, GROUPS, GROUP_TYPE_ALIAS, AUTOSUMMARY_QUANTITIES, AUTOSUMMARY_GROUPS,
 # AUTOSUMMARIES, and __all__ are derived from the dispatcher _REGISTRY by
@@ -104,7 +107,7 @@ instead of the constructor Calculation()."""
             raise exception.IncorrectUsage(message)
 
     @classmethod
-    def from_path(cls, path_name):
+    def from_path(cls, path_name, *, cache_projections=False):
         """Set up a Calculation for a particular path and so that all files are opened there.
 
         py4vasp knows to which files the relevant information is written. It will
@@ -122,6 +125,12 @@ instead of the constructor Calculation()."""
         ----------
         path_name : str or pathlib.Path
             Name of the path associated with the calculation.
+        cache_projections : bool
+            If set, projections on elements and angular momenta are computed once and
+            stored in a sidecar file next to the VASP output. Selections that only
+            combine elements, angular momenta (s, p, d, f), and spins, e.g.,
+            "Fe(d), O(p)", are then answered from this much smaller file. This speeds
+            up repeated plots of the band structure or the DOS.
 
         Returns
         -------
@@ -143,11 +152,11 @@ instead of the constructor Calculation()."""
         calc = cls(_internal=True)
         calc._path = pathlib.Path(path_name).expanduser().resolve()
         calc._file = None
-        calc._source = FileSource(calc._path)
+        calc._source = FileSource(calc._path, cache_projections=cache_projections)
         return calc
 
     @classmethod
-    def from_file(cls, file_name):
+    def from_file(cls, file_name, *, cache_projections=False):
         """Set up a Calculation from a particular file.
 
         Typically this limits the amount of information, you have access to, so prefer
@@ -167,6 +176,9 @@ instead of the constructor Calculation()."""
         ----------
         file_name : str or pathlib.Path
             Name of the file from which the data is read.
+        cache_projections : bool
+            If set, projections on elements and angular momenta are cached in a
+            sidecar file, see :meth:`from_path`.
 
         Returns
         -------
@@ -190,7 +202,9 @@ instead of the constructor Calculation()."""
         calc = cls(_internal=True)
         calc._path = pathlib.Path(file_name).expanduser().resolve().parent
         calc._file = file_name
-        calc._source = FileSource(calc._path, file=file_name)
+        calc._source = FileSource(
+            calc._path, file=file_name, cache_projections=cache_projections
+        )
         return calc
 
     def _to_database(self):
@@ -583,15 +597,40 @@ class DefaultCalculationFactory:
     the data in the current directory.
     """
 
+    def __init__(self):
+        object.__setattr__(self, "_cache", None)
+
     def __getattr__(self, attr):
-        calc = Calculation.from_path(".")
-        return getattr(calc, attr)
+        return getattr(self._calculation(), attr)
 
     def __setattr__(self, attr, value):
-        calc = Calculation.from_path(".")
-        return setattr(calc, attr, value)
+        return setattr(self._calculation(), attr, value)
+
+    def _calculation(self):
+        key = _current_directory_key()
+        if self._cache is not None and self._cache[0] == key:
+            profile.cache_hit("default calculation", quantity="calculation")
+            return self._cache[1]
+        calc = Calculation.from_path(key[0])
+        object.__setattr__(self, "_cache", (key, calc))
+        return calc
+
+
+def _current_directory_key():
+    # the cached Calculation is reused as long as the working directory and the
+    # modification times of the default VASP output files are unchanged
+    directory = os.getcwd()
+    return (directory, *(_modification_time(directory, file) for file in _OUTPUT_FILES))
+
+
+def _modification_time(directory, filename):
+    try:
+        return os.stat(os.path.join(directory, filename)).st_mtime_ns
+    except OSError:
+        return None
 
 
 # we use a factory instead of an instance of Calculation here so that changing the
-# directory works -> calculation will always point to the current directory
+# directory works -> calculation will always point to the current directory; the
+# factory reuses its Calculation while the directory and the output files are unchanged
 calculation = DefaultCalculationFactory()
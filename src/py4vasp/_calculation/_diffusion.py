@@ -0,0 +1,147 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Mean-square displacement and diffusion coefficients of MD trajectories.
+
+The positions of long MD runs do not fit comfortably into memory, e.g., 100 000 steps
+of 1000 atoms require more than 2 GB. Because the mean-square displacement (MSD) of
+every atom depends only on its own trajectory, we read the file in chunks of a few
+atoms for all selected steps. Every chunk is unwrapped across the periodic boundaries,
+its MSD is evaluated with FFTs in O(T log T) and accumulated into the average over the
+selected atoms. Only the MSD of every selection is kept in memory.
+"""
+
+import numpy as np
+
+from py4vasp import exception
+from py4vasp._util import check, correlation
+
+CHUNK_SIZE = 16
+"Default number of atoms whose trajectory is read from the file at once."
+
+FIT_RANGE = (0.1, 0.5)
+"Default range of the time lags, relative to the length of a block, used for the fit."
+
+A2_PER_FS_TO_CM2_PER_S = 0.1
+"Convert a diffusion coefficient from Å²/fs to cm²/s."
+
+PARAMETERS = """\
+time_step : float
+    Time between two steps stored in the file in fs. If you select every n-th step of
+    the trajectory, the time lag is adjusted accordingly.
+chunk_size : int
+    Number of atoms whose trajectory is read from the file at once. Larger chunks are
+    faster but require more memory.
+"""
+
+
+def unwrap(positions, lattice_vectors):
+    """Convert direct positions to continuous Cartesian trajectories.
+
+    Atoms crossing the boundary of the cell jump by a lattice vector in direct
+    coordinates. We remove these jumps by taking the shortest periodic image of the
+    displacement between consecutive steps. The displacement is converted to Cartesian
+    coordinates with the cell of the later step, so that trajectories with a changing
+    cell (NpT) are unwrapped correctly.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Direct coordinates with shape (steps, atoms, 3).
+    lattice_vectors : np.ndarray
+        The lattice vectors of every step with shape (steps, 3, 3) or a single cell
+        with shape (3, 3).
+
+    Returns
+    -------
+    np.ndarray
+        Cartesian positions relative to the first step with shape (steps, atoms, 3).
+    """
+    number_steps = len(positions)
+    lattice_vectors = np.broadcast_to(lattice_vectors, (number_steps, 3, 3))
+    jumps = np.diff(positions, axis=0)
+    jumps -= np.round(jumps)
+    result = np.zeros(np.shape(positions))
+    displacements = np.einsum("tai,tij->taj", jumps, lattice_vectors[1:])
+    np.cumsum(displacements, axis=0, out=result[1:])
+    return result
+
+
+def mean_square_displacement(
+    positions, steps, lattice_vectors, weights, number_blocks=0, chunk_size=CHUNK_SIZE
+):
+    """Average the MSD over the atoms of every selection.
+
+    Parameters
+    ----------
+    positions : VaspData
+        Direct coordinates of the full trajectory with shape (steps, atoms, 3).
+    steps : slice
+        The steps of the trajectory included in the analysis.
+    lattice_vectors : np.ndarray
+        The lattice vectors of the selected steps.
+    weights : np.ndarray
+        Weight of every atom for every selection with shape (atoms, selections).
+    number_blocks : int
+        If larger than zero, additionally split the trajectory into this number of
+        blocks and evaluate the MSD for every block independently.
+    chunk_size : int
+        Number of atoms read from the file at once.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The MSD of the full trajectory with shape (steps, selections) and the MSD of
+        every block with shape (blocks, steps per block, selections).
+    """
+    check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+    number_steps = len(range(len(positions))[steps])
+    block_length = number_steps // number_blocks if number_blocks else 0
+    msd = np.zeros((number_steps, weights.shape[1]))
+    block_msd = np.zeros((number_blocks, block_length, weights.shape[1]))
+    for start in range(0, len(weights), chunk_size):
+        atoms = slice(start, start + chunk_size)
+        chunk = unwrap(np.asarray(positions[steps, atoms]), lattice_vectors)
+        msd += correlation.mean_square_displacement(chunk) @ weights[atoms]
+        for i in range(number_blocks):
+            block = chunk[i * block_length : (i + 1) * block_length]
+            block_msd[i] += correlation.mean_square_displacement(block) @ weights[atoms]
+    return msd, block_msd
+
+
+def fit_slope(time, msd, fit_range):
+    """Fit a straight line to the MSD within the range of time lags.
+
+    Parameters
+    ----------
+    time : np.ndarray
+        The time lags of the MSD.
+    msd : np.ndarray
+        The MSD with the time lag along the first axis.
+    fit_range : tuple[float, float]
+        The first and last time lag included in the fit relative to the length of
+        *time*.
+
+    Returns
+    -------
+    np.ndarray
+        The slope of the MSD for every remaining dimension of *msd*.
+    """
+    lags = _fit_lags(len(time), fit_range)
+    slope, _ = np.polyfit(time[lags], msd[lags], 1)
+    return slope
+
+
+def _fit_lags(number_steps, fit_range):
+    try:
+        lower, upper = fit_range
+    except (TypeError, ValueError):
+        message = f"The fit range {fit_range} must be a pair of fractions."
+        raise exception.IncorrectUsage(message) from None
+    if not 0 <= lower < upper <= 1:
+        message = f"The fit range {fit_range} must satisfy 0 <= start < stop <= 1."
+        raise exception.IncorrectUsage(message)
+    lags = slice(int(lower * number_steps), int(np.ceil(upper * number_steps)))
+    if len(range(number_steps)[lags]) < 2:
+        message = f"The fit range {fit_range} contains fewer than two time lags of the {number_steps} steps. Please use a longer trajectory or fewer blocks."
+        raise exception.IncorrectUsage(message)
+    return lags
@@ -0,0 +1,262 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Fourier interpolation of phonons from the force constants of a supercell.
+
+The force constants computed by VASP for a supercell define the dynamical matrix at
+arbitrary q points of the primitive cell. Every pair of atoms interacts through the
+shortest of its periodic images; if several images have the same distance, they
+contribute with equal weights. The dynamical matrices are diagonalized in chunks of
+q points so that dense meshes never need to be held in memory at once.
+"""
+
+import concurrent.futures
+import dataclasses
+import itertools
+
+import numpy as np
+
+from py4vasp import exception
+from py4vasp._calculation.structure import StructureHandler
+from py4vasp._util import check
+
+CHUNK_SIZE = 256
+# sqrt(eV / (Å² amu)) / 2π converted to THz
+_TO_THZ = 15.633302
+_TOLERANCE = 1e-5
+
+
+@dataclasses.dataclass
+class DynamicalMatrix:
+    """Construct the dynamical matrix of the primitive cell at any q point.
+
+    For every atom of the primitive cell, the interactions with all atoms of the
+    supercell are stored as the lattice vectors connecting them and the mass-weighted
+    force constants arranged such that a single matrix product with the phase factors
+    yields the rows of the dynamical matrix.
+    """
+
+    number_atoms: int
+    "Number of atoms in the primitive cell."
+    vectors: list
+    "Per primitive atom, the vectors to all interacting atoms in primitive coordinates."
+    blocks: list
+    "Per primitive atom, the mass-weighted force constants multiplied by the weights."
+
+    @classmethod
+    def from_data(cls, raw_force_constant, supercell, masses=None):
+        """Set up the dynamical matrix from the force constants of a supercell.
+
+        Parameters
+        ----------
+        raw_force_constant : raw.ForceConstant
+            Force constants and structure of the supercell.
+        supercell : int or np.ndarray
+            How often the primitive cell is repeated along every lattice vector, either
+            a single integer, three integers, or a 3x3 integer matrix.
+        masses : dict
+            Masses in amu for some or all elements overriding the standard values.
+        """
+        _raise_error_if_selective_dynamics(raw_force_constant)
+        structure = StructureHandler.from_data(raw_force_constant.structure)
+        lattice_vectors = _last_step(structure.lattice_vectors())
+        positions = _last_step(structure.cartesian_positions())
+        supercell = _parse_supercell(supercell)
+        primitive_vectors = np.linalg.solve(supercell, lattice_vectors)
+        labels = _primitive_atoms(positions, primitive_vectors, supercell)
+        representatives = np.unique(labels, return_index=True)[1]
+        mass = structure._stoichiometry().masses(masses)
+        force_constants = -_symmetrize(raw_force_constant.force_constants[:])
+        factory = _BlockFactory(
+            lattice_vectors, primitive_vectors, positions, labels, mass, force_constants
+        )
+        blocks = [factory.block(representative) for representative in representatives]
+        vectors, blocks = zip(*blocks)
+        return cls(len(representatives), list(vectors), list(blocks))
+
+    def __call__(self, qpoints):
+        """Evaluate the dynamical matrix at the given q points.
+
+        Parameters
+        ----------
+        qpoints : np.ndarray
+            q points in fractional coordinates of the primitive reciprocal lattice.
+
+        Returns
+        -------
+        np.ndarray
+            Hermitian dynamical matrices with shape (q points, 3 atoms, 3 atoms).
+        """
+        qpoints = np.atleast_2d(qpoints)
+        number_modes = 3 * self.number_atoms
+        rows = [
+            (np.exp(2j * np.pi * qpoints @ vectors.T) @ blocks).reshape(
+                -1, 3, number_modes
+            )
+            for vectors, blocks in zip(self.vectors, self.blocks)
+        ]
+        matrix = np.concatenate(rows, axis=1)
+        return 0.5 * (matrix + np.conj(np.swapaxes(matrix, 1, 2)))
+
+    def diagonalize(
+        self, qpoints, eigenvectors=False, workers=1, chunk_size=CHUNK_SIZE
+    ):
+        """Compute phonon frequencies and optionally eigenvectors at the q points.
+
+        Parameters
+        ----------
+        qpoints : np.ndarray
+            q points in fractional coordinates of the primitive reciprocal lattice.
+        eigenvectors : bool
+            Whether the eigenvectors are computed and returned as well.
+        workers : int
+            Number of threads used to diagonalize the chunks of q points.
+        chunk_size : int
+            Number of q points set up and diagonalized together.
+
+        Returns
+        -------
+        dict
+            The frequencies in THz with imaginary modes represented by negative values
+            and, if requested, the eigenvectors with shape (q points, modes, atoms, 3).
+        """
+        check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+        qpoints = np.atleast_2d(np.asarray(qpoints, dtype=np.float64))
+        chunks = [
+            qpoints[i : i + chunk_size] for i in range(0, len(qpoints), chunk_size)
+        ]
+        diagonalize_chunk = lambda chunk: self._diagonalize_chunk(chunk, eigenvectors)
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                results = list(executor.map(diagonalize_chunk, chunks))
+        else:
+            results = [diagonalize_chunk(chunk) for chunk in chunks]
+        frequencies = np.concatenate([result[0] for result in results])
+        result = {"frequencies": frequencies}
+        if eigenvectors:
+            result["eigenvectors"] = np.concatenate([result[1] for result in results])
+        return result
+
+    def _diagonalize_chunk(self, qpoints, compute_eigenvectors):
+        matrices = self(qpoints)
+        if not compute_eigenvectors:
+            return _to_frequencies(np.linalg.eigvalsh(matrices)), None
+        eigenvalues, eigenvectors = np.linalg.eigh(matrices)
+        eigenvectors = np.swapaxes(eigenvectors, 1, 2)
+        shape = eigenvectors.shape[:2] + (self.number_atoms, 3)
+        return _to_frequencies(eigenvalues), eigenvectors.reshape(shape)
+
+
+@dataclasses.dataclass
+class _BlockFactory:
+    lattice_vectors: np.ndarray
+    primitive_vectors: np.ndarray
+    positions: np.ndarray
+    labels: np.ndarray
+    masses: np.ndarray
+    force_constants: np.ndarray
+
+    def block(self, representative):
+        vectors, weights, atoms = self._shortest_images(representative)
+        number_modes = 3 * len(np.unique(self.labels))
+        block = np.zeros((len(atoms), 3, number_modes))
+        columns = 3 * self.labels[atoms, np.newaxis] + np.arange(3)
+        mass = np.sqrt(self.masses[representative] * self.masses[atoms])
+        scale = (weights / mass)[:, np.newaxis]
+        for direction in range(3):
+            force_constants = self.force_constants[3 * representative + direction]
+            values = force_constants[3 * atoms[:, np.newaxis] + np.arange(3)] * scale
+            np.put_along_axis(block[:, direction], columns, values, axis=1)
+        primitive_coordinates = vectors @ np.linalg.inv(self.primitive_vectors)
+        return primitive_coordinates, block.reshape(len(atoms), -1)
+
+    def _shortest_images(self, representative):
+        inverse_lattice = np.linalg.inv(self.lattice_vectors)
+        difference = (self.positions - self.positions[representative]) @ inverse_lattice
+        difference -= np.round(difference)
+        translations = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+        images = difference[:, np.newaxis] + translations
+        images = images @ self.lattice_vectors
+        distances = np.linalg.norm(images, axis=-1)
+        shortest = distances <= distances.min(axis=1, keepdims=True) + _TOLERANCE
+        multiplicity = np.count_nonzero(shortest, axis=1)
+        atoms, image = np.nonzero(shortest)
+        weights = 1 / multiplicity[atoms]
+        return images[atoms, image], weights, atoms
+
+
+def _raise_error_if_selective_dynamics(raw_force_constant):
+    selective_dynamics = raw_force_constant.selective_dynamics
+    if check.is_none(selective_dynamics) or np.all(selective_dynamics[:]):
+        return
+    message = (
+        "The Fourier interpolation requires the force constants of all atoms in all "
+        "directions. Please rerun VASP without selective dynamics."
+    )
+    raise exception.NotImplemented(message)
+
+
+def _last_step(array):
+    return array[-1] if array.ndim == 3 else array
+
+
+def _parse_supercell(supercell):
+    matrix = np.asarray(supercell)
+    if matrix.ndim < 2 and matrix.size in (1, 3):
+        matrix = np.diag(np.broadcast_to(matrix, 3))
+    if (
+        matrix.shape != (3, 3)
+        or not np.allclose(matrix, np.round(matrix))
+        or np.isclose(np.linalg.det(matrix), 0)
+    ):
+        message = (
+            f"The supercell {supercell} is not valid. Please provide an integer, "
+            "three integers or a 3x3 integer matrix with nonzero determinant."
+        )
+        raise exception.IncorrectUsage(message)
+    return np.round(matrix)
+
+
+def _primitive_atoms(positions, primitive_vectors, supercell):
+    coordinates = positions @ np.linalg.inv(primitive_vectors)
+    difference = coordinates[:, np.newaxis] - coordinates[np.newaxis]
+    difference -= np.round(difference)
+    distances = np.linalg.norm(difference @ primitive_vectors, axis=-1)
+    equivalent = distances < _TOLERANCE
+    first_equivalent = np.argmax(equivalent, axis=1)
+    _, labels, counts = np.unique(
+        first_equivalent, return_inverse=True, return_counts=True
+    )
+    number_cells = round(abs(np.linalg.det(supercell)))
+    if np.any(counts != number_cells):
+        message = (
+            f"The structure is not a {supercell.astype(int).tolist()} supercell of a "
+            "primitive cell. Please check the supercell you provided."
+        )
+        raise exception.IncorrectUsage(message)
+    return labels
+
+
+def _symmetrize(force_constants):
+    return 0.5 * (force_constants + force_constants.T)
+
+
+def _to_frequencies(eigenvalues):
+    return np.sign(eigenvalues) * np.sqrt(np.abs(eigenvalues)) * _TO_THZ
+
+
+def mesh(shape):
+    """Generate a Γ-centered mesh of q points.
+
+    Parameters
+    ----------
+    shape : int or np.ndarray
+        Number of q points along every reciprocal lattice vector.
+
+    Returns
+    -------
+    np.ndarray
+        q points in fractional coordinates.
+    """
+    shape = np.broadcast_to(shape, 3)
+    axes = [np.arange(number) / number for number in shape]
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
@@ -0,0 +1,479 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Combine grid quantities of several calculations without loading them into memory.
+
+Charge-density differences, sums of spin densities, or averages over snapshots need
+the grids of several calculations. Instead of reading every grid with ``to_numpy``,
+a :class:`GridExpression` only refers to the datasets in the HDF5 files. Every
+supported operation (addition, subtraction, scaling, and thereby averaging) is
+linear, so an expression is a weighted sum of its operands. When the result is
+needed, the files are opened again and the sum is accumulated slab by slab along the
+third lattice vector. Only one slab of every operand is held in memory at any time;
+plotting a plane or integrating within Bader basins never creates the full grid of
+an operand.
+"""
+
+import contextlib
+import dataclasses
+import numbers
+from typing import Optional, Union
+
+import numpy as np
+
+from py4vasp import _config, exception
+from py4vasp._calculation.bader import _combine_source
+from py4vasp._calculation.dispatch import _parse_selections
+from py4vasp._third_party import graph, view
+from py4vasp._util import documentation, grid
+from py4vasp._util.density import SliceArguments, Visualizer
+
+SLAB_BYTES = 2**26
+"Maximal size of the slab read from every operand at once."
+
+CELL_TOLERANCE = 1e-5
+"Maximal difference of the lattice vectors (in Å) for which two grids are compatible."
+
+
+def from_quantity(quantity, selection=None, **options):
+    """Create an expression referring to a single grid of a quantity.
+
+    The data is accessed once to check the selection and to determine the grid and
+    the cell, but the grid itself is not read.
+
+    Parameters
+    ----------
+    quantity
+        A dispatcher whose handler implements ``_grid_terms(selection, **options)``
+        returning the label and a list of ``(weight, data, index)`` such that the
+        grid is the weighted sum of ``data[index]``.
+    selection : str or None
+        Selects a single grid of the quantity.
+    options
+        Further arguments passed to ``_grid_terms``, e.g., band and k-point index.
+
+    Returns
+    -------
+    GridExpression
+        An expression that evaluates to the selected grid.
+    """
+    selection = _combine_source(quantity, selection)
+    contexts = _parse_selections(quantity._quantity_name, selection)
+    if len(contexts) != 1:
+        message = f"The selection {selection!r} selects several sources. A grid expression refers to a single grid, please combine the sources with + or - instead."
+        raise exception.IncorrectUsage(message)
+    operand = _Operand(
+        quantity._source,
+        quantity._quantity_name,
+        quantity._handler_factory,
+        contexts[0],
+        tuple(options.items()),
+    )
+    with contextlib.ExitStack() as stack:
+        handler, label, terms = operand.open(stack)
+        lattice_vectors = np.asarray(handler._structure().lattice_vectors())
+        shapes = {data[index].shape for _, data, index in terms}
+    if len(shapes) != 1:
+        raise exception._Py4VaspInternalError(f"The terms have the shapes {shapes}.")
+    (shape,) = shapes
+    return GridExpression({operand: 1.0}, shape, lattice_vectors, label)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Operand:
+    source: object
+    quantity_name: str
+    handler_factory: object
+    context: object
+    options: tuple
+
+    def open(self, stack):
+        raw_data = stack.enter_context(
+            self.source.access(
+                self.quantity_name, selection=self.context.selection_name
+            )
+        )
+        handler = self.handler_factory(raw_data)
+        selection = self.context.remaining_selection
+        label, terms = handler._grid_terms(selection, **dict(self.options))
+        return handler, label, terms
+
+
+class GridExpression:
+    """A weighted sum of grid quantities that is evaluated only on demand.
+
+    Obtain an expression with the ``lazy`` method of a density or a potential and
+    combine it with other expressions on the same grid using ``+`` and ``-``, or
+    scale it by a number. Averaging follows as ``sum(expressions) / len(expressions)``.
+    All operands must be defined on the same grid in the same cell. The grid
+    quantities are read from the files only when you convert the expression, e.g.,
+    with :meth:`to_numpy` or :meth:`to_contour`, and then one slab at a time.
+
+    Examples
+    --------
+    Compute the charge-density difference of a compound AB and its parts A and B
+
+    >>> AB = py4vasp.Calculation.from_path("AB")
+    >>> A = py4vasp.Calculation.from_path("A")
+    >>> B = py4vasp.Calculation.from_path("B")
+    >>> difference = AB.density.lazy() - A.density.lazy() - B.density.lazy()
+    >>> difference.to_contour(c=0.5)
+
+    Average the density over several snapshots of an MD run
+
+    >>> densities = [calculation.density.lazy() for calculation in snapshots]
+    >>> average = sum(densities) / len(densities)
+    >>> average.write("CHGCAR_average")
+    """
+
+    def __init__(self, operands, shape, lattice_vectors, label):
+        self._operands = operands
+        self._shape = shape
+        self._lattice_vectors = lattice_vectors
+        self._label = label
+
+    def __str__(self):
+        nz, ny, nx = self._shape
+        return f"""grid expression:
+    {self._label}
+    operands: {len(self._operands)}
+    grid: {nx}, {ny}, {nz}"""
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+    @property
+    def shape(self):
+        "The number of grid points along the three lattice vectors."
+        return self._shape[::-1]
+
+    @property
+    def ndim(self):
+        return 3
+
+    @property
+    def label(self):
+        "A description of the expression derived from the labels of its operands."
+        return self._label
+
+    def __add__(self, other):
+        if not isinstance(other, GridExpression):
+            return NotImplemented
+        self._raise_error_if_incompatible(other)
+        operands = dict(self._operands)
+        for operand, coefficient in other._operands.items():
+            operands[operand] = operands.get(operand, 0.0) + coefficient
+        label = f"{self._label} + {_parenthesize(other._label)}"
+        return GridExpression(operands, self._shape, self._lattice_vectors, label)
+
+    def __radd__(self, other):
+        # allows to sum a list of expressions with the builtin sum starting at 0
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+        return NotImplemented
+
+    def __neg__(self):
+        return self._scale(-1, f"-{_parenthesize(self._label)}")
+
+    def __sub__(self, other):
+        if not isinstance(other, GridExpression):
+            return NotImplemented
+        difference = self + (-other)
+        difference._label = f"{self._label} - {_parenthesize(other._label)}"
+        return difference
+
+    def __mul__(self, factor):
+        if not _is_real(factor):
+            return NotImplemented
+        return self._scale(factor, f"{factor:g} * {_parenthesize(self._label)}")
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor):
+        if not _is_real(divisor):
+            return NotImplemented
+        if divisor == 0:
+            raise exception.IncorrectUsage("Cannot divide a grid expression by zero.")
+        return self._scale(1 / divisor, f"{_parenthesize(self._label)} / {divisor:g}")
+
+    def __getitem__(self, key):
+        """Evaluate the expression for a subset of the grid.
+
+        The key indexes the grid in the same order as :meth:`to_numpy`. Only the
+        selected grid points are read from the files, e.g., ``expression[:, :, 0]``
+        reads a single plane.
+        """
+        key = _expand_key(key)
+        with self._open() as terms:
+            result = _accumulate(terms, key[::-1])
+        return np.transpose(result)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.to_numpy(), dtype=dtype)
+
+    @documentation.format(parameters=grid.PARAMETERS)
+    def to_numpy(self, *, stride=None, region=None):
+        """Evaluate the expression on the grid.
+
+        The operands are read slab by slab, so only the result is held in memory at
+        full size. Use stride and region to evaluate only a part of the grid.
+
+        Parameters
+        ----------
+        {parameters}
+
+        Returns
+        -------
+        np.ndarray
+            The value of the expression on every selected grid point.
+        """
+        return grid.read(_FileOrder(self), stride, region)[0].T
+
+    @documentation.format(resolution=grid.RESOLUTION)
+    def to_view(
+        self,
+        supercell: Optional[Union[int, np.ndarray]] = None,
+        *,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
+        isolevel: float = 0.2,
+        color: Optional[str] = None,
+        opacity: float = 0.6,
+    ) -> view.View:
+        """Plot an isosurface of the expression within the structure.
+
+        If any operand enters with a negative weight, e.g., for density differences,
+        the expression is signed and isosurfaces for positive (blue) and negative
+        (red) values are shown.
+
+        Parameters
+        ----------
+        supercell : int | np.ndarray | None = None
+            If present the data is replicated the specified number of times along each
+            direction.
+
+        {resolution}
+        isolevel : float
+            The value at which the isosurface is drawn.
+        color : str or None
+            Color of the isosurface of an unsigned expression.
+        opacity : float
+            Opacity of the isosurfaces.
+
+        Returns
+        -------
+        View
+            Visualize an isosurface of the expression within the 3d structure.
+        """
+        data = grid.downsample(_FileOrder(self), resolution, downsampling)
+        with self._structure() as structure:
+            viewer = structure.to_view(supercell)
+        if self._is_signed():
+            isosurfaces = [
+                view.Isosurface(isolevel, _config.VASP_COLORS["blue"], opacity),
+                view.Isosurface(-isolevel, _config.VASP_COLORS["red"], opacity),
+            ]
+        else:
+            color = color or _config.VASP_COLORS["cyan"]
+            isosurfaces = [view.Isosurface(isolevel, color, opacity)]
+        viewer.grid_scalars = [
+            view.GridQuantity(
+                quantity=np.asarray(data)[0].T[np.newaxis],
+                label=self._label,
+                isosurfaces=isosurfaces,
+                sign_mode="mixed" if self._is_signed() else "continuous",
+            )
+        ]
+        return viewer
+
+    def to_contour(
+        self,
+        *,
+        a: Optional[float] = None,
+        b: Optional[float] = None,
+        c: Optional[float] = None,
+        normal: Optional[str] = None,
+        supercell: Optional[Union[int, np.ndarray]] = None,
+        isolevels: bool = True,
+    ) -> graph.Graph:
+        """Generate a contour plot of the expression in a plane of the cell.
+
+        Only the grid points in the plane are read from the files. Please refer to
+        ``Density.to_contour`` for a description of how the plane is selected.
+
+        Parameters
+        ----------
+        a, b, c : float or None
+            Select exactly one of them to cut the cell at this fraction of the
+            respective lattice vector.
+        normal : str or None
+            Rotate the plane such that its normal aligns with a Cartesian axis.
+        supercell : int | np.ndarray | None = None
+            Replicate the contour plot periodically a given number of times.
+        isolevels : bool
+            Draw isolevels or, if False, a heatmap.
+
+        Returns
+        -------
+        Graph
+            A contour plot in the plane spanned by the 2 remaining lattice vectors.
+        """
+        slice_arguments = SliceArguments(a, b, c, normal, supercell)
+        with self._structure() as structure:
+            visualizer = Visualizer(structure)
+            return visualizer.to_contour(
+                {self._label: self}, slice_arguments, isolevels
+            )
+
+    def bader_charge(self, *, bader_analysis):
+        """Integrate the expression within Bader basins.
+
+        Parameters
+        ----------
+        bader_analysis : BaderAnalysis
+            The basins to integrate in, obtained from ``Density.bader_analysis``.
+            They must be defined on the same grid as the expression.
+
+        Returns
+        -------
+        dict
+            Maps every atom label to the value of the expression integrated within
+            its basin.
+        """
+        basins = np.asarray(bader_analysis.basins())
+        if basins.shape != self.shape:
+            message = f"The grid expression has shape {self.shape} which does not match the grid {basins.shape} used to construct the basins."
+            raise exception.IncorrectUsage(message)
+        names = list(bader_analysis.charges())
+        totals = np.zeros(len(names))
+        with self._open() as terms:
+            for slab in self._slabs():
+                values = _accumulate(terms, (slab, slice(None), slice(None)))
+                labels = np.transpose(basins[:, :, slab])
+                totals += np.bincount(
+                    labels.ravel(), weights=values.ravel(), minlength=len(names)
+                )[: len(names)]
+        return dict(zip(names, totals / basins.size))
+
+    def write(self, filename):
+        """Write the expression to a file in the volumetric format of VASP.
+
+        The file contains the structure in POSCAR format followed by the grid in the
+        same layout as the CHGCAR or LOCPOT file, so that it can be read by other
+        tools. The grid is evaluated and written slab by slab.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The file the grid is written to. It is overwritten if it exists.
+        """
+        nz, ny, nx = self._shape
+        with self._structure() as structure:
+            header = str(structure)
+        with open(filename, "w") as file, self._open() as terms:
+            file.write(f"{header.rstrip()}\n\n{nx:5d}{ny:5d}{nz:5d}\n")
+            # VASP writes 5 values per line continuing across the planes
+            remainder = np.empty(0)
+            for slab in self._slabs():
+                values = _accumulate(terms, (slab, slice(None), slice(None)))
+                values = np.concatenate((remainder, values.ravel()))
+                number_complete = len(values) - len(values) % 5
+                np.savetxt(file, values[:number_complete].reshape(-1, 5), fmt="%18.11E")
+                remainder = values[number_complete:]
+            if len(remainder) > 0:
+                np.savetxt(file, remainder[np.newaxis], fmt="%18.11E")
+
+    def _scale(self, factor, label):
+        operands = {
+            operand: factor * coefficient
+            for operand, coefficient in self._operands.items()
+        }
+        return GridExpression(operands, self._shape, self._lattice_vectors, label)
+
+    def _is_signed(self):
+        return any(coefficient < 0 for coefficient in self._operands.values())
+
+    def _slabs(self):
+        nz, ny, nx = self._shape
+        thickness = max(1, SLAB_BYTES // (8 * ny * nx))
+        for start in range(0, nz, thickness):
+            yield slice(start, min(start + thickness, nz))
+
+    @contextlib.contextmanager
+    def _open(self):
+        # yields the weighted terms of all operands while the files are open
+        with contextlib.ExitStack() as stack:
+            terms = []
+            for operand, coefficient in self._operands.items():
+                _, _, operand_terms = operand.open(stack)
+                terms.extend(
+                    (coefficient * weight, data, index)
+                    for weight, data, index in operand_terms
+                )
+            yield terms
+
+    @contextlib.contextmanager
+    def _structure(self):
+        # all operands share the cell, so the structure of the first one is used
+        with contextlib.ExitStack() as stack:
+            handler, _, _ = next(iter(self._operands)).open(stack)
+            yield handler._structure()
+
+    def _raise_error_if_incompatible(self, other):
+        if self._shape != other._shape:
+            message = f"The grid expressions are defined on different grids {self.shape} and {other.shape}."
+            raise exception.IncorrectUsage(message)
+        difference = np.abs(self._lattice_vectors - other._lattice_vectors)
+        if np.max(difference) > CELL_TOLERANCE:
+            message = f"The grid expressions are defined in different cells, the lattice vectors differ by up to {np.max(difference):.2e} Å."
+            raise exception.IncorrectUsage(message)
+
+
+class _FileOrder:
+    # view of the expression in the layout of the file, i.e., (component, z, y, x)
+    # with a single component, as expected by the routines of py4vasp._util.grid
+
+    def __init__(self, expression):
+        self._expression = expression
+        self.shape = (1,) + expression._shape
+
+    def __len__(self):
+        return 1
+
+    def __getitem__(self, key):
+        key = _expand_key(key, ndim=4)
+        with self._expression._open() as terms:
+            result = _accumulate(terms, key[1:])
+        return result[np.newaxis][key[0]]
+
+    def __array__(self, dtype=None, copy=None):
+        result = np.empty(self.shape, dtype=dtype or np.float64)
+        with self._expression._open() as terms:
+            for slab in self._expression._slabs():
+                key = (slab, slice(None), slice(None))
+                result[0, slab] = _accumulate(terms, key)
+        return result
+
+
+def _accumulate(terms, key):
+    result = 0
+    for coefficient, data, index in terms:
+        result = result + coefficient * np.asarray(data[index + key])
+    return result
+
+
+def _expand_key(key, ndim=3):
+    if not isinstance(key, tuple):
+        key = (key,)
+    if any(entry is Ellipsis for entry in key) or len(key) > ndim:
+        message = f"Index grid expressions with up to {ndim} integers or slices."
+        raise exception.IncorrectUsage(message)
+    return key + (slice(None),) * (ndim - len(key))
+
+
+def _parenthesize(label):
+    is_compound = any(operator in label for operator in (" + ", " - ", " * ", " / "))
+    return f"({label})" if is_compound or label.startswith("-") else label
+
+
+def _is_real(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
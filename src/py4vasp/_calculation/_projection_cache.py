@@ -0,0 +1,125 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Cache of projections summed over the atoms of each element and the orbitals of
+each angular momentum channel.
+
+Selections like "Fe(d), O(p)" only combine whole elements and angular momenta. For
+these selections, it suffices to reduce the full atom- and orbital-resolved
+projections once to a tensor with shape (spin, element, channel, ...). When the
+cache is enabled, this tensor is stored next to the VASP output in a sidecar HDF5
+file, so that later selections and later sessions read only the small tensor. The
+sidecar is recomputed whenever the VASP output file changes.
+"""
+
+import contextlib
+import contextvars
+import os
+import pathlib
+
+import h5py
+import numpy as np
+
+from py4vasp._util import profile
+
+SUFFIX = ".projections.h5"
+
+_ENABLED = contextvars.ContextVar("projection_cache", default=False)
+
+
+@contextlib.contextmanager
+def enabled(active=True):
+    "Enable or disable the projection cache within the context."
+    token = _ENABLED.set(active)
+    try:
+        yield
+    finally:
+        _ENABLED.reset(token)
+
+
+def is_enabled():
+    "Check whether projections should be taken from the cache."
+    return _ENABLED.get()
+
+
+def sidecar_filename(filename):
+    "Return the name of the file in which the projections of *filename* are cached."
+    filename = pathlib.Path(filename)
+    return filename.with_name(filename.stem + SUFFIX)
+
+
+def load_or_compute(projections, elements, channels):
+    """Reduce the projections to elements and angular momentum channels.
+
+    Parameters
+    ----------
+    projections : VaspData
+        The projections with shape (spin, atom, orbital, ...) as written by VASP.
+    elements : dict
+        Maps every element to the indices of its atoms.
+    channels : dict
+        Maps every angular momentum channel to the indices of its orbitals.
+
+    Returns
+    -------
+    np.ndarray or None
+        The reduced projections with shape (spin, element, channel, ...) or None if
+        the projections are not read from a file and therefore cannot be cached.
+    """
+    dataset = getattr(projections, "data", None)
+    if not isinstance(dataset, h5py.Dataset):
+        return None
+    source = dataset.file.filename
+    filename = sidecar_filename(source)
+    attributes = {
+        "source_mtime_ns": os.stat(source).st_mtime_ns,
+        "source_size": os.stat(source).st_size,
+        "elements": list(elements),
+        "channels": list(channels),
+    }
+    reduced = _load(filename, dataset.name, attributes)
+    if reduced is not None:
+        profile.cache_hit(filename)
+        return reduced
+    reduced = _reduce(dataset, elements, channels)
+    _store(filename, dataset.name, attributes, reduced)
+    return reduced
+
+
+def _load(filename, key, attributes):
+    try:
+        with h5py.File(filename, "r") as file:
+            if key not in file or not _is_current(file[key].attrs, attributes):
+                return None
+            return file[key][()]
+    except OSError:
+        return None
+
+
+def _is_current(stored, attributes):
+    return all(
+        key in stored and np.array_equal(stored[key], value)
+        for key, value in attributes.items()
+    )
+
+
+def _reduce(dataset, elements, channels):
+    shape = dataset.shape
+    reduced = np.zeros((shape[0], len(elements), len(channels), *shape[3:]))
+    for i, atoms in enumerate(elements.values()):
+        # read one element at a time to limit the memory to the atoms of one element
+        element_projections = np.sum(dataset[:, atoms], axis=1)
+        for j, orbitals in enumerate(channels.values()):
+            reduced[:, i, j] = np.sum(element_projections[:, orbitals], axis=1)
+    return reduced
+
+
+def _store(filename, key, attributes, reduced):
+    try:
+        with h5py.File(filename, "a") as file:
+            if key in file:
+                del file[key]
+            dataset = file.create_dataset(key, data=reduced)
+            dataset.attrs.update(attributes)
+    except OSError:
+        # the cache is an optimization; a read-only directory must not fail the plot
+        pass
@@ -15,6 +15,7 @@ from py4vasp._calculation.selection import Selection
 from py4vasp._raw.models import StoichiometryModel
 from py4vasp._util import check, convert, database, documentation, import_, select
 
+ase_data = import_.optional("ase.data")
 mdtraj = import_.optional("mdtraj")
 pd = import_.optional("pandas")
 
@@ -105,6 +106,29 @@ class StoichiometryHandler:
         """Return the number of atoms in the system."""
         return int(np.sum(self._raw_stoichiometry.number_ion_types))
 
+    def masses(self, masses=None, ion_types=None) -> np.ndarray:
+        """Return the mass of every atom in amu.
+
+        Parameters
+        ----------
+        masses : dict
+            Masses in amu for some or all elements overriding the standard values.
+        """
+        masses = masses or {}
+        try:
+            return np.array(
+                [
+                    masses.get(element)
+                    or ase_data.atomic_masses[ase_data.atomic_numbers[element]]
+                    for element in self.elements(ion_types)
+                ]
+            )
+        except KeyError as error:
+            message = (
+                f"The mass of {error} is not known. Please provide it with `masses`."
+            )
+            raise exception.IncorrectUsage(message) from None
+
     def to_database(self) -> StoichiometryModel:
         """Return database-ready stoichiometry data."""
         ion_types = (
@@ -0,0 +1,91 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Stream columns of trajectory data into Parquet or Arrow files.
+
+Quantities that are resolved per ionic step, e.g., the energy of a long MD run, can
+contain many more rows than fit comfortably into a DataFrame. The handlers of these
+quantities read the HDF5 file chunk by chunk and pass the resulting columns to
+:func:`write`, which appends every chunk to the output file as it arrives. This
+avoids creating the intermediate Series of a Graph and the memory needed to hold all
+rows at once.
+"""
+
+import pathlib
+
+import numpy as np
+
+from py4vasp import exception
+from py4vasp._util import check, import_
+
+pa = import_.optional("pyarrow")
+pa_parquet = import_.optional("pyarrow.parquet")
+
+CHUNK_SIZE = 65536
+"Default number of rows read from the file and written at once."
+
+SUFFIXES = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+"Map from the file suffix to the format of the table."
+
+
+def chunks(rows, chunk_size=CHUNK_SIZE):
+    """Split a range of rows into slices of at most *chunk_size* rows.
+
+    Parameters
+    ----------
+    rows : range
+        The steps in the file that form the rows of the table.
+    chunk_size : int
+        Maximal number of rows in every slice.
+    """
+    check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        yield slice(chunk.start, chunk.stop, chunk.step)
+
+
+def write(filename, columns):
+    """Write the columns into a Parquet or Arrow file chunk by chunk.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The file the table is written to. Files ending in .parquet or .pq are written
+        in the Parquet format, files ending in .arrow or .feather in the Arrow IPC
+        format.
+    columns : Iterable[dict]
+        Every entry maps the name of the columns to the values of one chunk of rows.
+        All chunks must contain the same columns.
+    """
+    format = _get_format(filename)
+    writer = None
+    try:
+        for chunk in columns:
+            table = pa.table({key: np.asarray(value) for key, value in chunk.items()})
+            if writer is None:
+                writer = _open_writer(filename, format, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise exception.NoData(f"There is no data to write to {filename}.")
+
+
+def _get_format(filename):
+    suffix = pathlib.Path(filename).suffix.lower()
+    try:
+        return SUFFIXES[suffix]
+    except KeyError:
+        message = f"Cannot write a table to {filename}. Please use one of the suffixes {', '.join(SUFFIXES)}."
+        raise exception.IncorrectUsage(message) from None
+
+
+def _open_writer(filename, format, schema):
+    if format == "parquet":
+        return pa_parquet.ParquetWriter(filename, schema)
+    return pa.ipc.new_file(filename, schema)
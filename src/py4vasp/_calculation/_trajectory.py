@@ -0,0 +1,386 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Stream the frames of an MD or relaxation trajectory into trajectory files.
+
+In contrast to the ``to_X`` methods of :class:`~py4vasp._calculation.structure.Structure`,
+the writers in this module never hold the whole trajectory in memory. The frames are
+read chunk by chunk from the HDF5 file and written to the output file directly, so
+the memory footprint is independent of the length of the trajectory. Where the VASP
+output contains them, forces, velocities, and energies are written alongside the
+positions.
+"""
+
+import contextlib
+import dataclasses
+from typing import Optional
+
+import numpy as np
+
+from py4vasp import exception, raw
+from py4vasp._calculation._stoichiometry import StoichiometryHandler
+from py4vasp._calculation.cell import CellHandler
+from py4vasp._util import check, convert, import_
+
+ase = import_.optional("ase")
+ase_io = import_.optional("ase.io")
+ase_singlepoint = import_.optional("ase.calculators.singlepoint")
+ase_units = import_.optional("ase.units")
+
+FORMATS = ("lammps-dump", "extxyz", "ase-traj")
+"Trajectory formats supported by :func:`write`."
+
+CHUNK_SIZE = 256
+"Default number of frames read from the file at once."
+
+_FS_TO_PS = 1000  # LAMMPS metal units use Å/ps for velocities, VASP uses Å/fs
+_ENERGY_LABEL = "TOTEN"
+
+
+@dataclasses.dataclass
+class Chunk:
+    """Consecutive frames of a trajectory read from the VASP output at once."""
+
+    steps: np.ndarray
+    "Index of every frame in the trajectory (0-based)."
+    lattice_vectors: np.ndarray
+    "Lattice vectors of every frame in Å."
+    positions: np.ndarray
+    "Positions of all ions in every frame in direct coordinates."
+    forces: Optional[np.ndarray] = None
+    "Forces on all ions in every frame in eV/Å, if VASP wrote them."
+    velocities: Optional[np.ndarray] = None
+    "Velocities of all ions in every frame in Å/fs, if VASP wrote them."
+    energies: Optional[np.ndarray] = None
+    "Energy (TOTEN) of every frame in eV, if VASP wrote it."
+
+    def cartesian(self, vectors):
+        return vectors @ self.lattice_vectors
+
+
+class Frames:
+    """Read a trajectory chunkwise from the raw data.
+
+    Parameters
+    ----------
+    raw_structure : raw.Structure
+        The trajectory of the structure.
+    raw_force, raw_velocity, raw_energy
+        Optional data that is attached to every frame if it is present and its
+        number of steps matches the one of the structure.
+    steps : int or slice or None
+        Select which frames of the trajectory are read. Defaults to all of them.
+    """
+
+    def __init__(
+        self,
+        raw_structure,
+        raw_force=None,
+        raw_velocity=None,
+        raw_energy=None,
+        steps=None,
+    ):
+        self._raw_structure = raw_structure
+        self._scale = CellHandler.from_data(raw_structure.cell).scale()
+        self._forces = self._optional_data(raw_force, raw.Force, "forces")
+        self._velocities = self._optional_data(raw_velocity, raw.Velocity, "velocities")
+        self._energies, self._energy_index = self._energy_data(raw_energy)
+        self._range = self._select_range(steps)
+
+    @classmethod
+    @contextlib.contextmanager
+    def from_source(cls, source, selection=None, steps=None):
+        """Open the structure and the accompanying data from *source*.
+
+        The structure is mandatory, forces, velocities, and energies are silently
+        skipped if they cannot be accessed.
+        """
+        with contextlib.ExitStack() as stack:
+            raw_structure = stack.enter_context(
+                source.access("structure", selection=selection)
+            )
+            raw_force = _enter_optional(stack, source, "force")
+            raw_velocity = _enter_optional(stack, source, "velocity")
+            raw_energy = _enter_optional(stack, source, "energy")
+            yield cls(raw_structure, raw_force, raw_velocity, raw_energy, steps)
+
+    def __len__(self):
+        return len(self._range)
+
+    def elements(self):
+        "Return the element of every ion."
+        return StoichiometryHandler.from_data(
+            self._raw_structure.stoichiometry
+        ).elements()
+
+    def ion_types(self):
+        "Return the 1-based index of the ion type of every ion."
+        number_ion_types = np.asarray(
+            self._raw_structure.stoichiometry.number_ion_types
+        )
+        return np.repeat(np.arange(len(number_ion_types)) + 1, number_ion_types)
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """Iterate over the selected frames in chunks of at most *chunk_size* frames."""
+        check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+        for start in range(0, len(self._range), chunk_size):
+            yield self._read_chunk(self._range[start : start + chunk_size])
+
+    @property
+    def has_forces(self):
+        return self._forces is not None
+
+    @property
+    def has_velocities(self):
+        return self._velocities is not None
+
+    @property
+    def has_energies(self):
+        return self._energies is not None
+
+    def _number_steps(self):
+        positions = self._raw_structure.positions
+        return len(positions) if positions.ndim == 3 else 1
+
+    def _select_range(self, steps):
+        frames = range(self._number_steps())
+        try:
+            if steps is None:
+                return frames
+            if isinstance(steps, slice):
+                selected = frames[steps]
+            else:
+                selected = frames[steps : steps + 1 or None]
+        except (TypeError, ValueError) as error:
+            message = f"Could not select the steps {steps!r} of the trajectory."
+            raise exception.IncorrectUsage(message) from error
+        if len(selected) == 0:
+            message = f"The steps {steps!r} do not select any frame of the trajectory."
+            raise exception.IncorrectUsage(message)
+        if selected.step < 0:
+            message = "Streaming a trajectory in reverse order is not supported."
+            raise exception.NotImplemented(message)
+        return selected
+
+    def _optional_data(self, raw_data, type_, field):
+        if not isinstance(raw_data, type_):
+            return None
+        data = getattr(raw_data, field)
+        if check.is_none(data) or not self._matches_structure(data, default_ndim=2):
+            return None
+        return data
+
+    def _energy_data(self, raw_energy):
+        if not isinstance(raw_energy, raw.Energy) or check.is_none(raw_energy.values):
+            return None, None
+        labels = [convert.text_to_string(label).split() for label in raw_energy.labels]
+        for index, label in enumerate(labels):
+            if label and label[-1] == _ENERGY_LABEL:
+                break
+        else:
+            return None, None
+        if not self._matches_structure(raw_energy.values, default_ndim=1):
+            return None, None
+        return raw_energy.values, index
+
+    def _matches_structure(self, data, default_ndim):
+        if data.ndim == default_ndim:
+            return self._number_steps() == 1
+        return len(data) == self._number_steps()
+
+    def _read_chunk(self, frames):
+        key = slice(frames.start, frames.stop, frames.step)
+        lattice_vectors = self._read(self._raw_structure.cell.lattice_vectors, key, 2)
+        lattice_vectors = self._scale * np.broadcast_to(
+            lattice_vectors, (len(frames), 3, 3)
+        )
+        chunk = Chunk(
+            steps=np.asarray(frames),
+            lattice_vectors=lattice_vectors,
+            positions=self._read(self._raw_structure.positions, key, 2),
+        )
+        if self.has_forces:
+            chunk.forces = self._read(self._forces, key, 2)
+        if self.has_velocities:
+            chunk.velocities = self._read(self._velocities, key, 2)
+        if self.has_energies:
+            chunk.energies = self._read(self._energies, key, 1)[:, self._energy_index]
+        return chunk
+
+    def _read(self, data, key, default_ndim):
+        if data.ndim == default_ndim:
+            return np.asarray(data)[np.newaxis]
+        return np.asarray(data[key])
+
+
+def _enter_optional(stack, source, quantity):
+    try:
+        return stack.enter_context(source.access(quantity))
+    except (exception.Py4VaspError, FileNotFoundError, KeyError):
+        return None
+
+
+def write(source, filename, format, selection=None, steps=None, chunk_size=CHUNK_SIZE):
+    """Stream the trajectory found in *source* into *filename*.
+
+    The extxyz and ASE trajectory files use the units of VASP (Å, eV, Å/fs for the
+    velocities in extxyz). LAMMPS dump files follow the metal units of LAMMPS, i.e.,
+    velocities are written in Å/ps, and the cell is rotated into the lower triangular
+    form LAMMPS requires. LAMMPS dump files do not contain energies.
+
+    Parameters
+    ----------
+    source
+        The source of the raw data, e.g., a FileSource for a VASP calculation.
+    filename : str or pathlib.Path
+        The file the trajectory is written to. It is overwritten if it exists.
+    format : str
+        One of the :data:`FORMATS`.
+    selection : str or None
+        Select a particular source of the structure.
+    steps : int or slice or None
+        Select which frames of the trajectory are written. Defaults to all frames.
+    chunk_size : int
+        Number of frames read from the source at once.
+    """
+    writer = _get_writer(format)
+    with Frames.from_source(source, selection, steps) as frames:
+        writer(frames, filename, chunk_size)
+
+
+def _get_writer(format):
+    writers = {
+        "lammps-dump": _write_lammps_dump,
+        "extxyz": _write_extxyz,
+        "ase-traj": _write_ase_trajectory,
+    }
+    try:
+        return writers[format.lower()]
+    except KeyError:
+        message = f"Writing trajectories in the format {format!r} is not implemented. Please use one of {', '.join(FORMATS)}."
+        raise exception.NotImplemented(message) from None
+
+
+def _write_lammps_dump(frames, filename, chunk_size):
+    columns = "id type x y z"
+    columns += " vx vy vz" if frames.has_velocities else ""
+    columns += " fx fy fz" if frames.has_forces else ""
+    ids = np.arange(len(frames.elements())) + 1
+    ion_types = frames.ion_types()
+    with open(filename, "w") as file:
+        for chunk in frames.chunks(chunk_size):
+            cells, rotations = _lammps_standard_form(chunk.lattice_vectors)
+            positions = chunk.cartesian(chunk.positions) @ rotations
+            vectors = [positions]
+            if frames.has_velocities:
+                vectors.append(_FS_TO_PS * chunk.velocities @ rotations)
+            if frames.has_forces:
+                vectors.append(chunk.forces @ rotations)
+            for i, step in enumerate(chunk.steps):
+                file.write(_lammps_header(step, len(ids), cells[i], columns))
+                frame_vectors = [vector[i] for vector in vectors]
+                _write_table(file, ("%d", "%d"), [ids, ion_types], frame_vectors)
+
+
+def _lammps_standard_form(lattice_vectors):
+    # LAMMPS requires a lower triangular cell; all quantities are rotated accordingly
+    a, b, c = np.moveaxis(lattice_vectors, 1, 0)
+    ax = np.linalg.norm(a, axis=-1)
+    bx = np.sum(a * b, axis=-1) / ax
+    by = np.sqrt(np.sum(b * b, axis=-1) - bx**2)
+    cx = np.sum(a * c, axis=-1) / ax
+    cy = (np.sum(b * c, axis=-1) - bx * cx) / by
+    cz = np.linalg.det(lattice_vectors) / (ax * by)
+    zero = np.zeros_like(ax)
+    cells = np.stack(
+        (
+            np.stack((ax, zero, zero), axis=-1),
+            np.stack((bx, by, zero), axis=-1),
+            np.stack((cx, cy, cz), axis=-1),
+        ),
+        axis=1,
+    )
+    rotations = np.linalg.solve(lattice_vectors, cells)
+    return cells, rotations
+
+
+def _lammps_header(step, number_atoms, cell, columns):
+    xx, yy, zz = np.diag(cell)
+    xy, xz, yz = cell[1, 0], cell[2, 0], cell[2, 1]
+    x_low = min(0.0, xy, xz, xy + xz)
+    x_high = xx + max(0.0, xy, xz, xy + xz)
+    y_low = min(0.0, yz)
+    y_high = yy + max(0.0, yz)
+    return f"""\
+ITEM: TIMESTEP
+{step}
+ITEM: NUMBER OF ATOMS
+{number_atoms}
+ITEM: BOX BOUNDS xy xz yz pp pp pp
+{x_low:.16e} {x_high:.16e} {xy:.16e}
+{y_low:.16e} {y_high:.16e} {xz:.16e}
+0.0 {zz:.16e} {yz:.16e}
+ITEM: ATOMS {columns}
+"""
+
+
+def _write_extxyz(frames, filename, chunk_size):
+    properties = "species:S:1:pos:R:3"
+    properties += ":vel:R:3" if frames.has_velocities else ""
+    properties += ":forces:R:3" if frames.has_forces else ""
+    elements = np.array(frames.elements())
+    with open(filename, "w") as file:
+        for chunk in frames.chunks(chunk_size):
+            vectors = [chunk.cartesian(chunk.positions)]
+            if frames.has_velocities:
+                vectors.append(chunk.velocities)
+            if frames.has_forces:
+                vectors.append(chunk.forces)
+            for i, lattice_vectors in enumerate(chunk.lattice_vectors):
+                lattice = " ".join(f"{x:.16f}" for x in lattice_vectors.flatten())
+                energy = (
+                    ""
+                    if chunk.energies is None
+                    else f" energy={chunk.energies[i]:.16f}"
+                )
+                file.write(f"{len(elements)}\n")
+                file.write(
+                    f'Lattice="{lattice}" Properties={properties}{energy} pbc="T T T"\n'
+                )
+                frame_vectors = [vector[i] for vector in vectors]
+                _write_table(file, ("%-2s",), [elements], frame_vectors)
+
+
+def _write_table(file, formats, columns, vectors):
+    numbers = np.concatenate(vectors, axis=-1)
+    line_format = " ".join((*formats, *numbers.shape[-1] * ("%.16f",)))
+    rows = zip(*columns, *numbers.T)
+    file.write("\n".join(line_format % row for row in rows))
+    file.write("\n")
+
+
+def _write_ase_trajectory(frames, filename, chunk_size):
+    elements = frames.elements()
+    with ase_io.Trajectory(str(filename), "w") as trajectory:
+        for chunk in frames.chunks(chunk_size):
+            positions = chunk.cartesian(chunk.positions)
+            for i, lattice_vectors in enumerate(chunk.lattice_vectors):
+                atoms = ase.Atoms(
+                    symbols=elements,
+                    cell=lattice_vectors,
+                    positions=positions[i],
+                    pbc=True,
+                )
+                if frames.has_velocities:
+                    atoms.set_velocities(chunk.velocities[i] / ase_units.fs)
+                _attach_results(atoms, chunk, i)
+                trajectory.write(atoms)
+
+
+def _attach_results(atoms, chunk, i):
+    results = {}
+    if chunk.forces is not None:
+        results["forces"] = chunk.forces[i]
+    if chunk.energies is not None:
+        results["energy"] = chunk.energies[i]
+    if results:
+        atoms.calc = ase_singlepoint.SinglePointCalculator(atoms, **results)
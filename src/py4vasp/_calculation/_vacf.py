@@ -0,0 +1,126 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Velocity autocorrelation function (VACF) and vibrational density of states.
+
+The vibrational DOS at finite temperature is the Fourier transform of the
+mass-weighted VACF. Because the VACF of every atom depends only on its own velocities,
+we read the file in chunks of a few atoms for all selected steps, correlate them with
+FFTs in O(T log T), and accumulate the result into the selected projections. Only the
+VACF of every projection up to the maximal time lag is kept in memory.
+"""
+
+import numpy as np
+
+from py4vasp import exception
+from py4vasp._util import check, correlation
+
+CHUNK_SIZE = 16
+"Default number of atoms whose velocities are read from the file at once."
+
+WINDOWS = {
+    "hann": np.hanning,
+    "blackman": np.blackman,
+    "bartlett": np.bartlett,
+    "none": np.ones,
+}
+"Window functions damping the VACF at long time lags to reduce spectral leakage."
+
+FS_TO_THZ = 1000
+"Convert a frequency from 1/fs to THz."
+
+PARAMETERS = """\
+time_step : float
+    Time between two steps stored in the file in fs. If you select every n-th step of
+    the trajectory, the time lag is adjusted accordingly.
+number_lags : int | None
+    Number of time lags for which the VACF is computed. Defaults to half the number of
+    selected steps, because longer lags average over few time origins only.
+masses : dict | None
+    Masses in amu for some or all elements overriding the standard atomic masses.
+mass_weighted : bool
+    Weight the velocities of every atom by its mass. This requires ASE for the
+    standard atomic masses unless all masses are provided.
+chunk_size : int
+    Number of atoms whose velocities are read from the file at once. Larger chunks
+    are faster but require more memory.
+"""
+
+WINDOW = f"""\
+window : str
+    Window function applied to the VACF before the Fourier transform, one of
+    {", ".join(WINDOWS)}. A window smooths the spectrum at the cost of resolution.
+"""
+
+
+def autocorrelation(velocities, steps, weights, number_lags, chunk_size=CHUNK_SIZE):
+    """Accumulate the VACF of all atoms into the selected projections.
+
+    Parameters
+    ----------
+    velocities : VaspData
+        Velocities of the full trajectory with shape (steps, atoms, 3).
+    steps : slice
+        The steps of the trajectory included in the analysis.
+    weights : np.ndarray
+        Weight of every atom and direction for every projection with shape
+        (atoms * 3, projections).
+    number_lags : int
+        Number of time lags for which the VACF is returned.
+    chunk_size : int
+        Number of atoms read from the file at once.
+
+    Returns
+    -------
+    np.ndarray
+        The VACF with shape (lags, projections).
+    """
+    check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+    result = np.zeros((number_lags, weights.shape[1]))
+    number_atoms = len(weights) // 3
+    for start in range(0, number_atoms, chunk_size):
+        atoms = slice(start, start + chunk_size)
+        chunk = np.asarray(velocities[steps, atoms], dtype=np.float64)
+        vacf = correlation.autocorrelation(chunk)[:number_lags]
+        result += vacf.reshape(number_lags, -1) @ weights[3 * start : 3 * atoms.stop]
+    return result
+
+
+def spectrum(vacf, time_step, window="hann"):
+    """Fourier transform the VACF into a spectrum.
+
+    The VACF is an even function of the time lag, so we transform its symmetric
+    extension, which yields a real spectrum. The transform is zero padded to twice the
+    number of lags for a finer frequency grid.
+
+    Parameters
+    ----------
+    vacf : np.ndarray
+        The VACF with the time lag along the first axis.
+    time_step : float
+        Time between two lags in fs.
+    window : str
+        Name of the window function, see :data:`WINDOWS`.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The frequencies in THz and the spectrum for every remaining axis of *vacf*.
+    """
+    number_lags = len(vacf)
+    damped = vacf * _window(window, number_lags)[:, np.newaxis]
+    size = 2 * number_lags
+    transform = np.fft.rfft(damped, size, axis=0).real
+    # count the lag 0 once although the real part of the transform includes it twice
+    spectrum = time_step * (2 * transform - damped[0])
+    frequencies = FS_TO_THZ * np.fft.rfftfreq(size, time_step)
+    return frequencies, spectrum
+
+
+def _window(window, number_lags):
+    try:
+        function = WINDOWS[window]
+    except (KeyError, TypeError):
+        message = f"The window {window!r} is not implemented. Please use one of {', '.join(WINDOWS)}."
+        raise exception.NotImplemented(message) from None
+    # keep the decaying half of a symmetric window, so that the maximum is at lag 0
+    return function(2 * number_lags - 1)[number_lags - 1 :]
@@ -8,7 +8,7 @@ import numpy as np
 
 from py4vasp import _config, exception
 from py4vasp import raw as raw_module
-from py4vasp._calculation import _stoichiometry, bader
+from py4vasp._calculation import _grid_expression, _stoichiometry, bader
 from py4vasp._calculation.dispatch import (
     DataSource,
     is_available_raw,
@@ -19,7 +19,7 @@ from py4vasp._calculation.dispatch import (
 from py4vasp._calculation.structure import StructureHandler
 from py4vasp._raw import data as raw
 from py4vasp._third_party import graph, view
-from py4vasp._util import check, documentation, import_, index, select, slicing
+from py4vasp._util import check, documentation, grid, import_, index, select, slicing
 from py4vasp._util.density import SliceArguments, Visualizer
 
 pretty = import_.optional("IPython.lib.pretty")
@@ -97,18 +97,22 @@ class DensityHandler:
             components = [_COMPONENTS[i][_DEFAULT] for i in range(4)]
         return {"component": components}
 
-    def to_numpy(self):
-        return np.moveaxis(self._raw_density.charge, 0, -1).T
+    def to_numpy(self, stride=None, region=None):
+        density = grid.read(self._raw_density.charge, stride, region)
+        return np.moveaxis(density, 0, -1).T
 
     def to_view(
         self,
         component: Optional[str] = None,
         supercell: Optional[Union[int, np.ndarray]] = None,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
         **user_options,
     ) -> view.View:
         _raise_error_if_no_data(self._raw_density.charge)
         map_ = self._create_map()
-        selector = index.Selector({0: map_}, self._raw_density.charge)
+        density = grid.downsample(self._raw_density.charge, resolution, downsampling)
+        selector = index.Selector({0: map_}, density)
         component = component or _INTERNAL
         tree = select.Tree.from_selection(component)
         selections = list(self._filter_noncollinear_magnetization_from_selections(tree))
@@ -197,6 +201,20 @@ class DensityHandler:
         selections = self._filter_noncollinear_magnetization_from_selections(tree)
         return {self._label(selector.label(sel)): selector[sel].T for sel in selections}
 
+    def _grid_terms(self, selection):
+        _raise_error_if_no_data(self._raw_density.charge)
+        map_ = self._create_map()
+        selector = index.Selector({0: map_}, self._raw_density.charge)
+        tree = select.Tree.from_selection(selection or _INTERNAL)
+        selections = list(self._filter_noncollinear_magnetization_from_selections(tree))
+        component = map_.get(selections[0][0]) if len(selections[0]) == 1 else None
+        if len(selections) != 1 or component is None:
+            _raise_not_single_component_error(selection)
+        # raises an error if the density does not contain the component
+        self._use_symmetric_isosurface(component)
+        label = self._label(selector.label(selections[0]))
+        return label, [(1, self._raw_density.charge, (component,))]
+
     def _bader_reference(self, selection):
         "Peaked scalar density (valence + core) used only to define the basins."
         if self._raw_density.core.is_none():
@@ -495,17 +513,32 @@ class Density(view.Mixin):
         result["density"] = list(raw_module.selections(self._quantity_name))
         return result
 
-    def to_numpy(self):
+    @documentation.format(parameters=grid.PARAMETERS)
+    def to_numpy(self, *, stride=None, region=None):
         """Convert the density to a numpy array.
 
         The number of components is 1 for nonpolarized calculations, 2 for collinear
         calculations, and 4 for noncollinear calculations. Each component is 3
-        dimensional according to the grid VASP uses for the FFTs.
+        dimensional according to the grid VASP uses for the FFTs. If you need only a
+        coarse version or a part of the grid, use the stride and region arguments;
+        then only these grid points are read from the file.
+
+        Parameters
+        ----------
+        {parameters}
 
         Returns
         -------
         np.ndarray
             All components of the selected density.
+
+        Examples
+        --------
+        >>> calculation = py4vasp.Calculation.from_path(".")
+
+        Read every second grid point in the lower half of the cell along c
+
+        >>> calculation.density.to_numpy(stride=2, region=(None, None, (0, 24)))
         """
         return merge_default(
             self._source,
@@ -513,12 +546,18 @@ class Density(view.Mixin):
             self._selection_name,
             self._handler_factory,
             DensityHandler.to_numpy,
+            stride=stride,
+            region=region,
         )
 
+    @documentation.format(resolution=grid.RESOLUTION)
     def to_view(
         self,
         selection: Optional[str] = None,
         supercell: Optional[Union[int, np.ndarray]] = None,
+        *,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
         **user_options,
     ) -> view.View:
         """Plot the selected density as a 3d isosurface within the structure.
@@ -536,6 +575,7 @@ class Density(view.Mixin):
             If present the data is replicated the specified number of times along each
             direction.
 
+        {resolution}
         user_options : dict
             Further arguments with keyword that get directly passed on to the
             visualizer. Most importantly, you can set isolevel to adjust the
@@ -563,6 +603,10 @@ class Density(view.Mixin):
         Plot the isosurface for the third component of a noncollinear magnetization
 
         >>> calculation.density.plot("m(3)")
+
+        Preview a large grid with at most 64 points along every lattice vector
+
+        >>> calculation.density.plot(resolution=64)
         """
         return merge_default(
             self._source,
@@ -572,6 +616,8 @@ class Density(view.Mixin):
             DensityHandler.to_view,
             selection,
             supercell=supercell,
+            resolution=resolution,
+            downsampling=downsampling,
             **user_options,
         )
 
@@ -725,6 +771,35 @@ class Density(view.Mixin):
             DensityHandler.is_noncollinear,
         )
 
+    def lazy(self, selection=None) -> _grid_expression.GridExpression:
+        """Refer to a component of the density without reading it.
+
+        The returned expression can be combined with the densities or potentials of
+        other calculations on the same grid, e.g., to compute density differences or
+        averages. The data is read from the files only when the result is converted,
+        and then slab by slab, so that the full density of every calculation is
+        never held in memory.
+
+        Parameters
+        ----------
+        selection : str
+            Select a single component of the density. Defaults to the charge density.
+
+        Returns
+        -------
+        GridExpression
+            An expression that evaluates to the selected component of the density.
+
+        Examples
+        --------
+        >>> AB = py4vasp.Calculation.from_path("AB")
+        >>> A = py4vasp.Calculation.from_path("A")
+        >>> B = py4vasp.Calculation.from_path("B")
+        >>> difference = AB.density.lazy() - A.density.lazy() - B.density.lazy()
+        >>> difference.to_contour(c=0.5)
+        """
+        return _grid_expression.from_quantity(self, selection)
+
     def bader_analysis(self, selection=None, *, snap_to_atoms=True):
         """Partition the selected density into atomic Bader basins.
 
@@ -802,6 +877,11 @@ def _raise_component_not_specified_error(selec_tuple):
     raise exception.IncorrectUsage(msg)
 
 
+def _raise_not_single_component_error(selection):
+    msg = f"The selection '{selection}' does not select a single component of the density. Please select one component, e.g., 'charge' or 'm'."
+    raise exception.IncorrectUsage(msg)
+
+
 def _raise_is_nonpolarized_error():
     msg = "Density does not contain magnetization. Please rerun VASP with ISPIN = 2 or LNONCOLLINEAR = T to obtain it."
     raise exception.NoData(msg)
@@ -16,12 +16,13 @@ import numpy as np
 
 from py4vasp import exception
 from py4vasp import raw as _raw_module
+from py4vasp._calculation import _projection_cache
 from py4vasp._raw.definition import schema as _schema
 from py4vasp._raw.definition import selections as schema_selections
 from py4vasp._raw.definition import unique_selections as schema_unique_selections
 from py4vasp._raw.schema import DEFAULT_SELECTION, Link
 from py4vasp._third_party.graph import Graph
-from py4vasp._util import check, select
+from py4vasp._util import check, profile, select
 
 _REGISTRY = {}
 
@@ -159,11 +160,15 @@ class FileSource:
         Directory of the VASP calculation.
     file : str or pathlib.Path or None
         Specific HDF5 file to read from. If None, the schema default is used.
+    cache_projections : bool
+        Store projections reduced to elements and angular momenta in a sidecar file
+        and answer compatible selections from it.
     """
 
-    def __init__(self, path, file=None):
+    def __init__(self, path, file=None, cache_projections=False):
         self._path = pathlib.Path(path).expanduser().resolve()
         self._file = file
+        self._cache_projections = cache_projections
 
     @property
     def path(self):
@@ -172,9 +177,12 @@ class FileSource:
 
     @contextlib.contextmanager
     def access(self, quantity, selection=None):
-        with _raw_module.access(
-            quantity, selection=selection, path=self._path, file=self._file
-        ) as raw:
+        with (
+            _raw_module.access(
+                quantity, selection=selection, path=self._path, file=self._file
+            ) as raw,
+            _projection_cache.enabled(self._cache_projections),
+        ):
             yield raw
 
 
@@ -264,7 +272,11 @@ def _dispatch(
     handler_wants_selection, selection_has_default = _method_accepts_selection(method)
     results = {}
     for ctx in contexts:
-        with source.access(quantity_name, selection=ctx.selection_name) as raw:
+        with (
+            profile.quantity(quantity_name),
+            source.access(quantity_name, selection=ctx.selection_name) as raw,
+            profile.phase("handler", getattr(method, "__qualname__", method)),
+        ):
             handler = handler_factory(raw)
             if handler_wants_selection:
                 if ctx.remaining_selection is None and selection_has_default:
@@ -489,10 +501,7 @@ def merge_graphs(
     )
     if len(results) == 1:
         return next(iter(results.values()))
-    merged = Graph(series=[])
-    for label, graph in results.items():
-        merged = merged + graph.label(label)
-    return merged
+    return Graph.merge(results.values(), labels=results.keys())
 
 
 def merge_strings(
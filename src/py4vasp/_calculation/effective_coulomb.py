@@ -1,6 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 from types import EllipsisType
 
 import numpy as np
@@ -285,16 +285,16 @@ screened Hubbard J = {data["screened_J_uppercase"].real:8.4f} {data["screened_J_
             return _OmegaPlotter(omega_in, omega, config)
 
     def _get_effective_potentials(self, tree, plotter):
-        return [
-            self._get_effective_potential(selection, plotter)
-            for selection in tree.selections()
+        potentials = [
+            self._get_effective_potential(selection) for selection in tree.selections()
         ]
+        return plotter.interpolate_if_necessary(potentials)
 
-    def _get_effective_potential(self, selection, plotter):
+    def _get_effective_potential(self, selection):
         if self._bare_potential_selected(selection):
-            return self._get_bare_potential(selection, plotter)
+            return self._get_bare_potential(selection)
         else:
-            return self._get_screened_potential(selection, plotter)
+            return self._get_screened_potential(selection)
 
     def _bare_potential_selected(self, selection):
         if select.contains(selection, "bare"):
@@ -303,22 +303,20 @@ screened Hubbard J = {data["screened_J_uppercase"].real:8.4f} {data["screened_J_
             return False
         return select.contains(selection, "V") or select.contains(selection, "v")
 
-    def _get_bare_potential(self, selection, plotter):
+    def _get_bare_potential(self, selection):
         selection = self._filter_component_from_selection(selection)
         maps = self._create_map("bare")
         potential = self._raw_coulomb.bare_potential_high_cutoff
         selector = index.Selector(maps, potential, reduction=np.average)
         V = convert.to_complex(selector[selection])
-        V = plotter.interpolate_bare_if_necessary(V)
         return _CoulombPotential("bare", selector.label(selection), V)
 
-    def _get_screened_potential(self, selection, plotter):
+    def _get_screened_potential(self, selection):
         selection = self._filter_component_from_selection(selection)
         maps = self._create_map("screened")
         potential = self._raw_coulomb.screened_potential
         selector = index.Selector(maps, potential, reduction=np.average)
         U = convert.to_complex(selector[selection])
-        U = plotter.interpolate_screened_if_necessary(U)
         return _CoulombPotential("screened", selector.label(selection), U)
 
     def _filter_component_from_selection(self, selection):
@@ -604,6 +602,31 @@ class _OmegaPlotter:
             self.positions = positions["positions"]
             _, self.mask = transform_positions_to_radial(positions, radius_max)
 
+    def interpolate_if_necessary(self, potentials):
+        screened = [p.strength for p in potentials if p.component == "screened"]
+        screened = iter(self._interpolate_screened_together(screened))
+        return [
+            replace(
+                potential,
+                strength=(
+                    next(screened)
+                    if potential.component == "screened"
+                    else self.interpolate_bare_if_necessary(potential.strength)
+                ),
+            )
+            for potential in potentials
+        ]
+
+    def _interpolate_screened_together(self, potentials):
+        # continue all selections in a single call so that they are processed as one
+        # batch; this requires that all selections produce data of the same shape
+        shapes = {potential.shape for potential in potentials}
+        if not self.interpolate or len(potentials) < 2 or len(shapes) != 1:
+            return map(self.interpolate_screened_if_necessary, potentials)
+        stacked_potentials = np.stack(potentials, axis=-1)
+        interpolated = self.interpolate_screened_if_necessary(stacked_potentials)
+        return np.moveaxis(interpolated, -1, 0)
+
     def interpolate_bare_if_necessary(self, potential):
         num_omega = len(self.omega_out)
         return np.broadcast_to(potential, (num_omega,) + potential.shape)
@@ -654,6 +677,12 @@ class _RadialPlotter:
         self.radius_out = radius_out if self.interpolate else self.radius_in
         self.marker = None if self.interpolate else "*"
 
+    def interpolate_if_necessary(self, potentials):
+        return [
+            replace(potential, strength=self._ohno_interpolation(potential.strength))
+            for potential in potentials
+        ]
+
     def interpolate_bare_if_necessary(self, potential):
         return self._ohno_interpolation(potential)
 
@@ -1,5 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import functools
 import warnings
 
 import numpy as np
@@ -14,6 +15,7 @@ ALIAS = {
     "selfen_delta": "delta",
     "scattering_approx": "scattering_approximation",
 }
+METADATA = ("nbands_sum", "delta", "scattering_approximation")
 
 
 class ElectronPhononAccumulator:
@@ -24,6 +26,7 @@ class ElectronPhononAccumulator:
         self._raw_data = raw_data
         class_name = parent.__class__.__name__.replace("Handler", "")
         self._name = convert.quantity_name(class_name)
+        self._extra_columns = {}
 
     def __str__(self):
         num_instances = len(self._parent)
@@ -42,16 +45,27 @@ class ElectronPhononAccumulator:
         result = base_selections.copy()
         mu_tag, mu_val = self.chemical_potential_mu_tag()
         result[mu_tag] = np.unique(mu_val)
-        if nbands_sum := self._remove_missing_data(self._raw_data.nbands_sum):
-            result["nbands_sum"] = np.unique(nbands_sum)
-        if selfen_delta := self._remove_missing_data(self._raw_data.delta):
-            result["selfen_delta"] = np.unique(selfen_delta)
-        result["scattering_approx"] = np.unique(self._raw_data.scattering_approximation)
+        if (nbands_sum := self.metadata["nbands_sum"]).count():
+            result["nbands_sum"] = np.unique(nbands_sum.compressed())
+        if (selfen_delta := self.metadata["delta"]).count():
+            result["selfen_delta"] = np.unique(selfen_delta.compressed())
+        scattering_approximation = self.metadata["scattering_approximation"]
+        result["scattering_approx"] = np.unique(scattering_approximation.compressed())
         return result
 
-    def _remove_missing_data(self, data):
-        filter_function = lambda data: not check.is_none(data)
-        return list(filter(filter_function, data))
+    @functools.cached_property
+    def metadata(self):
+        """Columnar table of the metadata of all instances.
+
+        The table is a masked structured array with one row per instance. Masked
+        entries are not defined in the VASP output for that instance."""
+        mu_tag, _ = self.chemical_potential_mu_tag()
+        columns = {name: self._read_column(name) for name in (mu_tag, *METADATA)}
+        dtype = [(name, column.dtype) for name, column in columns.items()]
+        table = np.ma.empty(len(self._raw_data.valid_indices), dtype=dtype)
+        for name, column in columns.items():
+            table[name] = column
+        return table
 
     def _chemical_potential(self):
         new_chemical_potential = ElectronPhononChemicalPotential.from_data
@@ -65,23 +79,21 @@ class ElectronPhononAccumulator:
 
     def select_indices(self, selection, *args_filters, **kwargs_filters):
         tree = select.Tree.from_selection(selection)
-        return {
-            index_
-            for selection in tree.selections(filter=set(args_filters))
-            for index_ in self._filter_indices(selection, kwargs_filters)
-        }
+        mask = np.zeros(len(self._raw_data.valid_indices), dtype=np.bool_)
+        for selection in tree.selections(filter=set(args_filters)):
+            mask |= self._filter_indices(selection, kwargs_filters)
+        return set(np.flatnonzero(mask).tolist())
 
     def _filter_indices(self, selection, filters):
-        remaining_indices = range(len(self._raw_data.valid_indices))
+        mask = np.ones(len(self._raw_data.valid_indices), dtype=np.bool_)
         for key, value in filters.items():
-            remaining_indices = self._filter_assignment(remaining_indices, key, value)
+            mask = self._filter_assignment(mask, key, value)
         for assignment in selection:
             self._raise_error_if_assignment_format_incorrect(assignment)
-            remaining_indices = self._filter_assignment(
-                remaining_indices, assignment.left_operand, assignment.right_operand
+            mask = self._filter_assignment(
+                mask, assignment.left_operand, assignment.right_operand
             )
-            remaining_indices = list(remaining_indices)
-        yield from remaining_indices
+        return mask
 
     def _raise_error_if_assignment_format_incorrect(self, assignment):
         if not isinstance(assignment, select.Assignment):
@@ -90,22 +102,50 @@ The selection {assignment} is not formatted correctly. It should be formatted li
 "key=value". Please check the "selections" method for available options.'
             raise exception.IncorrectUsage(message)
 
-    def _filter_assignment(self, remaining_indices, key, value):
-        for index_ in remaining_indices:
-            if self._match_key_value(index_, key, str(value)):
-                yield index_
-
-    def _match_key_value(self, index_, key, value):
-        instance_value = self.get_data(key, index_)
-        if instance_value is None:
+    def _filter_assignment(self, mask, key, value):
+        if not mask.any():
+            return mask
+        column = self._column(key)
+        missing = np.ma.getmaskarray(column)
+        if np.any(mask & missing):
             message = f"{key} is not defined in the VASP output for some instances. These instances not be included in the selection."
             warnings.warn(message)
-            return False
+        return mask & ~missing & self._match_key_value(column.data, str(value))
+
+    def _match_key_value(self, column, value):
+        is_text = column.dtype.kind in "US"
         try:
             value = float(value)
         except ValueError:
-            return instance_value == value
-        return np.isclose(instance_value, float(value), rtol=1e-8, atol=0)
+            return column == value if is_text else np.zeros(len(column), np.bool_)
+        if is_text:
+            return np.zeros(len(column), np.bool_)
+        return np.isclose(column, value, rtol=1e-8, atol=0)
+
+    def _column(self, name):
+        name = ALIAS.get(name, name)
+        if name in self.metadata.dtype.names:
+            return self.metadata[name]
+        if name not in self._extra_columns:
+            self._extra_columns[name] = self._read_column(name)
+        return self._extra_columns[name]
+
+    def _read_column(self, name):
+        dataset = getattr(self._raw_data, name, None)
+        if dataset is None:
+            mu_tag, mu_val = self.chemical_potential_mu_tag()
+            self._raise_error_if_not_present(name, expected_name=mu_tag)
+            id_index = np.asarray(self._raw_data.id_index)
+            return np.ma.masked_array(np.asarray(mu_val)[id_index[:, 2] - 1])
+        number_instances = len(self._raw_data.valid_indices)
+        values = [dataset[index] for index in range(number_instances)]
+        present = [
+            index for index, value in enumerate(values) if not check.is_none(value)
+        ]
+        data = np.array([np.asarray(values[index])[()] for index in present])
+        column = np.ma.masked_all(number_instances, dtype=data.dtype)
+        column[present] = data
+        return column
 
     def get_data(self, name, index):
         name = ALIAS.get(name, name)
@@ -127,4 +167,3 @@ The selection {assignment} is not formatted correctly. It should be formatted li
 The selection "{name}" is not a valid choice. {did_you_mean}Please check the \
 available selections: "{available_selections}".'
             raise exception.IncorrectUsage(message)
-            raise exception.IncorrectUsage(message)
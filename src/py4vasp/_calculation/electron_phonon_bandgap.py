@@ -1,5 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import functools
 from collections import abc
 
 import numpy as np
@@ -144,14 +145,15 @@ class ElectronPhononBandgapHandler(abc.Sequence):
     ) -> "ElectronPhononBandgapHandler":
         return cls(raw_data)
 
+    @functools.cached_property
     def _accumulator(self):
         return ElectronPhononAccumulator(self, self._raw_data)
 
     def __str__(self):
-        return str(self._accumulator())
+        return str(self._accumulator)
 
     def to_dict(self):
-        return self._accumulator().to_dict()
+        return self._accumulator.to_dict()
 
     def selections(self):
         base_selections = {
@@ -159,21 +161,21 @@ class ElectronPhononBandgapHandler(abc.Sequence):
                 "default"
             ],
         }
-        result = self._accumulator().selections(base_selections)
+        result = self._accumulator.selections(base_selections)
         result.pop("scattering_approx", None)
         return result
 
     def chemical_potential_mu_tag(self):
-        return self._accumulator().chemical_potential_mu_tag()
+        return self._accumulator.chemical_potential_mu_tag()
 
     def select(self, selection):
-        indices = self._accumulator().select_indices(
+        indices = self._accumulator.select_indices(
             selection, scattering_approximation="SERTA"
         )
         return [BandgapInstance(self, index) for index in indices]
 
     def _get_data(self, name, index):
-        return self._accumulator().get_data(name, index)
+        return self._accumulator.get_data(name, index)
 
     def __getitem__(self, key):
         if 0 <= key < len(self):
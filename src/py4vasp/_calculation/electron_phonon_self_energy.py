@@ -1,7 +1,10 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import functools
 from collections import abc
 
+import numpy as np
+
 from py4vasp import exception, raw
 from py4vasp._calculation.dispatch import (
     DataSource,
@@ -74,7 +77,8 @@ class SelfEnergyInstance(ElectronPhononInstance):
             Sparse tensor containing Fan self-energy contributions for specific
             band, k-point, and spin combinations.
         """
-        return self._make_sparse_tensor(self._get_fan())
+        fan = self._get_dataset("fan")
+        return self._make_sparse_tensor(_CompressedRows(_to_complex, fan))
 
     def debye_waller(self):
         """
@@ -86,7 +90,7 @@ class SelfEnergyInstance(ElectronPhononInstance):
             Sparse tensor containing Debye-Waller self-energy contributions for specific
             band, k-point, and spin combinations.
         """
-        return self._make_sparse_tensor(self._get_data("debye_waller"))
+        return self._make_sparse_tensor(self._get_dataset("debye_waller"))
 
     def self_energy(self):
         """
@@ -98,8 +102,8 @@ class SelfEnergyInstance(ElectronPhononInstance):
             Sparse tensor containing the sum of Fan and Debye-Waller contributions
             for specific band, k-point, and spin combinations.
         """
-        self_energy = self._get_fan() + self._get_data("debye_waller")
-        return self._make_sparse_tensor(self_energy)
+        datasets = (self._get_dataset("fan"), self._get_dataset("debye_waller"))
+        return self._make_sparse_tensor(_CompressedRows(_add_fan, *datasets))
 
     def energies(self):
         """
@@ -111,7 +115,10 @@ class SelfEnergyInstance(ElectronPhononInstance):
             Sparse tensor containing energy values for specific band, k-point,
             and spin combinations.
         """
-        return self._make_sparse_tensor(self._get_data("energies"))
+        return self._make_sparse_tensor(self._get_dataset("energies"))
+
+    def _get_dataset(self, name):
+        return self.parent._get_dataset(name, self.index)
 
     def _make_sparse_tensor(self, tensor_data):
         band_kpoint_spin_index = self._get_data("band_kpoint_spin_index").T - 1
@@ -119,6 +126,30 @@ class SelfEnergyInstance(ElectronPhononInstance):
         return SparseTensor(band_kpoint_spin_index, band_start, tensor_data)
 
 
+def _to_complex(fan):
+    return convert.to_complex(np.asarray(fan, dtype=np.float64))
+
+
+def _add_fan(fan, debye_waller):
+    # the Debye-Waller term does not depend on the energy, the second to last axis
+    return _to_complex(fan) + np.expand_dims(np.asarray(debye_waller), axis=-2)
+
+
+class _CompressedRows:
+    """Read the requested rows of one or more compressed datasets and combine them.
+
+    The datasets are only accessed when rows are requested, so data stored in the
+    HDF5 file is read only for these rows.
+    """
+
+    def __init__(self, combine, *datasets):
+        self._combine = combine
+        self._datasets = datasets
+
+    def __getitem__(self, rows):
+        return self._combine(*(dataset[rows] for dataset in self._datasets))
+
+
 class ElectronPhononSelfEnergyHandler(abc.Sequence):
     """Handler for electron-phonon self-energy data."""
 
@@ -131,14 +162,15 @@ class ElectronPhononSelfEnergyHandler(abc.Sequence):
     ) -> "ElectronPhononSelfEnergyHandler":
         return cls(raw_data)
 
+    @functools.cached_property
     def _accumulator(self):
         return ElectronPhononAccumulator(self, self._raw_data)
 
     def __str__(self):
-        return str(self._accumulator())
+        return str(self._accumulator)
 
     def to_dict(self):
-        return self._accumulator().to_dict()
+        return self._accumulator.to_dict()
 
     def selections(self):
         base_selections = {
@@ -146,17 +178,20 @@ class ElectronPhononSelfEnergyHandler(abc.Sequence):
                 "default"
             ],
         }
-        return self._accumulator().selections(base_selections)
+        return self._accumulator.selections(base_selections)
 
     def chemical_potential_mu_tag(self):
-        return self._accumulator().chemical_potential_mu_tag()
+        return self._accumulator.chemical_potential_mu_tag()
 
     def select(self, selection):
-        indices = self._accumulator().select_indices(selection)
+        indices = self._accumulator.select_indices(selection)
         return [SelfEnergyInstance(self, index) for index in indices]
 
     def _get_data(self, name, index):
-        return self._accumulator().get_data(name, index)
+        return self._accumulator.get_data(name, index)
+
+    def _get_dataset(self, name, index):
+        return getattr(self._raw_data, name)[index]
 
     def eigenvalues(self):
         return self._raw_data.eigenvalues[:]
@@ -311,6 +346,10 @@ class ElectronPhononSelfEnergy(abc.Sequence):
             return len(self._handler_factory(raw))
 
 
+def _is_integer(index):
+    return isinstance(index, (int, np.integer))
+
+
 class SparseTensor:
     """
     A sparse tensor implementation for electron-phonon data.
@@ -325,7 +364,8 @@ class SparseTensor:
     band_start : int
         Starting band index for valid data.
     tensor : array_like
-        The actual tensor data values in compressed form.
+        The actual tensor data values in compressed form. Only the rows needed for the
+        requested indices are accessed, so the data may remain in the HDF5 file.
     """
 
     def __init__(self, band_kpoint_spin_index, band_start, tensor):
@@ -372,9 +412,16 @@ class SparseTensor:
         """
         Access tensor data for specific spin, k-point, and band indices.
 
+        Each index may be an integer, a slice, or an array of integers. Integer and
+        array indices follow the NumPy rules for fancy indexing. The band indices and
+        the bounds of band slices refer to the bands of the calculation; negative
+        values count from the last band in :attr:`valid_bands`. When all indices are
+        integers, the data of this single state is returned. Otherwise, states for
+        which the calculation was not performed are filled with NaN.
+
         Parameters
         ----------
-        spin, kpoint, band : int
+        spin, kpoint, band : int or slice or array_like
             Spin, k-point, and band indices.
 
         Returns
@@ -388,16 +435,82 @@ class SparseTensor:
             If the tuple doesn't contain exactly three indices, if band index
             is outside valid range, or if indices are invalid.
         DataMismatch
-            If the calculation for the specified indices was not performed.
+            If the calculation for the specified single state was not performed.
         """
         if len(spin_kpoint_band_tuple) != 3:
             raise exception.IncorrectUsage(
                 "Please provide exactly three indices for spin, kpoint and band."
             )
         spin, kpoint, band = spin_kpoint_band_tuple
+        if not all(map(_is_integer, spin_kpoint_band_tuple)):
+            return self._gather(self._bulk_index(spin, kpoint, band), fill=np.nan)
         index_ = self._get_band_kpoint_spin_index(spin, kpoint, band)
         if index_ < 0:
             raise exception.DataMismatch(
                 f"The calculation for {band=} {kpoint=} {spin=} was not performed."
             )
         return self._tensor[index_]
+
+    def to_dense(self, fill=np.nan):
+        """
+        Convert the sparse tensor to a dense array.
+
+        Parameters
+        ----------
+        fill : scalar
+            Value used for the states for which the calculation was not performed.
+
+        Returns
+        -------
+        np.ndarray
+            The tensor data for all spins, k-points, and valid bands. The first three
+            dimensions correspond to spin, k-point, and band; the remaining ones are
+            the dimensions of the data of a single state.
+        """
+        return self._gather(self._band_kpoint_spin_index.T, fill)
+
+    def _bulk_index(self, spin, kpoint, band):
+        try:
+            return self._band_kpoint_spin_index.T[spin, kpoint, self._local_band(band)]
+        except IndexError:
+            raise exception.IncorrectUsage(
+                f"Invalid indices: {spin=}, {kpoint=}, {band=}. "
+                f"Valid ranges are: 0 <= spin < {self._band_kpoint_spin_index.shape[2]}."
+                f", 0 <= kpoint < {self._band_kpoint_spin_index.shape[1]}, "
+                f", {self._band_range_string()}."
+            ) from None
+
+    def _local_band(self, band):
+        number_bands = self._band_kpoint_spin_index.shape[0]
+        if isinstance(band, slice):
+            return self._local_band_slice(band)
+        band = np.asarray(band)
+        local_band = np.where(band > 0, band - self._band_start, band)
+        below_start = (0 <= band) & (band < self._band_start)
+        out_of_range = (local_band < -number_bands) | (local_band >= number_bands)
+        if np.any(below_start | out_of_range):
+            raise exception.IncorrectUsage(
+                f"Band index {band} is not in valid range {self._band_range_string()}."
+            )
+        return local_band
+
+    def _local_band_slice(self, band):
+        all_bands = range(*band.indices(self.valid_bands.stop))
+        bands = [
+            band_ - self._band_start for band_ in all_bands if band_ in self.valid_bands
+        ]
+        if not bands:
+            return slice(0, 0)
+        stop = bands[-1] + all_bands.step
+        return slice(bands[0], stop if stop >= 0 else None, all_bands.step)
+
+    def _gather(self, index, fill):
+        index = np.asarray(index)
+        performed = index >= 0
+        rows, inverse = np.unique(index[performed], return_inverse=True)
+        # an empty slice still determines the shape and type of a single state
+        data = np.asarray(self._tensor[rows] if len(rows) > 0 else self._tensor[0:0])
+        dtype = np.result_type(data, np.min_scalar_type(fill))
+        result = np.full(index.shape + data.shape[1:], fill, dtype=dtype)
+        result[performed] = data[inverse]
+        return result
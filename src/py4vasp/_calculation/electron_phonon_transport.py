@@ -1,5 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import functools
 import pathlib
 from collections import abc
 from typing import Any, Dict, Generator, List, Optional, Tuple
@@ -400,14 +401,15 @@ class ElectronPhononTransportHandler(abc.Sequence):
     ) -> "ElectronPhononTransportHandler":
         return cls(raw_data)
 
+    @functools.cached_property
     def _accumulator(self):
         return ElectronPhononAccumulator(self, self._raw_data)
 
     def __str__(self):
-        return str(self._accumulator())
+        return str(self._accumulator)
 
     def to_dict(self) -> Dict[str, Any]:
-        return self._accumulator().to_dict()
+        return self._accumulator.to_dict()
 
     def selections(self) -> Dict[str, Any]:
         base_selections = {
@@ -418,7 +420,7 @@ class ElectronPhononTransportHandler(abc.Sequence):
         }
         if self._has_spin_data():
             base_selections["spin"] = list(SPINS.keys())
-        return self._accumulator().selections(base_selections)
+        return self._accumulator.selections(base_selections)
 
     def _has_spin_data(self):
         """Check if any instance has spin-resolved data."""
@@ -431,20 +433,20 @@ class ElectronPhononTransportHandler(abc.Sequence):
         return UNITS
 
     def chemical_potential_mu_tag(self) -> tuple[str, np.ndarray]:
-        return self._accumulator().chemical_potential_mu_tag()
+        return self._accumulator.chemical_potential_mu_tag()
 
     def _get_data(self, name, index, selection=None):
         if selection is not None:
             raise exception.IncorrectUsage(
                 "Creating ElectronPhononTransport.from_data does not allow to select a source."
             )
-        return self._accumulator().get_data(name, index)
+        return self._accumulator.get_data(name, index)
 
     def select(self, selection: str) -> List[TransportInstance]:
         return self._select_instances(selection)
 
     def _select_instances(self, selection, filter_keys=()):
-        indices = self._accumulator().select_indices(selection, *filter_keys)
+        indices = self._accumulator.select_indices(selection, *filter_keys)
         return [TransportInstance(self, index) for index in indices]
 
     def to_graph(self, selection: str) -> graph.Graph:
@@ -454,7 +456,7 @@ class ElectronPhononTransportHandler(abc.Sequence):
             for sel in select.Tree.from_selection(selection).selections()
             for series in builder.build(sel, self._get_instances(sel))
         ]
-        xlabel = self._accumulator().chemical_potential_label()
+        xlabel = self._accumulator.chemical_potential_label()
         return graph.Graph(series_list, xlabel=xlabel, ylabel=builder.ylabel)
 
     def _get_instances(self, selection):
@@ -5,7 +5,7 @@ import copy
 import numpy as np
 
 from py4vasp import exception, raw
-from py4vasp._calculation import slice_
+from py4vasp._calculation import _table, slice_
 from py4vasp._calculation.dispatch import (
     DataSource,
     _dispatch,
@@ -159,6 +159,9 @@ class EnergyHandler:
             [values for _, values in self._read_data(tree, self._steps_or_last)]
         )
 
+    def write_table(self, selection=None, filename=None, chunk_size=_table.CHUNK_SIZE):
+        _table.write(filename, self._table_chunks(selection, chunk_size))
+
     def selections(self) -> dict:
         components = list(self._init_selection_dict().keys())
         return {"energy": [], "component": components}
@@ -271,6 +274,24 @@ class EnergyHandler:
         for selection in tree.selections():
             yield selector.label(selection), selector[selection][steps]
 
+    def _table_chunks(self, selection, chunk_size):
+        number_steps = len(self._raw_energy.values)
+        steps = range(number_steps)[self._to_slice]
+        tree = None if selection is None else select.Tree.from_selection(selection)
+        labels = [
+            convert.text_to_string(label).strip() for label in self._raw_energy.labels
+        ]
+        for key in _table.chunks(steps, chunk_size):
+            values = np.asarray(self._raw_energy.values[key])
+            columns = {"step": np.arange(number_steps)[key] + 1}
+            if tree is None:
+                columns.update(zip(labels, values.T))
+            else:
+                selector = index.Selector({1: self._init_selection_dict()}, values)
+                for selection in tree.selections():
+                    columns[selector.label(selection)] = selector[selection]
+            yield columns
+
     def _init_selection_dict(self):
         return {
             selection: idx
@@ -410,6 +431,41 @@ class Energy(graph.Mixin):
             EnergyHandler.to_numpy,
         )
 
+    @documentation.format(selection=_selection_string("all energies"))
+    def write_table(
+        self, filename, selection=None, chunk_size: int = _table.CHUNK_SIZE
+    ) -> None:
+        """Stream the energies of the selected steps into a Parquet or Arrow file.
+
+        In contrast to :meth:`to_frame`, the energies are read from the file in chunks
+        of steps and every chunk is appended to the output directly. Use this for long
+        MD runs for which the energies of all steps do not fit in a DataFrame. Remember
+        to select the steps, e.g., `calculation.energy[:]`, because otherwise only the
+        final step is written. This requires the pyarrow package.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Files ending in .parquet or .pq are written in the Parquet format, files
+            ending in .arrow or .feather in the Arrow IPC format.
+        {selection}
+        chunk_size : int
+            Number of steps read from the file and written at once.
+
+        Examples
+        --------
+        >>> calculation.energy[:].write_table("energy.parquet", "TOTEN, temperature")
+        """
+        merge_default(
+            self._source,
+            self._quantity_name,
+            selection,
+            self._handler_factory,
+            EnergyHandler.write_table,
+            filename=filename,
+            chunk_size=chunk_size,
+        )
+
     def selections(self, selection: str | None = None) -> dict:
         """Return a dictionary describing what kind of energies are available.
 
@@ -15,7 +15,7 @@ from py4vasp._calculation.dispatch import (
 )
 from py4vasp._calculation.structure import StructureHandler
 from py4vasp._third_party import view
-from py4vasp._util import index, select
+from py4vasp._util import documentation, grid, index, select
 
 _DEFAULT_SELECTION = "1"
 
@@ -50,19 +50,25 @@ class ExcitonDensityHandler:
             "charge": self.to_numpy(),
         }
 
-    def to_numpy(self) -> np.ndarray:
-        return np.moveaxis(self._raw_exciton_density.exciton_charge, 0, -1).T
+    def to_numpy(self, stride=None, region=None) -> np.ndarray:
+        density = grid.read(self._raw_exciton_density.exciton_charge, stride, region)
+        return np.moveaxis(density, 0, -1).T
 
     def to_view(
         self,
         selection: Optional[str] = None,
         supercell: Optional[Union[int, np.ndarray]] = None,
         center: bool = False,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
         **user_options,
     ) -> view.View:
         _raise_error_if_no_data(self._raw_exciton_density.exciton_charge)
         map_ = self._create_map()
-        selector = index.Selector({0: map_}, self._raw_exciton_density.exciton_charge)
+        density = grid.downsample(
+            self._raw_exciton_density.exciton_charge, resolution, downsampling
+        )
+        selector = index.Selector({0: map_}, density)
         selection = selection or _DEFAULT_SELECTION
         tree = select.Tree.from_selection(selection)
         viewer = self._structure().to_view(supercell)
@@ -181,9 +187,14 @@ class ExcitonDensity(view.Mixin):
         """Convenient alias for :py:meth:`read`."""
         return self.read(selection=selection)
 
-    def to_numpy(self, selection=None) -> np.ndarray:
+    @documentation.format(parameters=grid.PARAMETERS)
+    def to_numpy(self, selection=None, *, stride=None, region=None) -> np.ndarray:
         """Convert the exciton charge density to a numpy array.
 
+        Parameters
+        ----------
+        {parameters}
+
         Returns
         -------
         np.ndarray
@@ -195,13 +206,19 @@ class ExcitonDensity(view.Mixin):
             selection,
             self._handler_factory,
             ExcitonDensityHandler.to_numpy,
+            stride=stride,
+            region=region,
         )
 
+    @documentation.format(resolution=grid.RESOLUTION)
     def to_view(
         self,
         selection: str | None = None,
         supercell: Optional[Union[int, np.ndarray]] = None,
         center: bool = False,
+        *,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
         **user_options,
     ) -> view.View:
         """Plot the selected exciton density as a 3d isosurface within the structure.
@@ -219,6 +236,7 @@ class ExcitonDensity(view.Mixin):
             Shift the origin of the unit cell to the center. This is helpful if
             the exciton is at the corner of the cell.
 
+        {resolution}
         user_options
             Further arguments with keyword that get directly passed on to the
             visualizer. Most importantly, you can set isolevel to adjust the
@@ -247,6 +265,8 @@ class ExcitonDensity(view.Mixin):
             ExcitonDensityHandler.to_view,
             supercell=supercell,
             center=center,
+            resolution=resolution,
+            downsampling=downsampling,
             **user_options,
         )
 
@@ -1,11 +1,16 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import dataclasses
+import io
 import itertools
+import numbers
+import pathlib
 
+import h5py
 import numpy as np
 
-from py4vasp import raw
+from py4vasp import exception, raw
+from py4vasp._calculation import _dynamical_matrix
 from py4vasp._calculation.dispatch import (
     DataSource,
     merge_default,
@@ -13,9 +18,13 @@ from py4vasp._calculation.dispatch import (
     quantity,
 )
 from py4vasp._calculation.structure import StructureHandler
-from py4vasp._util import check
+from py4vasp._util import check, import_
+
+linalg = import_.optional("scipy.linalg")
 
 _A_TO_BOHR = 0.529177210544
+_MOLDEN_BLOCK = 64
+_MODE_FILE_SUFFIXES = (".npz", ".h5", ".hdf5")
 
 
 class ForceConstantHandler:
@@ -58,14 +67,19 @@ class ForceConstantHandler:
             ]
         return result
 
-    def eigenvectors(self):
+    def eigenvectors(self, modes=None):
         """Compute the eigenvectors of the force constant matrix."""
-        return self._diagonalize()[1]
+        return self._diagonalize(modes)[1]
 
-    def _diagonalize(self):
-        eigenvalues, eigenvectors = np.linalg.eigh(
-            -self._raw_force_constant.force_constants
-        )
+    def _diagonalize(self, modes=None):
+        force_constants = -self._raw_force_constant.force_constants[:]
+        if modes is None:
+            eigenvalues, eigenvectors = np.linalg.eigh(force_constants)
+        else:
+            _raise_error_if_incorrect_modes(modes, len(force_constants))
+            eigenvalues, eigenvectors = linalg.eigh(
+                force_constants, subset_by_index=(0, modes - 1)
+            )
         eigenvectors = eigenvectors.T
         if check.is_none(self._raw_force_constant.selective_dynamics):
             return eigenvalues, eigenvectors.reshape(len(eigenvectors), -1, 3)
@@ -78,7 +92,52 @@ class ForceConstantHandler:
         unpacked_eigenvectors[:, selective_dynamics] = eigenvectors
         return eigenvalues, unpacked_eigenvectors
 
-    def to_molden(self) -> str:
+    def interpolate(
+        self, qpoints, supercell, masses=None, eigenvectors=False, workers=1
+    ) -> dict:
+        """Interpolate the phonon frequencies to arbitrary q points.
+
+        Returns
+        -------
+        dict
+            The q points, the frequencies in THz and optionally the eigenvectors.
+        """
+        dynamical_matrix = self._dynamical_matrix(supercell, masses)
+        qpoints = np.atleast_2d(np.asarray(qpoints, dtype=np.float64))
+        result = dynamical_matrix.diagonalize(qpoints, eigenvectors, workers)
+        return {"qpoints": qpoints, **result}
+
+    def to_dos(
+        self, mesh, supercell, masses=None, width=0.1, number_points=501, workers=1
+    ) -> dict:
+        """Compute the phonon DOS from the frequencies interpolated on a q mesh.
+
+        Returns
+        -------
+        dict
+            The frequencies in THz at which the DOS is evaluated and the total DOS.
+        """
+        if width <= 0:
+            raise exception.IncorrectUsage("The width of the DOS must be positive.")
+        dynamical_matrix = self._dynamical_matrix(supercell, masses)
+        qpoints = _dynamical_matrix.mesh(mesh)
+        frequencies = dynamical_matrix.diagonalize(qpoints, workers=workers)
+        frequencies = frequencies["frequencies"].ravel()
+        margin = 5 * width
+        energies = np.linspace(
+            frequencies.min() - margin, frequencies.max() + margin, number_points
+        )
+        return {
+            "energies": energies,
+            "total": _gaussian_dos(energies, frequencies, width) / len(qpoints),
+        }
+
+    def _dynamical_matrix(self, supercell, masses):
+        return _dynamical_matrix.DynamicalMatrix.from_data(
+            self._raw_force_constant, supercell, masses
+        )
+
+    def to_molden(self, modes=None) -> str:
         """Convert the eigenvectors of the force constant into molden format.
 
         Keep in mind that the eigenvectors indicate the direction of the forces and do
@@ -89,45 +148,77 @@ class ForceConstantHandler:
         str
             String describing the structure and eigenvectors in molden format.
         """
-        eigenvalues, eigenvectors = self._diagonalize()
-        frequencies = "\n".join(f"{x:12.6f}" for x in eigenvalues)
-        return f"""\
-[Molden Format]
-[FREQ]
-{frequencies}
-[FR-COORD]
-{self._format_coordinates()}
-[FR-NORM-COORD]
-{self._format_eigenvectors(eigenvectors)}
-"""
-
-    def _format_coordinates(self):
+        with io.StringIO() as file:
+            self.write_molden(file, modes)
+            return file.getvalue()
+
+    def write_molden(self, file, modes=None):
+        """Write the eigenvectors of the force constant in molden format to a file.
+
+        The eigenvectors are formatted in blocks of modes, so that the whole file is
+        never held in memory as a single string.
+
+        Parameters
+        ----------
+        file : str or pathlib.Path or file-like
+            The file or an open text stream the molden data is written to.
+        modes : int
+            Only the given number of modes with the lowest eigenvalues are computed
+            and written.
+        """
+        if not hasattr(file, "write"):
+            with open(file, "w", encoding="utf-8") as stream:
+                return self.write_molden(stream, modes)
+        eigenvalues, eigenvectors = self._diagonalize(modes)
+        file.write("[Molden Format]\n[FREQ]\n")
+        file.write(_format_rows(eigenvalues[:, np.newaxis]))
+        file.write("[FR-COORD]\n")
         structure = StructureHandler.from_data(self._raw_force_constant.structure)
-        element_positions = zip(
-            structure._stoichiometry().elements(),
-            structure.cartesian_positions() / _A_TO_BOHR,
-        )
-        return "\n".join(
-            f"{element:2} {self._format_vector(position)}"
-            for element, position in element_positions
-        )
-
-    def _format_eigenvectors(self, eigenvectors):
-        return "\n".join(
-            self._format_eigenvector(index, eigenvector)
-            for index, eigenvector in enumerate(eigenvectors)
-        )
-
-    def _format_eigenvector(self, index, eigenvector):
-        sign = np.sign(eigenvector.flatten()[np.argmax(np.abs(eigenvector))])
-        eigenvector_string = "\n".join(
-            self._format_vector(sign * vector) for vector in eigenvector
-        )
-        return f"vibration {index + 1}\n{eigenvector_string}"
-
-    def _format_vector(self, vector):
-        replace_nearly_zeros = lambda x: 0 if np.isclose(x, 0, atol=1e-9) else x
-        return " ".join(f"{replace_nearly_zeros(x):12.6f}" for x in vector)
+        positions = _replace_nearly_zeros(structure.cartesian_positions() / _A_TO_BOHR)
+        for element, position in zip(
+            structure._stoichiometry().elements(), _format_rows(positions).splitlines()
+        ):
+            file.write(f"{element:2} {position}\n")
+        file.write("[FR-NORM-COORD]\n")
+        for first in range(0, len(eigenvectors), _MOLDEN_BLOCK):
+            block = _align_sign(eigenvectors[first : first + _MOLDEN_BLOCK])
+            lines = _format_rows(block.reshape(-1, 3)).splitlines(keepends=True)
+            number_ions = block.shape[1]
+            for index in range(len(block)):
+                file.write(f"vibration {first + index + 1}\n")
+                file.writelines(lines[index * number_ions : (index + 1) * number_ions])
+
+    def write_modes(self, filename, modes=None):
+        """Write the eigenvalues and eigenvectors together with the structure to a file.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Files ending in .npz are written with numpy; files ending in .h5 or .hdf5
+            are written as HDF5 files.
+        modes : int
+            Only the given number of modes with the lowest eigenvalues are computed
+            and written.
+        """
+        suffix = pathlib.Path(filename).suffix.lower()
+        if suffix not in _MODE_FILE_SUFFIXES:
+            message = f"Cannot write modes to {filename}. Please use one of the suffixes {', '.join(_MODE_FILE_SUFFIXES)}."
+            raise exception.IncorrectUsage(message)
+        eigenvalues, eigenvectors = self._diagonalize(modes)
+        structure = StructureHandler.from_data(self._raw_force_constant.structure)
+        data = {
+            "eigenvalues": eigenvalues,
+            "eigenvectors": _align_sign(eigenvectors),
+            "lattice_vectors": structure.lattice_vectors(),
+            "positions": structure.cartesian_positions(),
+            "elements": np.array(structure._stoichiometry().elements(), dtype="S"),
+        }
+        if suffix == ".npz":
+            np.savez(filename, **data)
+            return
+        with h5py.File(filename, "w") as file:
+            for key, value in data.items():
+                file.create_dataset(key, data=value)
 
 
 @quantity("force_constant")
@@ -186,22 +277,146 @@ class ForceConstant:
         """Convenient alias for :py:meth:`read`."""
         return self.read()
 
-    def eigenvectors(self):
-        """Compute the eigenvectors of the force constant matrix."""
+    def eigenvectors(self, modes: int | None = None):
+        """Compute the eigenvectors of the force constant matrix.
+
+        Parameters
+        ----------
+        modes : int
+            If set, only this number of eigenvectors with the lowest eigenvalues is
+            computed with a partial eigensolver. This is much faster for large
+            supercells when only the soft modes are of interest.
+        """
         return merge_default(
             self._source,
             self._quantity_name,
             None,
             ForceConstantHandler.from_data,
             ForceConstantHandler.eigenvectors,
+            modes,
         )
 
-    def to_molden(self) -> str:
+    def interpolate(
+        self,
+        qpoints,
+        supercell,
+        *,
+        masses: dict | None = None,
+        eigenvectors: bool = False,
+        workers: int = 1,
+    ) -> dict:
+        """Interpolate the phonon frequencies from the force constants to any q point.
+
+        The force constants of the supercell define the dynamical matrix of the
+        primitive cell at arbitrary q points. This allows computing phonon band
+        structures along any path or on dense meshes without rerunning VASP. The
+        dynamical matrices are set up and diagonalized in chunks of q points, so that
+        even many thousand q points require little memory.
+
+        Parameters
+        ----------
+        qpoints : np.ndarray
+            q points in fractional coordinates of the reciprocal lattice of the
+            primitive cell.
+        supercell : int or np.ndarray
+            How the VASP structure is built from the primitive cell: a single integer,
+            three integers for the repetitions along each lattice vector, or a 3x3
+            integer matrix.
+        masses : dict
+            Masses in amu for some or all elements. The standard atomic masses are
+            used for all other elements.
+        eigenvectors : bool
+            If set, the mass-weighted eigenvectors are computed as well.
+        workers : int
+            Number of threads used to diagonalize the dynamical matrices.
+
+        Returns
+        -------
+        dict
+            The q points, the frequencies in THz for every q point and mode, where
+            imaginary modes are negative, and optionally the eigenvectors with shape
+            (q points, modes, atoms, 3).
+
+        Examples
+        --------
+        Compute the frequencies along the path from Γ to X for a 2x2x2 supercell.
+
+        >>> qpoints = np.linspace([0, 0, 0], [0.5, 0, 0], 101)
+        >>> calculation.force_constant.interpolate(qpoints, supercell=2)
+        {'qpoints': array(...), 'frequencies': array(...)}
+        """
+        return merge_default(
+            self._source,
+            self._quantity_name,
+            None,
+            ForceConstantHandler.from_data,
+            ForceConstantHandler.interpolate,
+            qpoints,
+            supercell,
+            masses,
+            eigenvectors,
+            workers,
+        )
+
+    def to_dos(
+        self,
+        mesh,
+        supercell,
+        *,
+        masses: dict | None = None,
+        width: float = 0.1,
+        number_points: int = 501,
+        workers: int = 1,
+    ) -> dict:
+        """Compute the phonon DOS from frequencies interpolated on a Γ-centered mesh.
+
+        Parameters
+        ----------
+        mesh : int or np.ndarray
+            Number of q points along every reciprocal lattice vector.
+        supercell : int or np.ndarray
+            How the VASP structure is built from the primitive cell, see
+            :meth:`interpolate`.
+        masses : dict
+            Masses in amu overriding the standard atomic masses.
+        width : float
+            Width in THz of the Gaussian broadening.
+        number_points : int
+            Number of frequencies at which the DOS is evaluated.
+        workers : int
+            Number of threads used to diagonalize the dynamical matrices.
+
+        Returns
+        -------
+        dict
+            The frequencies in THz at which the DOS is evaluated and the total DOS
+            in 1/THz normalized to the number of modes.
+        """
+        return merge_default(
+            self._source,
+            self._quantity_name,
+            None,
+            ForceConstantHandler.from_data,
+            ForceConstantHandler.to_dos,
+            mesh,
+            supercell,
+            masses,
+            width,
+            number_points,
+            workers,
+        )
+
+    def to_molden(self, modes: int | None = None) -> str:
         """Convert the eigenvectors of the force constant into molden format.
 
         Keep in mind that the eigenvectors indicate the direction of the forces and do
         not take into account the masses of the atom.
 
+        Parameters
+        ----------
+        modes : int
+            If set, only this number of modes with the lowest eigenvalues is included.
+
         Returns
         -------
         str
@@ -213,8 +428,93 @@ class ForceConstant:
             None,
             ForceConstantHandler.from_data,
             ForceConstantHandler.to_molden,
+            modes,
         )
 
+    def write_molden(self, filename, modes: int | None = None) -> None:
+        """Write the eigenvectors of the force constant in molden format to a file.
+
+        In contrast to :meth:`to_molden`, the data is streamed to the file in blocks of
+        modes, so that large supercells do not require building the whole file in
+        memory.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The molden file is written to this path; an existing file is overwritten.
+        modes : int
+            If set, only this number of modes with the lowest eigenvalues is computed
+            with a partial eigensolver and written.
+        """
+        merge_default(
+            self._source,
+            self._quantity_name,
+            None,
+            ForceConstantHandler.from_data,
+            ForceConstantHandler.write_molden,
+            filename,
+            modes,
+        )
+
+    def write_modes(self, filename, modes: int | None = None) -> None:
+        """Write the eigenvalues and eigenvectors of the force constant to a file.
+
+        The file contains the eigenvalues (eV/Å²), the eigenvectors with shape
+        (modes, atoms, 3), the lattice vectors, the Cartesian positions, and the
+        elements of the structure, so that other tools can process the modes without
+        parsing the molden format.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Files ending in .npz are written with numpy, files ending in .h5 or .hdf5
+            in the HDF5 format.
+        modes : int
+            If set, only this number of modes with the lowest eigenvalues is computed
+            with a partial eigensolver and written.
+        """
+        merge_default(
+            self._source,
+            self._quantity_name,
+            None,
+            ForceConstantHandler.from_data,
+            ForceConstantHandler.write_modes,
+            filename,
+            modes,
+        )
+
+
+def _raise_error_if_incorrect_modes(modes, number_modes):
+    if not isinstance(modes, numbers.Integral) or not 0 < modes <= number_modes:
+        message = f"The number of modes {modes} must be a positive integer not larger than {number_modes}."
+        raise exception.IncorrectUsage(message)
+
+
+def _align_sign(eigenvectors):
+    flat = eigenvectors.reshape(len(eigenvectors), -1)
+    largest = np.take_along_axis(flat, np.argmax(np.abs(flat), axis=1)[:, None], 1)
+    return np.sign(largest).reshape(-1, 1, 1) * eigenvectors
+
+
+def _replace_nearly_zeros(array):
+    return np.where(np.abs(array) <= 1e-9, 0.0, array)
+
+
+def _format_rows(array):
+    array = _replace_nearly_zeros(np.asarray(array, dtype=np.float64))
+    number_rows, number_columns = array.shape
+    line = " ".join(number_columns * ["%12.6f"]) + "\n"
+    return (number_rows * line) % tuple(array.ravel())
+
+
+def _gaussian_dos(energies, frequencies, width):
+    dos = np.zeros_like(energies)
+    chunk_size = max(1, 2**22 // len(energies))
+    for i in range(0, len(frequencies), chunk_size):
+        difference = energies[:, np.newaxis] - frequencies[i : i + chunk_size]
+        dos += np.exp(-0.5 * (difference / width) ** 2).sum(axis=1)
+    return dos / (np.sqrt(2 * np.pi) * width)
+
 
 @dataclasses.dataclass
 class _StringFormatter:
@@ -3,7 +3,9 @@
 """Neighbor list of all atom pairs within a cutoff radius, derived from a
 :class:`~py4vasp.calculation.structure`."""
 
+import concurrent.futures
 import copy
+import dataclasses
 import itertools
 
 import numpy as np
@@ -16,7 +18,7 @@ from py4vasp._calculation.dispatch import (
     quantity,
 )
 from py4vasp._calculation.structure import StructureHandler
-from py4vasp._util import import_, select
+from py4vasp._util import check, import_, select
 
 # scipy is only required for the full (not core) installation, so import it
 # lazily; the k-d tree is only touched when a neighbor list is actually computed.
@@ -43,6 +45,10 @@ _NEIGHBOR_TABLE_HEADER = " ion  position               nearest neighbor table"
 # Neighbors wrap onto indented continuation lines after this many per line (VASP).
 _NEIGHBORS_PER_LINE = 8
 
+# Number of steps of a trajectory read from the file and histogrammed together; the
+# chunks are the unit of work distributed over the threads.
+CHUNK_SIZE = 64
+
 
 def _replica_counts(lattice_vectors, cutoff):
     """Number of periodic replicas needed along each lattice direction.
@@ -73,6 +79,158 @@ def _replica_counts(lattice_vectors, cutoff):
     return np.ceil(cutoff / perpendicular_width - _REPLICA_TOL).astype(int)
 
 
+def _periodic_pairs(positions, lattice_vectors, cutoff):
+    """All atom pairs of a single step within *cutoff* (see ``_all_pairs``)."""
+    home = (positions % 1.0) @ lattice_vectors
+    offsets = _cell_offsets(lattice_vectors, cutoff)
+    images = (home[:, np.newaxis, :] + offsets @ lattice_vectors).reshape(-1, 3)
+    number_offsets = len(offsets)
+    home_tree = spatial.cKDTree(home)
+    image_tree = spatial.cKDTree(images)
+    distance_matrix = home_tree.sparse_distance_matrix(
+        image_tree, cutoff, output_type="coo_matrix"
+    )
+    source = distance_matrix.row
+    image = distance_matrix.col
+    neighbor = image // number_offsets
+    offset = offsets[image % number_offsets]
+    # exclude only the atom paired with its own home image (same atom, zero
+    # offset); an atom still neighbors its own replicas at nonzero offsets,
+    # and two distinct atoms sharing a position remain a genuine pair.
+    keep = ~((neighbor == source) & np.all(offset == 0, axis=1))
+    source, neighbor, offset = source[keep], neighbor[keep], offset[keep]
+    return {
+        "indices": np.stack([source, neighbor], axis=1),
+        "distances": distance_matrix.data[keep],
+        "distance_vectors": images[image[keep]] - home[source],
+        "cell_offsets": offset,
+    }
+
+
+def _cell_offsets(lattice_vectors, cutoff):
+    counts = _replica_counts(lattice_vectors, cutoff)
+    ranges = [np.arange(-count, count + 1) for count in counts]
+    return np.array(list(itertools.product(*ranges)))
+
+
+@dataclasses.dataclass
+class _Histogram:
+    """Histogram of pair distances or bond angles accumulated over the steps."""
+
+    edges: np.ndarray
+    "The boundaries of the bins."
+    counts: np.ndarray
+    "Number of pairs or triplets per atom type combination and bin summed over steps."
+    volume_counts: np.ndarray
+    "Like counts, but every step weighted by the volume of its cell."
+    number_steps: int
+    "Number of steps contributing to the histogram."
+
+    def __add__(self, other):
+        return _Histogram(
+            self.edges,
+            self.counts + other.counts,
+            self.volume_counts + other.volume_counts,
+            self.number_steps + other.number_steps,
+        )
+
+
+def _bins(maximum, bin_width, name):
+    if not bin_width > 0 or not maximum > 0:
+        message = f"The {name} and the bin width must be positive, got {maximum} and {bin_width}."
+        raise exception.IncorrectUsage(message)
+    number_bins = int(np.ceil(maximum / bin_width - _REPLICA_TOL))
+    return bin_width * np.arange(number_bins + 1)
+
+
+def _frames(raw_structure, steps):
+    """Direct positions and lattice vectors of every selected step."""
+    structure = StructureHandler.from_data(raw_structure, steps=steps)
+    positions = np.asarray(structure.positions())
+    positions = positions.reshape((-1,) + positions.shape[-2:])
+    lattice_vectors = np.asarray(structure.lattice_vectors())
+    lattice_vectors = np.broadcast_to(lattice_vectors, (len(positions), 3, 3))
+    return zip(positions, lattice_vectors)
+
+
+def _distance_histogram(frames, types, number_types, edges):
+    shape = (number_types, number_types, len(edges) - 1)
+    counts = np.zeros(np.prod(shape))
+    volume_counts = np.zeros(np.prod(shape))
+    number_steps = 0
+    for positions, lattice_vectors in frames:
+        pairs = _periodic_pairs(positions, lattice_vectors, edges[-1])
+        source, neighbor = pairs["indices"].T
+        bins = np.minimum(pairs["distances"] // (edges[1] - edges[0]), len(edges) - 2)
+        key = (types[source] * number_types + types[neighbor]) * shape[2] + bins
+        step_counts = np.bincount(key.astype(np.int64), minlength=len(counts))
+        counts += step_counts
+        volume_counts += np.abs(np.linalg.det(lattice_vectors)) * step_counts
+        number_steps += 1
+    return _Histogram(
+        edges, counts.reshape(shape), volume_counts.reshape(shape), number_steps
+    )
+
+
+def _angle_histogram(frames, types, number_types, edges, cutoff):
+    shape = (number_types, number_types, number_types, len(edges) - 1)
+    counts = np.zeros(np.prod(shape))
+    number_steps = 0
+    for positions, lattice_vectors in frames:
+        pairs = _periodic_pairs(positions, lattice_vectors, cutoff)
+        first, second = _neighbor_pairs(pairs["indices"][:, 0])
+        vectors = pairs["distance_vectors"]
+        angles = _angles(vectors[first], vectors[second])
+        bins = np.minimum(angles // (edges[1] - edges[0]), len(edges) - 2)
+        center = types[pairs["indices"][first, 0]]
+        neighbors = types[pairs["indices"][:, 1]]
+        low = np.minimum(neighbors[first], neighbors[second])
+        high = np.maximum(neighbors[first], neighbors[second])
+        key = ((center * number_types + low) * number_types + high) * shape[3] + bins
+        counts += np.bincount(key.astype(np.int64), minlength=len(counts))
+        number_steps += 1
+    counts = counts.reshape(shape)
+    return _Histogram(edges, counts, np.zeros_like(counts), number_steps)
+
+
+def _neighbor_pairs(source):
+    """Indices of all pairs of neighbors sharing the same central atom."""
+    order = np.argsort(source, kind="stable")
+    group_size = np.bincount(source)[source[order]]
+    group_start = np.searchsorted(source[order], source[order])
+    # every neighbor is combined with all later neighbors of the same central atom
+    partners = group_start + group_size - np.arange(len(order)) - 1
+    first = np.repeat(np.arange(len(order)), partners)
+    offset = np.arange(len(first)) - np.repeat(np.cumsum(partners) - partners, partners)
+    second = first + 1 + offset
+    return order[first], order[second]
+
+
+def _angles(first, second):
+    norm = np.linalg.norm(first, axis=1) * np.linalg.norm(second, axis=1)
+    cosine = np.einsum("ij,ij->i", first, second) / norm
+    return np.degrees(np.arccos(np.clip(cosine, -1, 1)))
+
+
+def _flatten_group(part):
+    if isinstance(part, select.Group) and part.separator == select.pair_separator:
+        return [atom for element in part.group for atom in _flatten_group(element)]
+    if isinstance(part, str):
+        return [part]
+    message = (
+        f"The selection '{part}' is not supported. Please select atom types joined "
+        "with a tilde, e.g. 'Sr~Ti' or 'O~Ti~O', or a single atom type, e.g. 'Sr'."
+    )
+    raise exception.IncorrectUsage(message)
+
+
+def _type_mask(atom_type, ion_types):
+    if atom_type == "total":
+        return np.ones(len(ion_types), dtype=np.bool_)
+    _raise_if_unknown(atom_type, np.array(ion_types))
+    return np.array(ion_types) == atom_type
+
+
 def _selection_label(selection):
     return " ".join(str(part) for part in selection)
 
@@ -197,6 +355,133 @@ class NeighborListHandler:
         mask = np.logical_and.reduce(masks)
         return {key: value[mask] for key, value in pairs.items()}
 
+    def pair_correlation(
+        self, selection=None, *, rmax, bin_width=0.05, chunk_size=CHUNK_SIZE, workers=1
+    ) -> dict:
+        """Compute the pair-correlation function averaged over the selected steps."""
+        histogram = self._histogram(
+            _distance_histogram, _bins(rmax, bin_width, "rmax"), chunk_size, workers
+        )
+        edges = histogram.edges
+        shell_volume = 4 / 3 * np.pi * np.diff(edges**3)
+        ion_types, number_ions = self._ion_types()
+        result = {"distances": 0.5 * (edges[1:] + edges[:-1])}
+        for label, (source, neighbor) in self._pair_selections(selection, ion_types):
+            counts = histogram.volume_counts[source][:, neighbor].sum(axis=(0, 1))
+            # atoms in both the source and the neighbor selection do not pair with themselves
+            number_pairs = number_ions[source].sum() * number_ions[neighbor].sum()
+            number_pairs -= number_ions[source & neighbor].sum()
+            if number_pairs == 0:
+                # e.g. a single atom of a type has no partner of the same type
+                result[label] = np.zeros_like(counts)
+                continue
+            normalization = histogram.number_steps * number_pairs * shell_volume
+            result[label] = counts / normalization
+        return result
+
+    def coordination_number(
+        self, selection=None, *, rmax, bin_width=0.05, chunk_size=CHUNK_SIZE, workers=1
+    ) -> dict:
+        """Compute the running coordination number averaged over the selected steps."""
+        histogram = self._histogram(
+            _distance_histogram, _bins(rmax, bin_width, "rmax"), chunk_size, workers
+        )
+        ion_types, number_ions = self._ion_types()
+        result = {"distances": histogram.edges[1:]}
+        selections = self._pair_selections(selection, ion_types, directed=True)
+        for label, (source, neighbor) in selections:
+            counts = histogram.counts[source][:, neighbor].sum(axis=(0, 1))
+            normalization = histogram.number_steps * number_ions[source].sum()
+            result[label] = np.cumsum(counts) / normalization
+        return result
+
+    def bond_angles(
+        self, selection=None, *, cutoff, bin_width=1.0, chunk_size=CHUNK_SIZE, workers=1
+    ) -> dict:
+        """Compute the distribution of bond angles averaged over the selected steps."""
+        edges = _bins(180, bin_width, "maximal angle")
+        histogram_function = lambda *args: _angle_histogram(*args, cutoff=cutoff)
+        histogram = self._histogram(histogram_function, edges, chunk_size, workers)
+        ion_types, _ = self._ion_types()
+        result = {"angles": 0.5 * (edges[1:] + edges[:-1])}
+        for label, masks in self._angle_selections(selection, ion_types):
+            center, first, second = masks
+            # the types of the two neighbors are stored in sorted order
+            neighbors = np.outer(first, second) | np.outer(second, first)
+            counts = np.einsum("c,lh,clhb->b", center, neighbors, histogram.counts)
+            total = np.sum(counts) * bin_width
+            result[label] = counts / total if total > 0 else counts
+        return result
+
+    def _histogram(self, histogram_function, edges, chunk_size, workers):
+        check.raise_error_if_not_positive_integer(chunk_size, "chunk size")
+        ion_types, _ = self._ion_types()
+        elements = self._structure._stoichiometry().elements()
+        types = np.array([ion_types.index(element) for element in elements])
+        raw_structure = self._structure._raw_structure
+        histogram_chunk = lambda steps: histogram_function(
+            _frames(raw_structure, steps), types, len(ion_types), edges
+        )
+        chunks = list(self._step_chunks(chunk_size))
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                histograms = list(executor.map(histogram_chunk, chunks))
+        else:
+            histograms = [histogram_chunk(chunk) for chunk in chunks]
+        return sum(histograms[1:], histograms[0])
+
+    def _step_chunks(self, chunk_size):
+        if not self._structure._is_trajectory:
+            yield None
+            return
+        number_steps = len(self._structure._raw_structure.positions)
+        steps = range(number_steps)[self._structure._slice]
+        if len(steps) == 0:
+            message = f"The selected steps {self._structure._slice} do not contain any step of the trajectory with {number_steps} steps."
+            raise exception.IncorrectUsage(message)
+        # the histograms do not depend on the order, so read the steps in ascending
+        # order; a descending slice would end at -1 and select nothing
+        if steps.step < 0:
+            steps = steps[::-1]
+        for start in range(0, len(steps), chunk_size):
+            chunk = steps[start : start + chunk_size]
+            yield slice(chunk.start, chunk.stop, chunk.step)
+
+    def _ion_types(self):
+        elements = self._structure._stoichiometry().elements()
+        ion_types = list(dict.fromkeys(elements))
+        number_ions = np.array([elements.count(ion_type) for ion_type in ion_types])
+        return ion_types, number_ions
+
+    def _pair_selections(self, selection, ion_types, directed=False):
+        if selection is None:
+            pairs = itertools.product(ion_types, repeat=2)
+            if not directed:
+                pairs = itertools.combinations_with_replacement(ion_types, 2)
+            labels = ["total"] + [select.pair_separator.join(pair) for pair in pairs]
+            selection = ", ".join(labels)
+        for selection_ in select.Tree.from_selection(selection).selections():
+            atom_types = [atom for part in selection_ for atom in _flatten_group(part)]
+            if len(atom_types) == 1:
+                atom_types.append("total")
+            if len(atom_types) != 2:
+                message = f"The selection '{_selection_label(selection_)}' must contain one or two atom types."
+                raise exception.IncorrectUsage(message)
+            masks = tuple(_type_mask(atom, ion_types) for atom in atom_types)
+            yield _selection_label(selection_), masks
+
+    def _angle_selections(self, selection, ion_types):
+        selection = selection or ", ".join(ion_types)
+        for selection_ in select.Tree.from_selection(selection).selections():
+            atom_types = [atom for part in selection_ for atom in _flatten_group(part)]
+            if len(atom_types) == 1:
+                atom_types = ["total", atom_types[0], "total"]
+            if len(atom_types) != 3:
+                message = f"The selection '{_selection_label(selection_)}' must contain the central atom type or three atom types, e.g. 'O~Ti~O'."
+                raise exception.IncorrectUsage(message)
+            first, center, second = (_type_mask(atom, ion_types) for atom in atom_types)
+            yield _selection_label(selection_), (center, first, second)
+
     def _lattice_vectors(self):
         return np.asarray(self._structure.lattice_vectors())
 
@@ -214,37 +499,7 @@ class NeighborListHandler:
                 "Please select a single step, e.g. neighbor_list[0]."
             )
             raise exception.NotImplemented(message)
-        lattice_vectors = self._lattice_vectors()
-        home = (positions % 1.0) @ lattice_vectors
-        offsets = self._cell_offsets(lattice_vectors, cutoff)
-        images = (home[:, np.newaxis, :] + offsets @ lattice_vectors).reshape(-1, 3)
-        number_offsets = len(offsets)
-        home_tree = spatial.cKDTree(home)
-        image_tree = spatial.cKDTree(images)
-        distance_matrix = home_tree.sparse_distance_matrix(
-            image_tree, cutoff, output_type="coo_matrix"
-        )
-        source = distance_matrix.row
-        image = distance_matrix.col
-        neighbor = image // number_offsets
-        offset = offsets[image % number_offsets]
-        # exclude only the atom paired with its own home image (same atom, zero
-        # offset); an atom still neighbors its own replicas at nonzero offsets,
-        # and two distinct atoms sharing a position remain a genuine pair.
-        keep = ~((neighbor == source) & np.all(offset == 0, axis=1))
-        source, neighbor, offset = source[keep], neighbor[keep], offset[keep]
-        return {
-            "indices": np.stack([source, neighbor], axis=1),
-            "distances": distance_matrix.data[keep],
-            "distance_vectors": images[image[keep]] - home[source],
-            "cell_offsets": offset,
-        }
-
-    @staticmethod
-    def _cell_offsets(lattice_vectors, cutoff):
-        counts = _replica_counts(lattice_vectors, cutoff)
-        ranges = [np.arange(-count, count + 1) for count in counts]
-        return np.array(list(itertools.product(*ranges)))
+        return _periodic_pairs(positions, self._lattice_vectors(), cutoff)
 
 
 @quantity("neighbor_list")
@@ -333,6 +588,197 @@ class NeighborList:
         """Convenient alias for :py:meth:`read`. Please read the documentation there."""
         return self.read(selection, cutoff=cutoff, sorted=sorted)
 
+    def pair_correlation(
+        self,
+        selection=None,
+        *,
+        rmax,
+        bin_width=0.05,
+        chunk_size=CHUNK_SIZE,
+        workers=1,
+    ) -> dict:
+        """Compute the pair-correlation function g(r) from the atom positions.
+
+        In contrast to :data:`~py4vasp.calculation.pair_correlation`, which reads the
+        g(r) VASP evaluated during the simulation, this method evaluates it from the
+        positions of the selected steps, so that you can choose the range, the
+        resolution, and the steps after the fact. Use the [] operator to select the
+        steps, e.g., ``neighbor_list[::10]`` to average over every tenth step. The
+        steps are read from the file in chunks and every chunk is histogrammed
+        independently, which allows distributing the work over several threads.
+
+        Parameters
+        ----------
+        selection : str
+            Select pairs of atom types with a tilde, e.g. 'Sr~Ti', a single atom type
+            to consider all of its neighbors, e.g. 'Sr', or 'total' for all pairs.
+            Combine multiple selections with commas or whitespace. By default, the
+            total and all element-resolved pair-correlation functions are returned.
+        rmax : float
+            The largest distance in Å included in the histogram. It is rounded up to
+            a multiple of the bin width.
+        bin_width : float
+            The width of the distance bins in Å.
+        chunk_size : int
+            Number of steps read from the file and histogrammed together.
+        workers : int
+            Number of threads used to histogram the chunks of steps.
+
+        Returns
+        -------
+        dict
+            Contains the centers of the distance bins and the pair-correlation
+            function for every selection. The functions approach 1 at large distances.
+
+        Examples
+        --------
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        Compute the pair-correlation function for all steps of the trajectory
+
+        >>> pair_correlation = calculation.neighbor_list[:].pair_correlation(rmax=5.0)
+        >>> list(pair_correlation)
+        ['distances', 'total', 'Sr~Sr', 'Sr~Ti', 'Sr~O', 'Ti~Ti', 'Ti~O', 'O~O']
+
+        Restrict the result to specific pairs and use a coarser resolution
+
+        >>> calculation.neighbor_list[:].pair_correlation("Ti~O", rmax=5.0, bin_width=0.5)
+        {'distances': array([0.25, ..., 4.75]), 'Ti~O': array([...])}
+        """
+        return merge_default(
+            self._source,
+            _DATA_QUANTITY,
+            selection,
+            self._handler_factory,
+            NeighborListHandler.pair_correlation,
+            rmax=rmax,
+            bin_width=bin_width,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
+
+    def coordination_number(
+        self,
+        selection=None,
+        *,
+        rmax,
+        bin_width=0.05,
+        chunk_size=CHUNK_SIZE,
+        workers=1,
+    ) -> dict:
+        """Compute the running coordination number from the atom positions.
+
+        The running coordination number counts how many neighbors an atom has on
+        average within a distance. It is accumulated from the same histogram of
+        distances as :py:meth:`pair_correlation`, see there for the selection of the
+        steps and the parallelization.
+
+        Parameters
+        ----------
+        selection : str
+            Select pairs of atom types with a tilde. The selection is directed, i.e.,
+            'Sr~O' counts the O neighbors of every Sr atom. A single atom type, e.g.
+            'Sr', counts all neighbors of that type and 'total' all neighbors of any
+            atom. By default, the total and all ordered pairs are returned.
+        rmax : float
+            The largest distance in Å included in the histogram. It is rounded up to
+            a multiple of the bin width.
+        bin_width : float
+            The width of the distance bins in Å.
+        chunk_size : int
+            Number of steps read from the file and histogrammed together.
+        workers : int
+            Number of threads used to histogram the chunks of steps.
+
+        Returns
+        -------
+        dict
+            Contains the upper boundaries of the distance bins and the average number
+            of neighbors within that distance for every selection.
+
+        Examples
+        --------
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        Count the O atoms around the Ti atoms
+
+        >>> calculation.neighbor_list[:].coordination_number("Ti~O", rmax=3.0, bin_width=1.0)
+        {'distances': array([1., 2., 3.]), 'Ti~O': array([...])}
+        """
+        return merge_default(
+            self._source,
+            _DATA_QUANTITY,
+            selection,
+            self._handler_factory,
+            NeighborListHandler.coordination_number,
+            rmax=rmax,
+            bin_width=bin_width,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
+
+    def bond_angles(
+        self,
+        selection=None,
+        *,
+        cutoff,
+        bin_width=1.0,
+        chunk_size=CHUNK_SIZE,
+        workers=1,
+    ) -> dict:
+        """Compute the distribution of bond angles from the atom positions.
+
+        Every pair of neighbors within the cutoff of a central atom forms a bond
+        angle. The angles of all selected steps are accumulated into a histogram, see
+        :py:meth:`pair_correlation` for the selection of the steps and the
+        parallelization.
+
+        Parameters
+        ----------
+        selection : str
+            Select the central atom type, e.g. 'Ti', to include all of its neighbors
+            or three atom types joined with tildes, e.g. 'O~Ti~O', where the middle
+            one is the central atom. Combine multiple selections with commas or
+            whitespace. By default, the angles around every atom type are returned.
+        cutoff : float
+            The neighbor cutoff radius in Å defining the bonds.
+        bin_width : float
+            The width of the angle bins in degrees.
+        chunk_size : int
+            Number of steps read from the file and histogrammed together.
+        workers : int
+            Number of threads used to histogram the chunks of steps.
+
+        Returns
+        -------
+        dict
+            Contains the centers of the angle bins in degrees and the normalized
+            distribution of the angles in 1/degree for every selection.
+
+        Examples
+        --------
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        Compute the O-Ti-O angles of the TiO6 octahedra
+
+        >>> calculation.neighbor_list[:].bond_angles("O~Ti~O", cutoff=2.5, bin_width=45)
+        {'angles': array([ 22.5,  67.5, 112.5, 157.5]), 'O~Ti~O': array([...])}
+        """
+        return merge_default(
+            self._source,
+            _DATA_QUANTITY,
+            selection,
+            self._handler_factory,
+            NeighborListHandler.bond_angles,
+            cutoff=cutoff,
+            bin_width=bin_width,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
+
     def selections(self) -> list:
         """Return every pair of atom types that can be selected.
 
@@ -8,7 +8,7 @@ from typing import Optional, Union
 import numpy as np
 
 from py4vasp import _config, exception
-from py4vasp._calculation import _stoichiometry, bader
+from py4vasp._calculation import _grid_expression, _stoichiometry, bader
 from py4vasp._calculation.dispatch import (
     DataSource,
     merge_default,
@@ -180,6 +180,22 @@ class PartialDensityHandler:
         selection = selection or "total"
         return {selection: self.to_numpy(selection)}
 
+    def _grid_terms(self, selection, band=0, kpoint=0):
+        band = int(self._check_band_index(band))
+        kpoint = int(self._check_kpoint_index(kpoint))
+        partial_charge = self._raw_partial_density.partial_charge
+        selection = selection or "total"
+        if not self._spin_polarized() or selection == "total":
+            return selection, [(1, partial_charge, (kpoint, band, 0))]
+        if selection in ("up", "down"):
+            sign = 1 if selection == "up" else -1
+            return selection, [
+                (0.5, partial_charge, (kpoint, band, 0)),
+                (0.5 * sign, partial_charge, (kpoint, band, 1)),
+            ]
+        message = f"Spin '{selection}' not understood. Use 'up', 'down' or 'total'."
+        raise exception.IncorrectUsage(message)
+
     def _spin_polarized(self):
         return self._raw_partial_density.partial_charge.shape[2] == 2
 
@@ -668,6 +684,38 @@ class PartialDensity(view.Mixin):
         """
         return bader.charge(self, selection, bader_analysis=bader_analysis)
 
+    def lazy(
+        self, selection: str = "total", band: int = 0, kpoint: int = 0
+    ) -> _grid_expression.GridExpression:
+        """Refer to a partial charge density without reading it.
+
+        The returned expression can be combined with other densities on the same
+        grid, e.g., to sum the partial densities of several bands. The data is read
+        from the files only when the result is converted, and then slab by slab.
+
+        Parameters
+        ----------
+        selection : str
+            The spin channel: "total", "up", or "down".
+        band : int
+            The band index. The default is 0, which means that all bands are summed.
+        kpoint : int
+            The k-point index. The default is 0, which means that all k-points are summed.
+
+        Returns
+        -------
+        GridExpression
+            An expression that evaluates to the selected partial charge density.
+
+        Examples
+        --------
+        >>> calculation = Calculation.from_path(".") # doctest: +SKIP
+        >>> bands = [calculation.partial_density.lazy(band=band) for band in (5, 6)] # doctest: +SKIP
+        >>> sum(bands).to_contour(c=0.5) # doctest: +SKIP
+        Graph(...)
+        """
+        return _grid_expression.from_quantity(self, selection, band=band, kpoint=kpoint)
+
     def _stoichiometry(self):
         return merge_default(
             self._source,
@@ -24,6 +24,8 @@ from py4vasp._raw.models import PhononBandModel
 from py4vasp._third_party import graph, view
 from py4vasp._util import check, convert, documentation, index, select
 
+_CHUNK_ELEMENTS = 2**22
+
 
 class PhononBandHandler:
     """Handler for phonon band structure data."""
@@ -70,9 +72,9 @@ class PhononBandHandler:
             "direction": ["x", "y", "z"],
         }
 
-    def to_view(self, supercell=None) -> view.View:
+    def to_view(self, supercell=None, qpoints=None) -> view.View:
         viewer = self._primitive_structure().to_view(supercell)
-        viewer.phonon = self._phonon_dispersion()
+        viewer.phonon = self._phonon_dispersion(qpoints)
         return viewer
 
     def _primitive_structure(self) -> StructureHandler:
@@ -89,24 +91,42 @@ class PhononBandHandler:
         )
         return StructureHandler.from_data(raw_structure)
 
-    def _phonon_dispersion(self) -> view.PhononDispersion:
-        eigenvectors = self._modes()
+    def _phonon_dispersion(self, qpoints) -> view.PhononDispersion:
+        dispersion = self._raw_phonon_band.dispersion
+        indices = self._qpoint_indices(qpoints)
+        eigenvectors = convert.to_complex(
+            _read_rows(self._raw_phonon_band.eigenvectors, indices)
+        )
         number_atoms = eigenvectors.shape[2]
-        kpoints = self._raw_phonon_band.dispersion.kpoints
         return view.PhononDispersion(
             eigenvectors=eigenvectors,
-            frequencies=self._raw_phonon_band.dispersion.eigenvalues[:],
-            qpoints=kpoints.coordinates[:],
+            frequencies=_read_rows(dispersion.eigenvalues, indices),
+            qpoints=_read_rows(dispersion.kpoints.coordinates, indices),
             supercell_matrix=np.eye(3),
             primitive_index=np.arange(number_atoms),
-            path_labels=self._path_labels(),
+            path_labels=self._path_labels(indices),
         )
 
-    def _path_labels(self):
+    def _qpoint_indices(self, qpoints):
+        number_qpoints = len(self._raw_phonon_band.dispersion.eigenvalues)
+        all_indices = np.arange(number_qpoints)
+        if qpoints is None:
+            return all_indices
+        try:
+            return np.atleast_1d(all_indices[qpoints])
+        except IndexError as error:
+            message = f"The q points {qpoints} cannot be selected from the {number_qpoints} q points of the band structure."
+            raise exception.IncorrectUsage(message) from error
+
+    def _path_labels(self, indices):
         labels = Kpoint.from_data(self._raw_phonon_band.dispersion.kpoints).labels()
         if labels is None:
             return None
-        path_labels = [[index, label] for index, label in enumerate(labels) if label]
+        path_labels = [
+            [new_index, labels[old_index]]
+            for new_index, old_index in enumerate(indices)
+            if labels[old_index]
+        ]
         return path_labels or None
 
     def _dispersion(self) -> DispersionHandler:
@@ -122,9 +142,25 @@ class PhononBandHandler:
         if not selection:
             return None
         maps = {2: self._init_atom_dict(), 3: self._init_direction_dict()}
-        selector = index.Selector(maps, np.abs(self._modes()), use_number_labels=True)
-        tree = select.Tree.from_selection(selection)
-        return {selector.label(sel): width * selector[sel] for sel in tree.selections()}
+        selections = list(select.Tree.from_selection(selection).selections())
+        projections = {}
+        for amplitudes in self._amplitude_chunks():
+            selector = index.Selector(maps, amplitudes, use_number_labels=True)
+            for sel in selections:
+                projections.setdefault(selector.label(sel), []).append(selector[sel])
+        return {
+            label: width * np.concatenate(parts) for label, parts in projections.items()
+        }
+
+    def _amplitude_chunks(self):
+        # the eigenvectors are stored with real and imaginary part in the last axis;
+        # reading a few q points at a time avoids a complex copy of the full dataset
+        eigenvectors = self._raw_phonon_band.eigenvectors
+        shape = eigenvectors.shape
+        chunk_size = max(1, _CHUNK_ELEMENTS // int(np.prod(shape[1:])))
+        for start in range(0, shape[0], chunk_size):
+            chunk = eigenvectors[start : start + chunk_size]
+            yield np.hypot(chunk[..., 0], chunk[..., 1])
 
     def _init_atom_dict(self) -> dict:
         return {
@@ -243,17 +279,21 @@ class PhononBand(graph.Mixin):
             PhononBandHandler.selections,
         )
 
-    def to_view(self, supercell=None) -> view.View:
+    def to_view(self, supercell=None, qpoints=None) -> view.View:
         """Visualize the phonon dispersion as animated modes in the primitive cell.
 
         The resulting :class:`~py4vasp.view.View` shows the primitive cell together
-        with the full phonon dispersion.
+        with the phonon dispersion.
 
         Parameters
         ----------
         supercell : int | np.ndarray | None = None
             If present the primitive cell is replicated the specified number of times
             along each direction, which is useful to visualize the phonon wave.
+        qpoints : int | slice | np.ndarray | None = None
+            Index of the **q** points passed to the viewer. Only the eigenvectors of
+            these **q** points are read, which keeps the view small for large cells
+            and dense paths. Defaults to all **q** points.
 
         Returns
         -------
@@ -274,6 +314,7 @@ class PhononBand(graph.Mixin):
             self._handler_factory,
             PhononBandHandler.to_view,
             supercell=supercell,
+            qpoints=qpoints,
         )
 
     def _is_available(self, raw_data, selection=None, method=None) -> bool:
@@ -295,3 +336,11 @@ class PhononBand(graph.Mixin):
             PhononBandHandler.from_data,
             PhononBandHandler.to_database,
         )
+
+
+def _read_rows(data, indices):
+    # HDF5 requires increasing indices, so read every q point once and reorder
+    unique_indices, inverse = np.unique(indices, return_inverse=True)
+    if len(unique_indices) == len(data):
+        return np.asarray(data[:])[inverse]
+    return np.asarray(data[unique_indices])[inverse]
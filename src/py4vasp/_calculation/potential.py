@@ -7,7 +7,7 @@ from typing import Optional, Union
 import numpy as np
 
 from py4vasp import _config, exception
-from py4vasp._calculation import _stoichiometry, bader
+from py4vasp._calculation import _grid_expression, _stoichiometry, bader
 from py4vasp._calculation.dispatch import (
     DataSource,
     _dispatch,
@@ -25,6 +25,7 @@ from py4vasp._util import (
     check,
     density,
     documentation,
+    grid,
     index,
     select,
     slicing,
@@ -119,13 +120,24 @@ class PotentialHandler:
             total_potential_mean_magnetization=total_potential_mean_magnetization,
         )
 
+    def to_numpy(self, selection="total", stride=None, region=None):
+        _raise_error_if_kind_incorrect(selection)
+        potential = self._get_potential(selection)
+        _raise_error_if_no_data(potential, selection)
+        return np.moveaxis(grid.read(potential, stride, region), 0, -1).T
+
     def to_view(
         self,
         selection: str = "total",
         supercell: Optional[Union[int, np.ndarray]] = None,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
         **user_options,
     ):
-        potentials = dict(self._get_potentials(selection))
+        resample = lambda potential: grid.downsample(
+            potential, resolution, downsampling
+        )
+        potentials = dict(self._get_potentials(selection, resample=resample))
         isosurface = self._create_isosurface(**user_options)
         viewer = self._structure().to_view(supercell)
         viewer.grid_scalars = [
@@ -167,11 +179,31 @@ class PotentialHandler:
     def _bader_grid(self, selection):
         return dict(self._get_potentials(selection or "total"))
 
-    def _get_potentials(self, selection, is_magnetic=False):
+    def _grid_terms(self, selection):
+        selections = list(select.Tree.from_selection(selection or "total").selections())
+        if len(selections) != 1:
+            _raise_error_if_not_single_potential(selection)
+        kind, component = self._determine_kind_and_component(selections[0])
+        _raise_error_if_kind_incorrect(kind)
+        potential = self._get_potential(kind)
+        _raise_error_if_no_data(potential, kind)
+        label = self._get_label(kind, component[0] if component else "")
+        map_ = self._create_map(potential)
+        if not component:
+            return label, [(1, potential, (0,))]
+        if len(component) != 1 or component[0] not in map_:
+            _raise_error_if_not_single_potential(selection)
+        if component[0] == "up":
+            return label, [(1, potential, (0,)), (1, potential, (1,))]
+        if component[0] == "down":
+            return label, [(1, potential, (0,)), (-1, potential, (1,))]
+        return label, [(1, potential, (map_[component[0]],))]
+
+    def _get_potentials(self, selection, is_magnetic=False, resample=None):
         tree = select.Tree.from_selection(selection)
         for selection in tree.selections():
             kind, component = self._determine_kind_and_component(selection)
-            selector = self._create_selector(kind, component, is_magnetic)
+            selector = self._create_selector(kind, component, is_magnetic, resample)
             component_label = component[0] if component else ""
             yield self._get_label(kind, component_label), selector[component].T
 
@@ -186,11 +218,11 @@ class PotentialHandler:
     def _get_label(self, kind, component):
         return f"{kind} potential" + (f"({component})" if component else "")
 
-    def _create_selector(self, kind, component, is_magnetic):
+    def _create_selector(self, kind, component, is_magnetic, resample=None):
         if is_magnetic:
             return self._create_magnetic_selector(kind, component)
         else:
-            return self._create_nonmagnetic_selector(kind)
+            return self._create_nonmagnetic_selector(kind, resample)
 
     def _create_magnetic_selector(self, kind, component):
         _raise_error_if_kind_incorrect(kind, ("total", "xc"))
@@ -199,8 +231,10 @@ class PotentialHandler:
         _raise_error_if_nonpolarized_potential(potential)
         return index.Selector(maps={}, data=potential, reduction=_PotentialReduction)
 
-    def _create_nonmagnetic_selector(self, kind):
+    def _create_nonmagnetic_selector(self, kind, resample=None):
         potential = self._get_potential(kind)
+        if resample is not None and not check.is_none(potential):
+            potential = resample(potential)
         maps = {0: self._create_map(potential)}
         return index.Selector(maps, potential, reduction=_PotentialReduction)
 
@@ -367,10 +401,44 @@ class Potential(view.Mixin):
         """Convenient alias for :py:meth:`read`. Please read the documentation there."""
         return self.read()
 
+    @documentation.format(parameters=grid.PARAMETERS)
+    def to_numpy(self, selection: str = "total", *, stride=None, region=None):
+        """Convert a kind of potential to a numpy array.
+
+        If you need only a coarse version or a part of the grid, use the stride and
+        region arguments; then only these grid points are read from the file.
+
+        Parameters
+        ----------
+        selection : str
+            Select the kind of potential: "total", "ionic", "xc", or "hartree".
+        {parameters}
+
+        Returns
+        -------
+        np.ndarray
+            All components of the selected potential. The number of components is 1
+            for nonpolarized calculations, 2 for collinear calculations, and 4 for
+            noncollinear calculations.
+        """
+        return merge_default(
+            self._source,
+            self._quantity_name,
+            selection,
+            self._handler_factory,
+            PotentialHandler.to_numpy,
+            stride=stride,
+            region=region,
+        )
+
+    @documentation.format(resolution=grid.RESOLUTION)
     def to_view(
         self,
         selection: str = "total",
         supercell: Optional[Union[int, np.ndarray]] = None,
+        *,
+        resolution: Optional[Union[int, np.ndarray]] = None,
+        downsampling: str = "block",
         **user_options,
     ):
         """Plot an isosurface of a selected potential.
@@ -382,6 +450,7 @@ class Potential(view.Mixin):
         supercell : int or np.ndarray
             If present the data is replicated the specified number of times along each
             direction.
+        {resolution}
         user_options
             Further arguments with keyword that get directly passed on to the
             visualizer. Most importantly, you can set isolevel (in eV) to adjust the
@@ -399,6 +468,8 @@ class Potential(view.Mixin):
             self._handler_factory,
             PotentialHandler.to_view,
             supercell=supercell,
+            resolution=resolution,
+            downsampling=downsampling,
             **user_options,
         )
 
@@ -547,6 +618,34 @@ class Potential(view.Mixin):
         """
         return bader.charge(self, selection, bader_analysis=bader_analysis)
 
+    def lazy(self, selection: str = "total") -> _grid_expression.GridExpression:
+        """Refer to a kind of potential without reading it.
+
+        The returned expression can be combined with the potentials of other
+        calculations on the same grid, e.g., to compute the change of the potential
+        or an average over snapshots. The data is read from the files only when the
+        result is converted, and then slab by slab.
+
+        Parameters
+        ----------
+        selection : str
+            Select the kind of potential and optionally a single component, e.g.,
+            "total", "xc(up)", or "hartree".
+
+        Returns
+        -------
+        GridExpression
+            An expression that evaluates to the selected potential.
+
+        Examples
+        --------
+        >>> charged = py4vasp.Calculation.from_path("charged")
+        >>> neutral = py4vasp.Calculation.from_path("neutral")
+        >>> change = charged.potential.lazy("hartree") - neutral.potential.lazy("hartree")
+        >>> change.to_contour(c=0.5, isolevels=False)
+        """
+        return _grid_expression.from_quantity(self, selection)
+
     def _to_database(self) -> dict:
         """Return {quantity[_selection]: handler_result} for database storage."""
         return merge_to_database(
@@ -596,6 +695,11 @@ selections are allowed: "{'", "'.join(VALID_KINDS)}". \
     raise exception.IncorrectUsage(message)
 
 
+def _raise_error_if_not_single_potential(selection):
+    message = f"The selection '{selection}' does not select a single potential. Please select one kind and at most one component, e.g., 'total' or 'xc(up)'."
+    raise exception.IncorrectUsage(message)
+
+
 def _raise_error_if_component_selected(component):
     if not component:
         return
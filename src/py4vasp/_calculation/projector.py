@@ -1,7 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 from py4vasp import exception
-from py4vasp._calculation import _stoichiometry
+from py4vasp._calculation import _projection_cache, _stoichiometry
 from py4vasp._calculation.dispatch import (
     DataSource,
     _dispatch,
@@ -139,7 +139,9 @@ class ProjectorHandler:
         if not selection:
             return {}
         self._raise_error_if_orbitals_missing()
-        selector = self._make_selector(projections)
+        selector = self._make_cached_selector(selection, projections)
+        if selector is None:
+            selector = self._make_selector(projections)
         return dict(self._create_projections(selector, selection))
 
     def _stoichiometry(self):
@@ -237,6 +239,38 @@ class ProjectorHandler:
                 atom, and orbital, respectively."""
             raise exception.IncorrectUsage(message) from None
 
+    def _make_cached_selector(self, selection, projections):
+        if not _projection_cache.is_enabled():
+            return None
+        elements = {
+            key: value
+            for key, value in self._init_atom_dict().items()
+            if not key.isdecimal()
+        }
+        channels = self._angular_momentum_channels()
+        spin_dict = self._init_spin_dict()
+        keys = {*elements, *channels, *spin_dict}
+        tree = select.Tree.from_selection(selection)
+        if not all(_only_contains(selection, keys) for selection in tree.selections()):
+            return None
+        reduced = _projection_cache.load_or_compute(projections, elements, channels)
+        if reduced is None:
+            return None
+        to_map = lambda keys: {key: slice(i, i + 1) for i, key in enumerate(keys)}
+        maps = {1: to_map(elements), 2: to_map(channels), 0: spin_dict}
+        return index.Selector(maps, reduced, use_number_labels=True)
+
+    def _angular_momentum_channels(self):
+        orbital_dict = self._init_orbital_dict()
+        if "px" not in orbital_dict:
+            return orbital_dict
+        number_orbitals = len(list(self._orbital_types()))
+        return {
+            channel: orbital_dict[channel]
+            for channel in ("s", "p", "d", "f")
+            if orbital_dict[channel].start < number_orbitals
+        }
+
     def _create_projections(self, selector, selection):
         spin_projections = []
         tree = select.Tree.from_selection(selection)
@@ -271,6 +305,17 @@ class ProjectorHandler:
             raise exception.IncorrectUsage(message)
 
 
+def _only_contains(selection, keys):
+    for part in selection:
+        if isinstance(part, select.Operation):
+            operands = part.left_operand, part.right_operand
+            if not all(_only_contains(operand, keys) for operand in operands):
+                return False
+        elif not isinstance(part, str) or part not in keys:
+            return False
+    return True
+
+
 @quantity("projector")
 class Projector:
     """The projectors used for atom and orbital resolved quantities.
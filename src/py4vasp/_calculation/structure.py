@@ -11,7 +11,7 @@ from typing import Union
 import numpy as np
 
 from py4vasp import exception, raw
-from py4vasp._calculation import _stoichiometry
+from py4vasp._calculation import _diffusion, _stoichiometry
 from py4vasp._calculation._stoichiometry import StoichiometryHandler
 from py4vasp._calculation.cell import CellHandler
 from py4vasp._calculation.dispatch import (
@@ -27,7 +27,7 @@ from py4vasp._calculation.symmetry import _SYMPREC, SymmetryHandler
 from py4vasp._raw.definition import unique_selections as _schema_unique_selections
 from py4vasp._raw.models import StoichiometryModel, StructureModel
 from py4vasp._third_party import view
-from py4vasp._util import check, import_, parse
+from py4vasp._util import check, documentation, import_, index, parse, select
 
 ase = import_.optional("ase")
 ase_io = import_.optional("ase.io")
@@ -71,6 +71,16 @@ class StandardizedCell:
     "The chemical element of every atom in the standardized cell."
 
 
+@dataclass
+class Diffusion:
+    """The diffusion coefficient of a selection of atoms in an MD simulation."""
+
+    coefficient: float
+    "The diffusion coefficient obtained from the slope of the MSD in cm²/s."
+    error: float
+    "The standard error of the coefficient estimated from blocks of the trajectory in cm²/s."
+
+
 class StructureHandler:
     """Processes structural data from a single raw.Structure object."""
 
@@ -278,6 +288,57 @@ Atoms # atomic
         else:
             return 1
 
+    def mean_square_displacement(
+        self, selection=None, time_step=1.0, chunk_size=_diffusion.CHUNK_SIZE
+    ) -> dict:
+        """Return the mean-square displacement of the selected atoms for every lag."""
+        labels, weights = self._atom_weights(selection)
+        msd, _ = _diffusion.mean_square_displacement(
+            self._raw_structure.positions,
+            self._slice,
+            self._trajectory_lattice_vectors(),
+            weights,
+            chunk_size=chunk_size,
+        )
+        return {
+            "time": self._time_lags(len(msd), time_step),
+            **dict(zip(labels, msd.T)),
+        }
+
+    def diffusion_coefficient(
+        self,
+        selection=None,
+        time_step=1.0,
+        fit_range=_diffusion.FIT_RANGE,
+        number_blocks=5,
+        chunk_size=_diffusion.CHUNK_SIZE,
+    ) -> dict:
+        """Return the diffusion coefficient of the selected atoms from the MSD."""
+        if not isinstance(number_blocks, (int, np.integer)) or number_blocks < 2:
+            message = f"The number of blocks must be an integer of at least 2 to estimate the error, got {number_blocks}."
+            raise exception.IncorrectUsage(message)
+        labels, weights = self._atom_weights(selection)
+        msd, block_msd = _diffusion.mean_square_displacement(
+            self._raw_structure.positions,
+            self._slice,
+            self._trajectory_lattice_vectors(),
+            weights,
+            number_blocks=number_blocks,
+            chunk_size=chunk_size,
+        )
+        # fit all MSDs over the same lags, which are limited by the length of a block
+        time = self._time_lags(block_msd.shape[1], time_step)
+        slope = _diffusion.fit_slope(time, msd[: len(time)], fit_range)
+        block_slopes = [
+            _diffusion.fit_slope(time, msd_, fit_range) for msd_ in block_msd
+        ]
+        error = np.std(block_slopes, axis=0, ddof=1) / np.sqrt(number_blocks)
+        to_cm2_per_s = _diffusion.A2_PER_FS_TO_CM2_PER_S / 6
+        return {
+            label: Diffusion(float(to_cm2_per_s * slope_), float(to_cm2_per_s * error_))
+            for label, slope_, error_ in zip(labels, slope, error)
+        }
+
     def equivalent_atoms(self) -> np.ndarray:
         """Return the orbit index of every atom under VASP's symmetry operations."""
         return self._orbit_labels()
@@ -522,6 +583,36 @@ Atoms # atomic
     def _stoichiometry(self) -> StoichiometryHandler:
         return StoichiometryHandler.from_data(self._raw_structure.stoichiometry)
 
+    def _atom_weights(self, selection):
+        stoichiometry = self._stoichiometry()
+        atom_map = {
+            key: value.indices
+            for key, value in stoichiometry.read().items()
+            if key != select.all
+        }
+        number_atoms = stoichiometry.number_atoms()
+        selector = index.Selector(
+            {0: atom_map},
+            np.arange(number_atoms),
+            reduction=index.Weights(number_atoms, average=True),
+            use_number_labels=True,
+        )
+        selection = selection or ", ".join(dict.fromkeys(stoichiometry.elements()))
+        selections = list(select.Tree.from_selection(selection).selections())
+        labels = [selector.label(selection) for selection in selections]
+        weights = np.array([selector[selection] for selection in selections]).T
+        return labels, weights
+
+    def _trajectory_lattice_vectors(self):
+        if not self._is_trajectory or self.number_steps() < 2:
+            message = "The mean-square displacement requires a trajectory with at least two steps. Please select the steps with the [] operator, e.g., `structure[:]`."
+            raise exception.IncorrectUsage(message)
+        return self._cell().lattice_vectors()
+
+    def _time_lags(self, number_steps, time_step):
+        stride = self._slice.step or 1
+        return time_step * stride * np.arange(number_steps)
+
     def _cell(self) -> CellHandler:
         return CellHandler.from_data(self._raw_structure.cell, steps=self._steps)
 
@@ -1387,6 +1478,125 @@ class Structure(view.Mixin):
             StructureHandler.number_steps,
         )
 
+    @documentation.format(parameters=_diffusion.PARAMETERS)
+    def mean_square_displacement(
+        self, selection=None, *, time_step=1.0, chunk_size=_diffusion.CHUNK_SIZE
+    ):
+        """Compute the mean-square displacement (MSD) of the atoms in an MD simulation.
+
+        The MSD measures how far the atoms move on average within a time lag. We
+        average over all time origins of the selected steps and all selected atoms.
+        Atoms crossing the boundary of the cell are followed into the neighboring cell
+        taking changes of the cell into account. The trajectory is read from the file
+        in chunks of a few atoms and the MSD is computed with fast Fourier transforms,
+        so that long trajectories of many atoms are processed efficiently.
+
+        Parameters
+        ----------
+        selection : str | None
+            Select the atoms for which the MSD is averaged, e.g., "Sr" for all Sr atoms
+            or "1:3" for the first three atoms. Separate multiple selections by commas.
+            By default, every element is analyzed separately.
+        {parameters}
+
+        Returns
+        -------
+        dict
+            Contains the time lags in fs and the MSD in Å² for every selection.
+
+        Examples
+        --------
+        First, we create some example data so that we can illustrate how to use this method.
+        You can also use your own VASP calculation data if you have it available.
+
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        The MSD requires multiple steps, so select the steps with the [] operator.
+        Without a selection, every element is analyzed separately.
+
+        >>> calculation.structure[:].mean_square_displacement(time_step=2.0)
+        {{'time': array([0., 2., 4., 6.]), 'Sr': array(...), 'Ti': array(...), 'O': array(...)}}
+
+        You can also select specific atoms.
+
+        >>> calculation.structure[:].mean_square_displacement("Sr, 3")
+        {{'time': array([0., 1., 2., 3.]), 'Sr': array(...), 'Ti_1': array(...)}}
+        """
+        return merge_default(
+            self._source,
+            self._quantity_name,
+            selection,
+            self._handler_factory,
+            StructureHandler.mean_square_displacement,
+            time_step=time_step,
+            chunk_size=chunk_size,
+        )
+
+    @documentation.format(parameters=_diffusion.PARAMETERS)
+    def diffusion_coefficient(
+        self,
+        selection=None,
+        *,
+        time_step=1.0,
+        fit_range=_diffusion.FIT_RANGE,
+        number_blocks=5,
+        chunk_size=_diffusion.CHUNK_SIZE,
+    ):
+        """Compute the diffusion coefficient from the mean-square displacement (MSD).
+
+        In the diffusive regime, the MSD grows linearly with the time lag and the
+        slope is six times the diffusion coefficient. We fit a straight line to the
+        MSD within the *fit_range* of time lags. To estimate the statistical error, the
+        trajectory is split into blocks and the fit is repeated for every block; the
+        error is the standard error of the mean over the blocks.
+
+        Parameters
+        ----------
+        selection : str | None
+            Select the atoms for which the diffusion coefficient is computed, e.g., "Sr"
+            for all Sr atoms or "1:3" for the first three atoms. Separate multiple
+            selections by commas. By default, every element is analyzed separately.
+        fit_range : tuple[float, float]
+            First and last time lag used for the fit relative to the length of a block.
+            Short lags are excluded, because the motion is ballistic, and long lags,
+            because few time origins contribute to them.
+        number_blocks : int
+            Number of blocks the trajectory is split into to estimate the error.
+        {parameters}
+
+        Returns
+        -------
+        dict[str, Diffusion]
+            The diffusion coefficient and its error in cm²/s for every selection.
+
+        Examples
+        --------
+        First, we create some example data so that we can illustrate how to use this method.
+        You can also use your own VASP calculation data if you have it available.
+
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        The diffusion coefficient requires multiple steps, so select the steps with the
+        [] operator. The example trajectory is very short, so we use only two blocks
+        and fit over all time lags of a block.
+
+        >>> calculation.structure[:].diffusion_coefficient(number_blocks=2, fit_range=(0, 1))
+        {{'Sr': Diffusion(coefficient=..., error=...), 'Ti': Diffusion(...), 'O': Diffusion(...)}}
+        """
+        return merge_default(
+            self._source,
+            self._quantity_name,
+            selection,
+            self._handler_factory,
+            StructureHandler.diffusion_coefficient,
+            time_step=time_step,
+            fit_range=fit_range,
+            number_blocks=number_blocks,
+            chunk_size=chunk_size,
+        )
+
     def equivalent_atoms(self):
         """Group the atoms into orbits of the symmetry operations VASP determined.
 
@@ -4,12 +4,13 @@ import copy
 
 import numpy as np
 
-from py4vasp import _config, raw
-from py4vasp._calculation import slice_
+from py4vasp import _config, exception, raw
+from py4vasp._calculation import _vacf, slice_
 from py4vasp._calculation.dispatch import (
     DataSource,
     _dispatch,
     merge_default,
+    merge_graphs,
     merge_strings,
     merge_to_database,
     quantity,
@@ -17,7 +18,8 @@ from py4vasp._calculation.dispatch import (
 )
 from py4vasp._calculation.structure import StructureHandler
 from py4vasp._raw.models import VelocityModel
-from py4vasp._third_party import view
+from py4vasp._third_party import graph, view
+from py4vasp._util import documentation, index, select
 
 
 class VelocityHandler:
@@ -115,6 +117,109 @@ class VelocityHandler:
         viewer.ion_arrows = [ion_arrow]
         return viewer
 
+    def autocorrelation(
+        self,
+        selection=None,
+        time_step=1.0,
+        number_lags=None,
+        masses=None,
+        mass_weighted=True,
+        chunk_size=_vacf.CHUNK_SIZE,
+    ) -> dict:
+        """Return the VACF of all atoms and of the selected projections."""
+        labels, weights = self._projection_weights(selection, masses, mass_weighted)
+        number_lags = self._number_lags(number_lags)
+        vacf = _vacf.autocorrelation(
+            self._raw_velocity.velocities,
+            self._to_slice,
+            weights,
+            number_lags,
+            chunk_size=chunk_size,
+        )
+        time = time_step * (self._to_slice.step or 1) * np.arange(number_lags)
+        return {"time": time, **dict(zip(labels, vacf.T))}
+
+    def vibrational_dos(
+        self,
+        selection=None,
+        time_step=1.0,
+        number_lags=None,
+        window="hann",
+        masses=None,
+        mass_weighted=True,
+        chunk_size=_vacf.CHUNK_SIZE,
+    ) -> dict:
+        """Return the vibrational DOS normalized to the number of modes."""
+        data = self.autocorrelation(
+            selection, time_step, number_lags, masses, mass_weighted, chunk_size
+        )
+        time = data.pop("time")
+        vacf = np.array(list(data.values())).T
+        frequencies, spectra = _vacf.spectrum(vacf, time[1] - time[0], window)
+        # every atom contributes three modes; the integral of the total fixes the scale
+        number_modes = 3 * self._raw_velocity.velocities.shape[1]
+        total_weight = np.trapezoid(spectra[:, 0], frequencies)
+        if not total_weight > 0:
+            message = "The vibrational DOS cannot be normalized, because the spectrum of the selected velocities vanishes. Please check that the atoms move in the selected steps."
+            raise exception.NoData(message)
+        spectra *= number_modes / total_weight
+        return {"frequencies": frequencies, **dict(zip(data, spectra.T))}
+
+    def vibrational_dos_graph(self, selection=None, **kwargs) -> graph.Graph:
+        """Plot the vibrational DOS of all atoms and of the selected projections."""
+        data = self.vibrational_dos(selection, **kwargs)
+        frequencies = data.pop("frequencies")
+        return graph.Graph(
+            series=[
+                graph.Series(frequencies, dos, label) for label, dos in data.items()
+            ],
+            xlabel="ν (THz)",
+            ylabel="DOS (1/THz)",
+        )
+
+    def _projection_weights(self, selection, masses, mass_weighted):
+        stoichiometry = StructureHandler.from_data(
+            self._raw_velocity.structure
+        )._stoichiometry()
+        number_atoms = stoichiometry.number_atoms()
+        atom_map = {
+            key: value.indices
+            for key, value in stoichiometry.read().items()
+            if key != select.all
+        }
+        direction_map = {"x": slice(0, 1), "y": slice(1, 2), "z": slice(2, 3)}
+        selector = index.Selector(
+            {0: atom_map, 1: direction_map},
+            np.arange(3 * number_atoms).reshape(number_atoms, 3),
+            reduction=index.Weights(3 * number_atoms),
+            use_number_labels=True,
+        )
+        labels = ["total"]
+        weights = [np.ones(3 * number_atoms)]
+        if selection:
+            for selection_ in select.Tree.from_selection(selection).selections():
+                labels.append(selector.label(selection_))
+                weights.append(selector[selection_])
+        weights = np.array(weights).T
+        if mass_weighted:
+            weights *= np.repeat(stoichiometry.masses(masses), 3)[:, np.newaxis]
+        return labels, weights
+
+    def _number_lags(self, number_lags):
+        velocities = self._raw_velocity.velocities
+        number_steps = len(range(len(velocities))[self._to_slice])
+        if velocities.ndim != 3 or number_steps < 2:
+            message = "The velocity autocorrelation requires a trajectory with at least two steps. Please select the steps with the [] operator, e.g., `velocity[:]`."
+            raise exception.IncorrectUsage(message)
+        if number_lags is None:
+            return max(number_steps // 2, 2)
+        if not isinstance(number_lags, (int, np.integer)) or not (
+            2 <= number_lags <= number_steps
+        ):
+            message = f"The number of lags {number_lags} must be an integer between 2 and the number of selected steps {number_steps}."
+            raise exception.IncorrectUsage(message)
+        return int(number_lags)
+
     def number_steps(self) -> int:
         """Return the number of velocities in the trajectory."""
         n = len(np.array(self._raw_velocity.velocities))
@@ -372,6 +477,128 @@ class Velocity(view.Mixin):
             supercell,
         )
 
+    @documentation.format(parameters=_vacf.PARAMETERS)
+    def autocorrelation(
+        self,
+        selection: str | None = None,
+        *,
+        time_step: float = 1.0,
+        number_lags: int | None = None,
+        masses: dict | None = None,
+        mass_weighted: bool = True,
+        chunk_size: int = _vacf.CHUNK_SIZE,
+    ) -> dict:
+        """Compute the velocity autocorrelation function (VACF) of an MD simulation.
+
+        The VACF correlates the velocity of every atom with its velocity after a time
+        lag averaged over all time origins of the selected steps. The velocities are
+        read from the file in chunks of a few atoms and correlated with fast Fourier
+        transforms, so that long trajectories of many atoms are processed efficiently.
+
+        Parameters
+        ----------
+        selection : str | None
+            Project the VACF onto atoms and directions with the same syntax as for
+            the phonon DOS, e.g., "Sr" for all Sr atoms, "1:3(x)" for the x component
+            of the first three atoms. Separate multiple projections by commas.
+        {parameters}
+
+        Returns
+        -------
+        dict
+            Contains the time lags in fs, the VACF summed over all atoms and the VACF
+            of the selected projections. With mass weighting, the VACF is given in
+            amu Å²/fs², otherwise in Å²/fs².
+
+        Examples
+        --------
+        First, we create some example data so that we can illustrate how to use this
+        method. You can also use your own VASP calculation data if you have it available.
+
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        The VACF requires multiple steps, so select the steps with the [] operator.
+
+        >>> calculation.velocity[:].autocorrelation("Sr, Ti(z)", time_step=2.0)
+        {{'time': array([0., 2.]), 'total': array(...), 'Sr': array(...), 'Ti_z': array(...)}}
+        """
+        return merge_default(
+            self._source,
+            self._quantity_name,
+            selection,
+            self._handler_factory,
+            VelocityHandler.autocorrelation,
+            time_step=time_step,
+            number_lags=number_lags,
+            masses=masses,
+            mass_weighted=mass_weighted,
+            chunk_size=chunk_size,
+        )
+
+    @documentation.format(parameters=_vacf.PARAMETERS, window=_vacf.WINDOW)
+    def vibrational_dos(
+        self,
+        selection: str | None = None,
+        *,
+        time_step: float = 1.0,
+        number_lags: int | None = None,
+        window: str = "hann",
+        masses: dict | None = None,
+        mass_weighted: bool = True,
+        chunk_size: int = _vacf.CHUNK_SIZE,
+    ) -> graph.Graph:
+        """Plot the vibrational density of states (DOS) of an MD simulation.
+
+        The vibrational DOS is the Fourier transform of the mass-weighted velocity
+        autocorrelation function. In contrast to the phonon DOS computed from the
+        force constants, it includes the anharmonic effects at the temperature of the
+        simulation. The DOS is normalized such that the total DOS integrates to the
+        number of modes, i.e., three times the number of atoms.
+
+        Parameters
+        ----------
+        selection : str | None
+            Project the DOS onto atoms and directions with the same syntax as for the
+            phonon DOS, e.g., "Sr" for all Sr atoms, "1:3(x)" for the x component of
+            the first three atoms. Separate multiple projections by commas.
+        {window}
+        {parameters}
+
+        Returns
+        -------
+        Graph
+            The total vibrational DOS and the selected projections as a function of
+            the frequency in THz.
+
+        Examples
+        --------
+        First, we create some example data so that we can illustrate how to use this
+        method. You can also use your own VASP calculation data if you have it available.
+
+        >>> from py4vasp import demo
+        >>> calculation = demo.calculation(path)
+
+        The DOS requires multiple steps, so select the steps with the [] operator. In
+        practice, you need long trajectories to resolve the spectrum.
+
+        >>> calculation.velocity[:].vibrational_dos("O", number_lags=4)
+        Graph(series=[Series(..., label='total', ...), Series(..., label='O', ...)], xlabel='ν (THz)', ..., ylabel='DOS (1/THz)', ...)
+        """
+        return merge_graphs(
+            self._source,
+            self._quantity_name,
+            selection,
+            self._handler_factory,
+            VelocityHandler.vibrational_dos_graph,
+            time_step=time_step,
+            number_lags=number_lags,
+            window=window,
+            masses=masses,
+            mass_weighted=mass_weighted,
+            chunk_size=chunk_size,
+        )
+
     def number_steps(self) -> int:
         """Return the number of velocities in the trajectory."""
         return merge_default(
@@ -11,7 +11,7 @@ from py4vasp import exception, raw
 from py4vasp._raw.definition import DEFAULT_FILE, DEFAULT_SOURCE, schema
 from py4vasp._raw.mapping import Mapping
 from py4vasp._raw.schema import Length, Link, error_message
-from py4vasp._util import check, convert
+from py4vasp._util import check, convert, profile
 
 
 @contextlib.contextmanager
@@ -87,6 +87,7 @@ class _State:
 
     def _open_file(self, filename):
         if filename in self._files:
+            profile.cache_hit(filename)
             return self._files[filename]
         else:
             file = self._create_and_enter_context(filename)
@@ -94,6 +95,10 @@ class _State:
             return file
 
     def _create_and_enter_context(self, filename):
+        with profile.phase("open", filename):
+            return self._open_hdf5_file(filename)
+
+    def _open_hdf5_file(self, filename):
         try:
             h5f = h5py.File(filename, "r")
         except FileNotFoundError as error:
@@ -112,6 +117,10 @@ class _State:
     def _check_version(self, h5f, required, quantity):
         if not required:
             return
+        with profile.phase("version", h5f.filename):
+            self._check_required_version(h5f, required, quantity)
+
+    def _check_required_version(self, h5f, required, quantity):
         try:
             version = raw.Version(
                 major=h5f[schema.version.major][()],
@@ -0,0 +1,126 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Combine the output of restarted MD runs into a single virtual trajectory.
+
+Long MD simulations are typically split into several runs, each restarting from the
+final structure of the previous one and writing its own HDF5 file. Here, we create a
+new HDF5 file that does not copy any data. Every dataset resolved per ionic step is
+an HDF5 virtual dataset concatenating the corresponding datasets of all runs along
+the steps. All other datasets are external links to the last run, which contains the
+final results. Because the paths are the same as in the file written by VASP, the
+combined file can be used like the output of a single long run.
+"""
+
+import contextlib
+import pathlib
+
+import h5py
+
+from py4vasp import exception
+from py4vasp._raw.definition import DEFAULT_FILE
+
+TRAJECTORY = "intermediate/ion_dynamics"
+"Group of the file containing the data resolved per ionic step."
+
+_POSITIONS = f"{TRAJECTORY}/position_ions"
+
+
+def concatenate(paths, destination):
+    """Combine the trajectories of several runs into one file without copying data.
+
+    The file refers to the runs by their absolute path, so the runs must not be moved
+    after creating the file. Datasets of the trajectory that are missing in some of
+    the runs or do not contain every step are omitted, because their steps cannot be
+    aligned.
+
+    Parameters
+    ----------
+    paths : Sequence[str or pathlib.Path]
+        The HDF5 files of the runs or the directories containing them in the order
+        of the simulation.
+    destination : str or pathlib.Path
+        The file to which the combined trajectory is written. An existing file is
+        overwritten.
+    """
+    filenames = [_filename(path) for path in paths]
+    destination = pathlib.Path(destination)
+    _raise_error_if_destination_is_run(filenames, destination)
+    with contextlib.ExitStack() as stack:
+        runs = [stack.enter_context(h5py.File(name, "r")) for name in filenames]
+        number_steps = [_number_steps(run) for run in runs]
+        with h5py.File(destination, "w") as h5f:
+            _combine(h5f, runs, number_steps)
+
+
+def _filename(path):
+    path = pathlib.Path(path)
+    if path.is_dir():
+        path = path / DEFAULT_FILE
+    if not path.is_file():
+        raise exception.FileAccessError(f"Cannot concatenate {path}, it is not a file.")
+    return path.resolve()
+
+
+def _raise_error_if_destination_is_run(filenames, destination):
+    if not filenames:
+        message = "Please provide at least one run to concatenate."
+        raise exception.IncorrectUsage(message)
+    if destination.exists() and destination.resolve() in filenames:
+        message = f"Cannot write the concatenated runs to {destination}, because it is one of the runs."
+        raise exception.IncorrectUsage(message)
+
+
+def _number_steps(run):
+    if _POSITIONS not in run:
+        message = f"The file {run.filename} does not contain a trajectory. Please check that all runs are MD or relaxation runs."
+        raise exception.NoData(message)
+    return len(run[_POSITIONS])
+
+
+def _combine(h5f, runs, number_steps):
+    last_run = runs[-1]
+    h5f.attrs.update(last_run.attrs)
+    objects = []
+    last_run.visititems(lambda name, obj: objects.append((name, obj)))
+    for name, obj in objects:
+        if isinstance(obj, h5py.Group):
+            h5f.create_group(name).attrs.update(obj.attrs)
+            continue
+        kind = _kind(name, runs, number_steps)
+        if kind == "steps":
+            _create_virtual_dataset(h5f, name, runs)
+        elif kind == "static":
+            h5f[name] = h5py.ExternalLink(last_run.filename, name)
+
+
+def _kind(name, runs, number_steps):
+    if not name.startswith(f"{TRAJECTORY}/"):
+        return "static"
+    datasets = [run.get(name) for run in runs]
+    if any(not isinstance(dataset, h5py.Dataset) for dataset in datasets):
+        return None
+    per_step = [
+        dataset.ndim > 0 and dataset.dtype.kind in "biufc" and len(dataset) == steps
+        for dataset, steps in zip(datasets, number_steps)
+    ]
+    if not any(per_step):
+        # data like the labels of the energies is the same for all steps
+        return "static"
+    if not all(per_step):
+        return None
+    if any(dataset.shape[1:] != datasets[0].shape[1:] for dataset in datasets):
+        message = f"The shape of {name} differs between the runs. Please make sure all runs simulate the same system."
+        raise exception.DataMismatch(message)
+    return "steps"
+
+
+def _create_virtual_dataset(h5f, name, runs):
+    datasets = [run[name] for run in runs]
+    total = sum(len(dataset) for dataset in datasets)
+    dtype = datasets[-1].dtype
+    layout = h5py.VirtualLayout(shape=(total, *datasets[0].shape[1:]), dtype=dtype)
+    start = 0
+    for dataset in datasets:
+        layout[start : start + len(dataset)] = h5py.VirtualSource(dataset)
+        start += len(dataset)
+    h5f.create_virtual_dataset(name, layout).attrs.update(datasets[-1].attrs)
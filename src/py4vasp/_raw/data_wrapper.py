@@ -5,6 +5,7 @@ import textwrap
 import numpy as np
 
 from py4vasp import exception
+from py4vasp._util import profile
 
 
 class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
@@ -45,9 +46,13 @@ class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
             self._data = data
 
     def __array__(self, *args, **kwargs):
+        if self._is_read_from_file():
+            return self._read_from_file(lambda data: np.array(data, *args, **kwargs))
         return np.array(self.data, *args, **kwargs)
 
     def __getitem__(self, key):
+        if self._is_read_from_file():
+            return self._read_from_file(lambda data: data[key])
         return self.data[key]
 
     def __repr__(self):
@@ -56,6 +61,17 @@ class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
     def __len__(self):
         return len(self.data)
 
+    def _is_read_from_file(self):
+        return profile.is_active() and not isinstance(
+            self._data, (np.ndarray, type(None))
+        )
+
+    def _read_from_file(self, read):
+        with profile.phase("read", getattr(self._data, "name", "")) as event:
+            result = read(self.data)
+            event.nbytes = getattr(result, "nbytes", 0)
+        return result
+
     def is_none(self):
         return self._data is None
 
@@ -1,6 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 
+import functools
 import numbers
 import re
 import types
@@ -138,48 +139,74 @@ def _coerce_field(value, annotation, name):
     aliases enforce their length; ``List[...]`` allows a variable number of elements.
     Raises :class:`exception.DataMismatch` (naming the field) on any mismatch.
     """
+    return _compile_coercer(annotation)(value, name)
+
+
+@functools.cache
+def _compile_coercer(annotation):
+    """Build a function ``coerce(value, name)`` implementing :func:`_coerce_field`.
+
+    The annotation is analyzed once per process, so constructing a model only runs the
+    checks on the values and not the ``typing`` introspection of every field.
+    """
     inner, is_optional = _strip_optional(annotation)
-    if isinstance(value, VaspData):
-        value = None if value.is_none() else value._data
-    if value is None:
-        if is_optional:
-            return None
-        raise exception.DataMismatch(f"Field '{name}' must not be None.")
     origin = typing.get_origin(inner)
     if origin is tuple:
-        return _coerce_sequence(value, typing.get_args(inner), name, fixed=True)
-    if origin is list:
-        return _coerce_sequence(value, typing.get_args(inner), name, fixed=False)
-    if origin is None:
-        return _coerce_scalar(value, inner, name)
+        convert = _sequence_coercer(typing.get_args(inner), fixed=True)
+    elif origin is list:
+        convert = _sequence_coercer(typing.get_args(inner), fixed=False)
+    elif origin is None:
+        convert = lambda value, name: _coerce_scalar(value, inner, name)
+    else:
+        convert = lambda value, name: _unsupported_annotation(name, annotation)
+
+    def coerce(value, name):
+        if isinstance(value, VaspData):
+            value = None if value.is_none() else value._data
+        if value is None:
+            if is_optional:
+                return None
+            raise exception.DataMismatch(f"Field '{name}' must not be None.")
+        return convert(value, name)
+
+    return coerce
+
+
+def _unsupported_annotation(name, annotation):
     raise exception.DataMismatch(
         f"Field '{name}' has an unsupported type annotation '{annotation}'."
     )
 
 
-def _coerce_sequence(value, args, name, *, fixed):
-    if isinstance(value, np.ndarray):
-        elements = list(value)
-    elif isinstance(value, (list, tuple)):
-        elements = list(value)
-    else:
-        raise exception.DataMismatch(
-            f"Field '{name}' expected a sequence but got '{type(value).__name__}'."
-        )
+def _sequence_coercer(args, *, fixed):
     if fixed:
-        if len(elements) != len(args):
+        coercers = [_compile_coercer(arg) for arg in args]
+    else:
+        coerce_element = _compile_coercer(args[0])
+
+    def coerce(value, name):
+        if isinstance(value, (np.ndarray, list, tuple)):
+            elements = list(value)
+        else:
+            raise exception.DataMismatch(
+                f"Field '{name}' expected a sequence but got '{type(value).__name__}'."
+            )
+        if not fixed:
+            return [
+                coerce_element(element, f"{name}[{index}]")
+                for index, element in enumerate(elements)
+            ]
+        if len(elements) != len(coercers):
             raise exception.DataMismatch(
-                f"Field '{name}' expected {len(args)} elements but got {len(elements)}."
+                f"Field '{name}' expected {len(coercers)} elements but got "
+                f"{len(elements)}."
             )
         return tuple(
-            _coerce_field(element, args[index], f"{name}[{index}]")
-            for index, element in enumerate(elements)
+            coerce_element(element, f"{name}[{index}]")
+            for index, (coerce_element, element) in enumerate(zip(coercers, elements))
         )
-    element_type = args[0]
-    return [
-        _coerce_field(element, element_type, f"{name}[{index}]")
-        for index, element in enumerate(elements)
-    ]
+
+    return coerce
 
 
 def _coerce_scalar(value, target, name):
@@ -234,9 +261,14 @@ class _DatabaseModel:
     """
 
     def __post_init__(self):
-        for field in fields(self):
-            value = getattr(self, field.name)
-            setattr(self, field.name, _coerce_field(value, field.type, field.name))
+        for name, coerce in _field_coercers(type(self)):
+            setattr(self, name, coerce(getattr(self, name), name))
+
+
+@functools.cache
+def _field_coercers(model):
+    "The name and the compiled coercion function of every field of the model."
+    return tuple((field.name, _compile_coercer(field.type)) for field in fields(model))
 
 
 @dataclass
@@ -0,0 +1,195 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Copy a VASP HDF5 file into a layout optimized for the analysis.
+
+VASP chooses the chunks of its datasets for writing, e.g., it appends one ionic step
+at a time. py4vasp reads the data in different patterns: it selects steps of a
+trajectory, k points of the projections, or slabs of a grid. Repacking copies every
+group, dataset, and attribute to the same path of a new file, but stores the datasets
+of the schema with chunks along the axis the analysis slices. Optionally, the datasets
+are compressed with a lossless filter. Because the paths do not change, all quantities
+can be read from the repacked file.
+"""
+
+import dataclasses
+import functools
+import pathlib
+
+import h5py
+import numpy as np
+
+from py4vasp import exception
+from py4vasp._raw.definition import schema
+from py4vasp._util import check
+
+CHUNK_BYTES = 2**20
+"Default size of the chunks of the repacked datasets in bytes."
+
+BUFFER_BYTES = 2**26
+"Maximal number of bytes copied from the source to the destination at once."
+
+COMPRESSIONS = ("gzip", "lzf")
+"Lossless compression filters available for the repacked datasets."
+
+_GRIDS = (
+    "current_density",
+    "density",
+    "exciton_density",
+    "nics",
+    "partial_density",
+    "potential",
+)
+_PROJECTIONS = ("projections", "band_projections")
+
+
+def repack(source, destination, *, compression=None, shuffle=False, chunk_bytes=None):
+    """Copy the VASP output in *source* into *destination* with a new layout.
+
+    Datasets of trajectories are chunked along the ionic steps, projections on atoms
+    and orbitals along the k points, and quantities on the FFT grid along slabs of
+    the z axis. All other datasets are copied unchanged unless they are compressed.
+
+    Parameters
+    ----------
+    source : str or pathlib.Path
+        The HDF5 file written by VASP.
+    destination : str or pathlib.Path
+        The file to which the repacked data is written. An existing file is
+        overwritten.
+    compression : str | None
+        Compress all nonscalar datasets with one of the filters gzip or lzf.
+    shuffle : bool
+        Apply the shuffle filter before the compression, which often improves the
+        compression of floating point data.
+    chunk_bytes : int | None
+        Approximate size of every chunk in bytes. Larger chunks make reading large
+        parts of a dataset faster, smaller chunks reading small parts.
+    """
+    source = pathlib.Path(source)
+    destination = pathlib.Path(destination)
+    _raise_error_if_same_file(source, destination)
+    filters = _filters(compression, shuffle)
+    chunk_bytes = _chunk_bytes(chunk_bytes)
+    with h5py.File(source, "r") as h5_source, h5py.File(destination, "w") as h5_dest:
+        h5_dest.attrs.update(h5_source.attrs)
+        for name, obj in _walk(h5_source):
+            if isinstance(obj, h5py.Group):
+                h5_dest.create_group(name).attrs.update(obj.attrs)
+            else:
+                _copy_dataset(h5_source, h5_dest, name, filters, chunk_bytes)
+
+
+def _raise_error_if_same_file(source, destination):
+    if not source.is_file():
+        raise exception.FileAccessError(f"Cannot repack {source}, it is not a file.")
+    if destination.exists() and destination.samefile(source):
+        message = (
+            f"Cannot repack {source} in place. Please provide a different destination."
+        )
+        raise exception.IncorrectUsage(message)
+
+
+def _filters(compression, shuffle):
+    if compression is not None and compression not in COMPRESSIONS:
+        message = f"The compression {compression!r} is not implemented. Please use one of {', '.join(COMPRESSIONS)}."
+        raise exception.NotImplemented(message)
+    if shuffle and compression is None:
+        message = "The shuffle filter only improves compressed data. Please select a compression as well."
+        raise exception.IncorrectUsage(message)
+    return {"compression": compression, "shuffle": bool(shuffle)}
+
+
+def _chunk_bytes(chunk_bytes):
+    if chunk_bytes is None:
+        return CHUNK_BYTES
+    check.raise_error_if_not_positive_integer(chunk_bytes, "chunk size in bytes")
+    return int(chunk_bytes)
+
+
+def _walk(h5f):
+    objects = []
+    h5f.visititems(lambda name, obj: objects.append((name, obj)))
+    return objects
+
+
+def _copy_dataset(h5_source, h5_dest, name, filters, chunk_bytes):
+    dataset = h5_source[name]
+    layout = _layout(name, dataset)
+    if not _is_chunkable(dataset) or (layout is None and not filters["compression"]):
+        h5_source.copy(dataset, h5_dest, name=name)
+        return
+    chunks = True if layout is None else _chunks(dataset, *layout, chunk_bytes)
+    copy = h5_dest.create_dataset(
+        name, shape=dataset.shape, dtype=dataset.dtype, chunks=chunks, **filters
+    )
+    copy.attrs.update(dataset.attrs)
+    _copy_blocks(dataset, copy, axis=0 if layout is None else layout[0])
+
+
+def _is_chunkable(dataset):
+    # scalars, empty datasets, and variable length data gain nothing from chunking
+    return dataset.ndim > 0 and dataset.size > 0 and dataset.dtype.kind != "O"
+
+
+def _layout(name, dataset):
+    # axis along which the chunks are split and whether the leading axes are split
+    kind = _kinds().get(name)
+    if kind == "trajectory":
+        return 0, False
+    if kind == "projections" and dataset.ndim == 5:
+        # (spin, atom, orbital, k point, band)
+        return 3, False
+    if kind == "grid" and dataset.ndim >= 4:
+        # (..., grid z, grid y, grid x), read one component and slab at a time
+        return dataset.ndim - 3, True
+    return None
+
+
+@functools.cache
+def _kinds():
+    result = {}
+    for quantity, sources in schema.sources.items():
+        for source in sources.values():
+            if source.data is None:
+                continue
+            for field in dataclasses.fields(source.data):
+                target = getattr(source.data, field.name)
+                if not isinstance(target, str) or "{" in target:
+                    continue
+                target = target.lstrip("/")
+                kind = _kind(quantity, field.name, target)
+                if kind is not None:
+                    result.setdefault(target, kind)
+    return result
+
+
+def _kind(quantity, field, target):
+    if target.startswith("intermediate/ion_dynamics/"):
+        return "trajectory"
+    if field in _PROJECTIONS:
+        return "projections"
+    if quantity in _GRIDS:
+        return "grid"
+    return None
+
+
+def _chunks(dataset, axis, split_leading, chunk_bytes):
+    chunks = list(dataset.shape)
+    if split_leading:
+        chunks[:axis] = [1] * axis
+    chunks[axis] = 1
+    bytes_per_slice = dataset.dtype.itemsize * np.prod(chunks)
+    chunks[axis] = int(np.clip(chunk_bytes // bytes_per_slice, 1, dataset.shape[axis]))
+    return tuple(chunks)
+
+
+def _copy_blocks(source, destination, axis):
+    # copy whole chunks of the destination, but at most about BUFFER_BYTES at once
+    chunk_length = destination.chunks[axis]
+    bytes_per_slice = source.dtype.itemsize * source.size // source.shape[axis]
+    number_chunks = BUFFER_BYTES // (bytes_per_slice * chunk_length)
+    block_length = chunk_length * max(1, number_chunks)
+    for start in range(0, source.shape[axis], block_length):
+        key = [slice(None)] * source.ndim
+        key[axis] = slice(start, start + block_length)
+        destination[tuple(key)] = source[tuple(key)]
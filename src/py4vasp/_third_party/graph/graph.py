@@ -19,7 +19,7 @@ from py4vasp._config import VASP_COLORS
 from py4vasp._third_party.graph.contour import Contour
 from py4vasp._third_party.graph.series import Series
 from py4vasp._third_party.graph.trace import Trace
-from py4vasp._util import import_, merge
+from py4vasp._util import import_, merge, profile
 
 go = import_.optional("plotly.graph_objects")
 pio = import_.optional("plotly.io")
@@ -270,6 +270,61 @@ class Graph(Sequence):
     def __add__(self, other):
         return Graph(tuple(self) + tuple(other), **_merge_fields(self, other))
 
+    @classmethod
+    def merge(cls, graphs, labels=None):
+        """Combine many graphs into a single one.
+
+        The result is the same as adding all graphs with `+`, but the series are
+        collected in a single pass instead of copying them for every addition. All
+        fields other than the series are merged in the same way as for the addition.
+
+        Parameters
+        ----------
+        graphs : Sequence[Graph]
+            The graphs combined in the given order.
+        labels : Sequence[str]
+            If provided, each graph is labeled with the corresponding entry in the
+            same way as :meth:`label` does, without modifying the original graphs.
+
+        Returns
+        -------
+        Graph
+            A graph containing the series of all graphs.
+
+        Examples
+        --------
+        Combine the graphs of several calculations and label them.
+
+        >>> x = np.array([1, 2, 3])
+        >>> graphs = [py4vasp.plot(x, x**2, "data"), py4vasp.plot(x, x**3, "data")]
+        >>> py4vasp.graph.Graph.merge(graphs, labels=["first", "second"])
+        Graph(series=(Series(..., label='first', ...), Series(..., label='second', ...)), ...)
+        """
+        graphs = list(graphs)
+        labels = [None] * len(graphs) if labels is None else list(labels)
+        if len(labels) != len(graphs):
+            message = (
+                f"The number of labels {len(labels)} does not match the number of "
+                f"graphs {len(graphs)}."
+            )
+            raise exception.IncorrectUsage(message)
+        parts = [tuple(graph) for graph in graphs]
+        series = [None] * sum(len(part) for part in parts)
+        merged_fields = {}
+        start = 0
+        for graph, part, label in zip(graphs, parts, labels):
+            end = start + len(part)
+            if label is None:
+                series[start:end] = part
+            else:
+                series[start:end] = (graph._make_label(line, label) for line in part)
+            start = end
+            for name in _MERGED_FIELDS:
+                merged_fields[name] = merge.merge_field_or_raise(
+                    merged_fields.get(name), getattr(graph, name), name, "graphs"
+                )
+        return cls(tuple(series), **merged_fields)
+
     def __getitem__(self, index):
         return np.atleast_1d(self.series)[index]
 
@@ -318,6 +373,10 @@ class Graph(Sequence):
         >>> fig = graph.to_plotly()
         >>> fig.write_html(path / "my_graph.html")
         """
+        with profile.phase("graph", self.title or ""):
+            return self._to_plotly()
+
+    def _to_plotly(self):
         _register_vasp_template()
         figure = self._make_plotly_figure()
         for trace, options in self._generate_plotly_traces():
@@ -578,11 +637,14 @@ class Graph(Sequence):
         0           1           3              0.5
         1           2           4              0.8
         """
-        df = pd.DataFrame()
+        columns = {}
         for series in np.atleast_1d(self.series):
-            _df = self._create_and_populate_df(series)
-            df = df.join(_df, how="outer")
-        return df
+            for name, column in self._series_columns(series):
+                if name in columns:
+                    message = f"The column {name} occurs more than once. Please make sure that every series has a unique label."
+                    raise exception.IncorrectUsage(message)
+                columns[name] = column
+        return pd.DataFrame(_pad_columns(columns))
 
     def to_csv(self, filename: str | Path) -> None:
         """Export graph data to a CSV file.
@@ -644,16 +706,14 @@ class Graph(Sequence):
         df = self.to_frame()
         df.to_csv(filename, index=False)
 
-    def _create_and_populate_df(self, series):
-        df = pd.DataFrame()
-        df[self._name_column(series, "x", None)] = series.x
+    def _series_columns(self, series):
+        yield self._name_column(series, "x", None), series.x
         for idx, series_y in enumerate(np.atleast_2d(series.y)):
-            df[self._name_column(series, "y", idx)] = series_y
+            yield self._name_column(series, "y", idx), series_y
         if series.weight is not None:
             assert series.weight.ndim == series.y.ndim
             for idx, series_weight in enumerate(np.atleast_2d(series.weight)):
-                df[self._name_column(series, "weight", idx)] = series_weight
-        return df
+                yield self._name_column(series, "weight", idx), series_weight
 
     def _name_column(self, series, suffix, idx=None):
         if series.label:
@@ -682,6 +742,26 @@ def _set_color_if_not_present(series, color_iterator):
 Graph._fields = tuple(field.name for field in fields(Graph))
 
 
+def _pad_columns(columns):
+    # series of different length are padded with NaN at the end, which is what an
+    # outer join on the index of the individual series produces
+    columns = {name: np.asarray(column) for name, column in columns.items()}
+    length = max((len(column) for column in columns.values()), default=0)
+    return {
+        name: column if len(column) == length else _pad(column, length)
+        for name, column in columns.items()
+    }
+
+
+def _pad(column, length):
+    padded = np.full(length, np.nan)
+    padded[: len(column)] = column
+    return padded
+
+
+_MERGED_FIELDS = tuple(field.name for field in fields(Graph) if field.name != "series")
+
+
 def _merge_fields(left_graph, right_graph):
     return {
         field.name: _merge_field(left_graph, right_graph, field.name)
@@ -1,5 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import concurrent.futures
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
@@ -17,16 +19,28 @@ class AAAConfig:
     max_terms: int = 100
     clean_up: bool = True
     clean_up_tol: float = 1e-13
+    workers: int = 1
+    "Number of processes used to continue independent data sets in parallel."
+
+
+_CHUNKS_PER_WORKER = 4
 
 
 def analytic_continuation(z_in, f_in, z_out, *, config: AAAConfig = AAAConfig()):
     shape = f_in.shape
     data_sets = f_in.reshape((-1, shape[-1]))
-    f_out = [
+    continue_chunk = functools.partial(
+        _analytic_continuation_chunk, z_in, z_out=z_out, config=config
+    )
+    f_out = _map_unique_data_sets(continue_chunk, data_sets, config.workers)
+    return np.reshape(f_out, shape[:-1] + (len(z_out),))
+
+
+def _analytic_continuation_chunk(z_in, data_sets, z_out, config):
+    return [
         _analytic_continuation_single(z_in, data_set, z_out, config)
         for data_set in data_sets
     ]
-    return np.reshape(f_out, shape[:-1] + (len(z_out),))
 
 
 def _analytic_continuation_single(z_in, f_in, z_out, config):
@@ -41,18 +55,43 @@ def _analytic_continuation_single(z_in, f_in, z_out, config):
     return aaa(z_out)
 
 
-def interpolate_with_function(function, x_in, y_in, x_out):
+def interpolate_with_function(function, x_in, y_in, x_out, *, workers=1):
     shape = y_in.shape
     data_sets = y_in.reshape((-1, shape[-1]))
-    y_out = np.array(
-        [
-            _interpolate_with_function_single(function, x_in, data_set, x_out)
-            for data_set in data_sets
-        ]
+    interpolate_chunk = functools.partial(
+        _interpolate_with_function_chunk, function, x_in, x_out=x_out
     )
+    y_out = _map_unique_data_sets(interpolate_chunk, data_sets, workers)
     return y_out.reshape(shape[:-1] + (len(x_out),))
 
 
+def _interpolate_with_function_chunk(function, x_in, data_sets, x_out):
+    return [
+        _interpolate_with_function_single(function, x_in, data_set, x_out)
+        for data_set in data_sets
+    ]
+
+
 def _interpolate_with_function_single(function, x_in, y_in, x_out):
     parameters, _ = optimize.curve_fit(function, x_in, y_in)
     return function(x_out, *parameters)
+
+
+def _map_unique_data_sets(process_chunk, data_sets, workers):
+    """Apply *process_chunk* to every distinct data set and broadcast the results.
+
+    Many data sets are identical, e.g., symmetry-equivalent Wannier components or
+    degenerate spin channels, so each distinct data set is processed only once. The
+    distinct data sets are split into chunks that are distributed over a process
+    pool if more than one worker is requested.
+    """
+    unique_sets, inverse = np.unique(data_sets, axis=0, return_inverse=True)
+    number_chunks = min(len(unique_sets), max(workers, 1) * _CHUNKS_PER_WORKER)
+    chunks = np.array_split(unique_sets, max(number_chunks, 1))
+    if workers > 1 and len(chunks) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process_chunk, chunks))
+    else:
+        results = [process_chunk(chunk) for chunk in chunks]
+    results = np.array([result for chunk in results for result in chunk])
+    return results[inverse.reshape(-1)]
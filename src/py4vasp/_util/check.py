@@ -22,6 +22,12 @@ def raise_error_if_not_number(test_if_number, error_message):
         raise exception.IncorrectUsage(error_message)
 
 
+def raise_error_if_not_positive_integer(value, name):
+    if not isinstance(value, numbers.Integral) or value < 1:
+        message = f"The {name} must be a positive integer, got {value}."
+        raise exception.IncorrectUsage(message)
+
+
 def raise_error_if_not_callable(function, *args, **kwargs):
     signature = inspect.signature(function)
     try:
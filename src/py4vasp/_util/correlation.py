@@ -0,0 +1,68 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import numpy as np
+
+
+def autocorrelation(data, axis=0):
+    """Average of data(t) * data(t + lag) over all time origins t.
+
+    The correlation is computed with FFTs in O(T log T) instead of the O(T²) direct
+    sum. The data is zero padded to avoid the periodic wrap around of the discrete
+    Fourier transform.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Real data with the time along *axis*.
+    axis : int
+        Axis of the time.
+
+    Returns
+    -------
+    np.ndarray
+        The autocorrelation with the same shape as *data*. Every lag is normalized
+        by the number of time origins contributing to it.
+    """
+    data = np.asarray(data)
+    number_steps = data.shape[axis]
+    size = 2 * number_steps
+    transform = np.fft.rfft(data, size, axis=axis)
+    power = transform.real**2 + transform.imag**2
+    correlation = np.fft.irfft(power, size, axis=axis)
+    correlation = np.take(correlation, np.arange(number_steps), axis=axis)
+    return correlation / _expand(number_steps - np.arange(number_steps), axis, data)
+
+
+def mean_square_displacement(positions):
+    """Mean-square displacement averaged over all time origins.
+
+    Uses the decomposition MSD(m) = S1(m) - 2 S2(m), where S2 is the autocorrelation of
+    the positions evaluated with FFTs and S1 follows from cumulative sums of the
+    squared positions.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Unwrapped Cartesian positions with shape (steps, ..., 3).
+
+    Returns
+    -------
+    np.ndarray
+        The mean-square displacement for every lag with shape (steps, ...).
+    """
+    positions = np.asarray(positions)
+    number_steps = len(positions)
+    square = np.sum(positions**2, axis=-1)
+    zero = np.zeros_like(square[:1])
+    forward = np.concatenate((zero, np.cumsum(square, axis=0)[:-1]))
+    backward = np.concatenate((zero, np.cumsum(square[::-1], axis=0)[:-1]))
+    counts = _expand(number_steps - np.arange(number_steps), 0, square)
+    first_term = (2 * np.sum(square, axis=0) - forward - backward) / counts
+    second_term = np.sum(autocorrelation(positions, axis=0), axis=-1)
+    return first_term - 2 * second_term
+
+
+def _expand(counts, axis, data):
+    shape = [1] * data.ndim
+    shape[axis] = len(counts)
+    return counts.reshape(shape)
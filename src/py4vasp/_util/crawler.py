@@ -0,0 +1,195 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Export only the calculations that changed since the last run to the database.
+
+Preparing the database data of a calculation reads and refines every quantity, so
+a crawler that revisits a large project repeatedly should skip calculations that
+were already exported. We keep a manifest of every exported file that records its
+size, modification time, and a hash of the version and a few key datasets. A file
+is exported again if it is new, if its size changed, if only its modification time
+changed but the hash differs, or if the database models changed since the manifest
+was written.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import pathlib
+import warnings
+
+import h5py
+import numpy as np
+
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.models import schema_fingerprint
+from py4vasp._util.manifest import read_manifest, write_manifest
+
+KEY_DATASETS = (
+    "version/major",
+    "version/minor",
+    "version/patch",
+    "intermediate/ion_dynamics/energies",
+    "intermediate/ion_dynamics/position_ions",
+    "results/positions/position_ions",
+    "results/electron_eigenvalues/eigenvalues",
+)
+"Datasets whose content identifies a calculation; missing datasets are skipped."
+
+HASH_BYTES = 2**20
+"Datasets larger than this only contribute their first and last entry to the hash."
+
+
+def export_changed(paths, manifest, *, workers=None, force=False):
+    """Prepare the database data of all new or changed calculations.
+
+    The calculations are exported concurrently and yielded as soon as they are
+    finished. A calculation is recorded in the manifest only after the caller
+    processed it, i.e., when the next item is requested, so an interrupted crawl
+    exports the unprocessed calculations again next time. The manifest is written
+    when the iteration stops.
+
+    Files that cannot be read or exported issue a warning and are skipped without
+    being recorded in the manifest, so the next crawl tries them again.
+
+    Parameters
+    ----------
+    paths : Iterable[str or pathlib.Path]
+        The directories of the calculations or their HDF5 files. Paths that do not
+        contain a file are skipped and removed from the manifest.
+    manifest : str or pathlib.Path
+        The file recording the calculations exported previously. It is created if
+        it does not exist.
+    workers : int or None
+        Maximal number of threads exporting calculations concurrently. By default,
+        the choice is left to :class:`concurrent.futures.ThreadPoolExecutor`.
+    force : bool
+        Export all calculations irrespective of the manifest.
+
+    Yields
+    ------
+    tuple[pathlib.Path, _DatabaseData]
+        The HDF5 file and the database data of every new or changed calculation.
+    """
+    manifest = pathlib.Path(manifest)
+    schema = _schema_hash()
+    entries = {} if force else _read_manifest(manifest, schema)
+    work = []
+    for filename in map(_filename, paths):
+        if not filename.is_file():
+            entries.pop(str(filename), None)
+            continue
+        try:
+            entry = _unchanged_entry(filename, entries.get(str(filename)))
+        except Exception as error:
+            _skip(filename, error, entries)
+            continue
+        if entry is None:
+            work.append(filename)
+        else:
+            entries[str(filename)] = entry
+    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    try:
+        futures = {executor.submit(_export, filename): filename for filename in work}
+        for future in concurrent.futures.as_completed(futures):
+            filename = futures[future]
+            try:
+                entry, database_data = future.result()
+            except Exception as error:
+                _skip(filename, error, entries)
+                continue
+            yield filename, database_data
+            entries[str(filename)] = entry
+    finally:
+        executor.shutdown(cancel_futures=True)
+        _write_manifest(manifest, schema, entries)
+
+
+def _skip(filename, error, entries):
+    entries.pop(str(filename), None)
+    message = f"Skipping {filename}, because it could not be exported: {error!r}"
+    warnings.warn(message, UserWarning)
+
+
+def _export(filename):
+    from py4vasp import Calculation
+
+    # record the state before the export, so that changes during the export are
+    # detected by the next crawl
+    entry = _entry(filename)
+    return entry, Calculation.from_file(filename)._to_database()
+
+
+def fingerprint(filename):
+    """Hash the version and the key datasets of a VASP HDF5 file.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The HDF5 file.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 hash of the content.
+    """
+    hash_ = hashlib.sha256()
+    with h5py.File(filename, "r") as h5f:
+        for name in KEY_DATASETS:
+            dataset = h5f.get(name)
+            if not isinstance(dataset, h5py.Dataset):
+                continue
+            hash_.update(f"{name}{dataset.shape}{dataset.dtype}".encode())
+            hash_.update(_sample(dataset).tobytes())
+    return hash_.hexdigest()
+
+
+def _sample(dataset):
+    if dataset.ndim == 0 or dataset.nbytes <= HASH_BYTES or len(dataset) == 0:
+        return np.asarray(dataset[()])
+    return np.stack((dataset[0], dataset[-1]))
+
+
+def _filename(path):
+    path = pathlib.Path(path).expanduser().resolve()
+    return path / DEFAULT_FILE if path.is_dir() else path
+
+
+def _unchanged_entry(filename, entry):
+    # returns the updated entry of an unchanged file or None if it must be exported
+    if entry is None:
+        return None
+    status = os.stat(filename)
+    if entry["size"] != status.st_size:
+        return None
+    if entry["mtime"] == status.st_mtime_ns:
+        return entry
+    # the file was touched or copied, check whether the key datasets changed; the
+    # hash samples only part of the file, so it cannot excuse a change of the size
+    if entry["hash"] != fingerprint(filename):
+        return None
+    return {**entry, "size": status.st_size, "mtime": status.st_mtime_ns}
+
+
+def _entry(filename):
+    status = os.stat(filename)
+    hash_ = fingerprint(filename)
+    return {"size": status.st_size, "mtime": status.st_mtime_ns, "hash": hash_}
+
+
+def _schema_hash():
+    content = json.dumps(schema_fingerprint(), sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _read_manifest(manifest, schema):
+    return read_manifest(manifest, schema=schema).get("calculations", {})
+
+
+def _write_manifest(manifest, schema, entries):
+    write_manifest(
+        manifest,
+        schema_version=schema_fingerprint()["schema_version"],
+        schema=schema,
+        calculations=entries,
+    )
@@ -285,6 +285,9 @@ def get_formula_and_compound(
 def get_dataclass_fields(dataclass: Any) -> List[dict]:
     """Get the fields of a dataclass as a list of dictionaries.
 
+    The fields are collected once per dataclass, so repeated calls do not parse the
+    source code again.
+
     Parameters
     ----------
     dataclass : Any
@@ -296,18 +299,24 @@ def get_dataclass_fields(dataclass: Any) -> List[dict]:
         A list of dictionaries, each containing the name, type, and
         optional field documentation of a dataclass field.
     """
+    if not isinstance(dataclass, type):
+        dataclass = type(dataclass)
+    return [dict(field) for field in _cached_dataclass_fields(dataclass)]
+
+
+@functools.cache
+def _cached_dataclass_fields(dataclass: type) -> Tuple[dict, ...]:
     from dataclasses import fields
 
-    dataclass_fields = fields(dataclass)
     docstrings = _get_dataclass_field_docstrings(dataclass)
-    return [
+    return tuple(
         {
             "name": field.name,
             "type": field.type,
             "documentation": docstrings.get(field.name),
         }
-        for field in dataclass_fields
-    ]
+        for field in fields(dataclass)
+    )
 
 
 def _get_dataclass_field_docstrings(dataclass: Any) -> Dict[str, Optional[str]]:
@@ -320,9 +329,7 @@ def _get_dataclass_field_docstrings(dataclass: Any) -> Dict[str, Optional[str]]:
         source_file = inspect.getsourcefile(dataclass)
         if source_file is None:
             return {}
-        source = Path(source_file).read_text()
-        tree = ast.parse(source)
-        class_node = _find_class_node(tree, dataclass.__name__)
+        class_node = _find_class_node(_parse_source(source_file), dataclass.__name__)
         if class_node is None:
             return {}
 
@@ -338,6 +345,12 @@ def _get_dataclass_field_docstrings(dataclass: Any) -> Dict[str, Optional[str]]:
     return {}
 
 
+@functools.cache
+def _parse_source(source_file: str) -> ast.Module:
+    # all models share a few source files, so parse each of them only once
+    return ast.parse(Path(source_file).read_text())
+
+
 def _find_class_node(tree: ast.AST, class_name: str) -> Optional[ast.ClassDef]:
     for node in tree.body:
         if isinstance(node, ast.ClassDef) and node.name == class_name:
@@ -368,6 +381,10 @@ def _extract_following_docstring(
     return doc if isinstance(doc, str) else None
 
 
+def _get_constant_value(node: ast.AST) -> Any:
+    return node.value if isinstance(node, ast.Constant) else None
+
+
 def get_all_possible_keys(
     to_print: bool = False, debug: bool = False
 ) -> tuple[Dict[str, List[Tuple[str, str]]], Dict[str, Optional[str]]]:
@@ -384,7 +401,18 @@ def get_all_possible_keys(
                         their dataclass names. If no matching dataclass exists, the value is None.
                         The default selection is represented without a suffix, e.g. "band"
                         instead of "band:default".
+
+    The keys are enumerated once per process; later calls return copies of the result.
     """
+    all_keys, output_type_dict, main_keys = _possible_keys()
+    if to_print:
+        _print_possible_keys(all_keys, output_type_dict)
+    main_keys = {name: list(fields) for name, fields in main_keys.items()}
+    return main_keys, dict(output_type_dict)
+
+
+@functools.cache
+def _possible_keys():
     all_keys = {}
 
     from py4vasp._calculation import GROUPS, QUANTITIES
@@ -443,32 +471,6 @@ def get_all_possible_keys(
         output_type_dict["energy"] = "EnergyRelaxationModel"
         output_type_dict["energy:afqmc"] = "EnergyAfqmcModel"
 
-    sort_keys_list = ["energy"]
-
-    if to_print:
-        print("\n--- PARSED KEYS: ---")
-        for k, v in sorted(all_keys.items()):
-            if v is not None and len(v) > 0:
-                print(f"\t{k}:")
-                should_sort = k in sort_keys_list
-                vsort = sorted(v) if should_sort else v
-                for subkey in vsort:
-                    print(f"\t\t- {subkey}")
-
-        print("\n--- EMPTY KEYS ---")
-        for k, v in sorted(all_keys.items()):
-            if v is not None and len(v) == 0:
-                print(f"\t{k}")
-
-        print("\n--- MISSING _to_database ---")
-        for k, v in sorted(all_keys.items()):
-            if v is None:
-                print(f"\t{k}")
-
-        print("\n--- OUTPUT TYPE DICT ---")
-        for k, v in sorted(output_type_dict.items()):
-            print(f"\t{k}:\n\t\ttype: {v}")
-
     main_keys = {
         dataclass_name: _get_dataclass_field_tuples(dataclass_name)
         for k in sorted(all_keys.keys())
@@ -482,7 +484,34 @@ def get_all_possible_keys(
     output_type_dict = {
         k: v for k, v in sorted(output_type_dict.items(), key=lambda item: item[0])
     }
-    return main_keys, output_type_dict
+    return all_keys, output_type_dict, main_keys
+
+
+def _print_possible_keys(all_keys, output_type_dict):
+    sort_keys_list = ["energy"]
+
+    print("\n--- PARSED KEYS: ---")
+    for k, v in sorted(all_keys.items()):
+        if v is not None and len(v) > 0:
+            print(f"\t{k}:")
+            should_sort = k in sort_keys_list
+            vsort = sorted(v) if should_sort else v
+            for subkey in vsort:
+                print(f"\t\t- {subkey}")
+
+    print("\n--- EMPTY KEYS ---")
+    for k, v in sorted(all_keys.items()):
+        if v is not None and len(v) == 0:
+            print(f"\t{k}")
+
+    print("\n--- MISSING _to_database ---")
+    for k, v in sorted(all_keys.items()):
+        if v is None:
+            print(f"\t{k}")
+
+    print("\n--- OUTPUT TYPE DICT ---")
+    for k, v in sorted(output_type_dict.items()):
+        print(f"\t{k}:\n\t\ttype: {v}")
 
 
 @functools.cache
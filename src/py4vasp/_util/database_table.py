@@ -0,0 +1,273 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Write the database data of many calculations as columnar tables.
+
+The database data of a calculation is a nested dictionary of model dataclasses. To
+ingest many calculations at once, we collect the models of the same type into one
+table with a column for every field of the model. Every row identifies the
+calculation by its path together with the quantity and the selection of the model.
+The metadata of the calculations is written to an additional table. The type of every
+column follows from the annotation of the field, so all batches of calculations
+share the same schema. The tables are written batch by batch either as Parquet
+files or into an SQLite database.
+"""
+
+import dataclasses
+import datetime
+import functools
+import json
+import pathlib
+import sqlite3
+import types
+import typing
+
+from py4vasp._raw.data import CalculationMetaData
+from py4vasp._util import check, convert, database, import_
+
+pa = import_.optional("pyarrow")
+pa_parquet = import_.optional("pyarrow.parquet")
+
+BATCH_SIZE = 1000
+"Default number of calculations converted to columns and written at once."
+
+METADATA_TABLE = "calculation"
+"Name of the table containing the metadata of every calculation."
+
+KEY_COLUMNS = ("path", "quantity", "selection")
+"Columns identifying every row of the tables of the models."
+
+
+def to_columns(database_data):
+    """Collect the models of all calculations into columns.
+
+    Parameters
+    ----------
+    database_data : Iterable[_DatabaseData]
+        The data returned by ``Calculation._to_database`` for every calculation.
+
+    Returns
+    -------
+    dict[str, tuple[type, dict[str, list]]]
+        For every table, the dataclass describing its rows and a list of values for
+        every column.
+    """
+    tables = {}
+    for data in database_data:
+        path = str(data.metadata.path)
+        _append_row(tables, CalculationMetaData, data.metadata, {})
+        for quantity, selections in data.properties.items():
+            for selection, model in selections.items():
+                if not dataclasses.is_dataclass(model):
+                    continue
+                keys = {"path": path, "quantity": quantity, "selection": selection}
+                _append_row(tables, type(model), model, keys)
+    return {_table_name(model): (model, columns) for model, columns in tables.items()}
+
+
+def write_parquet(directory, database_data, batch_size=BATCH_SIZE):
+    """Write one Parquet file for every table into the directory.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        The directory containing the tables; it is created if necessary. Every
+        table is written to a file named after the model, e.g., band_model.parquet.
+    database_data : Iterable[_DatabaseData]
+        The data returned by ``Calculation._to_database`` for every calculation.
+    batch_size : int
+        Number of calculations converted and written at once.
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    writers = {}
+    try:
+        for batch in _batches(database_data, batch_size):
+            for name, (model, columns) in to_columns(batch).items():
+                schema = _arrow_schema(model)
+                if name not in writers:
+                    filename = directory / f"{name}.parquet"
+                    writers[name] = pa_parquet.ParquetWriter(filename, schema)
+                table = pa.table(_arrow_columns(model, columns), schema=schema)
+                writers[name].write_table(table)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+
+def write_sqlite(filename, database_data, batch_size=BATCH_SIZE):
+    """Insert the rows of every table into an SQLite database.
+
+    Tables that do not exist are created. Sequences are stored as JSON text, so that
+    they can be decoded with the JSON functions of SQLite. Every calculation is
+    identified by its path; writing a calculation again replaces all its rows, so
+    re-exporting changed calculations does not duplicate them.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The SQLite database; it is created if necessary.
+    database_data : Iterable[_DatabaseData]
+        The data returned by ``Calculation._to_database`` for every calculation.
+    batch_size : int
+        Number of calculations converted and inserted in one transaction.
+    """
+    connection = sqlite3.connect(filename)
+    try:
+        for batch in _batches(database_data, batch_size):
+            tables = to_columns(batch)
+            with connection:
+                _delete_calculations(connection, tables[METADATA_TABLE][1]["path"])
+                for name, (model, columns) in tables.items():
+                    _insert_rows(connection, name, model, columns)
+    finally:
+        connection.close()
+
+
+def _append_row(tables, model, instance, keys):
+    columns = tables.setdefault(model, {name: [] for name in _column_types(model)})
+    for name, value in keys.items():
+        columns[name].append(value)
+    for field in dataclasses.fields(model):
+        columns[field.name].append(getattr(instance, field.name))
+
+
+def _table_name(model):
+    if model is CalculationMetaData:
+        return METADATA_TABLE
+    return convert.quantity_name(model.__name__)
+
+
+def _batches(database_data, batch_size):
+    check.raise_error_if_not_positive_integer(batch_size, "batch size")
+    batch = []
+    for data in database_data:
+        batch.append(data)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@functools.cache
+def _column_types(model):
+    if model is CalculationMetaData:
+        columns = {}
+    else:
+        columns = dict.fromkeys(KEY_COLUMNS, str)
+    # resolve annotations given as strings, e.g., in the metadata
+    annotations = typing.get_type_hints(model)
+    for field in database.get_dataclass_fields(model):
+        columns[field["name"]] = _strip_optional(annotations[field["name"]])
+    return columns
+
+
+@functools.cache
+def _column_documentation(model):
+    return {
+        field["name"]: field["documentation"]
+        for field in database.get_dataclass_fields(model)
+    }
+
+
+def _strip_optional(annotation):
+    if typing.get_origin(annotation) not in (typing.Union, types.UnionType):
+        return annotation
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    # unions of several types, e.g., str or Path, are stored as strings
+    return args[0] if len(args) == 1 else str
+
+
+def _is_sequence(annotation):
+    return typing.get_origin(annotation) in (list, tuple)
+
+
+@functools.cache
+def _arrow_schema(model):
+    documentation = _column_documentation(model)
+    fields = []
+    for name, annotation in _column_types(model).items():
+        metadata = (
+            {"description": documentation[name]} if documentation.get(name) else None
+        )
+        fields.append(pa.field(name, _arrow_type(annotation), metadata=metadata))
+    return pa.schema(fields)
+
+
+def _arrow_type(annotation):
+    if _is_sequence(annotation):
+        args = typing.get_args(annotation)
+        if typing.get_origin(annotation) is tuple:
+            return pa.list_(_arrow_type(args[0]), len(args))
+        return pa.list_(_arrow_type(args[0]))
+    types_ = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        datetime.datetime: pa.timestamp("us"),
+    }
+    return types_.get(annotation, pa.string())
+
+
+def _arrow_columns(model, columns):
+    return {
+        name: _convert_strings(annotation, columns[name])
+        for name, annotation in _column_types(model).items()
+    }
+
+
+def _convert_strings(annotation, values):
+    if annotation in (bool, int, float, datetime.datetime) or _is_sequence(annotation):
+        return values
+    return [None if value is None else str(value) for value in values]
+
+
+def _sqlite_type(annotation):
+    types_ = {bool: "INTEGER", int: "INTEGER", float: "REAL"}
+    return types_.get(annotation, "TEXT")
+
+
+def _sqlite_value(annotation, value):
+    if value is None:
+        return None
+    if _is_sequence(annotation):
+        return json.dumps(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if annotation in (bool, int, float):
+        return value
+    return str(value)
+
+
+def _delete_calculations(connection, paths):
+    # remove all rows of the calculations, including models they no longer produce
+    paths = [(str(path),) for path in paths]
+    query = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    for (name,) in connection.execute(query).fetchall():
+        columns = connection.execute(f'PRAGMA table_info("{name}")').fetchall()
+        if any(column[1] == "path" for column in columns):
+            connection.executemany(f'DELETE FROM "{name}" WHERE "path" = ?', paths)
+
+
+def _insert_rows(connection, name, model, columns):
+    column_types = _column_types(model)
+    definition = ", ".join(
+        f'"{column}" {_sqlite_type(annotation)}'
+        for column, annotation in column_types.items()
+    )
+    keys = ("path",) if model is CalculationMetaData else KEY_COLUMNS
+    primary_key = ", ".join(f'"{key}"' for key in keys)
+    connection.execute(
+        f'CREATE TABLE IF NOT EXISTS "{name}" ({definition}, PRIMARY KEY ({primary_key}))'
+    )
+    names = ", ".join(f'"{column}"' for column in column_types)
+    placeholders = ", ".join("?" for _ in column_types)
+    rows = zip(
+        *(
+            [_sqlite_value(annotation, value) for value in columns[column]]
+            for column, annotation in column_types.items()
+        )
+    )
+    connection.executemany(
+        f'INSERT OR REPLACE INTO "{name}" ({names}) VALUES ({placeholders})', rows
+    )
@@ -0,0 +1,101 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Find the output files of VASP calculations in large directory trees.
+
+Projects with many calculations store their results in deep directory trees, which
+may contain millions of entries. We scan the directories concurrently with
+:func:`os.scandir`, which returns the type of every entry without an additional
+system call. Optionally, the content of every directory is stored in a manifest
+together with its modification time. Adding or removing an entry changes the
+modification time of its directory, so the next discovery only scans directories
+that changed and reuses the manifest for all others.
+"""
+
+import concurrent.futures
+import os
+import pathlib
+
+from py4vasp import exception
+from py4vasp._util.manifest import read_manifest, write_manifest
+
+
+def find_files(root, filename, *, manifest=None, workers=None):
+    """Find all files with the given name in the directory tree below *root*.
+
+    Parameters
+    ----------
+    root : str or pathlib.Path
+        The top directory of the tree.
+    filename : str
+        Name of the files searched for, e.g., vaspout.h5.
+    manifest : str or pathlib.Path or None
+        If set, read the content of the directories that did not change since the
+        last discovery from this file and update it afterwards.
+    workers : int or None
+        Maximal number of threads scanning directories concurrently. By default, the
+        choice is left to :class:`concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    list[pathlib.Path]
+        The sorted paths of all files found. Symbolic links to directories are not
+        followed to avoid cycles.
+    """
+    root = pathlib.Path(root).expanduser().absolute()
+    if not root.is_dir():
+        raise exception.FileAccessError(f"Cannot search {root}, it is not a directory.")
+    cache = _read_manifest(manifest, root, filename)
+    directories = {}
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        scan = lambda path: _scan(path, filename, cache.get(str(path)))
+        pending = {executor.submit(scan, root)}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                path, entry = future.result()
+                if entry is None:
+                    continue
+                directories[str(path)] = entry
+                for name in entry["subdirectories"]:
+                    pending.add(executor.submit(scan, path / name))
+    _write_manifest(manifest, root, filename, directories)
+    return sorted(
+        pathlib.Path(path) / filename
+        for path, entry in directories.items()
+        if entry["found"]
+    )
+
+
+def _scan(path, filename, cached):
+    try:
+        modification_time = os.stat(path).st_mtime_ns
+        if cached is not None and cached["mtime"] == modification_time:
+            return path, cached
+        subdirectories = []
+        found = False
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.name)
+                elif entry.name == filename and entry.is_file():
+                    found = True
+    except OSError:
+        # directories may be removed or be unreadable while scanning the tree
+        return path, None
+    entry = {"mtime": modification_time, "subdirectories": subdirectories}
+    return path, {**entry, "found": found}
+
+
+def _read_manifest(manifest, root, filename):
+    if manifest is None:
+        return {}
+    content = read_manifest(manifest, root=str(root), filename=filename)
+    return content.get("directories", {})
+
+
+def _write_manifest(manifest, root, filename, directories):
+    if manifest is None:
+        return
+    write_manifest(manifest, root=str(root), filename=filename, directories=directories)
@@ -0,0 +1,180 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Read grid quantities partially or at a reduced resolution.
+
+VASP writes quantities defined on the FFT grid (densities, potentials) with the shape
+(components, grid z, grid y, grid x). The user facing methods transpose this to
+(components, grid x, grid y, grid z), so all arguments of this module refer to the
+lattice vectors in the order a, b, c and are translated to the order of the file
+here. Reading every n-th point or a sub-box is pushed into the slicing of the HDF5
+dataset, so that only the requested data is read. Downsampling by block averages
+reads the file slab by slab so that the full grid never needs to be held in memory.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from py4vasp import exception
+
+METHODS = ("block", "fourier")
+"Methods available to reduce the resolution of a grid."
+
+PARAMETERS = """\
+stride : int | Sequence[int] | None
+    Read only every n-th grid point along the lattice vectors. Provide a single
+    integer to use the same stride for all directions or one per lattice vector.
+region : Sequence[slice | tuple | None] | None
+    Restrict the data to a sub-box of the grid. For every lattice vector, provide a
+    slice or a (start, stop) pair of grid indices; None selects the full range.
+"""
+
+RESOLUTION = """\
+resolution : int | Sequence[int] | None
+    Reduce the grid to at most this number of points along every lattice vector,
+    which keeps the visualization of large grids interactive. Provide a single
+    integer to use the same limit for all directions or one per lattice vector.
+downsampling : str
+    Method used to reduce the resolution. "block" averages neighboring grid points
+    and reads the file slab by slab, "fourier" keeps only the lowest Fourier
+    components of the full grid.
+"""
+
+
+def read(data, stride=None, region=None):
+    """Read every *stride*-th point of a sub-box of the grid.
+
+    Parameters
+    ----------
+    data : VaspData or np.ndarray
+        Grid quantity with shape (components, grid z, grid y, grid x).
+    stride, region
+        See :data:`PARAMETERS`.
+
+    Returns
+    -------
+    np.ndarray
+        The selected grid points with the same ordering of the axes as *data*.
+    """
+    if stride is None and region is None:
+        return np.asarray(data)
+    strides = _per_axis(stride, "stride", default=1)
+    regions = _regions(region)
+    key = tuple(
+        _slice(number_points, region, stride)
+        for number_points, region, stride in zip(_grid_shape(data), regions, strides)
+    )
+    return np.asarray(data[(slice(None),) + key[::-1]])
+
+
+def downsample(data, resolution, method="block"):
+    """Reduce the number of points of the grid.
+
+    Parameters
+    ----------
+    data : VaspData or np.ndarray
+        Grid quantity with shape (components, grid z, grid y, grid x).
+    resolution, method
+        See :data:`RESOLUTION`.
+
+    Returns
+    -------
+    np.ndarray
+        The grid quantity with at most *resolution* points along every lattice vector
+        and the same ordering of the axes as *data*.
+    """
+    if resolution is None:
+        return data
+    shape = _grid_shape(data)
+    resolution = _per_axis(resolution, "resolution", default=None)
+    target = tuple(min(points, limit) for points, limit in zip(shape, resolution))
+    if method not in METHODS:
+        message = f"The downsampling method {method!r} is not implemented. Please use one of {', '.join(METHODS)}."
+        raise exception.NotImplemented(message)
+    if target == shape:
+        return np.asarray(data)
+    if method == "block":
+        return _block_average(data, shape, target)
+    return _fourier_interpolation(np.asarray(data), shape, target)
+
+
+def _grid_shape(data):
+    # shape of the grid in the order of the lattice vectors
+    return tuple(data.shape[:0:-1])
+
+
+def _per_axis(value, name, default):
+    message = (
+        f"The {name} {value} must be a positive integer or three positive integers."
+    )
+    try:
+        values = np.broadcast_to(value if value is not None else default, 3)
+    except ValueError:
+        raise exception.IncorrectUsage(message) from None
+    if not all(_is_positive_integer(entry) for entry in values):
+        raise exception.IncorrectUsage(message)
+    return tuple(int(entry) for entry in values)
+
+
+def _is_positive_integer(value):
+    return isinstance(value, (int, np.integer)) and value > 0
+
+
+def _regions(region):
+    if region is None:
+        return (None, None, None)
+    if not isinstance(region, Sequence) or len(region) != 3:
+        message = (
+            f"The region {region} must provide a range for all three lattice vectors."
+        )
+        raise exception.IncorrectUsage(message)
+    return region
+
+
+def _slice(number_points, region, stride):
+    if region is None:
+        region = slice(None)
+    elif not isinstance(region, slice):
+        region = slice(*region)
+    if region.step not in (None, 1):
+        message = f"The region {region} must not define a step. Please use the stride instead."
+        raise exception.IncorrectUsage(message)
+    points = range(number_points)[region.start : region.stop : stride]
+    if len(points) == 0:
+        message = f"The region {region} does not contain any of the {number_points} grid points."
+        raise exception.IncorrectUsage(message)
+    return slice(points.start, points.stop, points.step)
+
+
+def _bins(number_points, target):
+    return np.linspace(0, number_points, target + 1).round().astype(np.int_)
+
+
+def _block_average(data, shape, target):
+    bins_x, bins_y, bins_z = (_bins(*args) for args in zip(shape, target))
+    result = np.empty((len(data), target[2], target[1], target[0]))
+    for i, (start, stop) in enumerate(zip(bins_z[:-1], bins_z[1:])):
+        slab = np.mean(np.asarray(data[:, int(start) : int(stop)]), axis=1)
+        slab = _average_along(slab, bins_y, axis=1)
+        result[:, i] = _average_along(slab, bins_x, axis=2)
+    return result
+
+
+def _average_along(array, bins, axis):
+    sums = np.add.reduceat(array, bins[:-1], axis=axis)
+    counts = np.expand_dims(
+        np.diff(bins), tuple(i for i in range(array.ndim) if i != axis)
+    )
+    return sums / counts
+
+
+def _fourier_interpolation(data, shape, target):
+    # the axis in the file is the reverse of the lattice vector index
+    for axis, (number_points, number_target) in zip((3, 2, 1), zip(shape, target)):
+        if number_points == number_target:
+            continue
+        coefficients = np.fft.fft(data, axis=axis)
+        frequencies = np.fft.fftfreq(number_target, 1 / number_target).astype(np.int_)
+        coefficients = np.take(coefficients, frequencies, axis=axis)
+        data = np.fft.ifft(coefficients, axis=axis) * number_target / number_points
+    return np.real(data)
@@ -50,6 +50,35 @@ class Reduction(abc.ABC):
         pass
 
 
+class Weights:
+    """Reduction that returns the weight of every element instead of the reduced data.
+
+    Use it with the flat index of every element as data, i.e., ``np.arange(size)``
+    reshaped to the dimensions of the actual data. Each selection then yields a vector
+    of length `size` such that its dot product with the flattened data is the sum, or
+    with `average` the mean, over the selected elements. Only the selected indices are
+    processed, so no identity matrix of the size of the data is required.
+
+    Parameters
+    ----------
+    size : int
+        The total number of elements.
+    average : bool
+        If set the weights of every selection are normalized to 1.
+    """
+
+    def __init__(self, size, *, average=False):
+        self._size = size
+        self._average = average
+
+    def __call__(self, array, axis):
+        indices = np.ravel(array)
+        weights = np.bincount(indices, minlength=self._size).astype(np.float64)
+        if self._average and len(indices) > 0:
+            weights /= len(indices)
+        return weights
+
+
 class Selector:
     """Manages the logic to read a user selection.
 
@@ -0,0 +1,66 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Read and write the JSON manifests recording the result of previous runs.
+
+Tools that revisit large projects repeatedly, e.g., the discovery of calculations or
+the export to a database, store what they found in a manifest so that the next run
+only processes what changed. Every manifest carries a header identifying the run it
+belongs to. A manifest whose header differs, which cannot be read, or which was
+written by another version of the format is treated as if it did not exist.
+"""
+
+import json
+import os
+import pathlib
+
+VERSION = 1
+"Version of the format of the manifest; manifests of other versions are ignored."
+
+
+def read_manifest(path, /, **header):
+    """Read the content of a manifest if it matches the header.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The manifest file.
+    **header
+        Values that the manifest must contain to be used.
+
+    Returns
+    -------
+    dict
+        The content of the manifest or an empty dictionary if the file does not
+        exist, cannot be read, or does not match the version or the header.
+    """
+    path = pathlib.Path(path)
+    if not path.is_file():
+        return {}
+    try:
+        content = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(content, dict):
+        return {}
+    expected = {"version": VERSION, **header}
+    if any(content.get(key) != value for key, value in expected.items()):
+        return {}
+    return content
+
+
+def write_manifest(path, /, **content):
+    """Replace the manifest atomically with the given content.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The manifest file.
+    **content
+        The header and the data stored in the manifest; the version of the format
+        is added automatically.
+    """
+    path = pathlib.Path(path)
+    # write to a temporary file first so that an interrupted write keeps the old one
+    temporary = path.with_name(f"{path.name}.tmp")
+    temporary.write_text(json.dumps({"version": VERSION, **content}))
+    os.replace(temporary, path)
@@ -139,27 +139,19 @@ class PoscarParser:
 
         coordinate_system = next(remaining_lines)
         number_ions = np.sum(result["stoichiometry"].number_ion_types)
-        positions = []
-        selective_dynamics = []
-        for _ in range(number_ions):
-            self._parse_ion_line(next(remaining_lines), positions, selective_dynamics)
-
+        ion_lines = _take_lines(remaining_lines, number_ions, "ion positions")
+        positions = _parse_block(ion_lines, np.float64, columns=range(3))
         positions = self._to_fractional(result, positions, coordinate_system)
         result["positions"] = VaspData(positions)
         if has_selective_dynamics:
-            result["selective_dynamics"] = VaspData(np.array(selective_dynamics))
+            flags = _parse_block(ion_lines, "U1", columns=range(3, 6))
+            result["selective_dynamics"] = VaspData(flags == "T")
         return result, remaining_lines
 
-    @staticmethod
-    def _parse_ion_line(line, positions, selective_dynamics):
-        parts = line.split()
-        positions.append(np.array(parts[:3], dtype=np.float64))
-        selective_dynamics.append(np.array([x == "T" for x in parts[3:]]))
-
     def _to_fractional(self, result, positions, coordinate_system):
         if not first_char(coordinate_system) in "cCkK":
-            return np.array(positions)
-        cartesian_positions = np.array(positions) * result["scaling_factor"]
+            return positions
+        cartesian_positions = positions * result["scaling_factor"]
         inverse_lattice_vectors = self._get_inverse_lattice_vectors(result["cell"])
         direct_positions = cartesian_positions @ inverse_lattice_vectors
         return np.remainder(direct_positions, 1)
@@ -214,8 +206,8 @@ class PoscarParser:
             return result, remaining_lines
         coordinate_system = possible_coordinate_system
         number_ions = np.sum(result["stoichiometry"].number_ion_types)
-        ion_velocities = [next(remaining_lines).split() for _ in range(number_ions)]
-        ion_velocities = np.array(ion_velocities, dtype=np.float64)
+        velocity_lines = _take_lines(remaining_lines, number_ions, "ion velocities")
+        ion_velocities = _parse_block(velocity_lines, np.float64, columns=range(3))
         if not first_char(coordinate_system) in "cCkK ":
             # I'm not sure this implementation is correct, in VASP there is a factor of
             # POTIM to convert between Cartesian to fractional coordinates. Since this
@@ -248,6 +240,25 @@ class PoscarParser:
         return cartesian_positions
 
 
+def _take_lines(iterator, number_lines, description):
+    lines = list(itertools.islice(iterator, number_lines))
+    if len(lines) < number_lines:
+        message = f"Expected {number_lines} lines with {description}, but the POSCAR ends after {len(lines)}."
+        raise exception.ParserError(message)
+    return lines
+
+
+def _parse_block(lines, dtype, columns):
+    """Parse the given columns of all lines in a single call instead of line by line.
+
+    Any additional columns, e.g., comments after the coordinates, are ignored.
+    """
+    try:
+        return np.loadtxt(lines, dtype=dtype, usecols=columns, comments=None, ndmin=2)
+    except ValueError as error:
+        raise exception.ParserError(f"Could not parse the POSCAR: {error}") from error
+
+
 def _put_back(iterator, item):
     return itertools.chain([item], iterator)
 
@@ -0,0 +1,254 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Opt-in timing instrumentation of the data access.
+
+When a profile is active, py4vasp records how long each phase of reading and
+processing a quantity takes. The phases are
+
+open
+    Opening an HDF5 file.
+version
+    Checking that the VASP version of the file supports the quantity.
+read
+    Reading a dataset from the HDF5 file. The number of bytes is recorded as well.
+handler
+    Transforming the raw data in the handler, e.g., computing a dictionary or
+    preparing the series of a graph. Reads triggered by the handler are nested
+    inside this phase.
+graph
+    Converting a graph to a plotly figure.
+
+In addition, cache hits are recorded as events without duration.
+
+>>> import py4vasp
+>>> with py4vasp.profile() as profile:
+...     calculation.dos.plot()
+>>> print(profile.report())
+>>> profile.write_chrome_trace("trace.json")
+
+Alternatively, set the environment variable ``PY4VASP_PROFILE`` to a filename. Then
+py4vasp profiles the whole session and writes a Chrome trace to that file at exit.
+Without an active profile, the instrumentation reduces to a single check per phase.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import dataclasses
+import json
+import os
+import threading
+import time
+
+ENVIRONMENT_VARIABLE = "PY4VASP_PROFILE"
+PHASES = ("open", "version", "read", "handler", "graph")
+CACHE_HIT = "cache hit"
+_UNKNOWN_QUANTITY = "unknown"
+
+_ACTIVE = []
+_CURRENT_QUANTITY = contextvars.ContextVar("quantity", default=_UNKNOWN_QUANTITY)
+
+
+@dataclasses.dataclass
+class Event:
+    "A single timed phase of the data access."
+
+    quantity: str
+    "Name of the quantity that was accessed when the event occurred."
+    phase: str
+    "Which phase of the access is timed or a cache hit."
+    start: float
+    "Time in seconds when the phase started relative to the start of the profile."
+    duration: float = 0.0
+    "Time in seconds spent in this phase."
+    nbytes: int = 0
+    "Number of bytes read from the file."
+    detail: str = ""
+    "Additional information like the filename or the dataset."
+    thread: int = 0
+    "Identifier of the thread in which the event occurred."
+
+
+class Profile:
+    """Collect the timings of all phases while the profile is active.
+
+    Use :func:`profile` to create and activate a profile. After the profile finished,
+    you can inspect the :attr:`events` directly, aggregate them with :meth:`summary`,
+    or export them as a text report or a Chrome trace.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def summary(self):
+        """Aggregate the events per quantity and phase.
+
+        Returns
+        -------
+        dict
+            Maps every quantity to a dictionary of its phases. For every phase, the
+            number of calls, the total time in seconds and the bytes read are given.
+        """
+        result = {}
+        for event in self.events:
+            phases = result.setdefault(event.quantity, {})
+            entry = phases.setdefault(
+                event.phase, {"calls": 0, "time": 0.0, "bytes": 0}
+            )
+            entry["calls"] += 1
+            entry["time"] += event.duration
+            entry["bytes"] += event.nbytes
+        return result
+
+    def report(self):
+        """Format the summary as a table sorted by the time spent per quantity.
+
+        Returns
+        -------
+        str
+            One line per quantity and phase with calls, time in ms, and bytes read.
+        """
+        summary = self.summary()
+        total_time = lambda quantity: sum(e["time"] for e in summary[quantity].values())
+        lines = [
+            f"{'quantity':<24}{'phase':<12}{'calls':>8}{'time/ms':>12}{'bytes':>14}"
+        ]
+        for quantity in sorted(summary, key=total_time, reverse=True):
+            for phase, entry in summary[quantity].items():
+                time_in_ms = 1000 * entry["time"]
+                lines.append(
+                    f"{quantity:<24}{phase:<12}{entry['calls']:>8}"
+                    f"{time_in_ms:>12.3f}{entry['bytes']:>14}"
+                )
+        return "\n".join(lines)
+
+    def to_chrome_trace(self):
+        """Convert the events to the Chrome trace event format.
+
+        The result can be loaded in chrome://tracing or https://ui.perfetto.dev.
+
+        Returns
+        -------
+        dict
+            The trace events with timestamps in microseconds.
+        """
+        return {"traceEvents": [_chrome_event(event) for event in self.events]}
+
+    def write_chrome_trace(self, filename):
+        "Write the Chrome trace of the events to the given file."
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+@contextlib.contextmanager
+def profile():
+    """Record timings of all py4vasp data access within the context.
+
+    Profiles may be nested; every active profile records all events.
+
+    Yields
+    ------
+    Profile
+        Contains the recorded events after the context is left.
+    """
+    result = Profile()
+    _ACTIVE.append(result)
+    try:
+        yield result
+    finally:
+        _ACTIVE.remove(result)
+
+
+def is_active():
+    "Check whether any profile is recording."
+    return bool(_ACTIVE)
+
+
+@contextlib.contextmanager
+def quantity(name):
+    "Attribute all events within the context to the quantity with the given name."
+    if not _ACTIVE:
+        yield
+        return
+    token = _CURRENT_QUANTITY.set(name)
+    try:
+        yield
+    finally:
+        _CURRENT_QUANTITY.reset(token)
+
+
+@contextlib.contextmanager
+def phase(name, detail="", quantity=None):
+    """Time the code within the context as the given phase.
+
+    The yielded event may be modified, e.g., to set the number of bytes read.
+    """
+    if not _ACTIVE:
+        yield None
+        return
+    event = _make_event(name, detail, quantity)
+    start = time.perf_counter()
+    try:
+        yield event
+    finally:
+        event.duration = time.perf_counter() - start
+        _record(event)
+
+
+def cache_hit(detail="", quantity=None):
+    "Record that the data was taken from a cache instead of being computed again."
+    if _ACTIVE:
+        _record(_make_event(CACHE_HIT, detail, quantity))
+
+
+def _make_event(phase, detail, quantity):
+    return Event(
+        quantity=quantity or _CURRENT_QUANTITY.get(),
+        phase=phase,
+        start=time.perf_counter(),
+        detail=str(detail),
+        thread=threading.get_ident(),
+    )
+
+
+def _record(event):
+    for profile_ in list(_ACTIVE):
+        relative_event = dataclasses.replace(event, start=event.start - profile_._start)
+        profile_.record(relative_event)
+
+
+def _chrome_event(event):
+    to_microseconds = 1e6
+    result = {
+        "name": f"{event.quantity}: {event.phase}",
+        "cat": event.phase,
+        "ts": event.start * to_microseconds,
+        "pid": os.getpid(),
+        "tid": event.thread,
+        "args": {"quantity": event.quantity, "bytes": event.nbytes},
+    }
+    if event.detail:
+        result["args"]["detail"] = event.detail
+    if event.phase == CACHE_HIT:
+        result.update(ph="i", s="t")
+    else:
+        result.update(ph="X", dur=event.duration * to_microseconds)
+    return result
+
+
+def _profile_from_environment():
+    filename = os.environ.get(ENVIRONMENT_VARIABLE)
+    if not filename:
+        return
+    session = Profile()
+    _ACTIVE.append(session)
+    atexit.register(session.write_chrome_trace, filename)
+
+
+_profile_from_environment()
@@ -5,9 +5,12 @@ import pathlib
 import click
 
 import py4vasp
-from py4vasp import exception
+from py4vasp import exception, raw
+from py4vasp._calculation import _trajectory
+from py4vasp._calculation.dispatch import FileSource
 from py4vasp._calculation.structure import Structure
 from py4vasp._calculation.symmetry import _SYMPREC
+from py4vasp._raw import repack as _repack
 
 _HDF5_SUFFIXES = (".h5", ".hdf5")
 
@@ -33,19 +36,78 @@ def cli():
     type=click.STRING,
     help="String to further clarify the specific source of the quantity.",
 )
-def convert(quantity, format, path, selection):
+@click.option(
+    "--steps",
+    type=click.STRING,
+    help="Steps of the trajectory to convert, e.g. 0:-1:10 (default: all steps).",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(path_type=pathlib.Path),
+    help="Write the result to this file (required for trajectory formats).",
+)
+def convert(quantity, format, path, selection, steps, output):
     """Convert a quantity to a different format.
 
-    Specify which QUANTITY you want to convert into which FORMAT.
+    Specify which QUANTITY you want to convert into which FORMAT. The structure can
+    be converted to lammps (a single structure) or streamed as a trajectory into
+    lammps-dump, extxyz, or ase-traj. Trajectories include the forces, velocities,
+    and energies if VASP wrote them.
     """
-    if format.lower() != "lammps":
+    format = format.lower()
+    if format != "lammps" and format not in _trajectory.FORMATS:
         raise click.UsageError(f"Converting {quantity} to {format} is not implemented.")
     path = pathlib.Path.cwd() if path is None else pathlib.Path(path)
+    if format == "lammps":
+        if steps is not None:
+            message = "The option --steps is only available for trajectory formats."
+            raise click.UsageError(message)
+        _convert_structure(path, selection, output)
+    else:
+        if output is None:
+            message = f"Converting to {format} requires an output file -o/--output."
+            raise click.UsageError(message)
+        _convert_trajectory(path, format, selection, _parse_steps(steps), output)
+
+
+def _convert_structure(path, selection, output):
     try:
         result = _convert_to_lammps(path, selection)
     except exception.Py4VaspError as error:
         raise click.ClickException(*error.args) from error
-    print(result)
+    if output is None:
+        print(result)
+    else:
+        output.write_text(f"{result}\n")
+
+
+def _convert_trajectory(path, format, selection, steps, output):
+    if path.is_file():
+        source = FileSource(path.resolve().parent, file=path)
+    else:
+        source = FileSource(path)
+    try:
+        _trajectory.write(source, output, format, selection=selection, steps=steps)
+    except exception.Py4VaspError as error:
+        raise click.ClickException(*error.args) from error
+
+
+def _parse_steps(steps):
+    if steps is None:
+        return None
+    try:
+        parts = [int(part) if part.strip() else None for part in steps.split(":")]
+    except ValueError:
+        parts = []
+    if len(parts) == 1 and parts[0] is not None:
+        return parts[0]
+    if 2 <= len(parts) <= 3:
+        return slice(*parts)
+    message = (
+        f"Could not parse --steps={steps}, please use Python slice syntax like 0:-1:10."
+    )
+    raise click.BadParameter(message)
 
 
 def _convert_to_lammps(path, selection):
@@ -126,3 +188,72 @@ def _raise_if_hdf5_output(destination):
             "Writing the symmetrized structure to an HDF5 file is not implemented."
         )
         raise exception.NotImplemented(message)
+
+
+@cli.command()
+@click.argument(
+    "source", type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path)
+)
+@click.argument("destination", type=click.Path(dir_okay=False, path_type=pathlib.Path))
+@click.option(
+    "-c",
+    "--compression",
+    type=click.Choice(_repack.COMPRESSIONS),
+    help="Compress the datasets with this lossless filter.",
+)
+@click.option(
+    "--shuffle",
+    is_flag=True,
+    help="Apply the shuffle filter before the compression.",
+)
+@click.option(
+    "--chunk-bytes",
+    type=click.IntRange(min=1),
+    default=_repack.CHUNK_BYTES,
+    show_default=True,
+    help="Approximate size of every chunk in bytes.",
+)
+def repack(source, destination, compression, shuffle, chunk_bytes):
+    """Copy the VASP output in SOURCE to DESTINATION with a faster layout.
+
+    The datasets keep their paths, so py4vasp reads DESTINATION like the original
+    file. Trajectories are chunked along the ionic steps, projections along the k
+    points, and grid quantities along slabs of the z axis.
+    """
+    try:
+        raw.repack(
+            source,
+            destination,
+            compression=compression,
+            shuffle=shuffle,
+            chunk_bytes=chunk_bytes,
+        )
+    except exception.Py4VaspError as error:
+        raise click.ClickException(*error.args) from error
+
+
+@cli.command()
+@click.argument(
+    "runs",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=pathlib.Path),
+)
+@click.option(
+    "-o",
+    "--output",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    help="Write the combined trajectory to this HDF5 file.",
+)
+def concatenate(runs, output):
+    """Combine the trajectories of restarted RUNS into a single file.
+
+    Provide the HDF5 files or the directories of the RUNS in the order of the
+    simulation. The output refers to the data of the runs instead of copying it, so
+    py4vasp reads it like the output of one long run.
+    """
+    try:
+        raw.concatenate(runs, output)
+    except exception.Py4VaspError as error:
+        raise click.ClickException(*error.args) from error
@@ -6,7 +6,7 @@ from argparse import RawTextHelpFormatter
 
 import numpy as np
 
-from py4vasp._analysis.mlff import MLFFErrorAnalysis
+from py4vasp._analysis.mlff import CHUNK_SIZE, MLFFErrorAnalysis
 from py4vasp._third_party.graph import Graph, Series
 
 
@@ -31,6 +31,13 @@ def get_options(args=sys.argv[1:]):
     -txt/ --XYtextFile
           with this file the user gets 3 error files in xy format
           the default is a csv file containing all three errors
+    --stream
+          read the calculations in chunks instead of loading all of them into
+          memory; the errors are identical
+    --chunk-size
+          number of pairs of calculations read together in streaming mode
+    --workers
+          number of threads processing chunks in parallel in streaming mode
     """
     parser = argparse.ArgumentParser(
         description="py4vasp error-analysis\n" + "----------------------\n"
@@ -74,41 +81,63 @@ def get_options(args=sys.argv[1:]):
         help="Supply flag (without keyword) if you want to have XY txt files for the computed errors.\n"
         + "Default output will be a csv file (ErrorAnalysis.csv) containing all analysed errors",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Supply flag (without keyword) to process the calculations in chunks instead of\n"
+        + "loading all of them into memory. Recommended for large validation sets.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE,
+        help="Number of pairs of calculations processed together in streaming mode.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of threads processing the chunks in streaming mode.",
+    )
     options = parser.parse_args(args)
 
     return options
 
 
 def write_energy_error_file(cls, fname="EnergyError.out"):
-    files = cls._calculations.files()
     energy_error_per_atom = cls.get_energy_error_per_atom()
-    dft_files = files["dft_data"]
-    mlff_files = files["mlff_data"]
+    dft_files = cls.dft.files
+    mlff_files = cls.mlff.files
     writeout = np.array([dft_files, mlff_files, energy_error_per_atom]).T
     header = "file_path_dft, file_path_mlff, energy difference in eV/atom (value > 0 MLFF predicts too high value)"
     np.savetxt(fname, writeout, fmt="%s", delimiter=",", header=header)
 
 
 def write_force_error_file(cls, fname="ForceError.out"):
-    files = cls._calculations.files()
     force_error = cls.get_force_rmse()
-    dft_files = files["dft_data"]
-    mlff_files = files["mlff_data"]
+    dft_files = cls.dft.files
+    mlff_files = cls.mlff.files
     writeout = np.array([dft_files, mlff_files, force_error]).T
     header = "file_path_dft, file_path_mlff, force rmse in eV/Angstrom"
     np.savetxt(fname, writeout, fmt="%s", delimiter=",", header=header)
 
 
 def write_stress_error_file(cls, fname="StressError.out"):
-    files = cls._calculations.files()
     stress_error = cls.get_stress_rmse()
-    dft_files = files["dft_data"]
-    mlff_files = files["mlff_data"]
+    dft_files = cls.dft.files
+    mlff_files = cls.mlff.files
     writeout = np.array([dft_files, mlff_files, stress_error]).T
     header = "file_path_dft, file_path_mlff, stress rmse in kbar"
     np.savetxt(fname, writeout, fmt="%s", delimiter=",", header=header)
 
 
+def write_element_error_file(cls, fname="ForceErrorPerElement.out"):
+    element_error = cls.get_force_rmse_per_element()
+    writeout = np.array([list(element_error), list(element_error.values())]).T
+    header = "element, force rmse in eV/Angstrom"
+    np.savetxt(fname, writeout, fmt="%s", delimiter=",", header=header)
+
+
 def make_plot(cls, show=False, pdf=False, graph_name="ErrorAnalysis.pdf"):
     energy_error = cls.get_energy_error_per_atom()
     force_error = cls.get_force_rmse()
@@ -134,12 +163,21 @@ def make_plot(cls, show=False, pdf=False, graph_name="ErrorAnalysis.pdf"):
 
 def main():
     options = get_options(sys.argv[1:])
-    mlff_error_analysis = MLFFErrorAnalysis.from_files(
-        dft_data=options.DFTfiles, mlff_data=options.MLfiles
-    )
+    if options.stream:
+        mlff_error_analysis = MLFFErrorAnalysis.stream_from_files(
+            dft_data=options.DFTfiles,
+            mlff_data=options.MLfiles,
+            chunk_size=options.chunk_size,
+            workers=options.workers,
+        )
+    else:
+        mlff_error_analysis = MLFFErrorAnalysis.from_files(
+            dft_data=options.DFTfiles, mlff_data=options.MLfiles
+        )
     if options.XYtextFile:
         write_energy_error_file(mlff_error_analysis)
         write_force_error_file(mlff_error_analysis)
         write_stress_error_file(mlff_error_analysis)
+        write_element_error_file(mlff_error_analysis)
     if options.MakePlot or options.pdfplot:
         make_plot(mlff_error_analysis, options.MakePlot, options.pdfplot)
@@ -357,3 +357,116 @@ def test_multiple_stress_computation(mock_multiple_calculations):
         normalize_by_configurations=True
     )
     assert np.array_equal(expected_stress_error, output_stress_error)
+
+
+def test_force_rmse_per_element(mock_multiple_calculations, Assert):
+    mlff_error_analysis = MLFFErrorAnalysis._from_data(mock_multiple_calculations)
+    elements = mlff_error_analysis.dft.elements[0]
+    squared_error = np.sum(
+        (mlff_error_analysis.dft.forces - mlff_error_analysis.mlff.forces) ** 2,
+        axis=-1,
+    )
+    actual = mlff_error_analysis.get_force_rmse_per_element()
+    assert list(actual) == list(dict.fromkeys(elements))
+    for element, error in actual.items():
+        mask = elements == element
+        expected = np.sqrt(np.mean(squared_error[:, mask]) / 3)
+        Assert.allclose(error, expected)
+
+
+def test_force_error_histogram(mock_multiple_calculations, Assert):
+    mlff_error_analysis = MLFFErrorAnalysis._from_data(mock_multiple_calculations)
+    forces = mlff_error_analysis.dft.forces - mlff_error_analysis.mlff.forces
+    norm_error = np.linalg.norm(forces, axis=-1).flatten()
+    histogram = mlff_error_analysis.get_force_error_histogram()
+    edges = histogram["edges"]
+    expected = np.histogram(np.minimum(norm_error, edges[-1]), edges)[0]
+    Assert.allclose(histogram["counts"], expected)
+    assert np.sum(histogram["counts"]) == norm_error.size
+
+
+@pytest.fixture
+def streamed_calculations(mock_multiple_calculations, tmp_path):
+    energies = mock_multiple_calculations.energies.read()
+    forces = mock_multiple_calculations.forces.read()
+    stresses = mock_multiple_calculations.stresses.read()
+    configurations = {}
+    for key, prefix in (("dft_data", "dft"), ("mlff_data", "mlff")):
+        for i, (energy, force, stress) in enumerate(
+            zip(energies[key], forces[key], stresses[key])
+        ):
+            path = tmp_path / f"{prefix}_{i}"
+            path.mkdir()
+            configurations[path] = {
+                "energy": energy[MLFFErrorAnalysis.TOTAL_ENERGY],
+                "forces": force["forces"],
+                "elements": force["structure"]["elements"],
+                "lattice_vectors": force["structure"]["lattice_vectors"],
+                "positions": force["structure"]["positions"],
+                "stress": stress["stress"],
+            }
+    read_configuration = lambda location, _: configurations[location]
+    with patch("py4vasp._analysis.mlff._read_configuration", read_configuration):
+        yield tmp_path
+
+
+@pytest.mark.parametrize("chunk_size, workers", [(1, 1), (3, 2), (64, 1)])
+def test_stream_matches_in_memory(
+    mock_multiple_calculations, streamed_calculations, chunk_size, workers, Assert
+):
+    expected = MLFFErrorAnalysis._from_data(mock_multiple_calculations)
+    actual = MLFFErrorAnalysis.stream_from_paths(
+        dft_data=streamed_calculations / "dft_*",
+        mlff_data=streamed_calculations / "mlff_*",
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+    assert actual.dft.nconfig == expected.dft.nconfig
+    assert np.array_equal(actual.dft.nions, expected.dft.nions)
+    for normalize in (False, True):
+        for method in (
+            "get_energy_error_per_atom",
+            "get_force_rmse",
+            "get_stress_rmse",
+        ):
+            actual_error = getattr(actual, method)(normalize)
+            expected_error = getattr(expected, method)(normalize)
+            assert np.array_equal(actual_error, expected_error)
+    assert actual.get_force_rmse_per_element() == expected.get_force_rmse_per_element()
+    actual_histogram = actual.get_force_error_histogram()["counts"]
+    expected_histogram = expected.get_force_error_histogram()["counts"]
+    assert np.array_equal(actual_histogram, expected_histogram)
+
+
+def test_stream_incompatible_structures(raw_data, tmp_path):
+    dft_path = tmp_path / "dft"
+    mlff_path = tmp_path / "mlff"
+    configurations = {}
+    for path, species in ((dft_path, "Sr2TiO4"), (mlff_path, "Fe3O4")):
+        force = Force.from_data(raw_data.force(species)).read()
+        configurations[path] = {
+            "forces": force["forces"],
+            "elements": force["structure"]["elements"],
+            "lattice_vectors": force["structure"]["lattice_vectors"],
+            "positions": force["structure"]["positions"],
+        }
+    read_configuration = lambda location, _: configurations[location]
+    with patch("py4vasp._analysis.mlff._read_configuration", read_configuration):
+        with pytest.raises(exception.IncorrectUsage):
+            MLFFErrorAnalysis.stream_from_paths(dft_data=dft_path, mlff_data=mlff_path)
+
+
+def test_stream_different_number_of_calculations(tmp_path):
+    for name in ("dft_0", "dft_1", "mlff_0"):
+        (tmp_path / name).mkdir()
+    with pytest.raises(exception.IncorrectUsage):
+        MLFFErrorAnalysis.stream_from_paths(
+            dft_data=tmp_path / "dft_*", mlff_data=tmp_path / "mlff_*"
+        )
+
+
+def test_stream_incorrect_chunk_size(tmp_path):
+    with pytest.raises(exception.IncorrectUsage):
+        MLFFErrorAnalysis.stream_from_paths(
+            dft_data=tmp_path, mlff_data=tmp_path, chunk_size=0
+        )
@@ -1,12 +1,14 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import concurrent.futures
 import os
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from py4vasp import Batch
+import py4vasp
+from py4vasp import Batch, demo, exception
 
 
 def test_error_when_using_constructor():
@@ -147,3 +149,138 @@ def test_has_attributes(mock_access):
     assert output_read.keys() == {"path_name_1", "path_name_2"}
     assert isinstance(output_read["path_name_1"], list)
     assert isinstance(output_read["path_name_2"], list)
+
+
+@pytest.fixture(scope="module")
+def demo_calculations(tmp_path_factory):
+    path = tmp_path_factory.mktemp("batch")
+    for name in ("encut_a", "encut_b", "kpoints"):
+        demo.calculation(path / name)
+    return path
+
+
+def test_to_graph(demo_calculations):
+    batch = Batch.from_paths(
+        encut=demo_calculations / "encut_*", kpoints=demo_calculations / "kpoints"
+    )
+    graph = batch.to_graph("dos", "s, p")
+    expected = py4vasp.Calculation.from_path(demo_calculations / "kpoints")
+    expected = expected.dos.to_graph("s, p")
+    assert len(graph) == 3 * len(expected)
+    labels = [series.label for series in graph]
+    for prefix in ("encut[0]", "encut[1]", "kpoints"):
+        assert [f"{prefix} {series.label}" for series in expected] == [
+            label for label in labels if label.startswith(f"{prefix} ")
+        ]
+    assert graph.xlabel == expected.xlabel
+    assert graph.ylabel == expected.ylabel
+
+
+def test_to_graph_from_files(demo_calculations):
+    batch = Batch.from_files(
+        first=demo_calculations / "encut_a" / "vaspout.h5",
+        second=demo_calculations / "kpoints" / "vaspout.h5",
+    )
+    graph = batch.to_graph("energy", workers=1)
+    assert [series.label for series in graph] == ["first", "second"]
+
+
+def test_to_graph_nested_quantity(demo_calculations):
+    batch = Batch.from_paths(calc=demo_calculations / "kpoints")
+    graph = batch.to_graph("phonon.band")
+    assert len(graph) > 0
+    with pytest.raises(exception.IncorrectUsage):
+        batch.to_graph("not_a_quantity")
+
+
+def test_creation_from_paths_with_recursive_wildcards(tmp_path):
+    paths = [tmp_path / "a" / "calc_1", tmp_path / "b" / "c" / "calc_2"]
+    for path in paths:
+        path.mkdir(parents=True)
+    (tmp_path / "b" / "other").mkdir()
+    batch = Batch.from_paths(calcs=tmp_path / "**" / "calc_*")
+    assert batch.paths()["calcs"] == [path.resolve() for path in paths]
+
+
+def test_generic_quantity(demo_calculations, Assert):
+    batch = Batch.from_paths(
+        encut=demo_calculations / "encut_*", kpoints=demo_calculations / "kpoints"
+    )
+    actual = batch.dos.to_dict("s, p")
+    assert actual.keys() == {"encut", "kpoints"}
+    assert len(actual["encut"]) == 2
+    assert len(actual["kpoints"]) == 1
+    expected = py4vasp.Calculation.from_path(demo_calculations / "kpoints")
+    expected = expected.dos.to_dict("s, p")
+    for key, value in expected.items():
+        Assert.allclose(actual["kpoints"][0][key], value)
+
+
+def test_generic_quantity_with_index_and_group(demo_calculations, Assert):
+    batch = Batch.from_paths(calc=demo_calculations / "kpoints")
+    expected = py4vasp.Calculation.from_path(demo_calculations / "kpoints")
+    actual = batch.structure[-1].to_dict()
+    Assert.allclose(actual["calc"][0]["positions"], expected.structure[-1].positions())
+    actual = batch.phonon.band.to_dict()
+    Assert.allclose(actual["calc"][0]["bands"], expected.phonon.band.to_dict()["bands"])
+
+
+@pytest.mark.parametrize("constructor", ("from_paths", "from_files", "from_tree"))
+def test_workers_limit_concurrent_reads(demo_calculations, constructor):
+    path = demo_calculations / "encut_*"
+    if constructor == "from_files":
+        path = path / "vaspout.h5"
+    batch = getattr(Batch, constructor)(calc=path, workers=2)
+    executor = concurrent.futures.ThreadPoolExecutor
+    with patch.object(concurrent.futures, "ThreadPoolExecutor", wraps=executor) as mock:
+        assert len(batch.energy.read()["calc"]) == 2
+        mock.assert_called_once_with(2)
+        mock.reset_mock()
+        batch.to_graph("dos")
+        mock.assert_called_once_with(2)
+        mock.reset_mock()
+        batch.to_graph("dos", workers=1)
+        mock.assert_called_once_with(1)
+
+
+def test_generic_quantity_from_files(demo_calculations):
+    batch = Batch.from_files(calc=demo_calculations / "encut_a" / "vaspout.h5")
+    assert batch.energy.is_available()["calc"] == [True]
+
+
+def test_unknown_quantity():
+    batch = Batch.from_paths(calc="path")
+    with pytest.raises(AttributeError):
+        batch.not_a_quantity
+    with pytest.raises(AttributeError):
+        batch.band.not_a_method
+    assert "band" in dir(batch)
+    assert "to_dict" in dir(batch.band)
+
+
+def test_quantities_resolved_without_calculation_in_working_directory(monkeypatch):
+    batch = Batch.from_paths(calc="path")
+    monkeypatch.setattr(py4vasp.Calculation, "from_path", None)
+    assert "dos" in dir(batch)
+    assert "to_dict" in dir(batch.phonon.band)
+    assert callable(batch.structure[-1].to_dict)
+
+
+def test_creation_from_tree(demo_calculations):
+    batch = Batch.from_tree(all=demo_calculations, encut=demo_calculations / "encut_*")
+    expected = sorted(demo_calculations.glob("*/vaspout.h5"))
+    assert batch.files()["all"] == expected
+    assert batch.paths()["all"] == [file.parent for file in expected]
+    assert batch.number_of_calculations() == {"all": 3, "encut": 2}
+    assert len(batch.energy.read()["encut"]) == 2
+
+
+def test_creation_from_tree_with_manifest(demo_calculations, tmp_path):
+    manifest = tmp_path / "manifest.json"
+    batch = Batch.from_tree(calcs=demo_calculations, manifest=manifest, workers=2)
+    assert manifest.is_file()
+    assert batch.number_of_calculations() == {"calcs": 3}
+    with pytest.raises(exception.IncorrectUsage):
+        Batch.from_tree(first="first", second="second", manifest=manifest)
+    with pytest.raises(exception.IncorrectUsage):
+        Batch.from_tree(calcs=demo_calculations / "encut_*", manifest=manifest)
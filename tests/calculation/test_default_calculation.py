@@ -24,6 +24,38 @@ def attribute_included(attr):
     return True
 
 
+def test_default_calculation_is_reused(tmp_path, monkeypatch):
+    demo.calculation(tmp_path / "demo_calculation")
+    monkeypatch.chdir(tmp_path / "demo_calculation")
+    with patch.object(Calculation, "from_path", wraps=Calculation.from_path) as mock:
+        calculation.dos.read()
+        calculation.band.read()
+    mock.assert_called_once_with(str(tmp_path / "demo_calculation"))
+
+
+def test_default_calculation_follows_working_directory(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.chdir(first)
+    assert calculation.path() == first
+    monkeypatch.chdir(second)
+    assert calculation.path() == second
+
+
+def test_default_calculation_updated_when_output_changes(tmp_path, monkeypatch):
+    demo.calculation(tmp_path / "demo_calculation")
+    monkeypatch.chdir(tmp_path)
+    with patch.object(Calculation, "from_path", wraps=Calculation.from_path) as mock:
+        calculation.path()
+        calculation.path()
+        assert mock.call_count == 1
+        (tmp_path / "demo_calculation" / "vaspout.h5").rename(tmp_path / "vaspout.h5")
+        assert calculation.dos.read()
+        assert mock.call_count == 2
+
+
 @pytest.mark.skip("Input files are not included in current release.")
 def test_assigning_to_input_file(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
@@ -475,6 +475,24 @@ def test_to_numpy(reference_density, Assert):
     Assert.allclose(reference_density.to_numpy(), expected_density)
 
 
+def test_to_numpy_stride_and_region(reference_density, Assert):
+    expected = reference_density.to_numpy()[:, 1:8:2, ::2, -5::2]
+    actual = reference_density.to_numpy(stride=2, region=((1, 8), None, (-5, None)))
+    Assert.allclose(actual, expected)
+
+
+@pytest.mark.parametrize("downsampling", ["block", "fourier"])
+def test_plot_reduced_resolution(nonpolarized_density, downsampling, Assert):
+    view = nonpolarized_density.plot(resolution=(5, 6, 20), downsampling=downsampling)
+    quantity = view.grid_scalars[0].quantity
+    assert quantity.shape == (1, 5, 6, 14)
+    expected = nonpolarized_density.ref.output["charge"]
+    Assert.allclose(np.mean(quantity), np.mean(expected))
+    if downsampling == "block":
+        expected = expected.reshape(5, 2, 6, 2, 14).mean(axis=(1, 3))
+        Assert.allclose(quantity[0], expected)
+
+
 def test_selections(reference_density):
     assert reference_density.selections() == reference_density.ref.selections
 
@@ -303,6 +303,24 @@ def test_plot_with_analytic_continuation(nonpolarized_crpar, Assert):
     assert series.label == "screened U"
 
 
+def test_plot_with_analytic_continuation_of_several_selections(
+    nonpolarized_crpar, Assert
+):
+    pytest.importorskip("scipy")
+    omega_data = nonpolarized_crpar.ref.omega_data
+    omega = np.linspace(0, 10, 20)
+    graph = nonpolarized_crpar.plot("U J V", omega=omega)
+    assert len(graph) == 3
+    for series, label in zip(graph, ("screened U", "screened J")):
+        expected = numeric.analytic_continuation(
+            omega_data["frequencies"], omega_data[label], omega
+        )
+        Assert.allclose(series.y, expected[0].real, tolerance=100)
+        assert series.label == label
+    assert graph[2].label == "bare V"
+    Assert.allclose(graph[2].y, omega_data["bare V"][0].real)
+
+
 def test_plot_with_analytic_continuation_and_spin_selection(collinear_crpar, Assert):
     pytest.importorskip("scipy")
     omega_data = collinear_crpar.ref.omega_data
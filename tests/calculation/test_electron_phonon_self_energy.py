@@ -4,6 +4,7 @@ import itertools
 import random
 import re
 import types
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -11,6 +12,7 @@ import pytest
 from py4vasp import exception
 from py4vasp._calculation.electron_phonon_self_energy import (
     ElectronPhononSelfEnergy,
+    ElectronPhononSelfEnergyHandler,
     SelfEnergyInstance,
     SparseTensor,
 )
@@ -188,6 +190,43 @@ def test_incorrect_selection(self_energy, selection):
         self_energy.select(selection)
 
 
+def test_metadata_table(raw_self_energy, self_energy, Assert):
+    handler = ElectronPhononSelfEnergyHandler.from_data(raw_self_energy)
+    metadata = handler._accumulator.metadata
+    assert len(metadata) == len(handler)
+    Assert.allclose(metadata["selfen_carrier_den"], self_energy.ref.selfen_carrier_den)
+    Assert.allclose(metadata["nbands_sum"], self_energy.ref.nbands_sum)
+    Assert.allclose(metadata["delta"], self_energy.ref.selfen_delta)
+    assert list(metadata["scattering_approximation"]) == list(
+        self_energy.ref.scattering_approx
+    )
+
+
+def test_select_reads_metadata_once(raw_self_energy):
+    handler = ElectronPhononSelfEnergyHandler.from_data(raw_self_energy)
+    accumulator = handler._accumulator
+    choice = raw_self_energy.scattering_approximation[1]
+    selection = (
+        f"scattering_approx={choice}, nbands_sum={raw_self_energy.nbands_sum[0]}"
+    )
+    with patch.object(accumulator, "get_data") as get_data:
+        with patch.object(accumulator, "_read_column", wraps=accumulator._read_column):
+            selected = handler.select(selection)
+            handler.select(selection)
+            assert accumulator._read_column.call_count == 4
+    get_data.assert_not_called()
+    assert [instance.index for instance in selected] == [0, 1]
+
+
+def test_select_with_missing_metadata(raw_data):
+    raw_self_energy = raw_data.electron_phonon_self_energy("CRTA")
+    handler = ElectronPhononSelfEnergyHandler.from_data(raw_self_energy)
+    assert handler._accumulator.metadata["delta"].mask.all()
+    assert "selfen_delta" not in handler.selections()
+    with pytest.warns(UserWarning):
+        assert handler.select("selfen_delta=0.01") == []
+
+
 @pytest.fixture
 def mock_sparse_tensor():
     # 4 bands, 3 kpoints, 2 spins, only some indices valid
@@ -261,6 +300,104 @@ def test_sparse_tensor_should_only_succeed_if_index_is_valid(mock_sparse_tensor)
             assert bks[band - valid_bands.start, kpoint, spin] < 0
 
 
+def test_sparse_tensor_to_dense(mock_sparse_tensor, Assert):
+    expected = np.full((2, 3, 4), np.nan)
+    expected[0, 0, 0] = 10.0
+    expected[1, 1, 1] = 20.0
+    expected[1, 2, 3] = 30.0
+    Assert.allclose(mock_sparse_tensor.to_dense(), expected)
+    Assert.allclose(mock_sparse_tensor.to_dense(fill=0), np.nan_to_num(expected))
+    Assert.allclose(mock_sparse_tensor[:, :, :], expected)
+
+
+@pytest.mark.parametrize(
+    "indices, expected_indices",
+    [
+        ((1, slice(None), 5), (1, slice(None), 3)),
+        ((slice(None), 2, slice(3, None)), (slice(None), 2, slice(1, None))),
+        ((1, [1, 2], [3, 5]), (1, [1, 2], [1, 3])),
+        ((np.array([1, 0]), 1, -3), (np.array([1, 0]), 1, 1)),
+        ((0, 0, slice(None, None, -1)), (0, 0, slice(None, None, -1))),
+        ((1, 2, slice(0, 4)), (1, 2, slice(0, 2))),
+        ((1, 2, slice(4, 0, -2)), (1, 2, slice(2, None, -2))),
+        ((1, 2, slice(-2, None)), (1, 2, slice(2, None))),
+    ],
+)
+def test_sparse_tensor_bulk_access(
+    mock_sparse_tensor, indices, expected_indices, Assert
+):
+    expected = mock_sparse_tensor.to_dense()[expected_indices]
+    Assert.allclose(mock_sparse_tensor[indices], expected)
+
+
+@pytest.mark.parametrize(
+    "indices", [(0, slice(None), [1, 2]), (slice(None), 3, 2), (0, 0, [2, 6])]
+)
+def test_sparse_tensor_bulk_access_invalid(mock_sparse_tensor, indices):
+    with pytest.raises(exception.IncorrectUsage):
+        mock_sparse_tensor[indices]
+
+
+def test_sparse_tensor_reads_only_requested_rows(Assert):
+    band_kpoint_spin_index = np.arange(6).reshape(3, 2, 1)
+    tensor = np.random.rand(6, 4)
+    requested_rows = []
+
+    class Dataset:
+        def __getitem__(self, rows):
+            requested_rows.append(rows)
+            return tensor[rows]
+
+    sparse_tensor = SparseTensor(band_kpoint_spin_index, 1, Dataset())
+    Assert.allclose(sparse_tensor[0, 1, [3, 1, 3]], tensor[[5, 1, 5]])
+    assert len(requested_rows) == 1
+    assert list(requested_rows[0]) == [1, 5]
+
+
+def test_sparse_tensor_bulk_access_without_performed_state(Assert):
+    band_kpoint_spin_index = np.full((3, 2, 1), -1)
+    band_kpoint_spin_index[0, 0, 0] = 0
+    tensor = np.random.rand(1, 4, 2)
+    sparse_tensor = SparseTensor(band_kpoint_spin_index, 1, tensor)
+    missing = sparse_tensor[0, 1, [2, 3]]
+    assert missing.shape == (2, 4, 2)
+    assert np.all(np.isnan(missing))
+    mixed = sparse_tensor[0, :, 1]
+    assert mixed.shape == (2, 4, 2)
+    Assert.allclose(mixed[0], tensor[0])
+    assert np.all(np.isnan(mixed[1]))
+
+
+@pytest.mark.parametrize(
+    "contribution", ["fan", "debye_waller", "self_energy", "energies"]
+)
+def test_sparse_tensor_missing_states_keep_shape(self_energy, contribution):
+    sparse_tensor = getattr(self_energy[0], contribution)()
+    dense = sparse_tensor.to_dense()
+    index = np.full(dense.shape[:3], -1)
+    missing = SparseTensor(
+        index.T, sparse_tensor.valid_bands.start, sparse_tensor._tensor
+    )
+    actual = missing.to_dense()
+    assert actual.shape == dense.shape
+    assert actual.dtype == dense.dtype
+    assert np.all(np.isnan(actual))
+
+
+@pytest.mark.parametrize(
+    "contribution", ["fan", "debye_waller", "self_energy", "energies"]
+)
+def test_sparse_tensor_bulk_self_energy(self_energy, contribution, Assert):
+    first_band = 1
+    for instance in self_energy:
+        sparse_tensor = getattr(instance, contribution)()
+        dense = sparse_tensor.to_dense()
+        valid = ~np.isnan(dense.reshape(dense.shape[:3] + (-1,))[..., 0])
+        for spin, kpoint, band in zip(*np.nonzero(valid)):
+            expected = sparse_tensor[int(spin), int(kpoint), int(band) + first_band]
+            Assert.allclose(dense[spin, kpoint, band], expected)
+
+
 @pytest.mark.parametrize(
     "contribution", ["fan", "debye_waller", "self_energy", "energies"]
 )
@@ -269,7 +406,8 @@ def test_sparse_tensor_self_energy(self_energy, contribution, Assert):
     for instance, indices in zip(self_energy, self_energy.ref.band_kpoint_spin_index):
         data = instance.read()
         if contribution == "self_energy":
-            expected_result = data["fan"] + data["debye_waller"]
+            debye_waller = data["debye_waller"][:, np.newaxis, :]
+            expected_result = data["fan"] + debye_waller
         else:
             expected_result = data[contribution]
         sparse_tensor = getattr(instance, contribution)()
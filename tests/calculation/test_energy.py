@@ -1,5 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import importlib.util
 import types
 from dataclasses import fields
 from unittest.mock import patch
@@ -291,6 +292,47 @@ def test_detect_energy_format_unknown_raises():
         _detect_energy_format({"not_a_real_energy_key"})
 
 
-def test_factory_methods(raw_data, check_factory_methods):
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+@pytest.mark.parametrize(
+    "selection, labels, subset",
+    [
+        (None, None, slice(None)),
+        ("ETOTAL, TEIN", ["ETOTAL", "TEIN"], [6, 3]),
+    ],
+)
+@pytest.mark.parametrize("steps", [slice(None), slice(1, 4), 0])
+def test_write_table(suffix, selection, labels, subset, steps, MD_energy, tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.feather
+    import pyarrow.parquet
+
+    filename = tmp_path / f"energy{suffix}"
+    MD_energy[steps].write_table(filename, selection, chunk_size=2)
+    if suffix == ".parquet":
+        table = pyarrow.parquet.read_table(filename)
+    else:
+        table = pyarrow.feather.read_table(filename)
+    reference = MD_energy.ref
+    labels = labels or reference.labels[subset]
+    assert table.column_names == ["step", *labels]
+    expected_steps = np.atleast_1d(np.arange(reference.number_steps)[steps])
+    assert table.column("step").to_pylist() == list(expected_steps + 1)
+    for label, expected in zip(labels, reference.values[subset]):
+        actual = table.column(label).to_numpy()
+        assert np.array_equal(actual, np.atleast_1d(expected[steps]))
+
+
+def test_write_table_with_incorrect_arguments(MD_energy, tmp_path):
+    with pytest.raises(exception.IncorrectUsage):
+        MD_energy[:].write_table(tmp_path / "energy.csv")
+    with pytest.raises(exception.IncorrectUsage):
+        MD_energy[:].write_table(tmp_path / "energy.parquet", chunk_size=0)
+
+
+def test_factory_methods(raw_data, check_factory_methods, tmp_path):
     data = raw_data.energy("MD")
-    check_factory_methods(Energy, data)
+    if importlib.util.find_spec("pyarrow") is None:
+        check_factory_methods(Energy, data, skip_methods=["write_table"])
+        return
+    parameters = {"write_table": {"filename": tmp_path / "energy.parquet"}}
+    check_factory_methods(Energy, data, parameters)
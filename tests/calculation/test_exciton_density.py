@@ -47,6 +47,18 @@ def test_to_numpy(exciton_density, Assert):
     Assert.allclose(actual, exciton_density.ref.density)
 
 
+def test_to_numpy_stride_and_region(exciton_density, Assert):
+    actual = exciton_density.to_numpy(stride=(1, 2, 3), region=(None, None, (4, 12)))
+    Assert.allclose(actual, exciton_density.ref.density[:, :, ::2, 4:12:3])
+
+
+def test_plot_reduced_resolution(exciton_density, Assert):
+    view = exciton_density.plot("2", resolution=(20, 6, 7))
+    quantity = view.grid_scalars[0].quantity
+    assert quantity.shape[1:] == (exciton_density.ref.density.shape[1], 6, 7)
+    Assert.allclose(np.mean(quantity), np.mean(exciton_density.ref.density[1]))
+
+
 @pytest.mark.parametrize("selection, indices", [(None, 0), ("2", 1), ("1, 3", (0, 2))])
 def test_plot_selection(exciton_density, selection, indices, Assert):
     indices = np.atleast_1d(indices)
@@ -1,10 +1,14 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import itertools
 import types
 
+import h5py
 import numpy as np
 import pytest
 
+from py4vasp import exception, raw
+from py4vasp._calculation import _dynamical_matrix
 from py4vasp._calculation.force_constant import ForceConstant, ForceConstantHandler
 from py4vasp._calculation.structure import StructureHandler
 
@@ -121,6 +125,173 @@ def test_to_molden(Sr2TiO4, Assert):
     assert molden_string == Sr2TiO4.ref.molden_string
 
 
+def test_write_molden(Sr2TiO4, tmp_path):
+    filename = tmp_path / "modes.molden"
+    Sr2TiO4.write_molden(filename)
+    assert filename.read_text() == Sr2TiO4.ref.molden_string
+
+
+def test_lowest_modes(Sr2TiO4, Assert):
+    number_modes = 4
+    expected_values, expected_vectors = Sr2TiO4._diagonalize()
+    actual_values, actual_vectors = Sr2TiO4._diagonalize(number_modes)
+    Assert.allclose(actual_values, expected_values[:number_modes])
+    for actual, expected in zip(actual_vectors, expected_vectors):
+        overlap = np.abs(np.sum(actual * expected))
+        Assert.allclose(overlap, 1, tolerance=1e4)
+    molden_string = Sr2TiO4.to_molden(number_modes)
+    assert molden_string.count("vibration") == number_modes
+    expected_lines = Sr2TiO4.ref.molden_string.splitlines()
+    frequencies = molden_string.splitlines()[2 : 2 + number_modes]
+    assert frequencies == expected_lines[2 : 2 + number_modes]
+
+
+@pytest.mark.parametrize("modes", [0, 22, 1.5])
+def test_incorrect_number_of_modes(Sr2TiO4, modes):
+    with pytest.raises(exception.IncorrectUsage):
+        Sr2TiO4.eigenvectors(modes)
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".h5"])
+def test_write_modes(Sr2TiO4, suffix, tmp_path, Assert):
+    filename = tmp_path / f"modes{suffix}"
+    Sr2TiO4.write_modes(filename, modes=3)
+    if suffix == ".npz":
+        data = dict(np.load(filename))
+    else:
+        with h5py.File(filename, "r") as file:
+            data = {key: file[key][()] for key in file}
+    eigenvalues, eigenvectors = Sr2TiO4._diagonalize(3)
+    Assert.allclose(data["eigenvalues"], eigenvalues)
+    Assert.allclose(np.abs(data["eigenvectors"]), np.abs(eigenvectors))
+    structure = Sr2TiO4.ref.structure
+    Assert.allclose(data["lattice_vectors"], structure.lattice_vectors())
+    Assert.allclose(data["positions"], structure.cartesian_positions())
+    elements = [element.decode() for element in data["elements"]]
+    assert elements == structure._stoichiometry().elements()
+
+
+def test_write_modes_unknown_suffix(Sr2TiO4, tmp_path):
+    with pytest.raises(exception.IncorrectUsage):
+        Sr2TiO4.write_modes(tmp_path / "modes.txt")
+
+
+@pytest.fixture
+def linear_chain():
+    # atoms connected by springs along the x axis in a supercell of 4 primitive cells
+    number_cells = 4
+    spring_constant = 1.0
+    force_constants = np.zeros((number_cells, 3, number_cells, 3))
+    for cell, direction in itertools.product(range(number_cells), range(3)):
+        neighbors = [(cell + 1) % number_cells, (cell - 1) % number_cells]
+        force_constants[cell, direction, cell, direction] = 2 * spring_constant
+        force_constants[cell, direction, neighbors, direction] = -spring_constant
+    stoichiometry = raw.Stoichiometry(ion_types=["Si"], number_ion_types=[number_cells])
+    cell = raw.Cell(lattice_vectors=np.diag([1.0 * number_cells, 10.0, 10.0]))
+    positions = np.zeros((number_cells, 3))
+    positions[:, 0] = np.arange(number_cells) / number_cells
+    structure = raw.Structure(stoichiometry, cell, positions)
+    # VASP reports the negative second derivative of the energy
+    force_constants = -force_constants.reshape(3 * number_cells, 3 * number_cells)
+    raw_force_constant = raw.ForceConstant(structure, force_constants)
+    force_constant = ForceConstant.from_data(raw_force_constant)
+    force_constant.ref = types.SimpleNamespace()
+    force_constant.ref.supercell = [number_cells, 1, 1]
+    force_constant.ref.masses = {"Si": 2.0}
+    max_frequency = 2 * np.sqrt(spring_constant / 2.0) * 15.633302
+    force_constant.ref.dispersion = lambda q: max_frequency * np.abs(np.sin(np.pi * q))
+    return force_constant
+
+
+def test_interpolate_linear_chain(linear_chain, Assert):
+    qpoints = np.linspace([0, 0, 0], [0.5, 0, 0], 7)
+    actual = linear_chain.interpolate(
+        qpoints,
+        linear_chain.ref.supercell,
+        masses=linear_chain.ref.masses,
+        eigenvectors=True,
+    )
+    Assert.allclose(actual["qpoints"], qpoints)
+    expected = linear_chain.ref.dispersion(qpoints[:, 0])
+    Assert.allclose(actual["frequencies"], np.repeat(expected[:, np.newaxis], 3, 1))
+    assert actual["eigenvectors"].shape == (7, 3, 1, 3)
+    for eigenvectors in actual["eigenvectors"]:
+        Assert.allclose(np.abs(eigenvectors.reshape(3, 3)), np.eye(3))
+
+
+def test_interpolate_in_parallel(linear_chain, Assert):
+    qpoints = np.random.rand(600, 3)
+    arguments = (qpoints, linear_chain.ref.supercell)
+    serial = linear_chain.interpolate(*arguments, masses=linear_chain.ref.masses)
+    parallel = linear_chain.interpolate(
+        *arguments, masses=linear_chain.ref.masses, workers=3
+    )
+    Assert.allclose(parallel["frequencies"], serial["frequencies"], tolerance=1e4)
+    expected = linear_chain.ref.dispersion(qpoints[:, 0])
+    Assert.allclose(serial["frequencies"][:, 0], expected, tolerance=1e4)
+
+
+def test_interpolate_gamma_point_of_supercell(raw_data, Assert):
+    raw_force_constant = raw_data.force_constant("Sr2TiO4 all atoms")
+    force_constant = ForceConstant.from_data(raw_force_constant)
+    masses = {"Sr": 1.0, "Ti": 1.0, "O": 1.0}
+    actual = force_constant.interpolate([0, 0, 0], supercell=1, masses=masses)
+    eigenvalues = np.linalg.eigvalsh(-raw_force_constant.force_constants[:])
+    expected = np.sign(eigenvalues) * np.sqrt(np.abs(eigenvalues)) * 15.633302
+    Assert.allclose(actual["frequencies"], expected[np.newaxis])
+
+
+def test_to_dos_linear_chain(linear_chain, Assert):
+    actual = linear_chain.to_dos(
+        mesh=[16, 1, 1],
+        supercell=linear_chain.ref.supercell,
+        masses=linear_chain.ref.masses,
+        width=0.5,
+    )
+    assert len(actual["energies"]) == len(actual["total"]) == 501
+    number_modes = np.trapezoid(actual["total"], actual["energies"])
+    Assert.allclose(number_modes, 3, tolerance=1e8)
+    maximum = linear_chain.ref.dispersion(0.5)
+    assert actual["energies"][np.argmax(actual["total"])] > 0.5 * maximum
+
+
+def test_interpolate_with_selective_dynamics(raw_data):
+    raw_force_constant = raw_data.force_constant("Sr2TiO4 selective dynamics")
+    force_constant = ForceConstant.from_data(raw_force_constant)
+    with pytest.raises(exception.NotImplemented):
+        force_constant.interpolate([0, 0, 0], supercell=1)
+
+
+@pytest.mark.parametrize("supercell", [2, [1, 2], [[1, 0, 0], [0, 1, 0], [0, 0, 0]]])
+def test_interpolate_incorrect_supercell(raw_data, supercell):
+    raw_force_constant = raw_data.force_constant("Sr2TiO4 all atoms")
+    force_constant = ForceConstant.from_data(raw_force_constant)
+    with pytest.raises(exception.IncorrectUsage):
+        force_constant.interpolate([0, 0, 0], supercell)
+
+
+def test_interpolate_unknown_mass(linear_chain):
+    linear_chain._source._raw_data.structure.stoichiometry.ion_types = ["Xx"]
+    with pytest.raises(exception.IncorrectUsage):
+        linear_chain.interpolate([0, 0, 0], linear_chain.ref.supercell)
+
+
+def test_dynamical_matrix_in_chunks(linear_chain, Assert):
+    raw_force_constant = linear_chain._source._raw_data
+    dynamical_matrix = _dynamical_matrix.DynamicalMatrix.from_data(
+        raw_force_constant, linear_chain.ref.supercell, linear_chain.ref.masses
+    )
+    qpoints = _dynamical_matrix.mesh([5, 1, 1])
+    Assert.allclose(qpoints[:, 0], np.arange(5) / 5)
+    matrices = dynamical_matrix(qpoints)
+    Assert.allclose(matrices, np.conj(np.swapaxes(matrices, 1, 2)))
+    expected = dynamical_matrix.diagonalize(qpoints)
+    actual = dynamical_matrix.diagonalize(qpoints, chunk_size=2)
+    Assert.allclose(actual["frequencies"], expected["frequencies"])
+    with pytest.raises(exception.IncorrectUsage):
+        dynamical_matrix.diagonalize(qpoints, chunk_size=0)
+
+
 def get_molden_string(selection):
     if selection == "all atoms":
         return """\
@@ -431,6 +602,12 @@ vibration 10
 """
 
 
-def test_factory_methods(raw_data, check_factory_methods):
+def test_factory_methods(raw_data, check_factory_methods, tmp_path):
     data = raw_data.force_constant("Sr2TiO4 all atoms")
-    check_factory_methods(ForceConstant, data)
+    parameters = {
+        "interpolate": {"qpoints": [0, 0, 0], "supercell": 1},
+        "to_dos": {"mesh": 2, "supercell": 1},
+        "write_molden": {"filename": tmp_path / "modes.molden"},
+        "write_modes": {"filename": tmp_path / "modes.npz"},
+    }
+    check_factory_methods(ForceConstant, data, parameters)
@@ -0,0 +1,246 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import types
+
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import _config, demo, exception
+from py4vasp._calculation import _grid_expression
+from py4vasp._calculation.density import Density
+from py4vasp._calculation.partial_density import PartialDensity
+from py4vasp._calculation.potential import Potential
+from py4vasp._raw.definition import DEFAULT_FILE
+
+
+@pytest.fixture(scope="module")
+def calculations(tmp_path_factory):
+    path = tmp_path_factory.mktemp("grid_expression")
+    return [demo.calculation(path / name) for name in ("AB", "A", "B")]
+
+
+@pytest.fixture
+def small_slabs(monkeypatch):
+    # demo grids have 12 x 10 points per plane, evaluate 3 planes at once
+    monkeypatch.setattr(_grid_expression, "SLAB_BYTES", 8 * 12 * 10 * 3)
+
+
+def densities(calculations):
+    return [calculation.density.to_numpy()[0] for calculation in calculations]
+
+
+def test_density_difference(calculations, small_slabs):
+    AB, A, B = calculations
+    difference = AB.density.lazy() - A.density.lazy() - B.density.lazy()
+    rho_AB, rho_A, rho_B = densities(calculations)
+    expected = rho_AB - rho_A - rho_B
+    assert difference.shape == expected.shape
+    assert difference.label == "charge - charge - charge"
+    assert np.allclose(difference.to_numpy(), expected)
+    assert np.allclose(np.asarray(difference), expected)
+    assert np.allclose(difference.to_numpy(stride=2), expected[::2, ::2, ::2])
+    region = ((1, 4), None, (2, 5))
+    assert np.allclose(difference.to_numpy(region=region), expected[1:4, :, 2:5])
+
+
+def test_average(calculations, small_slabs):
+    expressions = [calculation.density.lazy() for calculation in calculations]
+    average = sum(expressions) / len(expressions)
+    assert np.allclose(average.to_numpy(), np.mean(densities(calculations), axis=0))
+    scaled = 0.5 * expressions[0] + expressions[1] * 2 - (-expressions[2])
+    rho_AB, rho_A, rho_B = densities(calculations)
+    assert np.allclose(scaled.to_numpy(), 0.5 * rho_AB + 2 * rho_A + rho_B)
+
+
+def test_repeated_operand_is_read_once(calculations):
+    density = calculations[0].density.lazy()
+    expression = density + density - 0.5 * density
+    assert len(expression._operands) == 1
+    assert np.allclose(expression.to_numpy(), 1.5 * density.to_numpy())
+
+
+def test_index_reads_plane(calculations):
+    AB, A, _ = calculations
+    difference = AB.density.lazy() - A.density.lazy()
+    rho_AB, rho_A, _ = densities(calculations)
+    expected = rho_AB - rho_A
+    assert np.allclose(difference[:, 3, :], expected[:, 3, :])
+    assert np.allclose(difference[2], expected[2])
+    assert np.allclose(difference[1:3, ::2, 4], expected[1:3, ::2, 4])
+
+
+def test_to_contour(calculations):
+    AB, A, _ = calculations
+    difference = AB.density.lazy() - A.density.lazy()
+    rho_AB, rho_A, _ = densities(calculations)
+    graph = difference.to_contour(a=0.2, isolevels=False)
+    (contour,) = graph.series
+    assert np.allclose(contour.data, (rho_AB - rho_A)[2])
+    assert contour.label == difference.label
+    assert not contour.isolevels
+    reference = AB.density.to_contour(c=0.5, supercell=2).series[0]
+    contour = AB.density.lazy().to_contour(c=0.5, supercell=2).series[0]
+    assert np.allclose(contour.data, reference.data)
+    assert np.allclose(contour.lattice.vectors, reference.lattice.vectors)
+    assert np.all(contour.supercell == reference.supercell)
+
+
+def test_to_view(calculations):
+    AB, A, _ = calculations
+    view = AB.density.lazy().to_view(isolevel=0.3)
+    (grid_scalar,) = view.grid_scalars
+    assert np.allclose(grid_scalar.quantity[0], densities(calculations)[0])
+    assert grid_scalar.sign_mode == "continuous"
+    assert grid_scalar.isosurfaces[0].isolevel == 0.3
+    assert grid_scalar.isosurfaces[0].color == _config.VASP_COLORS["cyan"]
+    difference = AB.density.lazy() - A.density.lazy()
+    view = difference.to_view(supercell=2, resolution=5)
+    (grid_scalar,) = view.grid_scalars
+    assert grid_scalar.quantity.shape == (1, 5, 5, 5)
+    assert grid_scalar.sign_mode == "mixed"
+    assert [surface.isolevel for surface in grid_scalar.isosurfaces] == [0.2, -0.2]
+    assert np.all(view.supercell == 2)
+
+
+def test_bader_charge(calculations, small_slabs):
+    AB, A, B = calculations
+    difference = AB.density.lazy() - A.density.lazy() - B.density.lazy()
+    rho_AB, rho_A, rho_B = densities(calculations)
+    analysis = AB.density.bader_analysis()
+    expected = analysis.charges(rho_AB - rho_A - rho_B)
+    actual = difference.bader_charge(bader_analysis=analysis)
+    assert actual.keys() == expected.keys()
+    assert np.allclose(list(actual.values()), list(expected.values()))
+
+
+def test_bader_charge_on_different_grid(calculations):
+    basins = np.zeros((2, 3, 4), dtype=np.int_)
+    analysis = types.SimpleNamespace(basins=lambda: basins, charges=lambda: {"Sr": 0})
+    with pytest.raises(exception.IncorrectUsage):
+        calculations[0].density.lazy().bader_charge(bader_analysis=analysis)
+
+
+def test_write(calculations, tmp_path, small_slabs):
+    AB, A, _ = calculations
+    difference = AB.density.lazy() - A.density.lazy()
+    rho_AB, rho_A, _ = densities(calculations)
+    filename = tmp_path / "CHGCAR"
+    difference.write(filename)
+    content = filename.read_text()
+    assert content.startswith(str(AB.structure).rstrip())
+    lines = content.splitlines()
+    nx, ny, nz = rho_AB.shape
+    start = lines.index(f"{nx:5d}{ny:5d}{nz:5d}")
+    assert lines[start - 1] == ""
+    assert all(len(line.split()) == 5 for line in lines[start + 1 : -1])
+    values = np.array(" ".join(lines[start + 1 :]).split(), dtype=np.float64)
+    expected = (rho_AB - rho_A).ravel(order="F")
+    assert np.allclose(values, expected)
+
+
+def test_potential(calculations, raw_data):
+    AB, A, _ = calculations
+    change = AB.potential.lazy("hartree") - A.potential.lazy("hartree")
+    expected = AB.potential.to_numpy("hartree") - A.potential.to_numpy("hartree")
+    assert change.label == "hartree potential - hartree potential"
+    assert np.allclose(change.to_numpy(), expected[0])
+    raw_potential = raw_data.potential("Fe3O4 collinear total")
+    potential = Potential.from_data(raw_potential)
+    total = np.asarray(raw_potential.total_potential)
+    expectations = {
+        "total": total[0],
+        "total(up)": total[0] + total[1],
+        "down": total[0] - total[1],
+        "sigma_z": total[1],
+    }
+    for selection, expected in expectations.items():
+        assert np.allclose(potential.lazy(selection).to_numpy(), expected.T)
+
+
+@pytest.mark.parametrize("selection", ("total, xc", "total(up, down)", "unknown"))
+def test_incorrect_potential_selection(raw_data, selection):
+    potential = Potential.from_data(raw_data.potential("Fe3O4 collinear total"))
+    with pytest.raises(exception.IncorrectUsage):
+        potential.lazy(selection)
+
+
+def test_missing_potential(raw_data):
+    potential = Potential.from_data(raw_data.potential("Sr2TiO4 total"))
+    with pytest.raises(exception.NoData):
+        potential.lazy("hartree")
+
+
+def test_partial_density(raw_data):
+    raw_partial_density = raw_data.partial_density("spin_polarized")
+    partial_density = PartialDensity.from_data(raw_partial_density)
+    for selection in ("total", "up", "down"):
+        expected = partial_density.to_numpy(selection)
+        expression = partial_density.lazy(selection)
+        assert expression.label == selection
+        assert np.allclose(expression.to_numpy(), expected)
+    with pytest.raises(exception.IncorrectUsage):
+        partial_density.lazy("unknown")
+
+
+def test_density_components(raw_data):
+    raw_density = raw_data.density("Fe3O4 collinear")
+    density = Density.from_data(raw_density)
+    charge = np.asarray(raw_density.charge)
+    magnetization = density.lazy("m")
+    assert magnetization.label == "m"
+    assert np.allclose(magnetization.to_numpy(), charge[1].T)
+    assert np.allclose(density.lazy("sigma_z").to_numpy(), charge[1].T)
+    kinetic_energy = density["kinetic_energy"].lazy()
+    assert kinetic_energy.label == "kinetic_energy"
+    assert np.allclose(kinetic_energy.to_numpy(), charge[0].T)
+
+
+@pytest.mark.parametrize("selection", ("0, 3", "unknown"))
+def test_incorrect_density_selection(raw_data, selection):
+    density = Density.from_data(raw_data.density("Fe3O4 collinear"))
+    with pytest.raises(exception.IncorrectUsage):
+        density.lazy(selection)
+
+
+def test_missing_magnetization(raw_data):
+    density = Density.from_data(raw_data.density("Sr2TiO4"))
+    with pytest.raises(exception.NoData):
+        density.lazy("sigma_z")
+
+
+def test_incompatible_grid(calculations, raw_data):
+    partial_density = PartialDensity.from_data(raw_data.partial_density("Graphite"))
+    with pytest.raises(exception.IncorrectUsage, match="different grids"):
+        calculations[0].density.lazy() + partial_density.lazy()
+
+
+def test_incompatible_cell(calculations, tmp_path):
+    other = demo.calculation(tmp_path / "strained")
+    with h5py.File(tmp_path / "strained" / DEFAULT_FILE, "a") as h5f:
+        h5f["intermediate/ion_dynamics/lattice_vectors"][-1] *= 1.01
+    with pytest.raises(exception.IncorrectUsage, match="different cells"):
+        calculations[0].density.lazy() - other.density.lazy()
+
+
+def test_arithmetic_with_other_types(calculations):
+    density = calculations[0].density.lazy()
+    with pytest.raises(TypeError):
+        density + 1
+    with pytest.raises(TypeError):
+        density * density
+    with pytest.raises(TypeError):
+        density * True
+    with pytest.raises(exception.IncorrectUsage):
+        density / 0
+
+
+def test_print(calculations, format_):
+    expression = calculations[0].density.lazy() - calculations[1].density.lazy()
+    actual, _ = format_(expression)
+    reference = """\
+grid expression:
+    charge - charge
+    operands: 2
+    grid: 10, 12, 14"""
+    assert actual == {"text/plain": reference}
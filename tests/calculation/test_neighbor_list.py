@@ -377,7 +377,13 @@ def test_factory_methods_access_structure(raw_data):
     # structure in the schema rather than a nonexistent "neighbor_list" entry.
     data = raw_data.structure("Sr2TiO4")
     instances = (NeighborList.from_path(), NeighborList.from_file("vaspout.h5"))
-    calls = (lambda nl: nl.read(cutoff=4.0), lambda nl: str(nl))
+    calls = (
+        lambda nl: nl.read(cutoff=4.0),
+        lambda nl: str(nl),
+        lambda nl: nl[:].pair_correlation(rmax=4.0),
+        lambda nl: nl[:].coordination_number(rmax=4.0),
+        lambda nl: nl[:].bond_angles(cutoff=4.0),
+    )
     for neighbor_list in instances:
         for call in calls:
             with patch("py4vasp.raw.access") as mock_access:
@@ -436,3 +442,180 @@ def test_is_available(tmp_path):
     # resolve that rather than the (non-existent) "neighbor_list" schema entry.
     calc = demo.calculation(tmp_path / "example")
     assert calc.neighbor_list.is_available("default") is True
+
+
+# --- histograms over trajectories --------------------------------------------
+
+
+def _trajectory():
+    """The tilted structure rattled and rescaled in every step like an NpT run."""
+    structure = _tilted_structure()
+    rng = np.random.default_rng(seed=17)
+    number_steps = 6
+    scale = 1 + 0.05 * rng.random(number_steps)
+    lattice = scale[:, np.newaxis, np.newaxis] * structure.cell.lattice_vectors
+    positions = structure.positions + 0.2 * rng.random((number_steps, 4, 3))
+    return _raw_structure(lattice, positions, ["Si", "C"], [2, 2])
+
+
+def _brute_force_distances(raw_structure, cutoff, steps):
+    elements = np.array(_elements(raw_structure))
+    for step in range(len(raw_structure.positions))[steps]:
+        lattice = raw_structure.cell.lattice_vectors[step]
+        volume = np.abs(np.linalg.det(lattice))
+        brute_map = _brute_force_map(raw_structure, cutoff, steps=step)
+        pairs = [
+            (elements[i], elements[j], distance)
+            for (i, j, *_), (distance, _) in brute_map.items()
+        ]
+        yield volume, pairs
+
+
+def test_pair_correlation_matches_brute_force(Assert):
+    structure = _trajectory()
+    rmax, bin_width = 4.0, 0.5
+    edges = np.arange(0, rmax + bin_width / 2, bin_width)
+    shell_volume = 4 / 3 * np.pi * np.diff(edges**3)
+    expected = {"total": 0, "Si~Si": 0, "Si~C": 0, "C~C": 0}
+    number_pairs = {"total": 12, "Si~Si": 2, "Si~C": 4, "C~C": 2}
+    steps = slice(1, None, 2)
+    for volume, pairs in _brute_force_distances(structure, rmax, steps):
+        for label in expected:
+            distances = [
+                distance
+                for source, neighbor, distance in pairs
+                if label == "total" or label == f"{source}~{neighbor}"
+            ]
+            histogram, _ = np.histogram(distances, edges)
+            expected[label] += volume * histogram / number_pairs[label]
+    neighbor_list = NeighborList.from_data(structure)[steps]
+    actual = neighbor_list.pair_correlation(rmax=rmax, bin_width=bin_width)
+    assert list(actual) == ["distances", "total", "Si~Si", "Si~C", "C~C"]
+    Assert.allclose(actual["distances"], 0.5 * (edges[1:] + edges[:-1]))
+    for label, histogram in expected.items():
+        Assert.allclose(actual[label], histogram / 3 / shell_volume)
+
+
+def test_pair_correlation_approaches_one():
+    rng = np.random.default_rng(seed=23)
+    lattice = 10 * np.eye(3)
+    positions = rng.random((10, 200, 3))
+    structure = _raw_structure([lattice] * 10, positions, ["Ar"], [200])
+    actual = NeighborList.from_data(structure)[:].pair_correlation(
+        "Ar", rmax=5.0, bin_width=0.5
+    )
+    assert np.all(np.abs(actual["Ar"][2:] - 1) < 0.1)
+
+
+@pytest.mark.parametrize("chunk_size, workers", [(1, 1), (2, 3), (64, 2)])
+def test_histograms_independent_of_chunks(chunk_size, workers, Assert):
+    neighbor_list = NeighborList.from_data(_trajectory())[:]
+    kwargs = {"chunk_size": chunk_size, "workers": workers}
+    methods = (
+        lambda **kwargs: neighbor_list.pair_correlation(rmax=4.0, **kwargs),
+        lambda **kwargs: neighbor_list.coordination_number(rmax=4.0, **kwargs),
+        lambda **kwargs: neighbor_list.bond_angles(cutoff=4.0, **kwargs),
+    )
+    for method in methods:
+        expected = method()
+        actual = method(**kwargs)
+        assert actual.keys() == expected.keys()
+        for label, values in expected.items():
+            Assert.allclose(actual[label], values)
+
+
+@pytest.mark.parametrize(
+    "steps, equivalent",
+    [
+        (slice(None, None, -1), slice(None)),
+        (slice(None, None, -2), slice(1, None, 2)),
+        (slice(4, 0, -3), slice(1, 5, 3)),
+        (slice(None, None, 4), slice(0, 5, 4)),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 64])
+def test_histograms_of_reversed_and_strided_steps(
+    steps, equivalent, chunk_size, Assert
+):
+    structure = _trajectory()
+    expected = NeighborList.from_data(structure)[equivalent].coordination_number(
+        rmax=4.0
+    )
+    actual = NeighborList.from_data(structure)[steps].coordination_number(
+        rmax=4.0, chunk_size=chunk_size
+    )
+    for label, values in expected.items():
+        Assert.allclose(actual[label], values)
+
+
+def test_histograms_of_empty_selection():
+    neighbor_list = NeighborList.from_data(_trajectory())[3:1]
+    with pytest.raises(exception.IncorrectUsage):
+        neighbor_list.coordination_number(rmax=4.0)
+
+
+def test_coordination_number_simple_cubic(Assert):
+    structure = _raw_structure(np.eye(3) * 3, [[0, 0, 0]], ["H"], [1])
+    actual = NeighborList.from_data(structure).coordination_number(
+        rmax=4.5, bin_width=0.5
+    )
+    Assert.allclose(actual["distances"], np.arange(0.5, 4.6, 0.5))
+    # 6 neighbors at 3 Å (in the bin up to 3.5 Å), 12 at 4.24 Å
+    Assert.allclose(actual["total"], [0, 0, 0, 0, 0, 0, 6, 6, 18])
+    Assert.allclose(actual["H~H"], actual["total"])
+
+
+def test_coordination_number_directed(Assert):
+    structure = _trajectory()
+    neighbor_list = NeighborList.from_data(structure)[:4]
+    actual = neighbor_list.coordination_number("Si~C, C~Si, C", rmax=4.0)
+    assert list(actual) == ["distances", "Si~C", "C~Si", "C"]
+    expected = {"Si~C": 0, "C~Si": 0, "C": 0}
+    for _, pairs in _brute_force_distances(structure, 4.0, slice(4)):
+        for source, neighbor, _ in pairs:
+            expected[f"{source}~{neighbor}"] = expected.get(f"{source}~{neighbor}", 0)
+            expected[f"{source}~{neighbor}"] += 1
+            if source == "C":
+                expected["C"] += 1
+    for label in ("Si~C", "C~Si", "C"):
+        Assert.allclose(actual[label][-1], expected[label] / 2 / 4)
+
+
+def test_bond_angles_simple_cubic(Assert):
+    structure = _raw_structure(np.eye(3) * 3, [[0, 0, 0]], ["H"], [1])
+    neighbor_list = NeighborList.from_data(structure)
+    actual = neighbor_list.bond_angles("H, H~H~H", cutoff=3.3, bin_width=45)
+    Assert.allclose(actual["angles"], [22.5, 67.5, 112.5, 157.5])
+    # 12 right angles and 3 straight angles between the 6 neighbors
+    expected = np.array([0, 0, 12, 3]) / 15 / 45
+    Assert.allclose(actual["H"], expected)
+    Assert.allclose(actual["H~H~H"], expected)
+
+
+def test_bond_angles_of_neighbor_types(Assert):
+    structure = _trajectory()
+    actual = NeighborList.from_data(structure)[:].bond_angles(
+        "Si~C~Si, Si~C~C, C~C~Si, C", cutoff=3.5, bin_width=5
+    )
+    assert list(actual) == ["angles", "Si~C~Si", "Si~C~C", "C~C~Si", "C"]
+    Assert.allclose(actual["Si~C~C"], actual["C~C~Si"])
+    for label in ("Si~C~Si", "Si~C~C", "C"):
+        Assert.allclose(np.sum(actual[label]) * 5, 1)
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("pair_correlation", {"rmax": 0}),
+        ("pair_correlation", {"rmax": 3.0, "bin_width": -0.1}),
+        ("pair_correlation", {"rmax": 3.0, "selection": "Si~C~Si"}),
+        ("pair_correlation", {"rmax": 3.0, "selection": "Fe"}),
+        ("coordination_number", {"rmax": 3.0, "chunk_size": 0}),
+        ("bond_angles", {"cutoff": 3.0, "selection": "Si~C"}),
+        ("bond_angles", {"cutoff": 3.0, "bin_width": 0}),
+    ],
+)
+def test_histograms_incorrect_usage(method, kwargs):
+    neighbor_list = NeighborList.from_data(_trajectory())[:]
+    with pytest.raises(exception.IncorrectUsage):
+        getattr(neighbor_list, method)(**kwargs)
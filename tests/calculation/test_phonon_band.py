@@ -175,6 +175,36 @@ def test_to_view(phonon_band, Assert):
     assert phonon.path_labels == expected_labels
 
 
+@pytest.mark.parametrize("qpoints", [slice(2, None, 3), [4, 0, 4], 1])
+def test_to_view_selected_qpoints(phonon_band, qpoints, Assert):
+    phonon = phonon_band.to_view(qpoints=qpoints).phonon
+    indices = np.atleast_1d(np.arange(len(phonon_band.ref.bands))[qpoints])
+    Assert.allclose(phonon.eigenvectors, phonon_band.ref.modes[indices])
+    Assert.allclose(phonon.frequencies, phonon_band.ref.bands[indices])
+    coordinates = np.array(phonon_band.ref.raw_data.dispersion.kpoints.coordinates)
+    Assert.allclose(phonon.qpoints, coordinates[indices])
+    labels = phonon_band.ref.qpoints.labels()
+    expected_labels = [
+        [i, labels[j]] for i, j in enumerate(indices) if labels[j]
+    ] or None
+    assert phonon.path_labels == expected_labels
+
+
+def test_to_view_incorrect_qpoints(phonon_band):
+    with pytest.raises(exception.IncorrectUsage):
+        phonon_band.to_view(qpoints=1000)
+
+
+def test_projections_in_chunks(phonon_band, Assert):
+    selection = "Sr, 3(x), y(4:5), z, Sr - Ti(x)"
+    expected = phonon_band.plot(selection)
+    with patch("py4vasp._calculation.phonon_band._CHUNK_ELEMENTS", 1):
+        actual = phonon_band.plot(selection)
+    for actual_series, expected_series in zip(actual.series, expected.series):
+        assert actual_series.label == expected_series.label
+        Assert.allclose(actual_series.weight, expected_series.weight)
+
+
 def test_to_view_supercell(phonon_band, Assert):
     view = phonon_band.to_view(supercell=2)
     Assert.allclose(view.supercell, (2, 2, 2))
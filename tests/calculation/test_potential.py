@@ -208,6 +208,27 @@ def check_view(potential, view, expectations, Assert, supercell=None):
         assert grid_scalar.isosurfaces[0] == expected.isosurface
 
 
+def test_to_numpy(raw_data, Assert):
+    raw_potential = raw_data.potential("Fe3O4 collinear all")
+    potential = Potential.from_data(raw_potential)
+    expected = np.moveaxis(raw_potential.total_potential, 0, -1).T
+    Assert.allclose(potential.to_numpy(), expected)
+    expected = np.moveaxis(raw_potential.xc_potential, 0, -1).T[:, ::3, 2:9:3, ::3]
+    actual = potential.to_numpy("xc", stride=3, region=(None, (2, 9), None))
+    Assert.allclose(actual, expected)
+    with pytest.raises(exception.IncorrectUsage):
+        potential.to_numpy("random_string")
+
+
+def test_plot_reduced_resolution(raw_data, Assert):
+    potential = make_reference_potential(raw_data, "Sr2TiO4", "total")
+    view = potential.plot(resolution=(5, 6, 7))
+    quantity = view.grid_scalars[0].quantity
+    assert quantity.shape == (1, 5, 6, 7)
+    expected = potential.ref.output["total"].reshape(5, 2, 6, 2, 7, 2)
+    Assert.allclose(quantity[0], expected.mean(axis=(1, 3, 5)))
+
+
 def test_incorrect_selection(reference_potential):
     with pytest.raises(exception.IncorrectUsage):
         reference_potential.plot("random_string")
@@ -0,0 +1,132 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import os
+
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import Calculation, demo, raw
+from py4vasp._calculation import _projection_cache
+from py4vasp._calculation.projector import ProjectorHandler
+from py4vasp._util import profile
+
+SELECTIONS = {
+    "Sr2TiO4": "Sr(p) Ti(d) - O(s), f",
+    "Fe3O4": "Fe(d), O(p + d), total, s(up)",
+    "Ba2PbO4": "Pb(p), O(sigma_z), sigma_x(Ba + Pb)",
+}
+
+
+@pytest.fixture(params=SELECTIONS.keys())
+def projector(raw_data, request):
+    projector = ProjectorHandler.from_data(raw_data.projector(request.param))
+    projector.selection = SELECTIONS[request.param]
+    return projector
+
+
+@pytest.fixture
+def projections(projector, tmp_path):
+    number_spins = projector._raw_projector.number_spin_projections
+    number_atoms = projector._stoichiometry().number_atoms()
+    number_orbitals = len(list(projector._orbital_types()))
+    shape = (number_spins, number_atoms, number_orbitals, 25)
+    data = np.random.default_rng(seed=1234).random(shape)
+    filename = tmp_path / "vaspout.h5"
+    with h5py.File(filename, "w") as file:
+        file.create_dataset("results/projections", data=data)
+    file = h5py.File(filename, "r")
+    yield raw.VaspData(file["results/projections"])
+    file.close()
+
+
+def test_project_from_cache(projector, projections, Assert):
+    selection = projector.selection
+    expected = projector.project(selection, projections[:])
+    with _projection_cache.enabled():
+        actual = projector.project(selection, projections)
+    assert actual.keys() == expected.keys()
+    for label, weight in expected.items():
+        if label == "is_spin_projection":
+            assert actual[label] == weight
+        else:
+            Assert.allclose(actual[label], weight, tolerance=100)
+    sidecar = _projection_cache.sidecar_filename(projections.data.file.filename)
+    assert sidecar.name == "vaspout.projections.h5"
+    with h5py.File(sidecar, "r") as file:
+        reduced = file["results/projections"]
+        assert reduced.shape[:3] == (
+            len(projections),
+            len(reduced.attrs["elements"]),
+            len(reduced.attrs["channels"]),
+        )
+
+
+def test_read_from_sidecar(projector, projections):
+    selection = projector.selection
+    with _projection_cache.enabled():
+        projector.project(selection, projections)
+        with profile.profile() as result:
+            projector.project(selection, projections)
+    phases = [event.phase for event in result.events]
+    assert profile.CACHE_HIT in phases
+    assert "read" not in phases
+
+
+def test_fine_selections_use_full_projections(projector, projections):
+    with _projection_cache.enabled():
+        projector.project("1", projections)
+    sidecar = _projection_cache.sidecar_filename(projections.data.file.filename)
+    assert not sidecar.exists()
+
+
+def test_not_enabled_by_default(projector, projections):
+    projector.project("s", projections)
+    sidecar = _projection_cache.sidecar_filename(projections.data.file.filename)
+    assert not sidecar.exists()
+
+
+def test_in_memory_projections_are_not_cached(projector, projections):
+    assert not _projection_cache.is_enabled()
+    with _projection_cache.enabled():
+        assert _projection_cache.is_enabled()
+        elements = {"all": slice(None)}
+        channels = {"all": slice(None)}
+        assert (
+            _projection_cache.load_or_compute(projections[:], elements, channels)
+            is None
+        )
+    assert not _projection_cache.is_enabled()
+
+
+def test_recompute_outdated_cache(tmp_path, Assert):
+    filename = tmp_path / "vaspout.h5"
+    elements = {"A": slice(0, 2), "B": slice(2, 3)}
+    channels = {"s": slice(0, 1), "p": slice(1, 4)}
+    for value in (1.0, 2.0):
+        with h5py.File(filename, "w") as file:
+            file.create_dataset("projections", data=np.full((1, 3, 4, 5), value))
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + int(value * 1e9)))
+        with h5py.File(filename, "r") as file:
+            data = raw.VaspData(file["projections"])
+            reduced = _projection_cache.load_or_compute(data, elements, channels)
+        Assert.allclose(reduced[0, :, :, 0], value * np.array([[2, 6], [1, 3]]))
+
+
+def test_calculation_with_projection_cache(tmp_path, Assert):
+    path = tmp_path / "demo"
+    demo.calculation(path)
+    selection = "Sr(p), Ti(d) - O(s)"
+    expected = Calculation.from_path(path).dos.read(selection)
+    assert not (path / "vaspout.projections.h5").exists()
+    calculation = Calculation.from_path(path, cache_projections=True)
+    actual = calculation.dos.read(selection)
+    assert (path / "vaspout.projections.h5").exists()
+    for label in ("Sr_p", "Ti_d - O_s"):
+        Assert.allclose(actual[label], expected[label], tolerance=100)
+    calculation = Calculation.from_file(path / "vaspout.h5", cache_projections=True)
+    actual = calculation.band.read(selection)
+    expected = Calculation.from_path(path).band.read(selection)
+    for label in ("Sr_p", "Ti_d - O_s"):
+        Assert.allclose(actual[label], expected[label], tolerance=100)
@@ -258,6 +258,17 @@ def test_ion_types_not_required(method, raw_data):
     getattr(stoichiometry, method)()  # make sure this does not raise an error
 
 
+def test_masses(raw_data, Assert):
+    pytest.importorskip("ase")
+    handler = StoichiometryHandler.from_data(raw_data.stoichiometry("Sr2TiO4"))
+    expected = [87.62, 87.62, 47.867, 15.999, 15.999, 15.999, 15.999]
+    Assert.allclose(handler.masses(), expected)
+    expected[2] = 1.0
+    Assert.allclose(handler.masses({"Ti": 1.0}), expected)
+    with pytest.raises(exception.IncorrectUsage):
+        handler.masses(ion_types=["Sr", "Xx", "O"])
+
+
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.stoichiometry("Sr2TiO4")
     check_factory_methods(Stoichiometry, data, skip_methods=["to_mdtraj"])
@@ -677,6 +677,8 @@ def test_factory_methods(raw_data, check_factory_methods):
         "standardized_cell",
         "prototype",
     ]
+    # the trajectory analysis needs a slice of steps and is tested separately
+    skip_methods += ["mean_square_displacement", "diffusion_coefficient"]
     check_factory_methods(Structure, data, parameters, skip_methods=skip_methods)
 
 
@@ -959,3 +961,135 @@ def test_symmetrize_to_primitive_keeps_species_order(Assert):
     assert actual["elements"] == ["Sr", "Ti", "O", "O", "O"]
     cell = (actual["lattice_vectors"], actual["positions"], [0, 1, 2, 2, 2])
     assert spglib.get_symmetry_dataset(cell, symprec=1e-5).number == 221
+
+
+# ---------------------------------------------------------------------------
+# Mean-square displacement and diffusion of MD trajectories
+# ---------------------------------------------------------------------------
+
+
+def make_trajectory(lattice_vectors, positions, ion_types, number_ion_types):
+    stoichiometry = raw.Stoichiometry(
+        ion_types=np.array(ion_types), number_ion_types=np.array(number_ion_types)
+    )
+    cell = raw.Cell(lattice_vectors=lattice_vectors, scale=raw.VaspData(1.0))
+    structure = raw.Structure(stoichiometry, cell, positions=positions % 1)
+    return Structure.from_data(structure)
+
+
+@pytest.fixture(params=("fixed cell", "NpT"))
+def md_trajectory(request):
+    number_steps = 120
+    rng = np.random.default_rng(seed=31)
+    # fractional trajectory without periodic wrapping
+    unwrapped = rng.random((5, 3)) + np.cumsum(
+        rng.normal(scale=0.03, size=(number_steps, 5, 3)), axis=0
+    )
+    if request.param == "fixed cell":
+        lattice_vectors = np.diag((8.0, 9.0, 10.0))
+        cartesian_steps = np.diff(unwrapped, axis=0) @ lattice_vectors
+    else:
+        time = np.arange(number_steps)
+        scale = 9.0 + 0.3 * np.sin(0.1 * time)
+        lattice_vectors = scale[:, np.newaxis, np.newaxis] * np.eye(3)
+        lattice_vectors[:, 0, 1] = 0.5 * np.cos(0.05 * time)
+        cartesian_steps = np.einsum(
+            "tai,tij->taj", np.diff(unwrapped, axis=0), lattice_vectors[1:]
+        )
+    structure = make_trajectory(lattice_vectors, unwrapped, ("Li", "O"), (3, 2))
+    structure.ref = types.SimpleNamespace()
+    structure.ref.cartesian = np.concatenate(
+        (np.zeros((1, 5, 3)), np.cumsum(cartesian_steps, axis=0))
+    )
+    return structure
+
+
+def brute_force_msd(positions):
+    result = [np.zeros(positions.shape[1])]
+    for lag in range(1, len(positions)):
+        displacement = positions[lag:] - positions[:-lag]
+        result.append(np.mean(np.sum(displacement**2, axis=-1), axis=0))
+    return np.array(result)
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 16))
+def test_mean_square_displacement(md_trajectory, chunk_size, Assert):
+    msd = brute_force_msd(md_trajectory.ref.cartesian)
+    actual = md_trajectory[:].mean_square_displacement(chunk_size=chunk_size)
+    assert list(actual) == ["time", "Li", "O"]
+    Assert.allclose(actual["time"], np.arange(120))
+    Assert.allclose(actual["Li"], np.mean(msd[:, :3], axis=1), tolerance=1e4)
+    Assert.allclose(actual["O"], np.mean(msd[:, 3:], axis=1), tolerance=1e4)
+
+
+def test_mean_square_displacement_selection(md_trajectory, Assert):
+    steps = slice(10, 100)
+    msd = brute_force_msd(md_trajectory.ref.cartesian[steps])
+    actual = md_trajectory[steps].mean_square_displacement("2, O", time_step=0.5)
+    assert list(actual) == ["time", "Li_2", "O"]
+    Assert.allclose(actual["time"], 0.5 * np.arange(90))
+    Assert.allclose(actual["Li_2"], msd[:, 1], tolerance=1e4)
+    Assert.allclose(actual["O"], np.mean(msd[:, 3:], axis=1), tolerance=1e4)
+
+
+def test_mean_square_displacement_every_nth_step(md_trajectory, Assert):
+    actual = md_trajectory[::4].mean_square_displacement(time_step=0.5)
+    Assert.allclose(actual["time"], 2 * np.arange(30))
+    assert len(actual["Li"]) == 30
+
+
+def test_diffusion_coefficient(Assert):
+    # random walk with 0.04 Å² variance per direction and step of 2 fs, so that the
+    # diffusion coefficient is 0.04 / (2 * 2) Å²/fs = 1e-3 cm²/s
+    rng = np.random.default_rng(seed=5)
+    displacements = rng.normal(scale=0.2, size=(4000, 20, 3))
+    lattice_vectors = 10 * np.eye(3)
+    positions = np.cumsum(displacements, axis=0) @ np.linalg.inv(lattice_vectors)
+    structure = make_trajectory(lattice_vectors, positions, ("Ar",), (20,))
+    actual = structure[:].diffusion_coefficient(time_step=2.0)
+    assert list(actual) == ["Ar"]
+    assert actual["Ar"].error > 0
+    assert abs(actual["Ar"].coefficient - 1e-3) < 3 * actual["Ar"].error
+    assert actual["Ar"].error < 1e-4
+
+
+def test_diffusion_coefficient_blocks_and_fit_range(md_trajectory, Assert):
+    trajectory = md_trajectory[:]
+    actual = trajectory.diffusion_coefficient(
+        "Li", number_blocks=3, fit_range=(0.25, 1), time_step=2.0
+    )
+    msd = trajectory.mean_square_displacement("Li", time_step=2.0)
+    time, msd = msd["time"][10:40], msd["Li"][10:40]
+    slope, _ = np.polyfit(time, msd, 1)
+    Assert.allclose(actual["Li"].coefficient, slope / 60)
+    block_slopes = []
+    for block in range(3):
+        steps = slice(40 * block, 40 * (block + 1))
+        msd = trajectory[steps].mean_square_displacement("Li", time_step=2.0)["Li"]
+        block_slopes.append(np.polyfit(time, msd[10:40], 1)[0])
+    error = np.std(block_slopes, ddof=1) / np.sqrt(3) / 60
+    Assert.allclose(actual["Li"].error, error, tolerance=1e4)
+
+
+def test_mean_square_displacement_requires_trajectory(md_trajectory, ZnS):
+    with pytest.raises(exception.IncorrectUsage):
+        md_trajectory.mean_square_displacement()
+    with pytest.raises(exception.IncorrectUsage):
+        md_trajectory[3:4].diffusion_coefficient()
+    with pytest.raises(exception.IncorrectUsage):
+        ZnS.mean_square_displacement()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"number_blocks": 1},
+        {"number_blocks": 100},
+        {"fit_range": (0.5, 0.2)},
+        {"fit_range": 0.5},
+        {"chunk_size": 0},
+    ),
+)
+def test_diffusion_coefficient_incorrect_arguments(md_trajectory, kwargs):
+    with pytest.raises(exception.IncorrectUsage):
+        md_trajectory[:].diffusion_coefficient(**kwargs)
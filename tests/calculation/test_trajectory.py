@@ -0,0 +1,154 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import numpy as np
+import pytest
+
+from py4vasp import exception
+from py4vasp._calculation import _trajectory
+from py4vasp._calculation.dispatch import DataSource, DictSource
+from py4vasp._calculation.structure import Structure
+from py4vasp._util import import_
+
+ase_cell = import_.optional("ase.cell")
+ase_io = import_.optional("ase.io")
+ase_units = import_.optional("ase.units")
+
+
+@pytest.fixture
+def md_source(raw_data):
+    raw_structure = raw_data.structure("Fe3O4")
+    source = DictSource(
+        {
+            "structure": raw_structure,
+            "force": raw_data.force("Fe3O4"),
+            "velocity": raw_data.velocity("Fe3O4"),
+            "energy": raw_data.energy("MD"),
+        }
+    )
+    source.ref = _reference(raw_data)
+    return source
+
+
+def _reference(raw_data):
+    raw_structure = raw_data.structure("Fe3O4")
+    structure = Structure.from_data(raw_structure)[:]
+    return {
+        "lattice_vectors": structure.lattice_vectors(),
+        "positions": np.array(raw_structure.positions),
+        "forces": np.array(raw_data.force("Fe3O4").forces),
+        "velocities": np.array(raw_data.velocity("Fe3O4").velocities),
+        "energies": np.array(raw_data.energy("MD").values)[:, 0],
+    }
+
+
+@pytest.mark.parametrize(
+    "steps, expected", [(None, [0, 1, 2, 3]), (slice(1, None, 2), [1, 3]), (-1, [3])]
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, _trajectory.CHUNK_SIZE])
+def test_chunks(md_source, steps, expected, chunk_size, Assert):
+    with _trajectory.Frames.from_source(md_source, steps=steps) as frames:
+        assert len(frames) == len(expected)
+        chunks = list(frames.chunks(chunk_size))
+    assert all(len(chunk.steps) <= chunk_size for chunk in chunks)
+    concatenate = lambda field: np.concatenate([getattr(c, field) for c in chunks])
+    Assert.allclose(concatenate("steps"), expected)
+    for field, reference in md_source.ref.items():
+        Assert.allclose(concatenate(field), reference[expected])
+
+
+def test_frames_without_optional_data(raw_data):
+    source = DataSource(raw_data.structure("Fe3O4"))
+    with _trajectory.Frames.from_source(source) as frames:
+        assert not frames.has_forces
+        assert not frames.has_velocities
+        assert not frames.has_energies
+        (chunk,) = frames.chunks()
+    assert chunk.forces is None
+    assert chunk.velocities is None
+    assert chunk.energies is None
+
+
+def test_frames_of_single_structure(raw_data, Assert):
+    raw_structure = raw_data.structure("Sr2TiO4")
+    raw_structure.positions = raw_structure.positions[-1]
+    with _trajectory.Frames.from_source(DataSource(raw_structure)) as frames:
+        (chunk,) = frames.chunks()
+    Assert.allclose(chunk.steps, [0])
+    Assert.allclose(chunk.positions, raw_structure.positions[np.newaxis])
+
+
+def test_write_extxyz(md_source, tmp_path, Assert):
+    filename = tmp_path / "trajectory.xyz"
+    _trajectory.write(md_source, filename, "extxyz", chunk_size=3)
+    frames = ase_io.read(filename, index=":", format="extxyz")
+    check_ase_frames(frames, md_source.ref, Assert)
+    for atoms, velocities in zip(frames, md_source.ref["velocities"]):
+        Assert.allclose(atoms.arrays["vel"], velocities)
+
+
+def test_write_ase_trajectory(md_source, tmp_path, Assert):
+    filename = tmp_path / "trajectory.traj"
+    _trajectory.write(md_source, filename, "ase-traj", chunk_size=3)
+    frames = ase_io.read(filename, index=":")
+    check_ase_frames(frames, md_source.ref, Assert)
+    for atoms, velocities in zip(frames, md_source.ref["velocities"]):
+        Assert.allclose(atoms.get_velocities() * ase_units.fs, velocities, 10)
+
+
+def check_ase_frames(frames, reference, Assert):
+    assert len(frames) == len(reference["positions"])
+    for i, atoms in enumerate(frames):
+        assert atoms.get_chemical_symbols() == ["Fe", "Fe", "Fe", "O", "O", "O", "O"]
+        Assert.allclose(atoms.cell[:], reference["lattice_vectors"][i])
+        Assert.allclose(
+            atoms.get_scaled_positions(wrap=False), reference["positions"][i], 100
+        )
+        Assert.allclose(atoms.get_forces(), reference["forces"][i])
+        Assert.allclose(atoms.get_potential_energy(), reference["energies"][i])
+
+
+def test_write_lammps_dump(md_source, tmp_path, Assert):
+    filename = tmp_path / "trajectory.dump"
+    _trajectory.write(md_source, filename, "lammps-dump", steps=slice(0, None, 2))
+    text = filename.read_text()
+    assert text.count("ITEM: TIMESTEP") == 2
+    assert "ITEM: ATOMS id type x y z vx vy vz fx fy fz" in text
+    frames = ase_io.read(filename, index=":", format="lammps-dump-text")
+    for atoms, step in zip(frames, (0, 2)):
+        # LAMMPS rotates the cell, but the shape and the direct coordinates persist
+        lattice_vectors = md_source.ref["lattice_vectors"][step]
+        Assert.allclose(atoms.cell.cellpar(), ase_cellpar(lattice_vectors), 100)
+        positions = atoms.get_scaled_positions(wrap=False)
+        Assert.allclose(positions, md_source.ref["positions"][step], 100)
+        forces = np.linalg.norm(atoms.get_forces(), axis=-1)
+        reference = np.linalg.norm(md_source.ref["forces"][step], axis=-1)
+        Assert.allclose(forces, reference, 100)
+
+
+def ase_cellpar(lattice_vectors):
+    return ase_cell.Cell(lattice_vectors).cellpar()
+
+
+def test_write_lammps_dump_without_optional_data(raw_data, tmp_path):
+    filename = tmp_path / "trajectory.dump"
+    source = DataSource(raw_data.structure("Fe3O4"))
+    _trajectory.write(source, filename, "lammps-dump", steps=0)
+    text = filename.read_text()
+    assert text.count("ITEM: TIMESTEP") == 1
+    assert "ITEM: ATOMS id type x y z\n" in text
+
+
+@pytest.mark.parametrize("steps", [slice(None, None, -1), slice(10, 20), 999, "step"])
+def test_incorrect_steps(md_source, steps, tmp_path):
+    with pytest.raises(exception.Py4VaspError):
+        _trajectory.write(md_source, tmp_path / "traj.xyz", "extxyz", steps=steps)
+
+
+def test_incorrect_chunk_size(md_source, tmp_path):
+    with pytest.raises(exception.IncorrectUsage):
+        _trajectory.write(md_source, tmp_path / "traj.xyz", "extxyz", chunk_size=0)
+
+
+def test_unknown_format(md_source, tmp_path):
+    with pytest.raises(exception.NotImplemented):
+        _trajectory.write(md_source, tmp_path / "traj.pdb", "pdb")
@@ -5,7 +5,7 @@ import types
 import numpy as np
 import pytest
 
-from py4vasp import _config, exception
+from py4vasp import _config, exception, raw
 from py4vasp._calculation.structure import Structure
 from py4vasp._calculation.velocity import Velocity, VelocityHandler
 from py4vasp._raw.models import VelocityModel
@@ -144,4 +144,104 @@ def test_to_database(velocities):
 
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.velocity("Fe3O4")
-    check_factory_methods(Velocity, data)
+    # the correlation functions need a slice of steps and are tested separately
+    skip_methods = ["autocorrelation", "vibrational_dos"]
+    check_factory_methods(Velocity, data, skip_methods=skip_methods)
+
+
+# Sr2TiO4 contains the atoms Sr Sr Ti O O O O
+_MASSES = np.repeat((87.62, 47.867, 15.999), (2, 1, 4))
+
+
+@pytest.fixture
+def md_velocities(raw_data):
+    velocities = np.random.default_rng(seed=11).normal(size=(40, 7, 3))
+    structure = raw_data.structure("Sr2TiO4")
+    velocity = Velocity.from_data(raw.Velocity(structure, velocities))
+    velocity.ref = types.SimpleNamespace(velocities=velocities)
+    return velocity
+
+
+def brute_force_vacf(velocities, number_lags):
+    number_steps = len(velocities)
+    return np.array(
+        [
+            np.mean(velocities[: number_steps - lag] * velocities[lag:], axis=0)
+            for lag in range(number_lags)
+        ]
+    )
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 16))
+def test_autocorrelation(md_velocities, chunk_size, Assert):
+    pytest.importorskip("ase")
+    vacf = brute_force_vacf(md_velocities.ref.velocities, 20)
+    vacf *= _MASSES[np.newaxis, :, np.newaxis]
+    actual = md_velocities[:].autocorrelation(
+        "Sr, 3(z), 1:2(x + y)", time_step=0.5, chunk_size=chunk_size
+    )
+    assert list(actual) == ["time", "total", "Sr", "Ti_1_z", "1:2_x + 1:2_y"]
+    Assert.allclose(actual["time"], 0.5 * np.arange(20))
+    Assert.allclose(actual["total"], np.sum(vacf, axis=(1, 2)), tolerance=1e3)
+    Assert.allclose(actual["Sr"], np.sum(vacf[:, :2], axis=(1, 2)), tolerance=1e3)
+    Assert.allclose(actual["Ti_1_z"], vacf[:, 2, 2], tolerance=1e3)
+    expected = np.sum(vacf[:, :2, :2], axis=(1, 2))
+    Assert.allclose(actual["1:2_x + 1:2_y"], expected, tolerance=1e3)
+
+
+def test_autocorrelation_without_masses(md_velocities, Assert):
+    vacf = brute_force_vacf(md_velocities.ref.velocities[::2], 5)
+    actual = md_velocities[::2].autocorrelation("O", number_lags=5, mass_weighted=False)
+    Assert.allclose(actual["time"], 2 * np.arange(5))
+    Assert.allclose(actual["O"], np.sum(vacf[:, 3:], axis=(1, 2)), tolerance=1e3)
+    masses = {"Sr": 1.0, "Ti": 1.0, "O": 1.0}
+    weighted = md_velocities[::2].autocorrelation("O", number_lags=5, masses=masses)
+    Assert.allclose(weighted["O"], actual["O"])
+
+
+@pytest.mark.parametrize("window", ("hann", "none"))
+def test_vibrational_dos(raw_data, window, Assert):
+    pytest.importorskip("ase")
+    # every atom oscillates with 10 THz (period of 100 fs) and a random phase
+    time = 2.0 * np.arange(2000)
+    phase = np.random.default_rng(seed=3).random((7, 3))
+    velocities = np.cos(2 * np.pi * (time[:, None, None] / 100 + phase))
+    structure = raw_data.structure("Sr2TiO4")
+    velocity = Velocity.from_data(raw.Velocity(structure, velocities))
+    graph = velocity[:].vibrational_dos("Ti, O(z)", time_step=2.0, window=window)
+    assert graph.xlabel == "ν (THz)"
+    assert graph.ylabel == "DOS (1/THz)"
+    assert [series.label for series in graph] == ["total", "Ti", "O_z"]
+    total, titanium, oxygen = graph.series
+    Assert.allclose(total.x[np.argmax(total.y)], 10, tolerance=1e13)
+    Assert.allclose(np.trapezoid(total.y, total.x), 21)
+    # equipartition is violated by the constant amplitude, so the mass defines the weight
+    expected = 47.867 / np.sum(_MASSES)
+    Assert.allclose(np.trapezoid(titanium.y, titanium.x) / 21, expected, tolerance=1e12)
+    Assert.allclose(oxygen.x[np.argmax(oxygen.y)], 10, tolerance=1e13)
+
+
+def test_vibrational_dos_unknown_window(md_velocities):
+    with pytest.raises(exception.NotImplemented):
+        md_velocities[:].vibrational_dos(window="foo", mass_weighted=False)
+
+
+def test_vibrational_dos_without_motion(raw_data):
+    velocities = np.zeros((10, 7, 3))
+    structure = raw_data.structure("Sr2TiO4")
+    velocity = Velocity.from_data(raw.Velocity(structure, velocities))
+    with pytest.raises(exception.NoData):
+        velocity[:].vibrational_dos(mass_weighted=False)
+
+
+@pytest.mark.parametrize("number_lags", (1, 41, 2.5))
+def test_autocorrelation_incorrect_number_lags(md_velocities, number_lags):
+    with pytest.raises(exception.IncorrectUsage):
+        md_velocities[:].autocorrelation(number_lags=number_lags, mass_weighted=False)
+
+
+def test_autocorrelation_requires_trajectory(md_velocities):
+    with pytest.raises(exception.IncorrectUsage):
+        md_velocities.autocorrelation(mass_weighted=False)
+    with pytest.raises(exception.IncorrectUsage):
+        md_velocities[3:4].vibrational_dos(mass_weighted=False)
@@ -106,6 +106,96 @@ def test_error_in_py4vasp(mock_calculation):
     assert error_message in result.output
 
 
+@pytest.fixture
+def mock_write_trajectory():
+    with patch("py4vasp.cli._trajectory.write", autospec=True) as mock:
+        yield mock
+
+
+@pytest.mark.parametrize("format", ("lammps-dump", "EXTXYZ", "ase-traj"))
+@pytest.mark.parametrize("flag", ("-o", "--output"))
+def test_convert_trajectory(mock_write_trajectory, format, flag, tmp_path):
+    output = tmp_path / "trajectory"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["convert", "structure", format, flag, str(output)])
+    assert result.exit_code == 0
+    mock_write_trajectory.assert_called_once()
+    source, filename, actual_format = mock_write_trajectory.call_args.args
+    assert source.path == pathlib.Path.cwd()
+    assert filename == output
+    assert actual_format == format.lower()
+    assert mock_write_trajectory.call_args.kwargs == {"selection": None, "steps": None}
+
+
+@pytest.mark.parametrize(
+    "steps, expected",
+    (("0:-1:10", slice(0, -1, 10)), ("5", 5), ("::2", slice(None, None, 2))),
+)
+def test_convert_trajectory_steps(mock_write_trajectory, steps, expected, tmp_path):
+    output = tmp_path / "trajectory.xyz"
+    runner = CliRunner()
+    options = ["--steps", steps, "-s", "choice", "-o", str(output)]
+    result = runner.invoke(cli, ["convert", "structure", "extxyz", *options])
+    assert result.exit_code == 0
+    kwargs = mock_write_trajectory.call_args.kwargs
+    assert kwargs == {"selection": "choice", "steps": expected}
+
+
+def test_convert_trajectory_from_file(mock_write_trajectory, tmp_path):
+    filename = tmp_path / "backup.h5"
+    filename.touch()
+    output = tmp_path / "trajectory.xyz"
+    runner = CliRunner()
+    options = ["-f", str(filename), "-o", str(output)]
+    result = runner.invoke(cli, ["convert", "structure", "extxyz", *options])
+    assert result.exit_code == 0
+    source = mock_write_trajectory.call_args.args[0]
+    assert source.path == tmp_path
+
+
+def test_convert_trajectory_requires_output(mock_write_trajectory):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["convert", "structure", "extxyz"])
+    assert result.exit_code != 0
+    assert "--output" in result.output
+    mock_write_trajectory.assert_not_called()
+
+
+@pytest.mark.parametrize("steps", ("a:b", "1:2:3:4", ""))
+def test_convert_trajectory_incorrect_steps(mock_write_trajectory, steps, tmp_path):
+    runner = CliRunner()
+    options = ["--steps", steps, "-o", str(tmp_path / "trajectory.xyz")]
+    result = runner.invoke(cli, ["convert", "structure", "extxyz", *options])
+    assert result.exit_code != 0
+    mock_write_trajectory.assert_not_called()
+
+
+def test_convert_lammps_does_not_accept_steps(mock_calculation):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["convert", "structure", "lammps", "--steps", "1"])
+    assert result.exit_code != 0
+    mock_calculation.from_path.assert_not_called()
+
+
+def test_convert_lammps_to_output_file(mock_calculation, tmp_path):
+    output = tmp_path / "structure.lmp"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["convert", "structure", "lammps", "-o", str(output)])
+    assert result.exit_code == 0
+    structure = mock_calculation.from_path.return_value.structure
+    assert output.read_text() == f"{structure.to_lammps.return_value}\n"
+
+
+def test_error_in_trajectory_conversion(mock_write_trajectory, tmp_path):
+    error_message = "Custom error message."
+    mock_write_trajectory.side_effect = exception.Py4VaspError(error_message)
+    runner = CliRunner()
+    options = ["-o", str(tmp_path / "trajectory.xyz")]
+    result = runner.invoke(cli, ["convert", "structure", "extxyz", *options])
+    assert result.exit_code != 0
+    assert error_message in result.output
+
+
 # ---------------------------------------------------------------------------
 # symmetrize command
 # ---------------------------------------------------------------------------
@@ -233,3 +323,88 @@ def test_symmetrize_in_place_hdf5_not_implemented(mock_calculation, tmp_path):
     result = runner.invoke(cli, ["symmetrize", str(hdf5), "-i"])
     assert result.exit_code != 0
     assert "not implemented" in result.output.lower()
+
+
+@pytest.fixture
+def mock_repack():
+    with patch("py4vasp.raw.repack", autospec=True) as mock:
+        yield mock
+
+
+def test_repack(mock_repack, tmp_path):
+    source = _write(tmp_path / "vaspout.h5")
+    destination = tmp_path / "repacked.h5"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["repack", str(source), str(destination)])
+    assert result.exit_code == 0
+    mock_repack.assert_called_once_with(
+        source, destination, compression=None, shuffle=False, chunk_bytes=2**20
+    )
+
+
+@pytest.mark.parametrize("compression", (("-c", "lzf"), ("--compression", "gzip")))
+def test_repack_with_options(mock_repack, tmp_path, compression):
+    source = _write(tmp_path / "vaspout.h5")
+    destination = tmp_path / "repacked.h5"
+    options = [*compression, "--shuffle", "--chunk-bytes", "4096"]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["repack", str(source), str(destination), *options])
+    assert result.exit_code == 0
+    mock_repack.assert_called_once_with(
+        source,
+        destination,
+        compression=compression[1],
+        shuffle=True,
+        chunk_bytes=4096,
+    )
+
+
+def test_repack_unknown_compression(mock_repack, tmp_path):
+    source = _write(tmp_path / "vaspout.h5")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["repack", str(source), "out.h5", "-c", "zstd"])
+    assert result.exit_code != 0
+    mock_repack.assert_not_called()
+
+
+def test_repack_error(mock_repack, tmp_path):
+    source = _write(tmp_path / "vaspout.h5")
+    mock_repack.side_effect = exception.IncorrectUsage("message")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["repack", str(source), str(source)])
+    assert result.exit_code != 0
+    assert "message" in result.output
+
+
+@pytest.fixture
+def mock_concatenate():
+    with patch("py4vasp.raw.concatenate", autospec=True) as mock:
+        yield mock
+
+
+@pytest.mark.parametrize("output", ("-o", "--output"))
+def test_concatenate(mock_concatenate, tmp_path, output):
+    runs = [tmp_path / f"run{i}" for i in range(3)]
+    for run in runs:
+        run.mkdir()
+    destination = tmp_path / "combined.h5"
+    arguments = [*map(str, runs), output, str(destination)]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["concatenate", *arguments])
+    assert result.exit_code == 0
+    mock_concatenate.assert_called_once_with(tuple(runs), destination)
+
+
+def test_concatenate_requires_output(mock_concatenate, tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["concatenate", str(tmp_path)])
+    assert result.exit_code != 0
+    mock_concatenate.assert_not_called()
+
+
+def test_concatenate_error(mock_concatenate, tmp_path):
+    mock_concatenate.side_effect = exception.DataMismatch("message")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["concatenate", str(tmp_path), "-o", "out.h5"])
+    assert result.exit_code != 0
+    assert "message" in result.output
@@ -0,0 +1,121 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import Calculation, exception, raw
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
+
+NUMBER_RUNS = 3
+POSITIONS = "intermediate/ion_dynamics/position_ions"
+LABELS = "intermediate/ion_dynamics/energies_tags"
+
+
+@pytest.fixture
+def runs(tmp_path, raw_data):
+    result = []
+    for i in range(NUMBER_RUNS):
+        directory = tmp_path / f"run{i}"
+        directory.mkdir()
+        force = raw_data.force("Sr2TiO4", randomize=True)
+        force.structure.positions = force.structure.positions + 0.1 * i
+        with h5py.File(directory / DEFAULT_FILE, "w") as h5f:
+            write(h5f, raw.Version(6, 5, 0))
+            write(h5f, force)
+            write(h5f, raw_data.energy("MD", randomize=True))
+            write(h5f, raw_data.velocity("Sr2TiO4"))
+            h5f[POSITIONS].attrs["run"] = i
+        result.append(directory)
+    return result
+
+
+@pytest.fixture
+def destination(tmp_path):
+    return tmp_path / "combined.h5"
+
+
+def test_concatenate_trajectory(runs, destination, Assert):
+    raw.concatenate(runs, destination)
+    expected = [Calculation.from_path(run) for run in runs]
+    actual = Calculation.from_file(destination)
+    positions = np.concatenate([calc.structure[:].positions() for calc in expected])
+    Assert.allclose(actual.structure[:].positions(), positions)
+    forces = np.concatenate([calc.force[:].read()["forces"] for calc in expected])
+    Assert.allclose(actual.force[:].read()["forces"], forces)
+    energies = np.concatenate([calc.energy[:].to_numpy() for calc in expected])
+    Assert.allclose(actual.energy[:].to_numpy(), energies)
+    velocities = np.concatenate(
+        [calc.velocity[:].read()["velocities"] for calc in expected]
+    )
+    Assert.allclose(actual.velocity[:].read()["velocities"], velocities)
+
+
+def test_slice_across_runs(runs, destination, Assert):
+    raw.concatenate(runs, destination)
+    expected = [Calculation.from_path(run) for run in runs]
+    actual = Calculation.from_file(destination)
+    number_steps = len(expected[0].structure[:].positions())
+    steps = slice(number_steps - 1, 2 * number_steps + 1)
+    positions = np.concatenate([calc.structure[:].positions() for calc in expected])
+    Assert.allclose(actual.structure[steps].positions(), positions[steps])
+    Assert.allclose(actual.structure[-1].positions(), positions[-1])
+
+
+def test_concatenate_does_not_copy_data(runs, destination):
+    raw.concatenate(runs, destination)
+    with h5py.File(destination, "r") as h5f:
+        assert h5f[POSITIONS].is_virtual
+        assert len(h5f[POSITIONS].virtual_sources()) == NUMBER_RUNS
+        assert h5f[POSITIONS].attrs["run"] == NUMBER_RUNS - 1
+        link = h5f.get(LABELS, getlink=True)
+        assert isinstance(link, h5py.ExternalLink)
+        assert link.filename == str((runs[-1] / DEFAULT_FILE).resolve())
+        assert isinstance(h5f.get("version/major", getlink=True), h5py.ExternalLink)
+
+
+def test_omit_datasets_missing_in_some_runs(runs, destination):
+    with h5py.File(runs[0] / DEFAULT_FILE, "a") as h5f:
+        del h5f["intermediate/ion_dynamics/ion_velocities"]
+    raw.concatenate(runs, destination)
+    with h5py.File(destination, "r") as h5f:
+        assert POSITIONS in h5f
+        assert "intermediate/ion_dynamics/ion_velocities" not in h5f
+
+
+def test_concatenate_files(runs, destination):
+    raw.concatenate([run / DEFAULT_FILE for run in runs[:2]], destination)
+    with h5py.File(destination, "r") as h5f:
+        assert len(h5f[POSITIONS].virtual_sources()) == 2
+
+
+def test_different_number_atoms(runs, destination):
+    with h5py.File(runs[1] / DEFAULT_FILE, "a") as h5f:
+        positions = h5f[POSITIONS][:, :-1]
+        del h5f[POSITIONS]
+        h5f[POSITIONS] = positions
+    with pytest.raises(exception.DataMismatch):
+        raw.concatenate(runs, destination)
+
+
+def test_run_without_trajectory(runs, destination, tmp_path):
+    with h5py.File(tmp_path / "static.h5", "w") as h5f:
+        write(h5f, raw.Version(6, 5, 0))
+    with pytest.raises(exception.NoData):
+        raw.concatenate([*runs, tmp_path / "static.h5"], destination)
+
+
+def test_missing_run(runs, destination, tmp_path):
+    with pytest.raises(exception.FileAccessError):
+        raw.concatenate([*runs, tmp_path / "missing"], destination)
+
+
+def test_no_runs(destination):
+    with pytest.raises(exception.IncorrectUsage):
+        raw.concatenate([], destination)
+
+
+def test_destination_is_run(runs):
+    with pytest.raises(exception.IncorrectUsage):
+        raw.concatenate(runs, runs[0] / DEFAULT_FILE)
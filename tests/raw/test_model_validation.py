@@ -1,12 +1,15 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import dataclasses
+import typing
 from typing import List, Optional
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from py4vasp import exception
+from py4vasp._raw import models
 from py4vasp._raw.data_wrapper import VaspData
 from py4vasp._raw.models import (
     BandModel,
@@ -226,3 +229,12 @@ def test_vaspdata_is_unwrapped_in_model():
     assert instance.field1 is None
     assert instance.field2 == "test"
     assert instance.field3 is True
+
+
+def test_coercers_are_compiled_once_per_model():
+    StressModel()
+    with patch.object(models.typing, "get_origin", wraps=typing.get_origin) as origin:
+        StressModel(initial_stress_mean=1.0)
+        StressModel(final_stress_tensor=np.arange(6.0))
+    origin.assert_not_called()
+    assert models._field_coercers(StressModel) is models._field_coercers(StressModel)
@@ -0,0 +1,138 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import Calculation, exception, raw
+from py4vasp._raw import repack as repack_module
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
+
+TRAJECTORY = "intermediate/ion_dynamics/position_ions"
+PROJECTIONS = "results/projectors/par"
+GRID = "charge/charge"
+
+
+@pytest.fixture
+def vasp_file(tmp_path, raw_data):
+    filename = tmp_path / DEFAULT_FILE
+    with h5py.File(filename, "w") as h5f:
+        h5f.attrs["program"] = "vasp"
+        write(h5f, raw.Version(6, 5, 0))
+        write(h5f, raw_data.structure("Sr2TiO4"))
+        write(h5f, raw_data.band("multiple with_projectors"))
+        write(h5f, raw_data.density("Fe3O4 collinear"))
+        h5f[TRAJECTORY].attrs["unit"] = "direct"
+    return filename
+
+
+@pytest.fixture
+def destination(tmp_path):
+    path = tmp_path / "repacked"
+    path.mkdir()
+    return path / DEFAULT_FILE
+
+
+def test_repack_keeps_paths_and_data(vasp_file, destination):
+    raw.repack(vasp_file, destination)
+    with h5py.File(vasp_file, "r") as expected, h5py.File(destination, "r") as actual:
+        assert dict(actual.attrs) == dict(expected.attrs)
+        check_same_content(expected, actual)
+        assert actual[TRAJECTORY].attrs["unit"] == "direct"
+
+
+@pytest.mark.parametrize("compression", ("gzip", "lzf"))
+def test_repack_with_compression(vasp_file, destination, compression):
+    raw.repack(vasp_file, destination, compression=compression, shuffle=True)
+    with h5py.File(vasp_file, "r") as expected, h5py.File(destination, "r") as actual:
+        check_same_content(expected, actual)
+        for name in (
+            TRAJECTORY,
+            PROJECTIONS,
+            GRID,
+            "results/electron_eigenvalues/eigenvalues",
+        ):
+            assert actual[name].compression == compression
+            assert actual[name].shuffle
+
+
+def check_same_content(expected, actual):
+    names = []
+    expected.visit(names.append)
+    actual_names = []
+    actual.visit(actual_names.append)
+    assert actual_names == names
+    for name in names:
+        if isinstance(expected[name], h5py.Dataset):
+            assert actual[name].dtype == expected[name].dtype
+            assert np.array_equal(actual[name][()], expected[name][()])
+
+
+def test_repack_chunks_along_analysis_axes(vasp_file, destination):
+    chunk_bytes = 256
+    raw.repack(vasp_file, destination, chunk_bytes=chunk_bytes)
+    with h5py.File(destination, "r") as h5f:
+        steps, atoms, _ = h5f[TRAJECTORY].shape
+        assert h5f[TRAJECTORY].chunks == (chunk_bytes // (atoms * 3 * 8), atoms, 3)
+        spin, atom, orbital, kpoints, bands = h5f[PROJECTIONS].shape
+        bytes_per_kpoint = spin * atom * orbital * bands * 8
+        expected = (spin, atom, orbital, 1, bands)
+        if bytes_per_kpoint < chunk_bytes:
+            expected = (spin, atom, orbital, chunk_bytes // bytes_per_kpoint, bands)
+        assert h5f[PROJECTIONS].chunks == expected
+        _, _, grid_y, grid_x = h5f[GRID].shape
+        assert h5f[GRID].chunks == (1, 1, grid_y, grid_x)
+        assert h5f["results/electron_eigenvalues/eigenvalues"].chunks is None
+
+
+def test_repack_default_chunks_contain_full_small_datasets(vasp_file, destination):
+    raw.repack(vasp_file, destination)
+    with h5py.File(destination, "r") as h5f:
+        assert h5f[TRAJECTORY].chunks == h5f[TRAJECTORY].shape
+        assert h5f[GRID].chunks == (1, *h5f[GRID].shape[1:])
+
+
+def test_repack_copies_in_blocks(vasp_file, destination, monkeypatch):
+    monkeypatch.setattr(repack_module, "BUFFER_BYTES", 1)
+    raw.repack(vasp_file, destination, chunk_bytes=1)
+    with h5py.File(vasp_file, "r") as expected, h5py.File(destination, "r") as actual:
+        check_same_content(expected, actual)
+
+
+def test_calculation_reads_repacked_file(vasp_file, destination, Assert):
+    raw.repack(vasp_file, destination, compression="gzip")
+    expected = Calculation.from_file(vasp_file)
+    actual = Calculation.from_file(destination)
+    Assert.allclose(
+        actual.structure[:].cartesian_positions(),
+        expected.structure[:].cartesian_positions(),
+    )
+    Assert.allclose(actual.band.to_dict("Sr")["Sr"], expected.band.to_dict("Sr")["Sr"])
+    Assert.allclose(actual.density.to_numpy(), expected.density.to_numpy())
+
+
+def test_repack_unknown_compression(vasp_file, destination):
+    with pytest.raises(exception.NotImplemented):
+        raw.repack(vasp_file, destination, compression="zstd")
+
+
+def test_repack_shuffle_without_compression(vasp_file, destination):
+    with pytest.raises(exception.IncorrectUsage):
+        raw.repack(vasp_file, destination, shuffle=True)
+
+
+@pytest.mark.parametrize("chunk_bytes", (0, -1, 1.5))
+def test_repack_incorrect_chunk_bytes(vasp_file, destination, chunk_bytes):
+    with pytest.raises(exception.IncorrectUsage):
+        raw.repack(vasp_file, destination, chunk_bytes=chunk_bytes)
+
+
+def test_repack_in_place(vasp_file):
+    with pytest.raises(exception.IncorrectUsage):
+        raw.repack(vasp_file, vasp_file)
+
+
+def test_repack_missing_file(tmp_path, destination):
+    with pytest.raises(exception.FileAccessError):
+        raw.repack(tmp_path / "missing.h5", destination)
@@ -73,6 +73,9 @@ def _all_calculation_examples():
 _FULL_INSTALL_EXAMPLES = {
     "py4vasp._calculation.neighbor_list.NeighborList.read": "scipy",
     "py4vasp._calculation.neighbor_list.NeighborList.to_string": "scipy",
+    "py4vasp._calculation.neighbor_list.NeighborList.pair_correlation": "scipy",
+    "py4vasp._calculation.neighbor_list.NeighborList.coordination_number": "scipy",
+    "py4vasp._calculation.neighbor_list.NeighborList.bond_angles": "scipy",
     "py4vasp._calculation.optics.Optics.color": "scipy",
     "py4vasp._calculation.symmetry.Symmetry.space_group": "spglib",
     "py4vasp._calculation.symmetry.Symmetry.point_group_schoenflies": "spglib",
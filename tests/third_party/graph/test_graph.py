@@ -693,6 +693,13 @@ def test_convert_different_length_series_to_frame(parabola, two_lines, Assert):
     Assert.allclose(df["two_lines.y1"], padded_two_lines_y[1])
 
 
+def test_convert_series_with_same_label_to_frame(parabola):
+    pytest.importorskip("pandas")
+    graph = Graph([parabola, parabola])
+    with pytest.raises(exception.IncorrectUsage):
+        graph.to_frame()
+
+
 def test_ipython_display(parabola):
     pytest.importorskip("plotly")
     with patch("plotly.graph_objs.Figure._ipython_display_") as mock_display:
@@ -1272,3 +1279,21 @@ def test_importing_plotly_sets_vasp_default_template(imports):
         [sys.executable, "-c", code], capture_output=True, text=True
     )
     assert result.returncode == 0, result.stderr
+
+
+def test_merge_many_graphs(parabola, sine):
+    graphs = [Graph(parabola, xlabel="x"), Graph([sine, parabola]), Graph(sine)]
+    merged = Graph.merge(graphs)
+    expected = graphs[0] + graphs[1] + graphs[2]
+    assert merged == expected
+    merged = Graph.merge(graphs, labels=["A", "B", "C"])
+    expected = [graph.label(label) for graph, label in zip(graphs, "ABC")]
+    assert merged == expected[0] + expected[1] + expected[2]
+    assert len(Graph.merge([])) == 0
+
+
+def test_merge_graphs_with_incorrect_labels(parabola):
+    with pytest.raises(exception.IncorrectUsage):
+        Graph.merge([Graph(parabola)], labels=["A", "B"])
+    with pytest.raises(exception.IncorrectUsage):
+        Graph.merge([Graph(parabola, xlabel="x"), Graph(parabola, xlabel="y")])
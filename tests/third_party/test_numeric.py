@@ -55,6 +55,31 @@ def test_pass_parameters_to_analytic_continuation(Assert):
         Assert.allclose(f_out, f_expected)
 
 
+def test_analytic_continuation_in_parallel(Assert):
+    pytest.importorskip("scipy")
+    z_in = 1j * np.linspace(0.1, 10.0, 8)
+    poles = np.linspace(0.5, 2.0, 6).reshape(3, 2, 1)
+    f_in = 1 / (z_in - poles + 0.5j)
+    z_out = np.linspace(0.0, 2.5, 6)
+    config = interpolate.AAAConfig(workers=2)
+    f_out = numeric.analytic_continuation(z_in, f_in, z_out, config=config)
+    f_expected = numeric.analytic_continuation(z_in, f_in, z_out)
+    assert f_out.shape == (3, 2, 6)
+    Assert.allclose(f_out, f_expected)
+
+
+def test_analytic_continuation_of_identical_data_sets_done_once(Assert):
+    pytest.importorskip("scipy")
+    with patch("scipy.interpolate.AAA") as AAAMock:
+        z_in = np.random.rand(3)
+        f_in = np.tile(np.random.rand(3), (4, 1))
+        z_out = np.random.rand(5)
+        f_expected = AAAMock.return_value.return_value = np.random.rand(5)
+        f_out = numeric.analytic_continuation(z_in, f_in, z_out)
+        AAAMock.assert_called_once()
+        Assert.allclose(f_out, np.tile(f_expected, (4, 1)))
+
+
 def test_interpolate_with_function(Assert):
     pytest.importorskip("scipy")
     x_in = np.array([0.1, 0.5, 1.0, 2.0])
@@ -87,3 +112,14 @@ def test_interpolate_with_function_higher_dimensions(Assert):
     y_out = numeric.interpolate_with_function(gaussian, x_in, y_in, x_out)
     Assert.allclose(y_out, y_in)
     Assert.allclose(y_out, y_in)
+
+
+def test_interpolate_with_function_in_parallel(Assert):
+    pytest.importorskip("scipy")
+    x_in = np.linspace(-2.0, 2.0, 9)
+    amplitude = np.linspace(1.0, 3.0, 4)
+    y_in = gaussian(x_in, amplitude=amplitude)
+    x_out = np.linspace(-1.0, 1.0, 5)
+    y_out = numeric.interpolate_with_function(gaussian, x_in, y_in, x_out, workers=2)
+    y_expected = gaussian(x_out, amplitude=amplitude)
+    Assert.allclose(y_out, y_expected, tolerance=1e6)
@@ -45,3 +45,14 @@ def test_error_if_not_callable():
         check.raise_error_if_not_callable(func, 6, 7, 8)
     with pytest.raises(exception.IncorrectUsage):
         check.raise_error_if_not_callable(func, 9, z=10)
+
+
+@pytest.mark.parametrize("value", (1, 7, np.int64(3)))
+def test_positive_integer(value):
+    check.raise_error_if_not_positive_integer(value, "chunk size")
+
+
+@pytest.mark.parametrize("value", (0, -1, 1.5, "2", None))
+def test_error_if_not_positive_integer(value):
+    with pytest.raises(exception.IncorrectUsage, match="chunk size"):
+        check.raise_error_if_not_positive_integer(value, "chunk size")
@@ -0,0 +1,42 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import numpy as np
+import pytest
+
+from py4vasp._util import correlation
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(seed=7).normal(size=(50, 4, 3))
+
+
+def test_autocorrelation(data, Assert):
+    number_steps = len(data)
+    expected = np.array(
+        [
+            np.mean(data[: number_steps - lag] * data[lag:], axis=0)
+            for lag in range(number_steps)
+        ]
+    )
+    Assert.allclose(correlation.autocorrelation(data), expected)
+
+
+def test_autocorrelation_along_axis(data, Assert):
+    expected = np.moveaxis(correlation.autocorrelation(data), 0, 1)
+    actual = correlation.autocorrelation(np.moveaxis(data, 0, 1), axis=1)
+    Assert.allclose(actual, expected)
+
+
+def test_mean_square_displacement(data, Assert):
+    positions = np.cumsum(data, axis=0)
+    number_steps = len(positions)
+    expected = np.array(
+        [
+            np.mean(np.sum((positions[lag:] - positions[:-lag]) ** 2, axis=-1), axis=0)
+            for lag in range(1, number_steps)
+        ]
+    )
+    actual = correlation.mean_square_displacement(positions)
+    Assert.allclose(actual[0], np.zeros(4), tolerance=1000)
+    Assert.allclose(actual[1:], expected, tolerance=1000)
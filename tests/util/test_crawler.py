@@ -0,0 +1,191 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import json
+import os
+from unittest.mock import patch
+
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import Calculation, demo
+from py4vasp._raw.data import _DatabaseData
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._util import crawler
+
+NAMES = ("a", "b", "c")
+
+
+@pytest.fixture(scope="module")
+def calculations(tmp_path_factory):
+    path = tmp_path_factory.mktemp("crawler")
+    for name in NAMES:
+        demo.calculation(path / name)
+    return [path / name for name in NAMES]
+
+
+@pytest.fixture
+def copied_calculations(calculations, tmp_path):
+    paths = []
+    for path in calculations:
+        destination = tmp_path / path.name
+        destination.mkdir()
+        (destination / DEFAULT_FILE).write_bytes((path / DEFAULT_FILE).read_bytes())
+        paths.append(destination)
+    return paths
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return tmp_path / "manifest.json"
+
+
+@pytest.fixture
+def count_exports():
+    with patch.object(
+        Calculation, "_to_database", autospec=True, side_effect=lambda calc: calc.path()
+    ) as mock:
+        yield mock
+
+
+def exported(paths, manifest, **kwargs):
+    return dict(crawler.export_changed(paths, manifest, **kwargs))
+
+
+def test_export_all_calculations_initially(calculations, manifest):
+    result = exported(calculations, manifest, workers=2)
+    assert result.keys() == {path / DEFAULT_FILE for path in calculations}
+    for filename, database_data in result.items():
+        assert isinstance(database_data, _DatabaseData)
+        assert database_data.metadata.path == filename.parent
+    content = json.loads(manifest.read_text())
+    assert content["calculations"].keys() == {str(file) for file in result}
+
+
+def test_skip_unchanged_calculations(calculations, manifest, count_exports):
+    exported(calculations, manifest)
+    assert count_exports.call_count == len(calculations)
+    assert exported(calculations, manifest) == {}
+    assert count_exports.call_count == len(calculations)
+
+
+def test_export_new_calculation(calculations, manifest, count_exports):
+    exported(calculations[:2], manifest)
+    result = exported(calculations, manifest)
+    assert list(result) == [calculations[2] / DEFAULT_FILE]
+    assert exported(calculations, manifest) == {}
+
+
+def test_export_changed_calculation(copied_calculations, manifest, count_exports):
+    exported(copied_calculations, manifest)
+    filename = copied_calculations[1] / DEFAULT_FILE
+    with h5py.File(filename, "a") as h5f:
+        h5f["intermediate/ion_dynamics/energies"][0, 0] += 1
+    assert list(exported(copied_calculations, manifest)) == [filename]
+
+
+def test_export_calculation_with_new_data(copied_calculations, manifest, count_exports):
+    exported(copied_calculations, manifest)
+    filename = copied_calculations[1] / DEFAULT_FILE
+    fingerprint = crawler.fingerprint(filename)
+    with h5py.File(filename, "a") as h5f:
+        h5f["additional/data"] = np.ones((200, 200))
+    assert crawler.fingerprint(filename) == fingerprint
+    assert list(exported(copied_calculations, manifest)) == [filename]
+
+
+def test_touched_calculation_is_not_exported(
+    copied_calculations, manifest, count_exports
+):
+    exported(copied_calculations, manifest)
+    filename = copied_calculations[0] / DEFAULT_FILE
+    status = os.stat(filename)
+    os.utime(filename, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+    with patch.object(crawler, "fingerprint", wraps=crawler.fingerprint) as hash_:
+        assert exported(copied_calculations, manifest) == {}
+    hash_.assert_called_once_with(filename)
+    content = json.loads(manifest.read_text())
+    assert (
+        content["calculations"][str(filename)]["mtime"] == os.stat(filename).st_mtime_ns
+    )
+
+
+def test_export_all_if_schema_changed(calculations, manifest, count_exports):
+    exported(calculations, manifest)
+    with patch.object(crawler, "_schema_hash", return_value="changed"):
+        assert len(exported(calculations, manifest)) == len(calculations)
+    content = json.loads(manifest.read_text())
+    assert content["schema"] == "changed"
+
+
+def test_force_export(calculations, manifest, count_exports):
+    exported(calculations, manifest)
+    assert len(exported(calculations, manifest, force=True)) == len(calculations)
+
+
+def test_interrupted_crawl(calculations, manifest, count_exports):
+    iterator = crawler.export_changed(calculations, manifest, workers=1)
+    first, _ = next(iterator)
+    iterator.close()
+    assert str(first) not in json.loads(manifest.read_text())["calculations"]
+    iterator = crawler.export_changed(calculations, manifest, workers=1)
+    first, _ = next(iterator)
+    second, _ = next(iterator)
+    iterator.close()
+    calculations_in_manifest = json.loads(manifest.read_text())["calculations"]
+    assert str(first) in calculations_in_manifest
+    assert str(second) not in calculations_in_manifest
+    remaining = dict(crawler.export_changed(calculations, manifest))
+    assert first not in remaining
+    assert len(remaining) == len(calculations) - 1
+
+
+def test_missing_calculation_is_removed(copied_calculations, manifest, count_exports):
+    exported(copied_calculations, manifest)
+    filename = copied_calculations[2] / DEFAULT_FILE
+    filename.unlink()
+    assert exported(copied_calculations, manifest) == {}
+    content = json.loads(manifest.read_text())
+    assert str(filename) not in content["calculations"]
+
+
+def test_corrupt_manifest(calculations, manifest, count_exports):
+    manifest.write_text("not json")
+    assert len(exported(calculations, manifest)) == len(calculations)
+
+
+def test_skip_corrupt_calculation(copied_calculations, manifest, count_exports):
+    exported(copied_calculations, manifest)
+    corrupt = copied_calculations[0] / DEFAULT_FILE
+    corrupt.write_bytes(b"not an HDF5 file")
+    new = copied_calculations[1] / "new.h5"
+    new.write_bytes((copied_calculations[1] / DEFAULT_FILE).read_bytes())
+    with pytest.warns(UserWarning, match=str(corrupt)):
+        result = exported([*copied_calculations, new], manifest)
+    assert list(result) == [new]
+    content = json.loads(manifest.read_text())
+    assert str(corrupt) not in content["calculations"]
+    assert str(new) in content["calculations"]
+
+
+def test_skip_calculation_failing_export(calculations, manifest, count_exports):
+    failing = calculations[1] / DEFAULT_FILE
+    export = lambda calc: calc.path() if calc.path() != failing.parent else 1 / 0
+    count_exports.side_effect = export
+    with pytest.warns(UserWarning, match="ZeroDivisionError"):
+        result = exported(calculations, manifest, workers=2)
+    assert result.keys() == {path / DEFAULT_FILE for path in calculations} - {failing}
+    content = json.loads(manifest.read_text())
+    assert str(failing) not in content["calculations"]
+    count_exports.side_effect = lambda calc: calc.path()
+    assert list(exported(calculations, manifest)) == [failing]
+
+
+def test_fingerprint(copied_calculations, tmp_path):
+    first = copied_calculations[0] / DEFAULT_FILE
+    second = tmp_path / "copy.h5"
+    second.write_bytes(first.read_bytes())
+    assert crawler.fingerprint(first) == crawler.fingerprint(second)
+    with h5py.File(second, "a") as h5f:
+        h5f["version/patch"][()] += 1
+    assert crawler.fingerprint(first) != crawler.fingerprint(second)
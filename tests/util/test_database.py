@@ -1,9 +1,12 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+from unittest.mock import patch
+
 import pytest
 
 from py4vasp._calculation import GROUPS, QUANTITIES
 from py4vasp._raw.definition import DEFAULT_SOURCE
+from py4vasp._raw.models import BandModel, StressModel
 from py4vasp._util import database
 
 
@@ -200,3 +203,26 @@ def test_get_all_possible_keys():
         sum([1 for v in all_keys.values() if len(v) > 0 and isinstance(v[0], tuple)])
         > 10
     )
+
+
+def test_get_all_possible_keys_is_cached():
+    first_keys, first_types = database.get_all_possible_keys()
+    with patch.object(database, "unique_selections") as selections:
+        second_keys, second_types = database.get_all_possible_keys()
+    selections.assert_not_called()
+    assert first_keys == second_keys and first_types == second_types
+    # the results are copies, so callers may modify them
+    first_keys["BandModel"].clear()
+    first_types.clear()
+    assert database.get_all_possible_keys() == (second_keys, second_types)
+
+
+def test_get_dataclass_fields_parses_source_once():
+    database.get_dataclass_fields(BandModel)
+    with patch.object(database.ast, "parse") as parse:
+        fields = database.get_dataclass_fields(StressModel)
+        fields[0]["name"] = "modified"
+        fields = database.get_dataclass_fields(StressModel)
+    parse.assert_not_called()
+    field = next(field for field in fields if field["name"] == "final_stress_tensor")
+    assert field["documentation"]
@@ -0,0 +1,160 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import datetime
+import json
+import pathlib
+import sqlite3
+
+import pytest
+
+from py4vasp import demo, exception
+from py4vasp._raw.data import CalculationMetaData, _DatabaseData
+from py4vasp._raw.models import BandModel, StoichiometryModel, StressModel
+from py4vasp._util import database_table, import_
+
+pa_parquet = import_.optional("pyarrow.parquet")
+
+STRESS = (1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+
+
+def make_data(path, index):
+    metadata = CalculationMetaData(path=path, schema_version="0.11")
+    metadata.added_at = datetime.datetime(2024, 1, index + 1)
+    properties = {
+        "band": {
+            "default": BandModel(num_considered_bands=10 + index, fermi_energy=0.5),
+            "kpoints_opt": BandModel(num_considered_bands=20 + index),
+        },
+        "stoichiometry": {
+            "default": StoichiometryModel(ion_types=["Sr", "O"], formula="SrO")
+        },
+    }
+    if index % 2 == 0:
+        properties["stress"] = {"default": StressModel(final_stress_tensor=STRESS)}
+    return _DatabaseData(metadata=metadata, properties=properties)
+
+
+@pytest.fixture
+def database_data(tmp_path):
+    return [make_data(tmp_path / f"calc_{i}", i) for i in range(3)]
+
+
+def test_to_columns(database_data, tmp_path):
+    tables = database_table.to_columns(database_data)
+    assert tables.keys() == {
+        "calculation",
+        "band_model",
+        "stoichiometry_model",
+        "stress_model",
+    }
+    model, columns = tables["band_model"]
+    assert model is BandModel
+    paths = [str(tmp_path / f"calc_{i}") for i in range(3)]
+    assert columns["path"] == [path for path in paths for _ in range(2)]
+    assert columns["quantity"] == 6 * ["band"]
+    assert columns["selection"] == 3 * ["default", "kpoints_opt"]
+    assert columns["num_considered_bands"] == [10, 20, 11, 21, 12, 22]
+    assert columns["fermi_energy"] == 3 * [0.5, None]
+    model, columns = tables["stress_model"]
+    assert columns["path"] == [paths[0], paths[2]]
+    assert columns["final_stress_tensor"] == [STRESS, STRESS]
+    model, columns = tables["calculation"]
+    assert model is CalculationMetaData
+    assert columns["path"] == [pathlib.Path(path) for path in paths]
+    assert "quantity" not in columns
+
+
+def test_write_parquet(database_data, tmp_path):
+    directory = tmp_path / "tables"
+    database_table.write_parquet(directory, database_data, batch_size=2)
+    band = pa_parquet.read_table(directory / "band_model.parquet")
+    assert band.num_rows == 6
+    assert band.column("num_considered_bands").to_pylist() == [10, 20, 11, 21, 12, 22]
+    assert band.schema.field("fermi_energy").metadata[b"description"]
+    stress = pa_parquet.read_table(directory / "stress_model.parquet")
+    assert stress.column("final_stress_tensor").to_pylist() == [
+        list(STRESS),
+        list(STRESS),
+    ]
+    stoichiometry = pa_parquet.read_table(directory / "stoichiometry_model.parquet")
+    assert stoichiometry.column("ion_types").to_pylist() == 3 * [["Sr", "O"]]
+    metadata = pa_parquet.read_table(directory / "calculation.parquet")
+    assert metadata.column("path").to_pylist() == [
+        str(data.metadata.path) for data in database_data
+    ]
+    assert metadata.column("added_at").to_pylist()[1] == datetime.datetime(2024, 1, 2)
+
+
+def test_schema_is_independent_of_values(tmp_path):
+    # the first batch contains only missing values, so inferring the types would fail
+    database_data = [
+        _DatabaseData(
+            metadata=CalculationMetaData(path=tmp_path / "first"),
+            properties={"band": {"default": BandModel()}},
+        ),
+        make_data(tmp_path / "second", 1),
+    ]
+    database_table.write_parquet(tmp_path, database_data, batch_size=1)
+    band = pa_parquet.read_table(tmp_path / "band_model.parquet")
+    assert band.column("num_considered_bands").to_pylist() == [None, 11, 21]
+
+
+def test_write_sqlite(database_data, tmp_path):
+    filename = tmp_path / "database.sqlite"
+    database_table.write_sqlite(filename, database_data[:2], batch_size=1)
+    database_table.write_sqlite(filename, database_data[2:])
+    connection = sqlite3.connect(filename)
+    rows = connection.execute(
+        'SELECT path, selection, num_considered_bands, fermi_energy FROM "band_model"'
+    ).fetchall()
+    assert [row[2] for row in rows] == [10, 20, 11, 21, 12, 22]
+    assert rows[0] == (str(database_data[0].metadata.path), "default", 10, 0.5)
+    (stress,) = connection.execute(
+        'SELECT final_stress_tensor FROM "stress_model"'
+    ).fetchone()
+    assert json.loads(stress) == list(STRESS)
+    rows = connection.execute('SELECT path, added_at FROM "calculation"').fetchall()
+    assert rows[0] == (str(database_data[0].metadata.path), "2024-01-01T00:00:00")
+    connection.close()
+
+
+def test_write_sqlite_replaces_calculation(database_data, tmp_path):
+    filename = tmp_path / "database.sqlite"
+    database_table.write_sqlite(filename, database_data)
+    database_table.write_sqlite(filename, database_data[:1])
+    changed = make_data(database_data[0].metadata.path, 1)
+    database_table.write_sqlite(filename, [changed, changed])
+    connection = sqlite3.connect(filename)
+    count = lambda table: connection.execute(
+        f'SELECT path, COUNT(*) FROM "{table}" GROUP BY path ORDER BY path'
+    ).fetchall()
+    paths = [str(data.metadata.path) for data in database_data]
+    assert count("calculation") == [(path, 1) for path in paths]
+    assert count("band_model") == [(path, 2) for path in paths]
+    assert count("stoichiometry_model") == [(path, 1) for path in paths]
+    # the changed calculation no longer contains a stress
+    assert count("stress_model") == [(paths[2], 1)]
+    rows = connection.execute(
+        'SELECT num_considered_bands FROM "band_model" WHERE path = ?', (paths[0],)
+    ).fetchall()
+    assert sorted(rows) == [(11,), (21,)]
+    connection.close()
+
+
+def test_export_demo_calculation(tmp_path):
+    database_data = [demo.calculation(tmp_path / "calc")._to_database()]
+    database_table.write_parquet(tmp_path / "tables", database_data)
+    database_table.write_sqlite(tmp_path / "database.sqlite", database_data)
+    connection = sqlite3.connect(tmp_path / "database.sqlite")
+    query = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    names = connection.execute(query).fetchall()
+    connection.close()
+    parquet_files = {path.stem for path in (tmp_path / "tables").iterdir()}
+    assert {name for name, in names} == parquet_files
+    assert {"calculation", "band_model", "structure_model"} <= parquet_files
+
+
+@pytest.mark.parametrize("batch_size", (0, -1, 1.5))
+def test_incorrect_batch_size(database_data, tmp_path, batch_size):
+    with pytest.raises(exception.IncorrectUsage):
+        database_table.write_sqlite(tmp_path / "x.sqlite", database_data, batch_size)
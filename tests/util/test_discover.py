@@ -0,0 +1,90 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from py4vasp import exception
+from py4vasp._util import discover
+
+FILENAME = "vaspout.h5"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    for directory in ("a", "a/b", "a/b/c", "d", "e/f"):
+        (root / directory).mkdir(parents=True)
+    files = [root / "a" / FILENAME, root / "a/b/c" / FILENAME, root / "e/f" / FILENAME]
+    for file in files:
+        file.touch()
+    (root / "d" / "other.h5").touch()
+    return root, sorted(files)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return tmp_path / "manifest.json"
+
+
+def test_find_files(tree):
+    root, expected = tree
+    assert discover.find_files(root, FILENAME) == expected
+
+
+def test_find_files_in_root(tmp_path):
+    (tmp_path / FILENAME).touch()
+    assert discover.find_files(tmp_path, FILENAME, workers=1) == [tmp_path / FILENAME]
+
+
+def test_do_not_follow_symbolic_links(tree):
+    root, expected = tree
+    os.symlink(root / "a", root / "d" / "link")
+    os.symlink(root, root / "a" / "cycle")
+    assert discover.find_files(root, FILENAME) == expected
+
+
+def test_directory_named_like_file(tree):
+    root, expected = tree
+    (root / "d" / FILENAME).mkdir()
+    assert discover.find_files(root, FILENAME) == expected
+
+
+def test_manifest_skips_unchanged_directories(tree, manifest):
+    root, expected = tree
+    assert discover.find_files(root, FILENAME, manifest=manifest) == expected
+    content = json.loads(manifest.read_text())
+    assert content["root"] == str(root)
+    assert content["filename"] == FILENAME
+    with patch("os.scandir", side_effect=AssertionError) as scandir:
+        assert discover.find_files(root, FILENAME, manifest=manifest) == expected
+    new_file = root / "d" / FILENAME
+    new_file.touch()
+    with patch("os.scandir", wraps=os.scandir) as scandir:
+        actual = discover.find_files(root, FILENAME, manifest=manifest)
+    assert actual == sorted([*expected, new_file])
+    scandir.assert_called_once_with(root / "d")
+
+
+def test_manifest_of_other_search_is_ignored(tree, manifest):
+    root, expected = tree
+    discover.find_files(root / "a", FILENAME, manifest=manifest)
+    assert discover.find_files(root, FILENAME, manifest=manifest) == expected
+    manifest.write_text("not json")
+    assert discover.find_files(root, FILENAME, manifest=manifest) == expected
+
+
+def test_removed_directory(tree, manifest):
+    root, expected = tree
+    discover.find_files(root, FILENAME, manifest=manifest)
+    (root / "e/f" / FILENAME).unlink()
+    (root / "e/f").rmdir()
+    actual = discover.find_files(root, FILENAME, manifest=manifest)
+    assert actual == [file for file in expected if "e" not in file.parts[-3:]]
+
+
+def test_root_is_not_a_directory(tmp_path):
+    with pytest.raises(exception.FileAccessError):
+        discover.find_files(tmp_path / "missing", FILENAME)
@@ -0,0 +1,97 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import exception, raw
+from py4vasp._util import grid
+
+
+@pytest.fixture
+def data():
+    # shape as written by VASP: (components, grid z, grid y, grid x)
+    return np.random.default_rng(seed=42).random((2, 14, 12, 10))
+
+
+def transpose(data):
+    return np.moveaxis(data, 0, -1).T
+
+
+@pytest.mark.parametrize(
+    "stride, region, expected",
+    [
+        (None, None, np.s_[:, :, :, :]),
+        (2, None, np.s_[:, ::2, ::2, ::2]),
+        ((1, 3, 4), None, np.s_[:, :, ::3, ::4]),
+        (None, (None, (2, 5), slice(-4, None)), np.s_[:, :, 2:5, -4:]),
+        (2, ((1, 8), None, slice(3, 4)), np.s_[:, 1:8:2, ::2, 3:4:2]),
+    ],
+)
+def test_read(data, stride, region, expected, Assert):
+    actual = grid.read(data, stride, region)
+    Assert.allclose(transpose(actual), transpose(data)[expected])
+
+
+def test_read_hyperslab_from_file(data, tmp_path, Assert):
+    filename = tmp_path / "grid.h5"
+    with h5py.File(filename, "w") as file:
+        file["charge"] = data
+    with h5py.File(filename, "r") as file:
+        actual = grid.read(raw.VaspData(file["charge"]), 3, (None, (2, 11), None))
+    Assert.allclose(transpose(actual), transpose(data)[:, ::3, 2:11:3, ::3])
+
+
+@pytest.mark.parametrize(
+    "stride, region",
+    [
+        (0, None),
+        (1.5, None),
+        ((1, 2), None),
+        (None, ((0, 2), (0, 2))),
+        (None, (slice(0, 4, 2), None, None)),
+        (None, ((5, 2), None, None)),
+    ],
+)
+def test_read_with_incorrect_arguments(data, stride, region):
+    with pytest.raises(exception.IncorrectUsage):
+        grid.read(data, stride, region)
+
+
+def test_block_average(data, Assert):
+    actual = grid.downsample(data, (5, 6, 7), "block")
+    expected = data.reshape(2, 7, 2, 6, 2, 5, 2).mean(axis=(2, 4, 6))
+    Assert.allclose(actual, expected)
+
+
+def test_block_average_uneven_bins(Assert):
+    data = np.arange(5.0).reshape(1, 1, 1, 5)
+    actual = grid.downsample(data, 2, "block")
+    Assert.allclose(actual, [[[[0.5, 3.0]]]])
+
+
+def test_fourier_downsampling(Assert):
+    make_grid = lambda shape: np.meshgrid(
+        *(np.arange(n) / n for n in shape), indexing="ij"
+    )
+    function = lambda x, y, z: 1 + np.cos(2 * np.pi * x) * np.sin(4 * np.pi * z) + y
+    x, y, z = make_grid((16, 6, 20))
+    data = transpose(function(x, np.cos(2 * np.pi * y), z)[np.newaxis])
+    actual = grid.downsample(data, (8, 6, 10), "fourier")
+    x, y, z = make_grid((8, 6, 10))
+    expected = transpose(function(x, np.cos(2 * np.pi * y), z)[np.newaxis])
+    Assert.allclose(actual, expected, tolerance=100)
+
+
+@pytest.mark.parametrize("method", grid.METHODS)
+def test_downsampling_keeps_coarse_grid(data, method, Assert):
+    assert grid.downsample(data, None, method) is data
+    Assert.allclose(grid.downsample(data, 20, method), data)
+    assert grid.downsample(data, (4, 20, 3), method).shape == (2, 3, 12, 4)
+
+
+def test_downsampling_with_incorrect_arguments(data):
+    with pytest.raises(exception.IncorrectUsage):
+        grid.downsample(data, 0)
+    with pytest.raises(exception.NotImplemented):
+        grid.downsample(data, 4, "unknown")
@@ -389,6 +389,26 @@ def test_operation_with_custom_reduction(selection, expected, Assert):
     Assert.allclose(selector[selection], expected)
 
 
+@pytest.mark.parametrize("average", (False, True))
+@pytest.mark.parametrize("selection", ("A + x", "B - y", "A(z) + B(x - y)", "2:4"))
+def test_weights_reproduce_selection(selection, average, Assert):
+    values = np.log(np.linspace(0.1, 1.9, 24)).reshape(4, 6)
+    map_ = {
+        0: {"A": slice(0, 3), "B": slice(2, 4), "2": 1, "3": 2, "4": 3},
+        1: {"x": slice(1, 5), "y": slice(None, None, 3), "z": slice(0, 5, 2)},
+    }
+    reduction = np.mean if average else np.sum
+    expected = index.Selector(map_, values, reduction=reduction)
+    weights = index.Weights(values.size, average=average)
+    selector = index.Selector(
+        map_, np.arange(values.size).reshape(4, 6), reduction=weights
+    )
+    selection, *_ = select.Tree.from_selection(selection).selections()
+    actual = selector[selection]
+    assert actual.shape == (values.size,)
+    Assert.allclose(actual @ values.ravel(), expected[selection])
+
+
 @pytest.mark.parametrize(
     "selection, label",
     [
@@ -0,0 +1,54 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from py4vasp._util import manifest
+from py4vasp._util.manifest import read_manifest, write_manifest
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return tmp_path / "manifest.json"
+
+
+def test_write_and_read(filename):
+    write_manifest(filename, root="tree", filename="vaspout.h5", entries={"a": 1})
+    content = json.loads(filename.read_text())
+    assert content["version"] == manifest.VERSION
+    assert read_manifest(filename, root="tree", filename="vaspout.h5") == content
+    assert read_manifest(filename)["entries"] == {"a": 1}
+    assert not filename.with_name("manifest.json.tmp").exists()
+
+
+def test_header_mismatch(filename):
+    write_manifest(filename, root="tree")
+    assert read_manifest(filename, root="other") == {}
+    assert read_manifest(filename, missing="value") == {}
+
+
+def test_other_version(filename):
+    write_manifest(filename, root="tree")
+    with patch.object(manifest, "VERSION", manifest.VERSION + 1):
+        assert read_manifest(filename, root="tree") == {}
+
+
+@pytest.mark.parametrize("content", ("not json", "[1, 2]"))
+def test_invalid_manifest(filename, content):
+    filename.write_text(content)
+    assert read_manifest(filename) == {}
+
+
+def test_missing_manifest(filename):
+    assert read_manifest(filename) == {}
+
+
+def test_interrupted_write_keeps_old_manifest(filename):
+    write_manifest(filename, entries="old")
+    with patch.object(os, "replace", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            write_manifest(filename, entries="new")
+    assert read_manifest(filename)["entries"] == "old"
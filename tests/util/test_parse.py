@@ -287,3 +287,67 @@ def test_error_velocities_in_fractional_coordinates(raw_data):
 @pytest.mark.parametrize("string, expected", (("", " "), (" ", " "), ("foo", "f")))
 def test_first_char(string, expected):
     assert parse.first_char(string) == expected
+
+
+def test_parse_ion_lines_with_comments(Assert):
+    poscar_string = """\
+comments after the coordinates
+1.0
+4.0 0.0 0.0
+0.0 4.0 0.0
+0.0 0.0 4.0
+Sr Ti
+1 2
+Selective dynamics
+Direct
+0.0 0.0 0.0 T T F Sr
+0.5 0.5 0.5 F F T Ti ! first titanium
+0.5 0.0 0.0 T F T
+"""
+    actual = parse.POSCAR(poscar_string)
+    expected_positions = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.5, 0.0, 0.0]]
+    Assert.allclose(actual.structure.positions, expected_positions)
+    expected_flags = [[True, True, False], [False, False, True], [True, False, True]]
+    Assert.allclose(actual.selective_dynamics, np.array(expected_flags))
+
+
+def test_parse_large_poscar(Assert):
+    number_atoms = 10000
+    positions = np.random.random((number_atoms, 3))
+    flags = np.random.random((number_atoms, 3)) > 0.5
+    lines = (
+        f"{x:.16f} {y:.16f} {z:.16f} {' '.join('T' if f else 'F' for f in flag)}"
+        for (x, y, z), flag in zip(positions, flags)
+    )
+    poscar_string = f"""\
+large cell
+1.0
+20.0 0.0 0.0
+0.0 20.0 0.0
+0.0 0.0 20.0
+Si
+{number_atoms}
+Selective dynamics
+Direct
+""" + "\n".join(lines)
+    actual = parse.POSCAR(poscar_string)
+    Assert.allclose(actual.structure.positions, positions)
+    Assert.allclose(actual.selective_dynamics, flags)
+
+
+@pytest.mark.parametrize(
+    "ion_lines", ("0.0 0.0 0.0\n0.5 0.5", "0.0 0.0 0.0\n0.5 0.5 x", "0.0 0.0 0.0")
+)
+def test_error_in_ion_lines(ion_lines):
+    poscar_string = f"""\
+incorrect ion lines
+1.0
+4.0 0.0 0.0
+0.0 4.0 0.0
+0.0 0.0 4.0
+Si
+2
+Direct
+{ion_lines}"""
+    with pytest.raises(exception.ParserError):
+        parse.POSCAR(poscar_string)
@@ -0,0 +1,97 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import py4vasp
+from py4vasp import demo, raw
+from py4vasp._util import profile
+
+
+@pytest.fixture(scope="module")
+def calculation(tmp_path_factory):
+    return demo.calculation(tmp_path_factory.mktemp("profile") / "demo")
+
+
+def test_no_events_without_active_profile():
+    assert not profile.is_active()
+    with profile.phase("read") as event:
+        assert event is None
+    profile.cache_hit()
+
+
+def test_profile_data_access(calculation):
+    with py4vasp.profile() as result:
+        assert profile.is_active()
+        calculation.dos.read()
+    assert not profile.is_active()
+    summary = result.summary()
+    assert set(summary["dos"]) >= {"open", "handler", "read"}
+    assert summary["dos"]["open"]["calls"] == 1
+    assert summary["dos"]["read"]["bytes"] > 0
+    assert all(event.duration >= 0 for event in result.events)
+    assert all(event.start >= 0 for event in result.events)
+
+
+def test_profile_version_check_and_cache_hit(calculation):
+    with py4vasp.profile() as result:
+        with profile.quantity("bandgap"):
+            with raw.access("bandgap", path=calculation.path()):
+                pass
+        calculation.band.read()
+    summary = result.summary()
+    assert "version" in summary["bandgap"]
+    assert profile.CACHE_HIT in summary["band"]
+
+
+def test_profile_graph(calculation):
+    graph = calculation.dos.plot()
+    with profile.profile() as result:
+        graph.to_plotly()
+    assert [event.phase for event in result.events] == ["graph"]
+
+
+def test_nested_profiles(calculation):
+    with profile.profile() as outer:
+        calculation.energy.read()
+        with profile.profile() as inner:
+            calculation.dos.read()
+    assert "energy" in outer.summary()
+    assert "energy" not in inner.summary()
+    assert set(inner.summary()) <= set(outer.summary())
+
+
+def test_report(calculation):
+    with profile.profile() as result:
+        calculation.dos.read()
+    lines = result.report().splitlines()
+    assert lines[0].split() == ["quantity", "phase", "calls", "time/ms", "bytes"]
+    assert any(line.startswith("dos") and "read" in line for line in lines[1:])
+
+
+def test_chrome_trace(calculation, tmp_path):
+    with profile.profile() as result:
+        calculation.dos.read()
+    filename = tmp_path / "trace.json"
+    result.write_chrome_trace(filename)
+    trace = json.loads(filename.read_text())
+    assert trace == json.loads(json.dumps(result.to_chrome_trace()))
+    events = trace["traceEvents"]
+    assert len(events) == len(result.events)
+    for event in events:
+        assert event["ph"] in ("X", "i")
+        assert event["name"].startswith(event["args"]["quantity"])
+        assert event["cat"] in profile.PHASES + (profile.CACHE_HIT,)
+
+
+def test_profile_from_environment(calculation, tmp_path):
+    filename = tmp_path / "trace.json"
+    script = f"import py4vasp; py4vasp.Calculation.from_path({str(calculation.path())!r}).dos.read()"
+    env = {**os.environ, profile.ENVIRONMENT_VARIABLE: str(filename)}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
+    trace = json.loads(filename.read_text())
+    assert any(event["cat"] == "read" for event in trace["traceEvents"])